@@ -0,0 +1,146 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Checkpoint / Resume for Long Runs
+
+A Checkpoint is a directory holding
+
+    state.npz        run configuration (JSON) plus the reduced state so far
+    part_00000.npz   optional per-shard / per-block arrays (raw samples)
+
+all written compressed and atomically (temporary file + os.replace, as the
+hydrostatic table cache does), so a run killed mid-write leaves the previous
+checkpoint intact. Nothing is pickled: streaming statistics are flattened
+to plain arrays by streaming_to_arrays() / streaming_from_arrays() (used
+by monte_carlo.MonteCarloStats.to_arrays()).
+
+Resuming checks that the stored configuration equals the current one and
+raises ValueError otherwise - a checkpoint from a different seed, sample
+count or model would silently change the answer.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from calculations.streaming_stats import Histogram, Moments, QuantileSketch, StreamingStats
+
+CHECKPOINT_VERSION = 1
+STATE_FILE = "state.npz"
+
+
+def seed_config(seed) -> Dict:
+    """JSON-able identity of an int or SeedSequence seed."""
+    if isinstance(seed, np.random.SeedSequence):
+        return {"entropy": seed.entropy, "spawn_key": list(seed.spawn_key)}
+    return {"entropy": seed, "spawn_key": []}
+
+
+def table_config(hydro_table) -> Optional[Dict]:
+    """Identity of an optional hydrostatic table (name and geometry hash)."""
+    if hydro_table is None:
+        return None
+    return {"name": hydro_table.name, "geometry_hash": hydro_table.geometry_hash}
+
+
+def streaming_to_arrays(st: StreamingStats, prefix: str) -> Dict[str, np.ndarray]:
+    """Flatten one StreamingStats into arrays keyed prefix/..."""
+    m, sk = st.moments, st.sketch
+    out = {
+        f"{prefix}/count": np.array([m.count, sk.k, sk.count], dtype=np.int64),
+        f"{prefix}/moments": np.array([m.mean, m.m2, m.min, m.max]),
+        f"{prefix}/offsets": np.array(sk._offsets, dtype=np.int64),
+    }
+    for h, level in enumerate(sk.levels):
+        out[f"{prefix}/level{h}"] = level
+    if st.histogram is not None:
+        hist = st.histogram
+        out[f"{prefix}/edges"] = hist.edges
+        out[f"{prefix}/counts"] = hist.counts
+        out[f"{prefix}/flow"] = np.array([hist.underflow, hist.overflow], dtype=np.int64)
+    return out
+
+
+def streaming_from_arrays(arrays, prefix: str) -> StreamingStats:
+    """Inverse of streaming_to_arrays()."""
+    count, k, sk_count = (int(v) for v in arrays[f"{prefix}/count"])
+    mean, m2, lo, hi = (float(v) for v in arrays[f"{prefix}/moments"])
+    sketch = QuantileSketch(k)
+    sketch.count = sk_count
+    sketch._offsets = [int(v) for v in arrays[f"{prefix}/offsets"]]
+    sketch.levels = [np.array(arrays[f"{prefix}/level{h}"]) for h in range(len(sketch._offsets))]
+    hist = None
+    if f"{prefix}/edges" in arrays:
+        under, over = (int(v) for v in arrays[f"{prefix}/flow"])
+        hist = Histogram(np.array(arrays[f"{prefix}/edges"]),
+                         np.array(arrays[f"{prefix}/counts"]), under, over)
+    return StreamingStats(Moments(count, mean, m2, lo, hi), sketch, hist)
+
+
+def _write_npz(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez_compressed(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+class Checkpoint:
+    """
+    Checkpoint directory for one run configuration.
+
+    start(resume) clears the directory for a fresh run, or loads and
+    validates the saved state; save() replaces the state, save_part() /
+    load_part() handle per-shard arrays.
+    """
+
+    def __init__(self, directory, config: Dict):
+        self.directory = Path(directory)
+        self.config = dict(config, version=CHECKPOINT_VERSION)
+        self._config_json = json.dumps(self.config, sort_keys=True, default=float)
+
+    @property
+    def state_path(self) -> Path:
+        return self.directory / STATE_FILE
+
+    def part_path(self, index: int) -> Path:
+        return self.directory / f"part_{index:05d}.npz"
+
+    def start(self, resume: bool = False) -> Optional[Dict[str, np.ndarray]]:
+        """
+        State arrays to resume from, or None for a fresh run (directory
+        cleared). Resuming with no saved state yet also starts fresh.
+        """
+        if resume and self.state_path.exists():
+            return self.load()
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+        self.directory.mkdir(parents=True)
+        return None
+
+    def load(self) -> Dict[str, np.ndarray]:
+        with np.load(self.state_path, allow_pickle=False) as z:
+            arrays = {k: z[k] for k in z.files}
+        saved = json.loads(str(arrays.pop("__config__")))
+        current = json.loads(self._config_json)
+        if saved != current:
+            diff = sorted(k for k in set(saved) | set(current) if saved.get(k) != current.get(k))
+            raise ValueError(
+                f"checkpoint in {self.directory} was written for a different run "
+                f"(differs in: {', '.join(diff)}); rerun without resume to start over"
+            )
+        return arrays
+
+    def save(self, arrays: Dict[str, np.ndarray]) -> None:
+        _write_npz(self.state_path, dict(arrays, __config__=np.array(self._config_json)))
+
+    def save_part(self, index: int, arrays: Dict[str, np.ndarray]) -> None:
+        _write_npz(self.part_path(index), arrays)
+
+    def has_part(self, index: int) -> bool:
+        return self.part_path(index).exists()
+
+    def load_part(self, index: int) -> Dict[str, np.ndarray]:
+        with np.load(self.part_path(index), allow_pickle=False) as z:
+            return {k: z[k] for k in z.files}
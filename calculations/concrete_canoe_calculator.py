@@ -16,20 +16,167 @@ v2.1 improvements (code review recommendations):
   8. Weighted COG from hull + crew component heights (calculate_cog_height)
   9. validate_concrete_mix() sanity check for density and strength
   10. Bending moment model accounts for concentrated crew load at midship
+
+v2.2:
+  11. Results carry a "diagnostics" key (Diagnostic bit flags) for the
+      input sanity checks, reported per the diagnostics() mode
 """
 
+from collections import Counter
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from enum import IntFlag
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, ClassVar, Iterator, Optional, Sequence
 import math
 import warnings
 
 
 # Constants
+MODEL_VERSION = "2.2"  # bump whenever a formula changes (invalidates cached results)
 WATER_DENSITY_LB_PER_FT3 = 62.4  # freshwater
 GRAVITY_FT_S2 = 32.174
 INCHES_PER_FOOT = 12
 
+# ASCE 2026 pass/fail thresholds
+MIN_FREEBOARD_IN = 6.0
+MIN_GM_IN = 6.0
+MIN_SAFETY_FACTOR = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Diagnostics
+#
+# Sanity checks record bit flags on each result instead of going through
+# warnings.warn on every evaluation. The reporting mode is per-context:
+#   "warn"    (default) flags are recorded and each one is also warned
+#   "collect" flags are recorded only; nothing is formatted or warned
+#   "strict"  any tripped check raises DiagnosticError
+# ---------------------------------------------------------------------------
+
+class Diagnostic(IntFlag):
+    """Bit flags for the input sanity checks."""
+    NONE = 0
+    DENSITY_UNUSUAL = 1
+    FLEXURAL_UNUSUAL = 2
+    FLEX_COMP_RATIO_HIGH = 4
+    WEIGHT_MISMATCH = 8
+
+
+_DIAGNOSTIC_MESSAGES = (
+    (Diagnostic.DENSITY_UNUSUAL,
+     "Density {density_pcf:.0f} pcf is unusual for concrete canoes "
+     "(typical: 50-80 pcf for lightweight mixes)."),
+    (Diagnostic.FLEXURAL_UNUSUAL,
+     "Flexural strength {flexural_psi:.0f} psi is unusual "
+     "(typical: 800-2500 psi for canoe mixes)."),
+    (Diagnostic.FLEX_COMP_RATIO_HIGH,
+     "Flexural/compressive ratio {ratio:.1%} is high "
+     "(typically 8-15% per ACI 318-25). Verify test data."),
+    (Diagnostic.WEIGHT_MISMATCH,
+     "Provided hull weight ({weight_lbs:.0f} lbs) differs from "
+     "estimated ({estimated_lbs:.0f} lbs) by {weight_diff_pct:.0f}%. "
+     "Check your weight input."),
+)
+
+DIAGNOSTIC_MODES = ("warn", "collect", "strict")
+
+
+class DiagnosticError(ValueError):
+    """Raised in strict mode when a sanity check trips."""
+
+    def __init__(self, flags: Diagnostic, messages: Sequence[str]):
+        super().__init__(" ".join(messages))
+        self.flags = flags
+
+
+class DiagnosticsCollector:
+    """Tallies flags over every evaluation inside a diagnostics() block."""
+
+    def __init__(self, mode: str = "collect"):
+        if mode not in DIAGNOSTIC_MODES:
+            raise ValueError(f"mode must be one of {DIAGNOSTIC_MODES}, got {mode!r}")
+        self.mode = mode
+        self.evaluations = 0
+        self.flagged = 0
+        self.seen = Diagnostic.NONE
+        self.counts: Counter = Counter()
+
+    def record(self, flags: Diagnostic) -> None:
+        self.evaluations += 1
+        if flags:
+            self.flagged += 1
+            self.seen |= flags
+            for flag, _ in _DIAGNOSTIC_MESSAGES:
+                if flags & flag:
+                    self.counts[flag] += 1
+
+    def merge(self, other: "DiagnosticsCollector") -> "DiagnosticsCollector":
+        """Add another collector's tallies (e.g. one returned by a worker process)."""
+        self.evaluations += other.evaluations
+        self.flagged += other.flagged
+        self.seen |= other.seen
+        self.counts.update(other.counts)
+        return self
+
+    def summary(self) -> str:
+        if not self.flagged:
+            return f"{self.evaluations} evaluations, no diagnostics"
+        parts = ", ".join(f"{flag.name} ×{n}" for flag, n in self.counts.items())
+        return f"{self.evaluations} evaluations, {self.flagged} flagged ({parts})"
+
+
+_diagnostics_state: ContextVar[Optional[DiagnosticsCollector]] = ContextVar(
+    "canoe_diagnostics", default=None
+)
+
+
+def active_diagnostics() -> Optional[DiagnosticsCollector]:
+    """The collector of the innermost diagnostics() block, or None."""
+    return _diagnostics_state.get()
+
+
+@contextmanager
+def diagnostics(mode: str = "collect") -> Iterator[DiagnosticsCollector]:
+    """
+    Set the diagnostics mode for every evaluation in the block.
+
+        with diagnostics("collect") as diag:
+            run_optimization()
+        print(diag.summary())
+    """
+    collector = DiagnosticsCollector(mode)
+    token = _diagnostics_state.set(collector)
+    try:
+        yield collector
+    finally:
+        _diagnostics_state.reset(token)
+
+
+def _report_diagnostics(flags: Diagnostic, stacklevel: int, **values) -> None:
+    """Record flags with the active collector, then warn or raise per mode.
+
+    stacklevel is relative to the caller of this function, as for
+    warnings.warn. Messages are only formatted when they will be shown.
+    """
+    state = _diagnostics_state.get()
+    if state is not None:
+        state.record(flags)
+        if state.mode == "collect":
+            return
+    if not flags:
+        return
+    messages = [
+        template.format(**values)
+        for flag, template in _DIAGNOSTIC_MESSAGES if flags & flag
+    ]
+    if state is not None and state.mode == "strict":
+        raise DiagnosticError(flags, messages)
+    for message in messages:
+        warnings.warn(message, stacklevel=stacklevel + 1)
+
 
 @dataclass
 class HullGeometry:
@@ -56,6 +203,231 @@ class HullGeometry:
         return self.thickness_in / INCHES_PER_FOOT
 
 
+# ---------------------------------------------------------------------------
+# Result records
+#
+# run_complete_analysis() returns nested dicts for compatibility; with
+# as_record=True it returns these frozen, slotted records instead, which
+# need a fraction of the memory when millions of results are kept.
+# _KEYS maps each legacy dict key (aliases included) onto an attribute.
+# ---------------------------------------------------------------------------
+
+class _RecordView(Mapping):
+    """Read-only dict view of a result record. Nothing is copied."""
+    __slots__ = ("_record",)
+
+    def __init__(self, record):
+        self._record = record
+
+    def __getitem__(self, key):
+        try:
+            attr = self._record._KEYS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        value = getattr(self._record, attr)
+        return value.as_dict() if isinstance(value, _Record) else value
+
+    def __iter__(self):
+        return iter(self._record._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._record._KEYS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class _Record:
+    __slots__ = ()
+    _KEYS: ClassVar[Dict[str, str]] = {}
+
+    def as_dict(self) -> Mapping:
+        """Zero-copy Mapping with the same keys as the legacy dict."""
+        return _RecordView(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain (mutable) nested dict, as run_complete_analysis returns."""
+        out = {}
+        for key, attr in self._KEYS.items():
+            value = getattr(self, attr)
+            out[key] = value.to_dict() if isinstance(value, _Record) else value
+        return out
+
+
+@dataclass(frozen=True, slots=True)
+class HullResult(_Record):
+    length_in: float
+    beam_in: float
+    depth_in: float
+    weight_lbs: float
+
+    _KEYS: ClassVar[Dict[str, str]] = {
+        "length_in": "length_in",
+        "beam_in": "beam_in",
+        "depth_in": "depth_in",
+        "weight_lbs": "weight_lbs",
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class FreeboardResult(_Record):
+    freeboard_in: float
+    draft_in: float
+    displacement_ft3: float
+    passed: bool
+    min_required_in: float = MIN_FREEBOARD_IN
+
+    _KEYS: ClassVar[Dict[str, str]] = {
+        "freeboard_in": "freeboard_in",
+        "draft_in": "draft_in",
+        "displacement_ft3": "displacement_ft3",
+        "pass": "passed",
+        "min_required_in": "min_required_in",
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class StabilityResult(_Record):
+    gm_in: float
+    passed: bool
+    min_required_in: float = MIN_GM_IN
+
+    _KEYS: ClassVar[Dict[str, str]] = {
+        "gm_in": "gm_in",
+        "GM_in": "gm_in",  # Alias for workflow compatibility
+        "pass": "passed",
+        "min_required_in": "min_required_in",
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class StructuralResult(_Record):
+    max_bending_moment_lb_ft: float
+    bending_stress_psi: float
+    section_modulus_in3: float
+    safety_factor: float
+    flexural_strength_psi: float
+    passed: bool
+    min_sf: float = MIN_SAFETY_FACTOR
+
+    _KEYS: ClassVar[Dict[str, str]] = {
+        "max_bending_moment_lb_ft": "max_bending_moment_lb_ft",
+        "bending_stress_psi": "bending_stress_psi",
+        "section_modulus_in3": "section_modulus_in3",
+        "safety_factor": "safety_factor",
+        "flexural_strength_psi": "flexural_strength_psi",
+        "pass": "passed",
+        "is_adequate": "passed",  # Alias for workflow compatibility
+        "min_sf": "min_sf",
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResult(_Record):
+    hull: HullResult
+    freeboard: FreeboardResult
+    stability: StabilityResult
+    structural: StructuralResult
+    overall_pass: bool
+    diagnostics: Diagnostic = Diagnostic.NONE
+
+    _KEYS: ClassVar[Dict[str, str]] = {
+        "hull": "hull",
+        "freeboard": "freeboard",
+        "stability": "stability",
+        "structural": "structural",
+        "overall_pass": "overall_pass",
+        "diagnostics": "diagnostics",
+    }
+
+
+class ResultTable:
+    """
+    Columnar batch results: one NumPy array per metric.
+
+    Column names are those of run_complete_analysis_batch(), which this
+    wraps without copying. row(i) materializes a single AnalysisResult.
+    """
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Dict[str, Any]):
+        import numpy as np
+
+        self.columns = {k: np.asarray(v) for k, v in columns.items()}
+        lengths = {c.shape[0] if c.ndim else 1 for c in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"ResultTable columns differ in length: {sorted(lengths)}")
+
+    @classmethod
+    def from_batch(cls, batch: Dict[str, Any]) -> "ResultTable":
+        return cls(batch)
+
+    @classmethod
+    def from_records(cls, records: Sequence[AnalysisResult]) -> "ResultTable":
+        import numpy as np
+
+        def col(get, dtype=float):
+            return np.fromiter((get(r) for r in records), dtype=dtype, count=len(records))
+
+        return cls({
+            "length_in": col(lambda r: r.hull.length_in),
+            "beam_in": col(lambda r: r.hull.beam_in),
+            "depth_in": col(lambda r: r.hull.depth_in),
+            "weight_lbs": col(lambda r: r.hull.weight_lbs),
+            "displacement_ft3": col(lambda r: r.freeboard.displacement_ft3),
+            "draft_in": col(lambda r: r.freeboard.draft_in),
+            "freeboard_in": col(lambda r: r.freeboard.freeboard_in),
+            "gm_in": col(lambda r: r.stability.gm_in),
+            "section_modulus_in3": col(lambda r: r.structural.section_modulus_in3),
+            "max_bending_moment_lb_ft": col(lambda r: r.structural.max_bending_moment_lb_ft),
+            "bending_stress_psi": col(lambda r: r.structural.bending_stress_psi),
+            "safety_factor": col(lambda r: r.structural.safety_factor),
+            "flexural_strength_psi": col(lambda r: r.structural.flexural_strength_psi),
+            "pass_freeboard": col(lambda r: r.freeboard.passed, bool),
+            "pass_stability": col(lambda r: r.stability.passed, bool),
+            "pass_structural": col(lambda r: r.structural.passed, bool),
+            "overall_pass": col(lambda r: r.overall_pass, bool),
+            "diagnostics": col(lambda r: r.diagnostics, np.uint8),
+        })
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, key: str):
+        return self.columns[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def keys(self):
+        return self.columns.keys()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self.columns.values())
+
+    def filter(self, mask) -> "ResultTable":
+        """Rows where mask is True (e.g. table.filter(table["overall_pass"]))."""
+        return ResultTable({k: c[mask] for k, c in self.columns.items()})
+
+    def row(self, i: int) -> AnalysisResult:
+        c = {k: v[i].item() for k, v in self.columns.items()}
+        return AnalysisResult(
+            hull=HullResult(c["length_in"], c["beam_in"], c["depth_in"], c["weight_lbs"]),
+            freeboard=FreeboardResult(
+                c["freeboard_in"], c["draft_in"], c["displacement_ft3"], c["pass_freeboard"],
+            ),
+            stability=StabilityResult(c["gm_in"], c["pass_stability"]),
+            structural=StructuralResult(
+                c["max_bending_moment_lb_ft"], c["bending_stress_psi"],
+                c["section_modulus_in3"], c["safety_factor"],
+                c["flexural_strength_psi"], c["pass_structural"],
+            ),
+            overall_pass=c["overall_pass"],
+            diagnostics=Diagnostic(c.get("diagnostics", 0)),
+        )
+
+
 def waterplane_approximation(
     length_ft: float, beam_ft: float, form_factor: float = 0.70
 ) -> float:
@@ -168,6 +540,22 @@ def calculate_cog_height(
     ) / total
 
 
+def concrete_mix_flags(
+    density_pcf: float,
+    flexural_psi: float,
+    compressive_psi: float = 0.0,
+) -> Diagnostic:
+    """Diagnostic flags for the concrete sanity checks (no side effects)."""
+    flags = Diagnostic.NONE
+    if density_pcf < 40 or density_pcf > 120:
+        flags |= Diagnostic.DENSITY_UNUSUAL
+    if flexural_psi < 300 or flexural_psi > 4000:
+        flags |= Diagnostic.FLEXURAL_UNUSUAL
+    if compressive_psi > 0 and flexural_psi > 0.20 * compressive_psi:
+        flags |= Diagnostic.FLEX_COMP_RATIO_HIGH
+    return flags
+
+
 def validate_concrete_mix(
     density_pcf: float,
     flexural_psi: float,
@@ -175,38 +563,18 @@ def validate_concrete_mix(
 ) -> bool:
     """
     Validate concrete properties are physically reasonable for canoe hulls.
-    Returns True if all checks pass. Issues warnings for each concern.
+    Returns True if all checks pass. Issues warnings for each concern
+    (or collects/raises, per the active diagnostics() mode).
 
     Typical lightweight canoe concrete: 50-80 PCF, f'r 800-2500 psi.
     """
-    ok = True
-
-    if density_pcf < 40 or density_pcf > 120:
-        warnings.warn(
-            f"Density {density_pcf:.0f} pcf is unusual for concrete canoes "
-            "(typical: 50-80 pcf for lightweight mixes).",
-            stacklevel=2,
-        )
-        ok = False
-
-    if flexural_psi < 300 or flexural_psi > 4000:
-        warnings.warn(
-            f"Flexural strength {flexural_psi:.0f} psi is unusual "
-            "(typical: 800-2500 psi for canoe mixes).",
-            stacklevel=2,
-        )
-        ok = False
-
-    if compressive_psi > 0 and flexural_psi > 0.20 * compressive_psi:
-        ratio = flexural_psi / compressive_psi
-        warnings.warn(
-            f"Flexural/compressive ratio {ratio:.1%} is high "
-            "(typically 8-15% per ACI 318-25). Verify test data.",
-            stacklevel=2,
-        )
-        ok = False
-
-    return ok
+    flags = concrete_mix_flags(density_pcf, flexural_psi, compressive_psi)
+    _report_diagnostics(
+        flags, stacklevel=2,
+        density_pcf=density_pcf, flexural_psi=flexural_psi,
+        ratio=flexural_psi / compressive_psi if compressive_psi > 0 else 0.0,
+    )
+    return not flags
 
 
 def estimate_hull_weight(
@@ -271,7 +639,8 @@ def bending_moment_distributed_crew(
 
     Note: This still uses simple-support boundary conditions. A real canoe
     sits on a continuous elastic foundation (water buoyancy), which reduces
-    the actual moment by ~20-40%. This model is therefore conservative.
+    the actual moment by ~20-40%. This model is therefore conservative;
+    calculations.elastic_foundation solves the beam-on-foundation case.
     """
     if length_ft <= 0:
         return 0.0
@@ -281,20 +650,20 @@ def bending_moment_distributed_crew(
     return m_hull + m_crew
 
 
-def section_modulus_thin_shell(
+def thin_shell_section_properties(
     beam_in: float, depth_in: float, thickness_in: float
-) -> float:
+) -> Dict[str, float]:
     """
-    Section modulus (in³) for a thin-shell U-shaped cross-section.
+    Gross section properties of the thin-shell U-shaped cross-section.
 
     Models the hull cross-section as:
       - Bottom plate: beam × thickness
       - Two side walls: thickness × (depth - thickness) each
 
-    Uses parallel axis theorem to compute I about the neutral axis,
-    then S = I / c_max.
-
-    For Canoe 1 (B=30, D=18, t=0.5): Sx ≈ 85 in³ (NOT 1,452 from solid rect).
+    Uses parallel axis theorem to compute I about the neutral axis.
+    Returns area_in2, y_na_in (from the bottom), i_in4 and c_max_in; all
+    zero for a degenerate section. Also accepts NumPy arrays (broadcast
+    against each other), returning arrays with the same per-element values.
     """
     b = beam_in
     t = thickness_in
@@ -317,9 +686,15 @@ def section_modulus_thin_shell(
 
     # --- Composite neutral axis ---
     total_area = a_bot + 2.0 * a_wall
-    if total_area <= 0:
-        return 0.0
-    y_na = (a_bot * y_bot + 2.0 * a_wall * y_wall) / total_area
+    vectorized = getattr(total_area, "ndim", 0) > 0
+    if vectorized:
+        import numpy as np
+        ok = total_area > 0
+        y_na = (a_bot * y_bot + 2.0 * a_wall * y_wall) / np.where(ok, total_area, 1.0)
+    elif total_area <= 0:
+        return {"area_in2": 0.0, "y_na_in": 0.0, "i_in4": 0.0, "c_max_in": 0.0}
+    else:
+        y_na = (a_bot * y_bot + 2.0 * a_wall * y_wall) / total_area
 
     # --- Parallel axis theorem for total I about NA ---
     i_total = (
@@ -327,17 +702,48 @@ def section_modulus_thin_shell(
         + 2.0 * (i_wall_self + a_wall * (y_wall - y_na) ** 2)
     )
 
-    # --- Section modulus: S = I / c_max ---
     c_top = d - y_na  # distance from NA to top fiber
     c_bot = y_na       # distance from NA to bottom fiber
-    c_max = max(c_top, c_bot)
+    if vectorized:
+        return {
+            "area_in2": np.where(ok, total_area, 0.0),
+            "y_na_in": np.where(ok, y_na, 0.0),
+            "i_in4": np.where(ok, i_total, 0.0),
+            "c_max_in": np.where(ok, np.maximum(c_top, c_bot), 0.0),
+        }
+    return {
+        "area_in2": total_area,
+        "y_na_in": y_na,
+        "i_in4": i_total,
+        "c_max_in": max(c_top, c_bot),
+    }
+
+
+def section_modulus_thin_shell(
+    beam_in: float, depth_in: float, thickness_in: float
+) -> float:
+    """
+    Section modulus (in³) for a thin-shell U-shaped cross-section.
+
+    S = I / c_max with I and c_max from thin_shell_section_properties().
+    Accepts NumPy arrays like thin_shell_section_properties().
 
-    if c_max <= 0:
+    For Canoe 1 (B=30, D=18, t=0.5): Sx ≈ 85 in³ (NOT 1,452 from solid rect).
+    """
+    props = thin_shell_section_properties(beam_in, depth_in, thickness_in)
+    c_max = props["c_max_in"]
+
+    if getattr(c_max, "ndim", 0) > 0:
+        import numpy as np
+        # Degenerate sections come back with c_max = 0
+        ok = c_max > 0
+        return np.where(ok, (props["i_in4"] / np.where(ok, c_max, 1.0)) * 0.75, 0.0)
+    if props["area_in2"] <= 0 or c_max <= 0:
         return 0.0
 
     # ACI 318 thin-shell reduction: 0.75 factor accounts for
     # curvature effects and microcracking in thin concrete shells
-    return (i_total / c_max) * 0.75
+    return (props["i_in4"] / c_max) * 0.75
 
 
 # Keep old function for backward compatibility but mark deprecated
@@ -365,6 +771,49 @@ def safety_factor(ultimate_stress_psi: float, design_stress_psi: float) -> float
     return ultimate_stress_psi / design_stress_psi
 
 
+def _analysis_diagnostic_values(
+    hull_length_in: float,
+    hull_beam_in: float,
+    hull_depth_in: float,
+    hull_thickness_in: float,
+    concrete_weight_lbs: float,
+    flexural_strength_psi: float = 1500,
+    concrete_density_pcf: float = 60.0,
+    **_unused,
+) -> Dict[str, float]:
+    """Message values for the run_complete_analysis input checks."""
+    estimated_weight = estimate_hull_weight(
+        hull_length_in, hull_beam_in, hull_depth_in,
+        hull_thickness_in, concrete_density_pcf,
+    )
+    weight_diff_pct = (abs(concrete_weight_lbs - estimated_weight) / estimated_weight * 100) if estimated_weight > 0 else 0.0
+    return {
+        "density_pcf": concrete_density_pcf,
+        "flexural_psi": flexural_strength_psi,
+        "weight_lbs": concrete_weight_lbs,
+        "estimated_lbs": estimated_weight,
+        "weight_diff_pct": weight_diff_pct,
+    }
+
+
+def replay_diagnostics(
+    result: Dict[str, Any], arguments: Mapping, stacklevel: int = 1
+) -> Dict[str, Any]:
+    """
+    Report the flags stored on a run_complete_analysis result again, under
+    the active diagnostics() mode, as if it had just been evaluated.
+
+    For results served from a cache. arguments are the call's bound
+    arguments (inspect.BoundArguments.arguments). result["diagnostics"] is
+    restored to a Diagnostic (a JSON round-trip leaves a plain int).
+    """
+    flags = Diagnostic(result["diagnostics"])
+    result["diagnostics"] = flags
+    values = _analysis_diagnostic_values(**arguments) if flags else {}
+    _report_diagnostics(flags, stacklevel=stacklevel + 1, **values)
+    return result
+
+
 def run_complete_analysis(
     hull_length_in: float,
     hull_beam_in: float,
@@ -375,6 +824,8 @@ def run_complete_analysis(
     waterplane_form_factor: float = 0.70,
     concrete_density_pcf: float = 60.0,
     crew_weight_lbs: float = 700.0,
+    hydrostatic_table=None,
+    as_record: bool = False,
 ) -> Dict[str, Any]:
     """
     Run full hull analysis. All dimensions in inches, weight in lbs.
@@ -386,6 +837,12 @@ def run_complete_analysis(
                        Set to 0 if concrete_weight_lbs already includes crew.
       waterplane_form_factor: Cwp waterplane coefficient (default 0.70).
       concrete_density_pcf: Concrete density (lb/ft³), used for weight check.
+      hydrostatic_table: Optional HydrostaticTable (calculations.hydrostatics).
+                         When given, draft, KB and BM come from the station-
+                         offset curves scaled to L × B × D instead of the
+                         Cwp box model, and waterplane_form_factor is unused.
+      as_record: Return a frozen AnalysisResult instead of nested dicts
+                 (AnalysisResult.as_dict() gives a dict-compatible view).
     """
     hull = HullGeometry(
         length_in=hull_length_in,
@@ -395,31 +852,32 @@ def run_complete_analysis(
     )
 
     # --- Material validation ---
-    validate_concrete_mix(concrete_density_pcf, flexural_strength_psi)
+    diag = concrete_mix_flags(concrete_density_pcf, flexural_strength_psi)
 
     # --- Fix 3: Weight verification ---
-    estimated_weight = estimate_hull_weight(
-        hull_length_in, hull_beam_in, hull_depth_in,
-        hull_thickness_in, concrete_density_pcf,
+    values = _analysis_diagnostic_values(
+        hull_length_in, hull_beam_in, hull_depth_in, hull_thickness_in,
+        concrete_weight_lbs, flexural_strength_psi, concrete_density_pcf,
     )
-    weight_diff_pct = (abs(concrete_weight_lbs - estimated_weight) / estimated_weight * 100) if estimated_weight > 0 else 0.0
-    if weight_diff_pct > 20:
-        warnings.warn(
-            f"Provided hull weight ({concrete_weight_lbs:.0f} lbs) differs from "
-            f"estimated ({estimated_weight:.0f} lbs) by {weight_diff_pct:.0f}%. "
-            f"Check your weight input.",
-            stacklevel=2,
-        )
+    if values["weight_diff_pct"] > 20:
+        diag |= Diagnostic.WEIGHT_MISMATCH
+    _report_diagnostics(diag, stacklevel=2, **values)
 
     # --- Fix 6: Total displacement includes crew ---
     total_weight_lbs = concrete_weight_lbs + crew_weight_lbs
 
     # Hydrostatics (using total loaded weight for displacement)
     disp_ft3 = displacement_volume(total_weight_lbs)
-    wp_ft2 = waterplane_approximation(
-        hull.length_ft, hull.beam_ft, waterplane_form_factor
-    )
-    draft_ft = draft_from_displacement(disp_ft3, wp_ft2)
+    if hydrostatic_table is not None:
+        curves = hydrostatic_table.at_weight(
+            total_weight_lbs, hull_length_in, hull_beam_in, hull_depth_in
+        )
+        draft_ft = float(curves["draft_ft"])
+    else:
+        wp_ft2 = waterplane_approximation(
+            hull.length_ft, hull.beam_ft, waterplane_form_factor
+        )
+        draft_ft = draft_from_displacement(disp_ft3, wp_ft2)
     draft_in = draft_ft * INCHES_PER_FOOT
     fb_ft = freeboard(hull.depth_ft, draft_ft)
     fb_in = fb_ft * INCHES_PER_FOOT
@@ -431,11 +889,16 @@ def run_complete_analysis(
         concrete_weight_lbs, hull_cog_ft,
         crew_weight_lbs, crew_cog_ft,
     )
-    gm_ft = metacentric_height_approx(
-        hull.beam_ft, draft_ft, hull.depth_ft, cog_approx_ft,
-        length_ft=hull.length_ft,
-        waterplane_coeff=waterplane_form_factor,
-    )
+    if hydrostatic_table is not None:
+        kg_ft = cog_approx_ft if cog_approx_ft > 0 else hull.depth_ft * 0.4
+        kb_bm_ft = float(curves["kb_ft"] + curves["bm_ft"])
+        gm_ft = kb_bm_ft - kg_ft if draft_ft > 0 else 0.0
+    else:
+        gm_ft = metacentric_height_approx(
+            hull.beam_ft, draft_ft, hull.depth_ft, cog_approx_ft,
+            length_ft=hull.length_ft,
+            waterplane_coeff=waterplane_form_factor,
+        )
     gm_in = gm_ft * INCHES_PER_FOOT
 
     # Structural (Fix 2: thin-shell section modulus)
@@ -448,15 +911,32 @@ def run_complete_analysis(
     sf = safety_factor(flexural_strength_psi, sigma_psi)
 
     # Pass/Fail — Fix 5: corrected ASCE 2026 thresholds
-    min_freeboard_in = 6.0
-    min_gm_in = 6.0
-    min_sf = 2.0
+    min_freeboard_in = MIN_FREEBOARD_IN
+    min_gm_in = MIN_GM_IN
+    min_sf = MIN_SAFETY_FACTOR
 
     pass_freeboard = fb_in >= min_freeboard_in
     pass_stability = gm_in >= min_gm_in
     pass_structural = sf >= min_sf
     is_adequate = pass_structural
 
+    if as_record:
+        return AnalysisResult(
+            hull=HullResult(
+                hull_length_in, hull_beam_in, hull_depth_in, concrete_weight_lbs,
+            ),
+            freeboard=FreeboardResult(
+                fb_in, draft_in, disp_ft3, pass_freeboard, min_freeboard_in,
+            ),
+            stability=StabilityResult(gm_in, pass_stability, min_gm_in),
+            structural=StructuralResult(
+                m_max_lb_ft, sigma_psi, s_in3, sf, flexural_strength_psi,
+                pass_structural, min_sf,
+            ),
+            overall_pass=pass_freeboard and pass_stability and pass_structural,
+            diagnostics=diag,
+        )
+
     return {
         "hull": {
             "length_in": hull_length_in,
@@ -488,6 +968,134 @@ def run_complete_analysis(
             "min_sf": min_sf,
         },
         "overall_pass": pass_freeboard and pass_stability and pass_structural,
+        "diagnostics": diag,
+    }
+
+
+def run_complete_analysis_batch(
+    hull_length_in,
+    hull_beam_in,
+    hull_depth_in,
+    hull_thickness_in,
+    concrete_weight_lbs,
+    flexural_strength_psi=1500,
+    waterplane_form_factor=0.70,
+    concrete_density_pcf=60.0,
+    crew_weight_lbs=700.0,
+    hydrostatic_table=None,
+) -> Dict[str, Any]:
+    """
+    Vectorized run_complete_analysis over NumPy arrays (or scalars).
+
+    All inputs broadcast against each other, so a sweep can pass 1-D arrays
+    for the swept parameters and scalars for the fixed ones. Returns a
+    columnar dict of arrays (one entry per metric) rather than nested dicts;
+    wrap it in ResultTable for row access and filtering.
+
+    The arithmetic mirrors the scalar path operation-for-operation, so each
+    element matches run_complete_analysis() to floating-point round-off.
+    Guards (zero waterplane, zero draft, zero section modulus) follow the
+    scalar functions. No warnings are issued; "diagnostics" carries the
+    Diagnostic bit flags per design and "weight_diff_pct" the raw weight
+    check.
+
+    hydrostatic_table behaves as in run_complete_analysis: draft, KB and BM
+    become interpolated lookups on the station-offset curves.
+    """
+    import numpy as np
+
+    L_in, B_in, D_in, t_in, w_hull, f_r, cwp, rho, w_crew = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            hull_length_in, hull_beam_in, hull_depth_in, hull_thickness_in,
+            concrete_weight_lbs, flexural_strength_psi, waterplane_form_factor,
+            concrete_density_pcf, crew_weight_lbs,
+        ))
+    )
+    length_ft = L_in / INCHES_PER_FOOT
+    beam_ft = B_in / INCHES_PER_FOOT
+    depth_ft = D_in / INCHES_PER_FOOT
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # --- Weight verification (reported, not warned) ---
+        est_w = estimate_hull_weight(L_in, B_in, D_in, t_in, rho)
+        weight_diff_pct = np.where(
+            est_w > 0, np.abs(w_hull - est_w) / est_w * 100, 0.0
+        )
+
+        # --- Hydrostatics ---
+        total_w = w_hull + w_crew
+        disp_ft3 = total_w / WATER_DENSITY_LB_PER_FT3
+        if hydrostatic_table is not None:
+            curves = hydrostatic_table.at_weight(total_w, L_in, B_in, D_in)
+            draft_ft = curves["draft_ft"]
+        else:
+            wp_ft2 = length_ft * beam_ft * cwp
+            draft_ft = np.where(wp_ft2 > 0, disp_ft3 / wp_ft2, 0.0)
+        fb_in = np.maximum(0.0, depth_ft - draft_ft) * INCHES_PER_FOOT
+
+        # --- Stability (same COG and Bouguer BM as the scalar path) ---
+        hull_cog_ft = depth_ft * 0.38
+        crew_cog_ft = 10.0 / INCHES_PER_FOOT
+        cog_ft = np.where(
+            total_w > 0,
+            (w_hull * hull_cog_ft + w_crew * crew_cog_ft) / total_w,
+            0.0,
+        )
+        kg_ft = np.where(cog_ft > 0, cog_ft, depth_ft * 0.4)
+        if hydrostatic_table is not None:
+            gm_ft = np.where(
+                draft_ft > 0, curves["kb_ft"] + curves["bm_ft"] - kg_ft, 0.0
+            )
+        else:
+            i_wp = cwp * length_ft * (beam_ft ** 3) / 12.0
+            v_disp = cwp * length_ft * beam_ft * draft_ft
+            bm_ft = i_wp / v_disp
+            gm_ft = np.where(
+                (draft_ft > 0) & (v_disp > 0), draft_ft / 2.0 + bm_ft - kg_ft, 0.0
+            )
+        gm_in = gm_ft * INCHES_PER_FOOT
+
+        # --- Structural ---
+        m_max = np.where(
+            length_ft > 0,
+            (w_hull / length_ft) * (length_ft ** 2) / 8.0
+            + w_crew * length_ft / 4.0,
+            0.0,
+        )
+        s_in3 = section_modulus_thin_shell(B_in, D_in, t_in)
+        sigma = np.where(s_in3 > 0, m_max * INCHES_PER_FOOT / s_in3, 0.0)
+        sf = np.where(sigma > 0, f_r / sigma, 0.0)
+
+    diag = (
+        np.where((rho < 40) | (rho > 120), int(Diagnostic.DENSITY_UNUSUAL), 0)
+        | np.where((f_r < 300) | (f_r > 4000), int(Diagnostic.FLEXURAL_UNUSUAL), 0)
+        | np.where(weight_diff_pct > 20, int(Diagnostic.WEIGHT_MISMATCH), 0)
+    ).astype(np.uint8)
+
+    pass_fb = fb_in >= MIN_FREEBOARD_IN
+    pass_gm = gm_in >= MIN_GM_IN
+    pass_sf = sf >= MIN_SAFETY_FACTOR
+
+    return {
+        "length_in": L_in,
+        "beam_in": B_in,
+        "depth_in": D_in,
+        "weight_lbs": w_hull,
+        "weight_diff_pct": weight_diff_pct,
+        "displacement_ft3": disp_ft3,
+        "draft_in": draft_ft * INCHES_PER_FOOT,
+        "freeboard_in": fb_in,
+        "gm_in": gm_in,
+        "section_modulus_in3": s_in3,
+        "max_bending_moment_lb_ft": m_max,
+        "bending_stress_psi": sigma,
+        "safety_factor": sf,
+        "flexural_strength_psi": f_r,
+        "pass_freeboard": pass_fb,
+        "pass_stability": pass_gm,
+        "pass_structural": pass_sf,
+        "overall_pass": pass_fb & pass_gm & pass_sf,
+        "diagnostics": diag,
     }
 
 
@@ -533,7 +1141,7 @@ def print_design_summary(results: Dict[str, Any], design_name: str = "Canoe") ->
 def main() -> None:
     """CLI entry - run analysis for default Canoe 1."""
     print("=" * 60)
-    print("NAU Concrete Canoe 2026 - Hull Analysis (v2.1)")
+    print(f"NAU Concrete Canoe 2026 - Hull Analysis (v{MODEL_VERSION})")
     print("=" * 60)
 
     # Canoe 1: 18' × 30" × 18", 276 lbs, density 70 pcf
@@ -561,10 +1169,13 @@ def visualize_hull_analysis(
     crew_weight_lbs: float = 700,
     save: bool = True,
     show: bool = False,
+    sections=None,
 ):
     """
     Create 4 plots: Hull profile, cross-sections, stability curve, load distribution.
     save=True writes PNGs to reports/figures/; show=True displays (needs display).
+    sections: optional cross_curves.SectionSet; when given, the stability
+    curve is the large-angle GZ from cross curves instead of GM·sin(φ).
     Returns list of figure objects.
     """
     try:
@@ -628,7 +1239,16 @@ def visualize_hull_analysis(
     fig3, ax3 = plt.subplots(figsize=(7, 4))
     gm_in = results["stability"]["gm_in"]
     angles = np.linspace(0, 90, 91)
-    gz = gm_in * np.sin(np.deg2rad(angles))
+    if sections is not None:
+        from calculations.cross_curves import gz_curve
+        kg_ft = calculate_cog_height(
+            concrete_weight_lbs, hull.depth_ft * 0.38,
+            crew_weight_lbs, 10.0 / INCHES_PER_FOOT,
+        )
+        curve = gz_curve(sections, concrete_weight_lbs + crew_weight_lbs, kg_ft, angles)
+        gz = curve["gz_ft"] * INCHES_PER_FOOT
+    else:
+        gz = gm_in * np.sin(np.deg2rad(angles))
     ax3.plot(angles, gz, "b-", lw=2)
     ax3.axhline(0, color="gray", ls="--")
     ax3.set_xlabel("Heel angle (deg)")
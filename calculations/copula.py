@@ -0,0 +1,172 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Correlated Input Sampling (Gaussian Copula)
+
+Draws the uncertain inputs jointly instead of independently. Each input
+has its own marginal distribution (MARGINALS registry: truncated normal,
+lognormal, uniform, triangular; extend with register_marginal) and the
+dependence between them is a Gaussian copula:
+
+    z = ε · Lᵀ,   ε ~ N(0, I),   L = cholesky(R)
+    x_j = F_j⁻¹( Φ(z_j) )
+
+R is the correlation of the underlying normals (for near-normal marginals
+it is close to the Pearson correlation of the inputs). The Cholesky factor
+is computed once when the copula is built, so a draw is one (n, d) matrix
+product plus one vectorized inverse CDF per column - the cost per sample
+grows with d, not with any per-sample Python work.
+
+sample() returns a dict of arrays named after the inputs, ready for
+monte_carlo.evaluate(**draw): the four material/crew inputs plus any of
+monte_carlo.VARIABLE_BASE (hull dimensions, Cwp, crew position).
+"""
+
+import math
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+from calculations.monte_carlo import UNCERTAINTIES
+from calculations.sampling import truncated_normal_ppf, unit_points
+
+Marginal = Callable[[np.ndarray, Dict], np.ndarray]
+
+
+def _normal(u, p):
+    return truncated_normal_ppf(u, p["mean"], p["std"], p.get("low", -math.inf),
+                                p.get("high", math.inf))
+
+
+def _lognormal(u, p):
+    # mean/std of the variable itself, converted to the log-space parameters
+    s2 = math.log1p((p["std"] / p["mean"]) ** 2)
+    return np.exp(math.log(p["mean"]) - s2 / 2 + math.sqrt(s2) * ndtri(u))
+
+
+def _uniform(u, p):
+    return p["low"] + u * (p["high"] - p["low"])
+
+
+def _triangular(u, p):
+    a, c, b = p["low"], p["mode"], p["high"]
+    f = (c - a) / (b - a)
+    return np.where(u < f, a + np.sqrt(u * (b - a) * (c - a)),
+                    b - np.sqrt((1 - u) * (b - a) * (b - c)))
+
+
+# dist name -> inverse CDF (u, spec) -> x; specs without "dist" are "normal"
+MARGINALS: Dict[str, Marginal] = {
+    "normal": _normal,
+    "lognormal": _lognormal,
+    "uniform": _uniform,
+    "triangular": _triangular,
+}
+
+
+def register_marginal(name: str, ppf: Marginal) -> None:
+    """Add a marginal: a vectorized inverse CDF (u, spec) -> x."""
+    MARGINALS[name] = ppf
+
+
+# Build tolerances and crew placement, in the UNCERTAINTIES format
+GEOMETRY_UNCERTAINTIES = {
+    "L":   {"mean": 192.0, "std": 0.25, "low": 191.0, "high": 193.0,
+            "label": "Length (in)", "pct": "±0.5\""},
+    "B":   {"mean": 32.0,  "std": 0.125, "low": 31.5, "high": 32.5,
+            "label": "Beam (in)", "pct": "±0.25\""},
+    "D":   {"mean": 17.0,  "std": 0.125, "low": 16.5, "high": 17.5,
+            "label": "Depth (in)", "pct": "±0.25\""},
+    "cwp": {"mean": 0.70,  "std": 0.02, "low": 0.62, "high": 0.78,
+            "label": "Waterplane Coefficient", "pct": "±3%"},
+    "crew_offset_ft": {"dist": "uniform", "mean": 0.0, "low": -1.0, "high": 1.0,
+                       "label": "Crew Offset from Midship (ft)", "pct": "±1 ft"},
+    "crew_cog_in": {"dist": "triangular", "mean": 10.67, "low": 8.0, "mode": 10.0,
+                    "high": 14.0, "label": "Crew COG Height (in)", "pct": "8–14\""},
+}
+
+CORRELATED_UNCERTAINTIES = {**UNCERTAINTIES, **GEOMETRY_UNCERTAINTIES}
+
+# Correlations of the underlying normals; unlisted pairs are independent.
+# Denser mixes (less lightweight aggregate) are stronger; the walls of a
+# hull laid up thick also tend to end up dense from extra compaction;
+# beam and depth come off the same mold scaling.
+DEFAULT_CORRELATIONS = {
+    ("density", "flexural"): 0.6,
+    ("density", "thickness"): 0.2,
+    ("B", "D"): 0.3,
+}
+
+
+def correlation_matrix(names, pairs: Mapping[Tuple[str, str], float]) -> np.ndarray:
+    """Symmetric matrix over names from {(a, b): rho} pairs, unit diagonal."""
+    index = {n: i for i, n in enumerate(names)}
+    r = np.eye(len(names))
+    for (a, b), rho in pairs.items():
+        if a not in index or b not in index:
+            raise ValueError(f"correlation pair ({a!r}, {b!r}) names an unknown input")
+        r[index[a], index[b]] = r[index[b], index[a]] = rho
+    return r
+
+
+class GaussianCopula:
+    """
+    Joint sampler for named inputs with arbitrary marginals.
+
+    correlation is a (d, d) matrix in the order of marginals, or a
+    {(a, b): rho} mapping (see correlation_matrix). It must be symmetric,
+    unit-diagonal and positive definite; the Cholesky factor is cached.
+    """
+
+    def __init__(self, marginals: Dict[str, Dict] = CORRELATED_UNCERTAINTIES,
+                 correlation=None):
+        self.marginals = dict(marginals)
+        self.names = tuple(self.marginals)
+        for name, spec in self.marginals.items():
+            dist = spec.get("dist", "normal")
+            if dist not in MARGINALS:
+                raise ValueError(f"{name}: unknown marginal {dist!r}; "
+                                 f"choose from {sorted(MARGINALS)}")
+        if correlation is None:
+            correlation = {k: v for k, v in DEFAULT_CORRELATIONS.items()
+                           if k[0] in self.marginals and k[1] in self.marginals}
+        if isinstance(correlation, Mapping):
+            correlation = correlation_matrix(self.names, correlation)
+        r = np.asarray(correlation, dtype=float)
+        d = len(self.names)
+        if r.shape != (d, d):
+            raise ValueError(f"correlation matrix must be {d}x{d}, got {r.shape}")
+        if not np.allclose(r, r.T) or not np.allclose(np.diag(r), 1.0):
+            raise ValueError("correlation matrix must be symmetric with a unit diagonal")
+        try:
+            self.cholesky = np.linalg.cholesky(r)
+        except np.linalg.LinAlgError:
+            raise ValueError("correlation matrix is not positive definite") from None
+        self.correlation = r
+
+    @property
+    def dim(self) -> int:
+        return len(self.names)
+
+    def transform(self, z: np.ndarray) -> Dict[str, np.ndarray]:
+        """Independent standard normals (n, d) -> correlated inputs."""
+        u = ndtr(z @ self.cholesky.T)
+        return {
+            name: MARGINALS[spec.get("dist", "normal")](u[:, j], spec)
+            for j, (name, spec) in enumerate(self.marginals.items())
+        }
+
+    def from_unit(self, u: np.ndarray) -> Dict[str, np.ndarray]:
+        """Unit-hypercube points (n, d), e.g. from a QMC sampler -> inputs."""
+        eps = np.finfo(float).eps
+        return self.transform(ndtri(np.clip(u, eps, 1 - eps)))
+
+    def sample(self, rng: np.random.Generator, n: int,
+               sampler: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """n joint draws; sampler names a sampling.SAMPLERS point set."""
+        if sampler is None:
+            return self.transform(rng.standard_normal((n, self.dim)))
+        return self.from_unit(unit_points(sampler, rng, n, self.dim))
+
+    def config(self) -> Dict:
+        """JSON-able description (for checkpoints and run metadata)."""
+        return {"marginals": self.marginals, "correlation": self.correlation.tolist()}
@@ -0,0 +1,223 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Moving-Crew Shear/Moment Envelopes
+
+generate_structural_fbd.compute_shear_moment() evaluates one crew layout.
+Here the hull girder is treated as a rigid floating beam and every
+admissible layout is swept at once through influence lines.
+
+A unit load at x = p is carried by buoyancy of fixed shape β(x) (∫β = 1,
+centroid x_b) plus a trim component τ(x) = β(x)·(x - x_b) / ∫β(x - x_b)²,
+which adds no force and restores moment equilibrium for off-centre loads.
+With Bc, Bm (and Tc, Tm) the first and second cumulative integrals of β
+(and τ), the influence lines at stations x are
+
+    V_p(x) = Bc(x) + (p - x_b)·Tc(x) - H(x - p)
+    M_p(x) = Bm(x) + (p - x_b)·Tm(x) - (x - p)⁺
+
+(upward positive, moment sagging positive). With candidate seat positions
+s_1..s_S precomputed as rows of IV, IM (S × n_x), a layout is a weight
+vector over seats, and any number of layouts is one matrix product
+
+    V = W @ IV,  M = W @ IM        W: (n_layouts, S)
+
+done in chunks that are reduced to max/min envelopes on the fly. The hull
+self-weight (uniform, on the same buoyancy) is added as a dead-load line.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_STATIONS = 401
+DEFAULT_CHUNK = 8192
+
+
+def sine_buoyancy(xi: np.ndarray) -> np.ndarray:
+    """Buoyancy shape used by the FBD figure: sin(πξ)^0.6."""
+    return np.sin(np.pi * np.clip(xi, 0.0, 1.0)) ** 0.6
+
+
+def _cumtrapz(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Cumulative trapezoid, starting at zero."""
+    out = np.zeros_like(y)
+    out[1:] = np.cumsum(0.5 * (y[1:] + y[:-1]) * np.diff(x))
+    return out
+
+
+@dataclass
+class InfluenceLines:
+    """Shear and moment influence lines for a set of candidate seats."""
+    x_ft: np.ndarray          # (n_x,) stations
+    seats_ft: np.ndarray      # (S,) candidate load positions
+    shear: np.ndarray         # (S, n_x) V at x per unit load at seat
+    moment: np.ndarray        # (S, n_x) M at x per unit load at seat
+    dead_shear: np.ndarray    # (n_x,) hull self-weight on its buoyancy
+    dead_moment: np.ndarray   # (n_x,)
+
+    @classmethod
+    def build(
+        cls,
+        length_ft: float,
+        seats_ft: Sequence[float],
+        hull_weight_lbs: float = 0.0,
+        buoyancy_shape: Optional[Callable[[np.ndarray], np.ndarray]] = sine_buoyancy,
+        n_stations: int = DEFAULT_STATIONS,
+    ) -> "InfluenceLines":
+        """
+        Precompute influence lines for loads at seats_ft on a hull of
+        length_ft. buoyancy_shape(ξ) gives the relative buoyancy along the
+        hull (ξ = x/L); None means uniform. Seat positions are merged into
+        the station grid so peak values are sampled exactly.
+        """
+        seats = np.asarray(seats_ft, dtype=float)
+        x = np.union1d(np.linspace(0.0, length_ft, n_stations), seats)
+
+        if buoyancy_shape is None:
+            beta = np.ones_like(x)
+        else:
+            beta = np.asarray(buoyancy_shape(x / length_ft), dtype=float)
+        beta = beta / _cumtrapz(beta, x)[-1]
+        x_b = _cumtrapz(beta * x, x)[-1]
+        tau = beta * (x - x_b)
+        tau = tau / _cumtrapz(tau * (x - x_b), x)[-1]
+
+        bc, tc = _cumtrapz(beta, x), _cumtrapz(tau, x)
+        bm, tm = _cumtrapz(bc, x), _cumtrapz(tc, x)
+
+        arm = seats[:, None] - x_b
+        shear = bc + arm * tc - (x >= seats[:, None])
+        moment = bm + arm * tm - np.maximum(x - seats[:, None], 0.0)
+
+        # Uniform self-weight acts at midship; the trim term is zero only
+        # when β is symmetric.
+        w = hull_weight_lbs / length_ft
+        x_g = 0.5 * length_ft
+        dead_shear = hull_weight_lbs * (bc + (x_g - x_b) * tc) - w * x
+        dead_moment = hull_weight_lbs * (bm + (x_g - x_b) * tm) - 0.5 * w * x**2
+        return cls(x, seats, shear, moment, dead_shear, dead_moment)
+
+    def evaluate(self, seat_index: np.ndarray, loads: np.ndarray) -> Dict[str, np.ndarray]:
+        """Full V(x), M(x) for a few layouts, shape (n_layouts, n_x)."""
+        W = _layout_matrix(np.atleast_2d(seat_index), np.atleast_2d(loads), len(self.seats_ft))
+        return {
+            "shear_lb": W @ self.shear + self.dead_shear,
+            "moment_lb_ft": W @ self.moment + self.dead_moment,
+        }
+
+
+def _layout_matrix(seat_index: np.ndarray, loads: np.ndarray, n_seats: int) -> np.ndarray:
+    """Dense (n_layouts, S) seat-load matrix."""
+    W = np.zeros((seat_index.shape[0], n_seats))
+    rows = np.broadcast_to(np.arange(seat_index.shape[0])[:, None], seat_index.shape)
+    np.add.at(W, (rows, seat_index), loads)
+    return W
+
+
+def crew_layouts(
+    seat_options_ft: Sequence[Sequence[float]],
+    paddler_weights_lbs: Sequence[float],
+    min_spacing_ft: float = 0.0,
+    permute_weights: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Enumerate admissible layouts.
+
+    seat_options_ft[i] lists the positions paddler slot i may take; one
+    position is picked per slot (Cartesian product), and combinations with
+    adjacent paddlers closer than min_spacing_ft are dropped. With
+    permute_weights every distinct assignment of paddler_weights_lbs to the
+    slots is included.
+
+    Returns (seats_ft, seat_index, loads): the sorted unique positions and,
+    per layout, the index into seats_ft and the load of each paddler.
+    """
+    n = len(seat_options_ft)
+    if len(paddler_weights_lbs) != n:
+        raise ValueError("need one paddler weight per seat slot")
+    seats = np.unique(np.concatenate([np.asarray(s, dtype=float) for s in seat_options_ft]))
+    choice = np.array(list(itertools.product(
+        *(np.searchsorted(seats, np.asarray(s, dtype=float)) for s in seat_options_ft)
+    )))
+    pos = seats[choice]
+    if n > 1:
+        gaps = np.diff(np.sort(pos, axis=1), axis=1)
+        choice = choice[(gaps >= min_spacing_ft - 1e-12).all(axis=1)]
+
+    weights = np.asarray(paddler_weights_lbs, dtype=float)
+    perms = (np.array(sorted(set(itertools.permutations(weights))))
+             if permute_weights else weights[None, :])
+    seat_index = np.repeat(choice, len(perms), axis=0)
+    loads = np.tile(perms, (len(choice), 1))
+    return seats, seat_index, loads
+
+
+def envelope(
+    lines: InfluenceLines,
+    seat_index: np.ndarray,
+    loads: np.ndarray,
+    chunk_size: int = DEFAULT_CHUNK,
+) -> Dict[str, np.ndarray]:
+    """
+    Max/min shear and moment over all layouts at every station.
+
+    Returns the four envelope curves (n_x,), the layout index that governs
+    each envelope at each station, and the overall governing layouts for
+    peak sagging, hogging and |V|, with their values.
+    """
+    seat_index = np.atleast_2d(seat_index)
+    loads = np.broadcast_to(np.atleast_2d(loads), seat_index.shape)
+    n_layouts, n_x = seat_index.shape[0], len(lines.x_ft)
+    S = len(lines.seats_ft)
+
+    out = {
+        "shear_max_lb": np.full(n_x, -np.inf),
+        "shear_min_lb": np.full(n_x, np.inf),
+        "moment_max_lb_ft": np.full(n_x, -np.inf),
+        "moment_min_lb_ft": np.full(n_x, np.inf),
+    }
+    arg = {k: np.zeros(n_x, dtype=np.int64) for k in out}
+
+    for start in range(0, n_layouts, chunk_size):
+        stop = min(start + chunk_size, n_layouts)
+        W = _layout_matrix(seat_index[start:stop], loads[start:stop], S)
+        for key, table, dead in (
+            ("shear", lines.shear, lines.dead_shear),
+            ("moment", lines.moment, lines.dead_moment),
+        ):
+            vals = W @ table
+            vals += dead
+            unit = "lb" if key == "shear" else "lb_ft"
+            for kind, pick, better in (("max", np.argmax, np.greater),
+                                       ("min", np.argmin, np.less)):
+                name = f"{key}_{kind}_{unit}"
+                k = pick(vals, axis=0)
+                v = vals[k, np.arange(n_x)]
+                upd = better(v, out[name])
+                out[name] = np.where(upd, v, out[name])
+                arg[name] = np.where(upd, k + start, arg[name])
+
+    result = {"x_ft": lines.x_ft, "n_layouts": n_layouts}
+    result.update(out)
+    result.update({f"{k}_layout": v for k, v in arg.items()})
+
+    i = int(np.argmax(out["moment_max_lb_ft"]))
+    j = int(np.argmin(out["moment_min_lb_ft"]))
+    v_abs = np.maximum(out["shear_max_lb"], -out["shear_min_lb"])
+    k = int(np.argmax(v_abs))
+    result.update({
+        "max_sagging_lb_ft": float(out["moment_max_lb_ft"][i]),
+        "max_sagging_x_ft": float(lines.x_ft[i]),
+        "max_sagging_layout": int(arg["moment_max_lb_ft"][i]),
+        "max_hogging_lb_ft": float(-out["moment_min_lb_ft"][j]),
+        "max_hogging_x_ft": float(lines.x_ft[j]),
+        "max_hogging_layout": int(arg["moment_min_lb_ft"][j]),
+        "max_shear_lb": float(v_abs[k]),
+        "max_shear_x_ft": float(lines.x_ft[k]),
+        "max_shear_layout": int(
+            arg["shear_max_lb"][k] if out["shear_max_lb"][k] >= -out["shear_min_lb"][k]
+            else arg["shear_min_lb"][k]
+        ),
+    })
+    return result
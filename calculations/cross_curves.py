@@ -0,0 +1,325 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Large-Angle Stability (Cross Curves / GZ)
+
+Replaces the wall-sided GZ formula with a direct calculation on the
+station sections from design/dxf_coords_design_*.txt.
+
+For each heel angle φ the hull is rotated (starboard down) and the
+waterline height c is found such that the immersed volume equals the
+displacement. The immersed area and centroid of every section come from
+Green's theorem on the section outline clipped to Z ≤ c:
+
+  A    = ∮ Y dZ        ∫∫ Y dA = ∮ Y²/2 dZ
+
+Along the waterline chord dZ = 0, so only the (clipped) outline edges
+contribute — no polygon clipping or ordering is needed, and every
+(angle, station, edge) term is one broadcast NumPy expression.
+Sections are integrated along the length with Simpson weights, and c is
+solved for all angles at once by a bracketed Newton iteration.
+
+  KN = horizontal distance from keel K to the centre of buoyancy
+  GZ = KN − KG · sin φ
+
+Assumptions: fixed (even-keel) trim, and the outline is closed at the
+sheer, i.e. the hull is treated as watertight past deck-edge immersion.
+An open canoe floods at the deck-edge angle, which is reported so the
+curve can be cut there.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    INCHES_PER_FOOT,
+    WATER_DENSITY_LB_PER_FT3,
+)
+from calculations.hydrostatics import (
+    DESIGN_DIR,
+    load_station_offsets,
+    simpson_weights,
+)
+
+
+# Heeled-waterline solve: relative volume tolerance and iteration cap
+VOLUME_RTOL = 1e-12
+MAX_NEWTON_STEPS = 60
+
+DEFAULT_ANGLES_DEG = np.arange(0.0, 91.0, 1.0)
+
+
+@dataclass
+class SectionSet:
+    """
+    Station outlines padded to a common vertex count, in feet.
+
+    vertices_ft has shape (n_stations, n_vertices, 2) holding (y, z) with
+    counter-clockwise orientation; padding repeats the last vertex, which
+    adds zero-length edges that contribute nothing to the integrals.
+    """
+    name: str
+    x_ft: np.ndarray
+    weights: np.ndarray
+    vertices_ft: np.ndarray
+    length_ft: float
+    beam_ft: float
+    depth_ft: float
+
+    @classmethod
+    def from_sections(
+        cls, positions_in: np.ndarray, sections: List[np.ndarray], name: str = "hull"
+    ) -> "SectionSet":
+        """Build from station positions and outlines in inches."""
+        n_vert = max(len(s) for s in sections)
+        verts = np.empty((len(sections), n_vert, 2))
+        for i, s in enumerate(sections):
+            s = np.asarray(s, dtype=float)
+            # Shoelace sign: make every outline counter-clockwise
+            y, z = s[:, 0], s[:, 1]
+            if np.dot(y, np.roll(z, -1)) - np.dot(np.roll(y, -1), z) < 0:
+                s = s[::-1]
+            verts[i, :len(s)] = s
+            verts[i, len(s):] = s[-1]
+        verts /= INCHES_PER_FOOT
+
+        x_ft = np.asarray(positions_in, dtype=float) / INCHES_PER_FOOT
+        return cls(
+            name=name,
+            x_ft=x_ft,
+            weights=simpson_weights(x_ft),
+            vertices_ft=verts,
+            length_ft=float(x_ft[-1] - x_ft[0]),
+            beam_ft=float(verts[..., 0].max() - verts[..., 0].min()),
+            depth_ft=float(verts[..., 1].max()),
+        )
+
+    @classmethod
+    def from_file(cls, path) -> "SectionSet":
+        """Load a dxf_coords_design_*.txt file."""
+        positions, sections = load_station_offsets(path)
+        return cls.from_sections(positions, sections, str(path))
+
+    @classmethod
+    def from_design(cls, design: str) -> "SectionSet":
+        """Load one of the committed designs by letter ("A", "B" or "C")."""
+        return cls.from_file(DESIGN_DIR / f"dxf_coords_design_{design.upper()}.txt")
+
+
+def _immersed_integrals(Y1, Z1, Y2, Z2, c, moments: bool = False):
+    """
+    Green's-theorem integrals of the outline edges clipped to Z ≤ c.
+
+    Inputs broadcast edge-wise. Returns per-edge (∮ Y dZ, dA/dc), where
+    dA/dc is the edge's share of the waterline breadth (±Y at the crossing);
+    with moments=True returns (∮ Y dZ, ∮ Y²/2 dZ) instead.
+    """
+    dZ = Z2 - Z1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(dZ != 0, (c - Z1) / dZ, 0.0)
+    Ys = Y1 + t * (Y2 - Y1)
+    below1 = Z1 <= c
+    below2 = Z2 <= c
+    Ya = np.where(below1, Y1, Ys)
+    Za = np.where(below1, Z1, c)
+    Yb = np.where(below2, Y2, Ys)
+    Zb = np.where(below2, Z2, c)
+    dz = np.where(below1 | below2, Zb - Za, 0.0)
+
+    area = 0.5 * (Ya + Yb) * dz
+    if moments:
+        return area, (Ya * Ya + Ya * Yb + Yb * Yb) * dz / 6.0
+    crossing = below1 != below2
+    return area, np.where(crossing, np.sign(dZ) * Ys, 0.0)
+
+
+def _heeled_edges(vertices_ft, sin_phi, cos_phi):
+    """
+    Rotate outlines into the heeled (earth) frame.
+
+    vertices_ft (..., S, E, 2) and angle arrays broadcast to (..., A, S, E).
+    Returns edge start/end coordinates (Y1, Z1, Y2, Z2).
+    """
+    y = vertices_ft[..., None, :, :, 0]
+    z = vertices_ft[..., None, :, :, 1]
+    s = sin_phi[..., :, None, None]
+    c = cos_phi[..., :, None, None]
+    Y = y * c + z * s
+    Z = z * c - y * s
+    return Y, Z, np.roll(Y, -1, axis=-1), np.roll(Z, -1, axis=-1)
+
+
+def _solve_heeled(vertices_ft, weights, volume_ft3, angles_rad):
+    """
+    Waterline height and KN for every angle (and optionally every hull).
+
+    vertices_ft: (..., S, E, 2); weights: (..., S); volume_ft3: (...,);
+    angles_rad: (A,). Returns (c, kn, volume) each of shape (..., A).
+
+    The waterline is found by Newton's method on V(c) − V_target, whose
+    derivative is the heeled waterplane area, safeguarded by a bisection
+    bracket so every angle converges even where the waterplane vanishes.
+    """
+    sin_phi = np.broadcast_to(np.sin(angles_rad), vertices_ft.shape[:-3] + angles_rad.shape)
+    cos_phi = np.broadcast_to(np.cos(angles_rad), sin_phi.shape)
+    Y1, Z1, Y2, Z2 = _heeled_edges(vertices_ft, sin_phi, cos_phi)
+    w = weights[..., None, :]
+    target = np.asarray(volume_ft3, dtype=float)[..., None]
+    tol = VOLUME_RTOL * np.maximum(target, 1e-12)
+
+    lo = Z1.min(axis=(-2, -1))
+    hi = Z1.max(axis=(-2, -1))
+    c = 0.5 * (lo + hi)
+    for _ in range(MAX_NEWTON_STEPS):
+        area, breadth = _immersed_integrals(Y1, Z1, Y2, Z2, c[..., None, None])
+        resid = (area.sum(axis=-1) * w).sum(axis=-1) - target
+        done = np.abs(resid) <= tol
+        if np.all(done):
+            break
+        awp = (breadth.sum(axis=-1) * w).sum(axis=-1)
+        lo = np.where(resid < 0, c, lo)
+        hi = np.where(resid < 0, hi, c)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = c - resid / awp
+        inside = (awp > 0) & (step >= lo) & (step <= hi)
+        c = np.where(done, c, np.where(inside, step, 0.5 * (lo + hi)))
+
+    area, moment_y = _immersed_integrals(
+        Y1, Z1, Y2, Z2, c[..., None, None], moments=True
+    )
+    vol = (area.sum(axis=-1) * w).sum(axis=-1)
+    my = (moment_y.sum(axis=-1) * w).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kn = np.where(vol > 0, my / vol, 0.0)
+    return c, kn, vol
+
+
+def _deck_edge_angle(vertices_ft, c, angles_deg):
+    """First angle (deg) at which a sheer-line vertex goes below the waterline."""
+    z_top = vertices_ft[..., 1].max(axis=(-2, -1), keepdims=True)
+    rad = np.deg2rad(angles_deg)
+    y = vertices_ft[..., 0][..., None, :, :]
+    z = vertices_ft[..., 1][..., None, :, :]
+    Z = z * np.cos(rad)[:, None, None] - y * np.sin(rad)[:, None, None]
+    on_sheer = z >= z_top[..., None, :, :] - 1e-9
+    immersed = (on_sheer & (Z < c[..., None, None])).any(axis=(-2, -1))
+    first = np.argmax(immersed, axis=-1)
+    return np.where(immersed.any(axis=-1), np.asarray(angles_deg)[first], np.nan)
+
+
+def area_under_gz(angles_deg, gz_ft, upto_deg: float) -> np.ndarray:
+    """Area under the GZ curve (ft·rad) from 0° to upto_deg (trapezoid)."""
+    angles_deg = np.asarray(angles_deg, dtype=float)
+    gz = np.asarray(gz_ft, dtype=float)
+    keep = angles_deg <= upto_deg
+    _trapz = getattr(np, "trapezoid", None) or np.trapz
+    return _trapz(gz[..., keep], np.deg2rad(angles_deg[keep]), axis=-1)
+
+
+def _curve_summary(angles_deg, gz_ft) -> Dict[str, np.ndarray]:
+    """Max GZ, its angle, angle of vanishing stability and areas."""
+    angles_deg = np.asarray(angles_deg, dtype=float)
+    i_max = np.argmax(gz_ft, axis=-1)
+    # Vanishing angle: first sign change from + to − after the maximum
+    after = np.arange(gz_ft.shape[-1]) > i_max[..., None]
+    neg = after & (gz_ft <= 0)
+    has_neg = neg.any(axis=-1)
+    j = np.argmax(neg, axis=-1)
+    jm = np.maximum(j - 1, 0)
+    g0 = np.take_along_axis(gz_ft, jm[..., None], -1)[..., 0]
+    g1 = np.take_along_axis(gz_ft, j[..., None], -1)[..., 0]
+    a0, a1 = angles_deg[jm], angles_deg[j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vanish = np.where(g0 != g1, a0 + (a1 - a0) * g0 / (g0 - g1), a1)
+    return {
+        "max_gz_ft": np.take_along_axis(gz_ft, i_max[..., None], -1)[..., 0],
+        "angle_max_gz_deg": angles_deg[i_max],
+        "vanishing_angle_deg": np.where(has_neg, vanish, np.nan),
+        "area_0_30_ft_rad": area_under_gz(angles_deg, gz_ft, 30.0),
+        "area_0_40_ft_rad": area_under_gz(angles_deg, gz_ft, 40.0),
+    }
+
+
+def gz_curve(
+    sections: SectionSet,
+    weight_lbs: float,
+    kg_ft: float,
+    angles_deg=DEFAULT_ANGLES_DEG,
+) -> Dict[str, np.ndarray]:
+    """
+    Righting-arm curve for one loading condition.
+
+    weight_lbs: total loaded weight; kg_ft: centre of gravity above keel.
+    Returns per-angle arrays (kn_ft, gz_ft, waterline_ft) plus curve
+    summary values and the deck-edge immersion angle.
+    """
+    angles_deg = np.asarray(angles_deg, dtype=float)
+    vol = weight_lbs / WATER_DENSITY_LB_PER_FT3
+    c, kn, _ = _solve_heeled(
+        sections.vertices_ft, sections.weights, vol, np.deg2rad(angles_deg)
+    )
+    gz = kn - kg_ft * np.sin(np.deg2rad(angles_deg))
+    out = {
+        "angles_deg": angles_deg,
+        "kn_ft": kn,
+        "gz_ft": gz,
+        "waterline_ft": c,
+        "deck_edge_angle_deg": float(
+            _deck_edge_angle(sections.vertices_ft, c, angles_deg)
+        ),
+    }
+    out.update({k: float(v) for k, v in _curve_summary(angles_deg, gz).items()})
+    return out
+
+
+def gz_curves_batch(
+    sections: SectionSet,
+    weight_lbs,
+    kg_ft,
+    length_in=None,
+    beam_in=None,
+    depth_in=None,
+    angles_deg=DEFAULT_ANGLES_DEG,
+    chunk_size: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    GZ curves for many hulls at once.
+
+    Each hull is the parent section set scaled to (length_in, beam_in,
+    depth_in) (any may be None to keep the parent value); all arguments
+    broadcast to a 1-D array of hulls. Hulls are processed in chunks so
+    the (hull, angle, station, edge) working arrays stay bounded.
+    Returns arrays of shape (n_hulls, n_angles) and (n_hulls,), with the
+    same keys as gz_curve() (deck_edge_angle_deg included).
+    """
+    angles_deg = np.asarray(angles_deg, dtype=float)
+    sx = 1.0 if length_in is None else np.asarray(length_in) / (sections.length_ft * INCHES_PER_FOOT)
+    sy = 1.0 if beam_in is None else np.asarray(beam_in) / (sections.beam_ft * INCHES_PER_FOOT)
+    sz = 1.0 if depth_in is None else np.asarray(depth_in) / (sections.depth_ft * INCHES_PER_FOOT)
+    w, kg, sx, sy, sz = (
+        np.atleast_1d(a).astype(float)
+        for a in np.broadcast_arrays(weight_lbs, kg_ft, sx, sy, sz)
+    )
+    n = len(w)
+    n_s, n_e = sections.vertices_ft.shape[:2]
+    if chunk_size is None:
+        chunk_size = max(1, 2_000_000 // (len(angles_deg) * n_s * n_e))
+
+    rad = np.deg2rad(angles_deg)
+    kn = np.empty((n, len(angles_deg)))
+    c = np.empty_like(kn)
+    deck_edge = np.empty(n)
+    for start in range(0, n, chunk_size):
+        sl = slice(start, start + chunk_size)
+        scale = np.stack([sy[sl], sz[sl]], axis=-1)[:, None, None, :]
+        verts = sections.vertices_ft[None] * scale
+        weights = sections.weights[None] * sx[sl, None]
+        vol = w[sl] / WATER_DENSITY_LB_PER_FT3
+        c[sl], kn[sl], _ = _solve_heeled(verts, weights, vol, rad)
+        deck_edge[sl] = _deck_edge_angle(verts, c[sl], angles_deg)
+
+    gz = kn - kg[:, None] * np.sin(rad)
+    out = {"angles_deg": angles_deg, "kn_ft": kn, "gz_ft": gz, "waterline_ft": c,
+           "deck_edge_angle_deg": deck_edge}
+    out.update(_curve_summary(angles_deg, gz))
+    return out
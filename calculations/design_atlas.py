@@ -0,0 +1,277 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Design-Space Feasibility Atlas
+
+Evaluates every point of a dense grid over the design variables once and
+stores the metrics so that questions like
+
+    atlas = DesignAtlas.open("data/design_atlas")
+    atlas.lightest(B=(None, 32), gm_in=(8, None))
+
+are answered from disk in milliseconds without re-running the model.
+
+Layout of an atlas directory:
+
+    atlas.json         axes (grid values per variable), metrics, row count,
+                       block size, model version, build metadata
+    cell.npy           flat grid index of each row (coordinates are implicit:
+                       np.unravel_index(cell, shape) -> axis positions)
+    <metric>.npy       one float32 column per metric
+    index.npz          per-block min/max of every axis and metric
+
+Rows are sorted by the sort metric (weight), so the first match is the
+lightest, and the per-block zone maps let a query skip every block whose
+range cannot satisfy the conditions. Columns are plain .npy files opened
+with mmap_mode="r": only the blocks a query touches are read. Storage is
+kept small by float32 metrics and implicit coordinates rather than by
+deflate, which would rule out memory-mapping.
+"""
+
+import json
+import math
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    MIN_FREEBOARD_IN,
+    MIN_GM_IN,
+    MIN_SAFETY_FACTOR,
+    MODEL_VERSION,
+)
+
+ATLAS_VERSION = 1
+META_FILE = "atlas.json"
+INDEX_FILE = "index.npz"
+CHUNK_ROWS = 1 << 18   # grid points evaluated per model call
+BLOCK_ROWS = 4096      # rows per zone-map block
+
+# Thresholds applied by feasible=True
+FEASIBILITY = {
+    "freeboard_in": (MIN_FREEBOARD_IN, None),
+    "gm_in": (MIN_GM_IN, None),
+    "safety_factor": (MIN_SAFETY_FACTOR, None),
+}
+
+Range = Tuple[Optional[float], Optional[float]]
+
+
+def grid_axis(lo: float, hi: float, step: float) -> np.ndarray:
+    """lo, lo + step, ..., hi (inclusive; hi must be on the step)."""
+    n = int(round((hi - lo) / step)) + 1
+    return lo + step * np.arange(n)
+
+
+def parse_conditions(text: str) -> Dict[str, Range]:
+    """'B<=32, gm_in>=8' -> {'B': (None, 32.0), 'gm_in': (8.0, None)}."""
+    ranges: Dict[str, Range] = {}
+    for term in filter(None, (t.strip() for t in text.split(","))):
+        m = re.fullmatch(r"(\w+)\s*(<=|>=|==)\s*([-+0-9.eE]+)", term)
+        if m is None:
+            raise ValueError(f"cannot parse condition {term!r}; use name<=x, name>=x or name==x")
+        name, op, value = m.group(1), m.group(2), float(m.group(3))
+        lo, hi = ranges.get(name, (None, None))
+        if op in (">=", "=="):
+            lo = value if lo is None else max(lo, value)
+        if op in ("<=", "=="):
+            hi = value if hi is None else min(hi, value)
+        ranges[name] = (lo, hi)
+    return ranges
+
+
+def _replace(path: Path, write: Callable[[Path], None]) -> None:
+    """Write via a temporary file and os.replace, so an atlas that is open
+    (memory-mapped) elsewhere keeps its old files instead of seeing them
+    truncated mid-rebuild."""
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _block_zones(columns: Dict[str, np.ndarray], block_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    starts = np.arange(0, len(next(iter(columns.values()))), block_rows)
+    lo = np.column_stack([np.minimum.reduceat(v, starts) for v in columns.values()])
+    hi = np.column_stack([np.maximum.reduceat(v, starts) for v in columns.values()])
+    return lo, hi
+
+
+def build_atlas(
+    directory,
+    axes: Dict[str, Sequence[float]],
+    evaluate: Callable[..., Dict[str, np.ndarray]],
+    metrics: Sequence[str],
+    sort_by: Optional[str] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    block_rows: int = BLOCK_ROWS,
+    metadata: Optional[Dict] = None,
+) -> "DesignAtlas":
+    """
+    Evaluate evaluate(**{axis: values}) -> {metric: values} over the full
+    grid of axes in chunks of chunk_rows points and write the atlas to
+    directory. Rows are stored sorted by sort_by (default: first metric).
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    axes = {k: np.asarray(v, dtype=float) for k, v in axes.items()}
+    names, metrics = list(axes), list(metrics)
+    sort_by = sort_by or metrics[0]
+    shape = tuple(len(v) for v in axes.values())
+    n = math.prod(shape)
+    cell_dtype = np.int32 if n < 2**31 else np.int64
+
+    # 1. evaluate the grid in flat (C) order
+    unsorted = {m: np.empty(n, dtype=np.float32) for m in metrics}
+    for lo in range(0, n, chunk_rows):
+        idx = np.arange(lo, min(n, lo + chunk_rows))
+        coords = np.unravel_index(idx, shape)
+        out = evaluate(**{name: axes[name][c] for name, c in zip(names, coords)})
+        for m in metrics:
+            unsorted[m][idx] = out[m]
+
+    # 2. sort by the key metric and write memory-mappable columns
+    order = np.argsort(unsorted[sort_by], kind="stable").astype(cell_dtype)
+    _replace(directory / "cell.npy", lambda p: np.save(p, order))
+    for m in metrics:
+        _replace(directory / f"{m}.npy", lambda p: np.save(p, unsorted[m][order]))
+    del unsorted
+
+    # 3. zone maps, computed block-aligned chunk by chunk
+    atlas = DesignAtlas(directory, axes, metrics, sort_by, block_rows, n)
+    chunk = max(block_rows, chunk_rows // block_rows * block_rows)
+    zone_lo, zone_hi = [], []
+    for lo in range(0, n, chunk):
+        cols = atlas._rows(lo, min(n, lo + chunk))
+        a, b = _block_zones(cols, block_rows)
+        zone_lo.append(a)
+        zone_hi.append(b)
+    _replace(directory / INDEX_FILE, lambda p: np.savez(
+        p, columns=np.array(atlas.columns),
+        zone_min=np.concatenate(zone_lo), zone_max=np.concatenate(zone_hi)))
+
+    meta = {
+        "atlas_version": ATLAS_VERSION,
+        "model_version": MODEL_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rows": n,
+        "axes": {k: v.tolist() for k, v in axes.items()},
+        "metrics": metrics,
+        "sort_by": sort_by,
+        "block_rows": block_rows,
+        **(metadata or {}),
+    }
+    _replace(directory / META_FILE, lambda p: p.write_text(json.dumps(meta, indent=2) + "\n"))
+    return DesignAtlas.open(directory)
+
+
+class DesignAtlas:
+    """
+    Read side of an atlas directory (see the module docstring).
+
+    Conditions are keyword ranges over any axis or metric, name=(lo, hi)
+    with None for an open end, both ends inclusive. feasible=True adds the
+    ASCE freeboard, GM and safety-factor minimums.
+    """
+
+    def __init__(self, directory, axes: Dict[str, np.ndarray], metrics: Sequence[str],
+                 sort_by: str, block_rows: int, rows: int, meta: Optional[Dict] = None):
+        self.directory = Path(directory)
+        self.axes = axes
+        self.metrics = list(metrics)
+        self.sort_by = sort_by
+        self.block_rows = block_rows
+        self.rows = rows
+        self.meta = meta or {}
+        self.shape = tuple(len(v) for v in axes.values())
+        self.columns = list(axes) + self.metrics
+        self._data = {m: np.load(self.directory / f"{m}.npy", mmap_mode="r")
+                      for m in ["cell"] + self.metrics}
+        self.zone_min = self.zone_max = None
+
+    @classmethod
+    def open(cls, directory) -> "DesignAtlas":
+        directory = Path(directory)
+        meta = json.loads((directory / META_FILE).read_text())
+        if meta.get("atlas_version") != ATLAS_VERSION:
+            raise ValueError(f"{directory}: atlas version {meta.get('atlas_version')} "
+                             f"is not {ATLAS_VERSION}; rebuild it")
+        axes = {k: np.asarray(v) for k, v in meta["axes"].items()}
+        atlas = cls(directory, axes, meta["metrics"], meta["sort_by"],
+                    meta["block_rows"], meta["rows"], meta)
+        with np.load(directory / INDEX_FILE) as z:
+            if list(z["columns"]) != atlas.columns:
+                raise ValueError(f"{directory}: index does not match the atlas columns")
+            atlas.zone_min, atlas.zone_max = z["zone_min"], z["zone_max"]
+        return atlas
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _rows(self, lo: int, hi: int) -> Dict[str, np.ndarray]:
+        """All columns for stored rows [lo, hi); axis values from the cell index."""
+        cell = np.asarray(self._data["cell"][lo:hi])
+        coords = np.unravel_index(cell, self.shape)
+        cols = {name: values[c] for (name, values), c in zip(self.axes.items(), coords)}
+        cols.update({m: np.asarray(self._data[m][lo:hi]) for m in self.metrics})
+        return cols
+
+    def _ranges(self, feasible: bool, ranges: Dict[str, Range]) -> Dict[str, Range]:
+        unknown = set(ranges) - set(self.columns)
+        if unknown:
+            raise ValueError(f"unknown atlas column(s) {sorted(unknown)}; "
+                             f"choose from {self.columns}")
+        if not feasible:
+            return dict(ranges)
+        out = dict(FEASIBILITY)
+        for name, (lo, hi) in ranges.items():
+            base_lo, base_hi = out.get(name, (None, None))
+            lo = base_lo if lo is None else (lo if base_lo is None else max(lo, base_lo))
+            hi = base_hi if hi is None else (hi if base_hi is None else min(hi, base_hi))
+            out[name] = (lo, hi)
+        return out
+
+    def candidate_blocks(self, ranges: Dict[str, Range]) -> np.ndarray:
+        """Blocks whose zone map overlaps every range, in stored order."""
+        ok = np.ones(len(self.zone_min), dtype=bool)
+        for name, (lo, hi) in ranges.items():
+            c = self.columns.index(name)
+            if lo is not None:
+                ok &= self.zone_max[:, c] >= lo
+            if hi is not None:
+                ok &= self.zone_min[:, c] <= hi
+        return np.flatnonzero(ok)
+
+    def query(self, limit: Optional[int] = None, feasible: bool = False,
+              **ranges: Range) -> Dict[str, np.ndarray]:
+        """Matching rows as columns, in ascending sort_by order."""
+        ranges = self._ranges(feasible, ranges)
+        found, count = [], 0
+        for b in self.candidate_blocks(ranges):
+            lo = int(b) * self.block_rows
+            cols = self._rows(lo, min(self.rows, lo + self.block_rows))
+            mask = np.ones(len(cols[self.sort_by]), dtype=bool)
+            for name, (r_lo, r_hi) in ranges.items():
+                if r_lo is not None:
+                    mask &= cols[name] >= r_lo
+                if r_hi is not None:
+                    mask &= cols[name] <= r_hi
+            if mask.any():
+                found.append({k: v[mask] for k, v in cols.items()})
+                count += int(mask.sum())
+                if limit is not None and count >= limit:
+                    break
+        if not found:
+            return {k: np.empty(0) for k in self.columns}
+        return {k: np.concatenate([f[k] for f in found])[:limit] for k in self.columns}
+
+    def lightest(self, feasible: bool = True, **ranges: Range) -> Optional[Dict[str, float]]:
+        """First row in sort_by order meeting the conditions, or None."""
+        rows = self.query(limit=1, feasible=feasible, **ranges)
+        if not len(rows[self.sort_by]):
+            return None
+        return {k: float(v[0]) for k, v in rows.items()}
+
+    def count(self, feasible: bool = False, **ranges: Range) -> int:
+        return len(self.query(feasible=feasible, **ranges)[self.sort_by])
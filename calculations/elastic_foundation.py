@@ -0,0 +1,310 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Hull Girder on an Elastic Foundation
+
+bending_moment_distributed_crew() treats the hull as simply supported at
+the ends. Afloat, the hull is carried along its whole length by buoyancy,
+which behaves like a Winkler foundation: an extra immersion v(x) adds an
+upward force ρ·b(x)·v(x) per foot, where b(x) is the waterline breadth.
+
+The problem is linearized about the level-keel flotation draft T0:
+
+    EI v'''' + k(x) v = q(x) + Σ P_j δ(x - a_j)
+    k(x) = ρ · b(x, T0)                      foundation modulus (lb/ft²)
+    q(x) = w_hull - ρ · A(x, T0)             self-weight less static buoyancy
+
+with free ends (V = M = 0). A rigid hull gives back the "balanced on
+water" moment; a flexible one sheds load into the foundation near the
+paddlers. Both ends of the range are tested.
+
+Discretization: cubic Hermite beam elements with consistent foundation
+stiffness, assembled straight into LAPACK upper-banded storage (half-
+bandwidth 3). The matrix is symmetric positive definite, so it is
+Cholesky-factorized once per hull; every crew layout is then one more
+right-hand-side column for cho_solve_banded. Shear and moment come from
+statics on the solved foundation reaction, with point loads applied
+exactly.
+
+Conventions: x from the bow in feet, v positive down (deeper immersion),
+loads positive down, moment positive sagging (as in the FBD script).
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict
+
+import numpy as np
+from scipy.linalg import cho_solve_banded, cholesky_banded
+
+from calculations.concrete_canoe_calculator import (
+    INCHES_PER_FOOT,
+    WATER_DENSITY_LB_PER_FT3,
+    section_modulus_thin_shell,
+    thin_shell_section_properties,
+)
+
+DEFAULT_ELEMENTS = 2000
+DEFAULT_COMPRESSIVE_PSI = 2000.0      # f'c used in Appendix C
+CREW_STATIONS = (0.25, 0.40, 0.60, 0.75)  # paddler positions, fraction of L
+BANDWIDTH = 3                         # upper bandwidth for [v0, θ0, v1, θ1, ...]
+
+
+def concrete_elastic_modulus_psi(density_pcf: float, compressive_psi: float) -> float:
+    """Ec = 33 · w^1.5 · √f'c (psi), ACI 318-19 §19.2.2.1."""
+    return 33.0 * density_pcf ** 1.5 * math.sqrt(compressive_psi)
+
+
+def _hermite_stiffness(h: np.ndarray, ei: np.ndarray) -> np.ndarray:
+    """Euler-Bernoulli element stiffness, shape (n_el, 4, 4)."""
+    c = (ei / h**3)[:, None, None]
+    h = h[:, None, None]
+    one = np.ones_like(h)
+    return c * np.block([
+        [12 * one, 6 * h, -12 * one, 6 * h],
+        [6 * h, 4 * h**2, -6 * h, 2 * h**2],
+        [-12 * one, -6 * h, 12 * one, -6 * h],
+        [6 * h, 2 * h**2, -6 * h, 4 * h**2],
+    ])
+
+
+def _hermite_foundation(h: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Consistent Winkler foundation stiffness, shape (n_el, 4, 4)."""
+    c = (k * h / 420.0)[:, None, None]
+    h = h[:, None, None]
+    one = np.ones_like(h)
+    return c * np.block([
+        [156 * one, 22 * h, 54 * one, -13 * h],
+        [22 * h, 4 * h**2, 13 * h, -3 * h**2],
+        [54 * one, 13 * h, 156 * one, -22 * h],
+        [-13 * h, -3 * h**2, -22 * h, 4 * h**2],
+    ])
+
+
+def _assemble_banded(ke: np.ndarray) -> np.ndarray:
+    """Scatter element matrices into upper-banded storage (4, n_dof)."""
+    n_el = ke.shape[0]
+    n_dof = 2 * (n_el + 1)
+    ab = np.zeros((BANDWIDTH + 1, n_dof))
+    a, b = np.triu_indices(4)
+    cols = 2 * np.arange(n_el)[:, None] + b
+    rows = np.broadcast_to(BANDWIDTH + a - b, cols.shape)
+    np.add.at(ab, (rows, cols), ke[:, a, b])
+    return ab
+
+
+def _cumtrapz(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Cumulative trapezoid along the last axis, starting at zero."""
+    out = np.zeros_like(y)
+    out[..., 1:] = np.cumsum(0.5 * (y[..., 1:] + y[..., :-1]) * np.diff(x), axis=-1)
+    return out
+
+
+@dataclass
+class ElasticFoundationBeam:
+    """
+    Factorized beam-on-foundation model for one hull and flotation state.
+
+    Node arrays have shape (n_nodes,). Build with from_dimensions(); then
+    call solve() with any number of crew layouts.
+    """
+    x_ft: np.ndarray
+    ei_lb_ft2: float
+    foundation_lb_ft2: np.ndarray
+    static_load_lb_per_ft: np.ndarray
+    section_modulus_in3: float
+    flexural_strength_psi: float
+    draft_ft: float
+    _factor: np.ndarray = field(init=False, repr=False)
+    _static_rhs: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        h = np.diff(self.x_ft)
+        k_el = 0.5 * (self.foundation_lb_ft2[1:] + self.foundation_lb_ft2[:-1])
+        ke = _hermite_stiffness(h, np.full_like(h, self.ei_lb_ft2))
+        ke += _hermite_foundation(h, k_el)
+        self._factor = cholesky_banded(_assemble_banded(ke), lower=False)
+        self._static_rhs = self._distributed_rhs(self.static_load_lb_per_ft)
+
+    @classmethod
+    def from_dimensions(
+        cls,
+        length_in: float,
+        beam_in: float,
+        depth_in: float,
+        thickness_in: float,
+        hull_weight_lbs: float,
+        crew_weight_lbs: float = 700.0,
+        flexural_strength_psi: float = 1500.0,
+        concrete_density_pcf: float = 60.0,
+        compressive_strength_psi: float = DEFAULT_COMPRESSIVE_PSI,
+        waterplane_form_factor: float = 0.70,
+        station_hull=None,
+        n_elements: int = DEFAULT_ELEMENTS,
+    ) -> "ElasticFoundationBeam":
+        """
+        Build the model for a hull of the given size and loaded weight.
+
+        Without station_hull the hull is the calculator's box: waterline
+        breadth Cwp·B and sectional area equal along the length. With a
+        StationHull (calculations.hydrostatics) the real station breadths
+        and areas at the flotation draft are used, scaled to L × B × D.
+        Stiffness is the gross thin-shell I with ACI Ec.
+        """
+        length_ft = length_in / INCHES_PER_FOOT
+        x = np.linspace(0.0, length_ft, n_elements + 1)
+        total_lbs = hull_weight_lbs + crew_weight_lbs
+        rho = WATER_DENSITY_LB_PER_FT3
+
+        if station_hull is None:
+            b_wl = np.full_like(x, waterplane_form_factor * beam_in / INCHES_PER_FOOT)
+            area = np.full_like(x, total_lbs / rho / length_ft)
+            draft_ft = total_lbs / rho / (b_wl[0] * length_ft)
+        else:
+            b_wl, area, draft_ft = _station_waterline(
+                station_hull, x, length_in, beam_in, depth_in, total_lbs
+            )
+
+        props = thin_shell_section_properties(beam_in, depth_in, thickness_in)
+        ec_psi = concrete_elastic_modulus_psi(concrete_density_pcf, compressive_strength_psi)
+        ei = ec_psi * props["i_in4"] / INCHES_PER_FOOT**2
+
+        return cls(
+            x_ft=x,
+            ei_lb_ft2=ei,
+            foundation_lb_ft2=rho * b_wl,
+            static_load_lb_per_ft=hull_weight_lbs / length_ft - rho * area,
+            section_modulus_in3=section_modulus_thin_shell(beam_in, depth_in, thickness_in),
+            flexural_strength_psi=flexural_strength_psi,
+            draft_ft=float(draft_ft),
+        )
+
+    @property
+    def length_ft(self) -> float:
+        return float(self.x_ft[-1] - self.x_ft[0])
+
+    def _distributed_rhs(self, q: np.ndarray) -> np.ndarray:
+        """Consistent nodal forces for a load linear between nodes."""
+        h = np.diff(self.x_ft)
+        q1, q2 = q[:-1], q[1:]
+        f = np.zeros(2 * len(self.x_ft))
+        np.add.at(f, 2 * np.arange(len(h)), h * (7 * q1 + 3 * q2) / 20)
+        np.add.at(f, 2 * np.arange(len(h)) + 1, h**2 * (3 * q1 + 2 * q2) / 60)
+        np.add.at(f, 2 * np.arange(len(h)) + 2, h * (3 * q1 + 7 * q2) / 20)
+        np.add.at(f, 2 * np.arange(len(h)) + 3, -(h**2) * (2 * q1 + 3 * q2) / 60)
+        return f
+
+    def _point_rhs(self, positions: np.ndarray, loads: np.ndarray) -> np.ndarray:
+        """Nodal forces for point loads, shape (n_dof, m) for (m, p) inputs."""
+        m, p = positions.shape
+        n_el = len(self.x_ft) - 1
+        e = np.clip(np.searchsorted(self.x_ft, positions, side="right") - 1, 0, n_el - 1)
+        h = self.x_ft[e + 1] - self.x_ft[e]
+        s = (positions - self.x_ft[e]) / h
+        shape = np.stack([
+            1 - 3 * s**2 + 2 * s**3,
+            h * (s - 2 * s**2 + s**3),
+            3 * s**2 - 2 * s**3,
+            h * (s**3 - s**2),
+        ])  # (4, m, p)
+        rhs = np.zeros((2 * (n_el + 1), m))
+        cols = np.broadcast_to(np.arange(m)[:, None], (m, p))
+        for j in range(4):
+            np.add.at(rhs, (2 * e + j, cols), shape[j] * loads)
+        return rhs
+
+    def solve(self, crew_positions_ft=None, crew_loads_lbs=None) -> Dict[str, np.ndarray]:
+        """
+        Deflection, shear and moment for one or many crew layouts.
+
+        crew_positions_ft and crew_loads_lbs broadcast to (m, p): m layouts
+        of p paddlers (1-D input is one layout). Defaults to four equal
+        paddlers at CREW_STATIONS sharing the crew weight implied by the
+        static buoyancy. Per-node outputs have shape (m, n_nodes); the
+        summary values have shape (m,).
+        """
+        if crew_positions_ft is None:
+            crew_positions_ft = np.array(CREW_STATIONS) * self.length_ft
+        if crew_loads_lbs is None:
+            crew = -_cumtrapz(self.static_load_lb_per_ft, self.x_ft)[-1]
+            crew_loads_lbs = crew / np.size(crew_positions_ft, -1)
+        pos = np.atleast_2d(np.asarray(crew_positions_ft, dtype=float))
+        loads = np.atleast_2d(np.asarray(crew_loads_lbs, dtype=float))
+        pos, loads = np.broadcast_arrays(pos, loads)
+
+        rhs = self._point_rhs(pos, loads) + self._static_rhs[:, None]
+        u = cho_solve_banded((self._factor, False), rhs)
+        v = u[0::2].T  # (m, n_nodes)
+
+        # Statics: net upward distributed load, then exact point-load steps
+        x = self.x_ft
+        p_up = self.foundation_lb_ft2 * v - self.static_load_lb_per_ft
+        shear = _cumtrapz(p_up, x)
+        moment = _cumtrapz(shear, x)
+        for j in range(pos.shape[1]):
+            a = pos[:, j:j + 1]
+            P = loads[:, j:j + 1]
+            shear -= P * (x >= a)
+            moment -= P * np.maximum(x - a, 0.0)
+
+        m_max = moment.max(axis=1)
+        m_min = moment.min(axis=1)
+        m_gov = np.maximum(np.abs(m_max), np.abs(m_min))
+        with np.errstate(divide="ignore"):
+            sigma = m_gov * INCHES_PER_FOOT / self.section_modulus_in3
+            sf = np.where(sigma > 0, self.flexural_strength_psi / sigma, np.inf)
+        return {
+            "x_ft": x,
+            "deflection_in": v * INCHES_PER_FOOT,
+            "shear_lb": shear,
+            "moment_lb_ft": moment,
+            "max_sagging_lb_ft": np.maximum(m_max, 0.0),
+            "max_hogging_lb_ft": np.maximum(-m_min, 0.0),
+            "max_moment_lb_ft": m_gov,
+            "bending_stress_psi": sigma,
+            "safety_factor": sf,
+        }
+
+
+def _station_waterline(hull, x_ft, length_in, beam_in, depth_in, total_lbs):
+    """Waterline breadth and sectional area at the level-keel draft, at x_ft."""
+    sx = length_in / INCHES_PER_FOOT / hull.length_ft
+    sy = beam_in / INCHES_PER_FOOT / hull.beam_ft
+    sz = depth_in / INCHES_PER_FOOT / hull.depth_ft
+    disp = total_lbs / WATER_DENSITY_LB_PER_FT3 / (sx * sy * sz)
+    t_parent = hull.draft_from_displacement(disp)
+
+    # Per-station values at the parent draft, then along the length
+    k = int(np.clip(np.searchsorted(hull.z_ft, t_parent) - 1, 0, len(hull.z_ft) - 2))
+    s = (t_parent - hull.z_ft[k]) / (hull.z_ft[k + 1] - hull.z_ft[k])
+    b_st = hull.breadth_ft[:, k] * (1 - s) + hull.breadth_ft[:, k + 1] * s
+    # Area is quadratic in z within a cell (linear breadth), so integrate exactly
+    dz = t_parent - hull.z_ft[k]
+    a_st = hull.area_ft2[:, k] + 0.5 * (hull.breadth_ft[:, k] + b_st) * dz
+
+    xs = (hull.x_ft - hull.x_ft[0]) * sx
+    b_wl = np.interp(x_ft, xs, b_st) * sy
+    area = np.interp(x_ft, xs, a_st) * sy * sz
+    # The stations were integrated with Simpson; renormalize so the nodal
+    # (trapezoid) static buoyancy carries exactly the total weight.
+    area *= total_lbs / WATER_DENSITY_LB_PER_FT3 / _cumtrapz(area, x_ft)[-1]
+    return b_wl, area, t_parent * sz
+
+
+def bending_moment_elastic_foundation(
+    length_in: float,
+    beam_in: float,
+    depth_in: float,
+    thickness_in: float,
+    hull_weight_lbs: float,
+    crew_weight_lbs: float = 700.0,
+    **kwargs,
+) -> float:
+    """Governing |M| (lb-ft) for four paddlers at CREW_STATIONS.
+
+    Elastic-foundation counterpart of bending_moment_distributed_crew().
+    Extra keyword arguments go to ElasticFoundationBeam.from_dimensions().
+    """
+    beam = ElasticFoundationBeam.from_dimensions(
+        length_in, beam_in, depth_in, thickness_in, hull_weight_lbs,
+        crew_weight_lbs, **kwargs,
+    )
+    return float(beam.solve()["max_moment_lb_ft"][0])
@@ -0,0 +1,159 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Analytic Design Gradients
+
+Exact derivatives of the run_complete_analysis() box model with respect to
+the hull dimensions x = (L, B, D, t), all in inches:
+
+    freeboard   fb = 12·(D/12 - T),        T = (W_hull + W_crew) / (ρw · L·B·Cwp)
+    stability   GM = 12·(T/2 + B²/(12T) - KG)
+    strength    SF = f_r · S / (12·M),     M = W_hull·L/8 + W_crew·L/4,
+                                           S = 0.75 · I / c_max  (thin-shell U)
+
+The hull weight is an input of the analysis, so its gradient is passed in
+(weight_grad) and carried through the chain rule - an optimizer that ties
+weight to the dimensions gets total derivatives, one that holds the weight
+fixed passes None. Each intermediate is carried as (value, gradient) with
+the gradient a length-4 array over VARIABLES, mirroring the calculator
+formula for formula (forward mode, written out by hand).
+
+Where the model has a kink (freeboard clipped at zero, c_max switching
+between top and bottom fibre) the gradient of the active branch is used.
+The station-offset hydrostatic table path is not covered.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    INCHES_PER_FOOT,
+    WATER_DENSITY_LB_PER_FT3,
+)
+
+VARIABLES = ("L", "B", "D", "t")
+OUTPUTS = ("weight_lbs", "freeboard_in", "gm_in", "safety_factor")
+
+_dL, _dB, _dD, _dt = np.eye(len(VARIABLES))
+_ZERO = np.zeros(len(VARIABLES))
+
+
+def section_modulus_gradient(
+    beam_in: float, depth_in: float, thickness_in: float
+) -> Tuple[float, np.ndarray]:
+    """section_modulus_thin_shell() and its gradient over (L, B, D, t)."""
+    b, d, t = beam_in, depth_in, thickness_in
+    a_bot, da_bot = b * t, t * _dB + b * _dt
+    y_bot, dy_bot = t / 2.0, _dt / 2.0
+    h, dh = d - t, _dD - _dt
+    a_wall, da_wall = t * h, h * _dt + t * dh
+    y_wall, dy_wall = t + h / 2.0, _dt + dh / 2.0
+
+    area = a_bot + 2.0 * a_wall
+    if area <= 0:
+        return 0.0, _ZERO.copy()
+    d_area = da_bot + 2.0 * da_wall
+    moment = a_bot * y_bot + 2.0 * a_wall * y_wall
+    d_moment = da_bot * y_bot + a_bot * dy_bot + 2.0 * (da_wall * y_wall + a_wall * dy_wall)
+    y_na = moment / area
+    dy_na = (d_moment - y_na * d_area) / area
+
+    e_bot, de_bot = y_na - y_bot, dy_na - dy_bot
+    e_wall, de_wall = y_wall - y_na, dy_wall - dy_na
+    i_total = (
+        b * t**3 / 12.0 + a_bot * e_bot**2
+        + 2.0 * (t * h**3 / 12.0 + a_wall * e_wall**2)
+    )
+    di_total = (
+        (t**3 * _dB + 3.0 * b * t**2 * _dt) / 12.0
+        + da_bot * e_bot**2 + 2.0 * a_bot * e_bot * de_bot
+        + 2.0 * ((h**3 * _dt + 3.0 * t * h**2 * dh) / 12.0
+                 + da_wall * e_wall**2 + 2.0 * a_wall * e_wall * de_wall)
+    )
+
+    if d - y_na >= y_na:
+        c_max, dc_max = d - y_na, _dD - dy_na
+    else:
+        c_max, dc_max = y_na, dy_na
+    if c_max <= 0:
+        return 0.0, _ZERO.copy()
+    s = (i_total / c_max) * 0.75
+    return s, s * (di_total / i_total - dc_max / c_max)
+
+
+def analysis_gradients(
+    hull_length_in: float,
+    hull_beam_in: float,
+    hull_depth_in: float,
+    hull_thickness_in: float,
+    concrete_weight_lbs: float,
+    weight_grad: Optional[np.ndarray] = None,
+    flexural_strength_psi: float = 1500,
+    waterplane_form_factor: float = 0.70,
+    crew_weight_lbs: float = 700.0,
+) -> Tuple[Dict[str, float], Dict[str, np.ndarray]]:
+    """
+    (values, gradients) of OUTPUTS for one hull; each gradient is a length-4
+    array over VARIABLES. Arguments follow run_complete_analysis();
+    weight_grad is d(concrete_weight_lbs)/dx (None: weight held fixed).
+    """
+    L, B, D = hull_length_in, hull_beam_in, hull_depth_in
+    w = concrete_weight_lbs
+    dw = _ZERO if weight_grad is None else np.asarray(weight_grad, dtype=float)
+    cwp = waterplane_form_factor
+    l_ft, b_ft, d_ft = L / INCHES_PER_FOOT, B / INCHES_PER_FOOT, D / INCHES_PER_FOOT
+    dl_ft, db_ft, dd_ft = _dL / INCHES_PER_FOOT, _dB / INCHES_PER_FOOT, _dD / INCHES_PER_FOOT
+
+    # --- Hydrostatics: draft from displacement over the Cwp waterplane ---
+    total_w = w + crew_weight_lbs
+    disp_ft3 = total_w / WATER_DENSITY_LB_PER_FT3
+    wp_ft2 = l_ft * b_ft * cwp
+    if wp_ft2 > 0 and total_w > 0:
+        draft_ft = disp_ft3 / wp_ft2
+        d_draft = draft_ft * (dw / total_w - _dL / L - _dB / B)
+    else:
+        draft_ft, d_draft = 0.0, _ZERO
+    if d_ft - draft_ft > 0:
+        fb_in = (d_ft - draft_ft) * INCHES_PER_FOOT
+        d_fb = (dd_ft - d_draft) * INCHES_PER_FOOT
+    else:
+        fb_in, d_fb = 0.0, _ZERO
+
+    # --- Stability: KB + BM - KG with the weighted hull/crew COG ---
+    hull_cog_ft = d_ft * 0.38
+    crew_cog_ft = 10.0 / INCHES_PER_FOOT
+    if total_w > 0:
+        cog_ft = (w * hull_cog_ft + crew_weight_lbs * crew_cog_ft) / total_w
+        d_cog = (dw * hull_cog_ft + w * 0.38 * dd_ft - cog_ft * dw) / total_w
+    else:
+        cog_ft, d_cog = 0.0, _ZERO
+    if cog_ft > 0:
+        kg_ft, d_kg = cog_ft, d_cog
+    else:
+        kg_ft, d_kg = d_ft * 0.4, 0.4 * dd_ft
+    if draft_ft > 0 and L > 0:
+        bm_ft = b_ft**2 / (12.0 * draft_ft)  # I_wp / V = Cwp·L·B³/12 / (Cwp·L·B·T)
+        d_bm = bm_ft * (2.0 * db_ft / b_ft - d_draft / draft_ft)
+        gm_in = (draft_ft / 2.0 + bm_ft - kg_ft) * INCHES_PER_FOOT
+        d_gm = (d_draft / 2.0 + d_bm - d_kg) * INCHES_PER_FOOT
+    else:
+        gm_in, d_gm = 0.0, _ZERO
+
+    # --- Structural: hull (uniform) + crew (midship point) on simple supports ---
+    m_max = w * l_ft / 8.0 + crew_weight_lbs * l_ft / 4.0
+    d_m = dw * l_ft / 8.0 + (w / 8.0 + crew_weight_lbs / 4.0) * dl_ft
+    s_in3, d_s = section_modulus_gradient(B, D, hull_thickness_in)
+    if s_in3 > 0 and m_max > 0:
+        sf = flexural_strength_psi * s_in3 / (m_max * INCHES_PER_FOOT)
+        d_sf = sf * (d_s / s_in3 - d_m / m_max)
+    else:
+        sf, d_sf = 0.0, _ZERO
+
+    values = {"weight_lbs": w, "freeboard_in": fb_in, "gm_in": gm_in, "safety_factor": sf}
+    grads = {"weight_lbs": dw.copy(), "freeboard_in": d_fb, "gm_in": d_gm, "safety_factor": d_sf}
+    return values, grads
+
+
+def jacobian(grads: Dict[str, np.ndarray], outputs=OUTPUTS, variables=VARIABLES) -> np.ndarray:
+    """Stack gradients into a (len(outputs), len(variables)) Jacobian."""
+    cols = [VARIABLES.index(v) for v in variables]
+    return np.array([grads[name][cols] for name in outputs])
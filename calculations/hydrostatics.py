@@ -0,0 +1,461 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Station-Offset Hydrostatics
+
+Replaces the L × B × Cwp box model with the real hull stations from the
+CNC coordinate files (design/dxf_coords_design_*.txt).
+
+The offsets are parsed once and reduced to per-station cumulative tables
+over a fine draft grid:
+  breadth(z)   waterline breadth of each station at height z
+  area(z)      sectional area below z        = ∫ breadth dz
+  moment(z)    first moment of that area     = ∫ z · breadth dz
+
+Integration along the length uses Simpson's rule, so the whole-hull
+volume, KB, LCB and waterplane properties at every grid draft are single
+matrix products. Draft for a given displacement is then a binary search
+on the volume table plus an exact quadratic solve inside the bracketing
+cell — microseconds per query, no re-integration.
+
+Conventions: x from the bow (station 0), z up from the keel, all results
+in feet (consistent with WATER_DENSITY_LB_PER_FT3). Even keel (no trim).
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    INCHES_PER_FOOT,
+    WATER_DENSITY_LB_PER_FT3,
+)
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DESIGN_DIR = PROJECT_ROOT / "design"
+CACHE_DIR = PROJECT_ROOT / ".cache" / "hydrostatics"
+
+# Draft-grid resolution for the cumulative tables (inches)
+DEFAULT_DZ_IN = 0.05
+
+# Bump when the table formulas change so cached curves are rebuilt
+TABLE_VERSION = 1
+
+
+def load_station_offsets(path) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Parse a dxf_coords_design_*.txt file.
+
+    Returns (positions_in, sections) where positions_in[i] is the station's
+    distance from the bow and sections[i] is an (N, 2) array of the closed
+    section outline (X = half-breadth coordinate, Y = height above keel),
+    all in inches, in file order.
+    """
+    stations: Dict[int, Tuple[float, list]] = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith("Station"):
+                continue
+            num, pos, x, y = (s.strip() for s in line.split(","))
+            entry = stations.setdefault(int(num), (float(pos), []))
+            entry[1].append((float(x), float(y)))
+
+    order = sorted(stations)
+    positions = np.array([stations[n][0] for n in order])
+    sections = [np.array(stations[n][1], dtype=float) for n in order]
+    return positions, sections
+
+
+def section_breadth(points: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Breadth (same units as points) of a closed section outline at heights z.
+
+    Intersects each horizontal line with every polygon edge (including the
+    closing edge) and takes max - min of the crossings. Heights with no
+    crossing (or degenerate single-point stations) have zero breadth.
+    """
+    z = np.asarray(z, dtype=float)
+    if len(points) < 2:
+        return np.zeros_like(z)
+
+    p1 = points
+    p2 = np.roll(points, -1, axis=0)
+    y1, z1 = p1[:, 0], p1[:, 1]
+    y2, z2 = p2[:, 0], p2[:, 1]
+    dz = z2 - z1
+    sloped = dz != 0
+
+    y1, z1, y2, dz = y1[sloped], z1[sloped], y2[sloped], dz[sloped]
+    t = (z[:, None] - z1[None, :]) / dz[None, :]
+    hit = (t >= 0.0) & (t <= 1.0)
+    y = y1[None, :] + t * (y2 - y1)[None, :]
+
+    y_max = np.where(hit, y, -np.inf).max(axis=1)
+    y_min = np.where(hit, y, np.inf).min(axis=1)
+    return np.where(np.isfinite(y_max), y_max - y_min, 0.0)
+
+
+def geometry_hash(
+    positions_in: np.ndarray, sections: List[np.ndarray], dz_in: float
+) -> str:
+    """Stable SHA-256 of the station offsets and table resolution."""
+    h = hashlib.sha256()
+    h.update(f"v{TABLE_VERSION};dz={float(dz_in)!r};".encode())
+    h.update(np.ascontiguousarray(positions_in, dtype=float).tobytes())
+    for s in sections:
+        h.update(np.int64(len(s)).tobytes())
+        h.update(np.ascontiguousarray(s, dtype=float).tobytes())
+    return h.hexdigest()
+
+
+def simpson_weights(x: np.ndarray) -> np.ndarray:
+    """
+    Quadrature weights w such that ∫ f dx ≈ w @ f(x).
+
+    Composite Simpson for uniformly spaced x; with an even number of points
+    the last panel falls back to the trapezoid rule. Non-uniform spacing
+    uses the trapezoid rule throughout.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    w = np.zeros(n)
+    if n < 2:
+        return w
+    h = np.diff(x)
+    if n < 3 or not np.allclose(h, h[0]):
+        w[:-1] += h / 2.0
+        w[1:] += h / 2.0
+        return w
+
+    m = n if n % 2 == 1 else n - 1
+    w[:m:2] = 2.0
+    w[1:m:2] = 4.0
+    w[0] = w[m - 1] = 1.0
+    w[:m] *= h[0] / 3.0
+    if m < n:
+        w[-2] += h[0] / 2.0
+        w[-1] += h[0] / 2.0
+    return w
+
+
+@dataclass
+class StationHull:
+    """
+    Hull described by station sections, with precomputed draft tables.
+
+    Per-station tables have shape (n_stations, n_z); whole-hull tables have
+    shape (n_z,). All lengths in feet.
+    """
+    name: str
+    x_ft: np.ndarray
+    z_ft: np.ndarray
+    breadth_ft: np.ndarray
+    area_ft2: np.ndarray
+    moment_ft3: np.ndarray
+    volume_ft3: np.ndarray
+    vmoment_ft4: np.ndarray
+    lmoment_ft4: np.ndarray
+    awp_ft2: np.ndarray
+    awp_moment_ft3: np.ndarray
+    it_ft4: np.ndarray
+    il_origin_ft4: np.ndarray
+    geometry_hash: str = ""
+
+    @classmethod
+    def from_sections(
+        cls,
+        positions_in: np.ndarray,
+        sections: List[np.ndarray],
+        name: str = "hull",
+        dz_in: float = DEFAULT_DZ_IN,
+    ) -> "StationHull":
+        """Build the draft tables from station positions and outlines (inches)."""
+        depth_in = max(float(s[:, 1].max()) for s in sections)
+        n_z = int(np.ceil(depth_in / dz_in)) + 1
+        z_in = np.linspace(0.0, depth_in, n_z)
+
+        breadth_in = np.array([section_breadth(s, z_in) for s in sections])
+
+        x_ft = np.asarray(positions_in, dtype=float) / INCHES_PER_FOOT
+        z_ft = z_in / INCHES_PER_FOOT
+        b_ft = breadth_in / INCHES_PER_FOOT
+
+        # Cumulative trapezoid over draft: area and first moment about keel
+        dz = np.diff(z_ft)
+        zb = z_ft * b_ft
+        area = np.zeros_like(b_ft)
+        moment = np.zeros_like(b_ft)
+        area[:, 1:] = np.cumsum(0.5 * (b_ft[:, 1:] + b_ft[:, :-1]) * dz, axis=1)
+        moment[:, 1:] = np.cumsum(0.5 * (zb[:, 1:] + zb[:, :-1]) * dz, axis=1)
+
+        # Simpson along length — one matrix product per quantity
+        w = simpson_weights(x_ft)
+        wx = w * x_ft
+        return cls(
+            geometry_hash=geometry_hash(positions_in, sections, dz_in),
+            name=name,
+            x_ft=x_ft,
+            z_ft=z_ft,
+            breadth_ft=b_ft,
+            area_ft2=area,
+            moment_ft3=moment,
+            volume_ft3=w @ area,
+            vmoment_ft4=w @ moment,
+            lmoment_ft4=wx @ area,
+            awp_ft2=w @ b_ft,
+            awp_moment_ft3=wx @ b_ft,
+            it_ft4=w @ (b_ft ** 3) / 12.0,
+            il_origin_ft4=(wx * x_ft) @ b_ft,
+        )
+
+    @classmethod
+    def from_file(cls, path, dz_in: float = DEFAULT_DZ_IN) -> "StationHull":
+        """Load a dxf_coords_design_*.txt file."""
+        positions, sections = load_station_offsets(path)
+        return cls.from_sections(positions, sections, Path(path).stem, dz_in)
+
+    @classmethod
+    def from_design(cls, design: str, dz_in: float = DEFAULT_DZ_IN) -> "StationHull":
+        """Load one of the committed designs by letter ("A", "B" or "C")."""
+        path = DESIGN_DIR / f"dxf_coords_design_{design.upper()}.txt"
+        return cls.from_file(path, dz_in)
+
+    @property
+    def length_ft(self) -> float:
+        return float(self.x_ft[-1] - self.x_ft[0])
+
+    @property
+    def beam_ft(self) -> float:
+        return float(self.breadth_ft.max())
+
+    @property
+    def depth_ft(self) -> float:
+        return float(self.z_ft[-1])
+
+    def draft_from_displacement(self, displacement_ft3):
+        """
+        Draft (ft) that displaces the given volume (ft³); scalar or array.
+
+        Binary search on the volume table, then the exact root within the
+        bracketing cell: waterplane area varies linearly between grid
+        drafts, so volume there is quadratic in draft. Volumes beyond the
+        sheer return the depth (hull swamped).
+        """
+        v = np.asarray(displacement_ft3, dtype=float)
+        vt = self.volume_ft3
+        k = np.clip(np.searchsorted(vt, v, side="right") - 1, 0, len(vt) - 2)
+
+        h = self.z_ft[k + 1] - self.z_ft[k]
+        a0 = self.awp_ft2[k]
+        slope = (self.awp_ft2[k + 1] - a0) / h
+        dv = v - vt[k]
+        # Solve 0.5·slope·s² + a0·s = dv in the numerically stable form
+        disc = np.sqrt(np.maximum(a0 * a0 + 2.0 * slope * dv, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = np.where(a0 + disc > 0, 2.0 * dv / (a0 + disc), 0.0)
+        draft = np.clip(self.z_ft[k] + s, 0.0, self.depth_ft)
+        draft = np.where(v <= 0, 0.0, draft)
+        return draft if draft.ndim else float(draft)
+
+    def hydrostatics(self, draft_ft) -> Dict[str, np.ndarray]:
+        """
+        Upright hydrostatic properties at the given draft(s) (ft).
+
+        Returns volume, KB, LCB, waterplane area, LCF, transverse and
+        longitudinal waterplane inertia (about the centreline / LCF) and
+        BM_T = I_T / V. Longitudinal positions are measured from the bow.
+        """
+        d = np.asarray(draft_ft, dtype=float)
+        interp = lambda table: np.interp(d, self.z_ft, table)
+
+        vol = interp(self.volume_ft3)
+        awp = interp(self.awp_ft2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kb = np.where(vol > 0, interp(self.vmoment_ft4) / vol, 0.0)
+            lcb = np.where(vol > 0, interp(self.lmoment_ft4) / vol, 0.0)
+            lcf = np.where(awp > 0, interp(self.awp_moment_ft3) / awp, 0.0)
+            it = interp(self.it_ft4)
+            il = interp(self.il_origin_ft4) - awp * lcf ** 2
+            bm = np.where(vol > 0, it / vol, 0.0)
+        return {
+            "draft_ft": d,
+            "volume_ft3": vol,
+            "displacement_lbs": vol * WATER_DENSITY_LB_PER_FT3,
+            "kb_ft": kb,
+            "lcb_ft": lcb,
+            "awp_ft2": awp,
+            "lcf_ft": lcf,
+            "it_ft4": it,
+            "il_ft4": il,
+            "bm_ft": bm,
+        }
+
+    def hydrostatics_for_weight(self, weight_lbs) -> Dict[str, np.ndarray]:
+        """Hydrostatics at the floating draft for a total weight (lbs)."""
+        disp = np.asarray(weight_lbs, dtype=float) / WATER_DENSITY_LB_PER_FT3
+        return self.hydrostatics(self.draft_from_displacement(disp))
+
+
+# Columns of a HydrostaticTable, in storage order
+TABLE_COLUMNS = (
+    "draft_ft", "volume_ft3", "displacement_lbs", "lcb_ft", "kb_ft",
+    "bm_ft", "bml_ft", "awp_ft2", "tpi_lbs_per_in", "mct_lb_ft_per_in",
+)
+
+
+@dataclass
+class HydrostaticTable:
+    """
+    Standard hydrostatic curves of one hull against draft.
+
+    Built once from a StationHull on its fine draft grid; queries are
+    vectorized np.interp lookups (binary search, O(log n) per point).
+
+    The table also serves any hull that is an affine scaling of the parent
+    form (length, beam and depth scaled independently), since each curve
+    scales by a closed-form factor. This lets the box-model callers
+    (run_complete_analysis, the dashboard, the Monte Carlo) swap in the
+    real section shape for arbitrary L × B × D.
+
+      TPI  weight (lbs) to sink the hull one inch = Awp · ρ / 12
+      MCT  moment (lb-ft) to trim one inch        ≈ Δ · BM_L / (12 · L)
+    """
+    name: str
+    geometry_hash: str
+    length_ft: float
+    beam_ft: float
+    depth_ft: float
+    draft_ft: np.ndarray
+    volume_ft3: np.ndarray
+    displacement_lbs: np.ndarray
+    lcb_ft: np.ndarray
+    kb_ft: np.ndarray
+    bm_ft: np.ndarray
+    bml_ft: np.ndarray
+    awp_ft2: np.ndarray
+    tpi_lbs_per_in: np.ndarray
+    mct_lb_ft_per_in: np.ndarray
+
+    @classmethod
+    def from_hull(cls, hull: StationHull) -> "HydrostaticTable":
+        """Evaluate every curve on the hull's draft grid."""
+        h = hull.hydrostatics(hull.z_ft)
+        vol = h["volume_ft3"]
+        disp = h["displacement_lbs"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bml = np.where(vol > 0, h["il_ft4"] / vol, 0.0)
+        return cls(
+            name=hull.name,
+            geometry_hash=hull.geometry_hash,
+            length_ft=hull.length_ft,
+            beam_ft=hull.beam_ft,
+            depth_ft=hull.depth_ft,
+            draft_ft=hull.z_ft.copy(),
+            volume_ft3=vol,
+            displacement_lbs=disp,
+            lcb_ft=h["lcb_ft"],
+            kb_ft=h["kb_ft"],
+            bm_ft=h["bm_ft"],
+            bml_ft=bml,
+            awp_ft2=h["awp_ft2"],
+            tpi_lbs_per_in=h["awp_ft2"] * WATER_DENSITY_LB_PER_FT3 / 12.0,
+            mct_lb_ft_per_in=disp * bml / (12.0 * hull.length_ft),
+        )
+
+    def save(self, path) -> None:
+        """Write the table to a compressed .npz file."""
+        np.savez_compressed(
+            path,
+            meta=np.array([self.name, self.geometry_hash]),
+            dims=np.array([self.length_ft, self.beam_ft, self.depth_ft]),
+            **{c: getattr(self, c) for c in TABLE_COLUMNS},
+        )
+
+    @classmethod
+    def load(cls, path) -> "HydrostaticTable":
+        """Read a table written by save()."""
+        with np.load(path) as f:
+            name, ghash = (str(v) for v in f["meta"])
+            length_ft, beam_ft, depth_ft = (float(v) for v in f["dims"])
+            cols = {c: f[c] for c in TABLE_COLUMNS}
+        return cls(name, ghash, length_ft, beam_ft, depth_ft, **cols)
+
+    def _scales(self, length_in, beam_in, depth_in):
+        """Scale factors (sx, sy, sz) from the parent form to the given dims."""
+        sx = 1.0 if length_in is None else np.asarray(length_in) / (self.length_ft * 12.0)
+        sy = 1.0 if beam_in is None else np.asarray(beam_in) / (self.beam_ft * 12.0)
+        sz = 1.0 if depth_in is None else np.asarray(depth_in) / (self.depth_ft * 12.0)
+        return sx, sy, sz
+
+    def _lookup(self, key, values, sx, sy, sz) -> Dict[str, np.ndarray]:
+        """Interpolate every curve at parent-form values of `key`, then scale."""
+        interp = lambda col: np.interp(values, key, col)
+        vol_scale = sx * sy * sz
+        return {
+            "draft_ft": interp(self.draft_ft) * sz,
+            "volume_ft3": interp(self.volume_ft3) * vol_scale,
+            "displacement_lbs": interp(self.displacement_lbs) * vol_scale,
+            "lcb_ft": interp(self.lcb_ft) * sx,
+            "kb_ft": interp(self.kb_ft) * sz,
+            "bm_ft": interp(self.bm_ft) * sy * sy / sz,
+            "bml_ft": interp(self.bml_ft) * sx * sx / sz,
+            "awp_ft2": interp(self.awp_ft2) * sx * sy,
+            "tpi_lbs_per_in": interp(self.tpi_lbs_per_in) * sx * sy,
+            "mct_lb_ft_per_in": interp(self.mct_lb_ft_per_in) * sx * sx * sy,
+        }
+
+    def at_draft(self, draft_ft, length_in=None, beam_in=None, depth_in=None):
+        """All curves at the given draft(s) (ft), optionally for scaled dims."""
+        sx, sy, sz = self._scales(length_in, beam_in, depth_in)
+        parent = np.asarray(draft_ft, dtype=float) / sz
+        return self._lookup(self.draft_ft, parent, sx, sy, sz)
+
+    def at_weight(self, weight_lbs, length_in=None, beam_in=None, depth_in=None):
+        """
+        All curves at the floating draft for a total weight (lbs).
+
+        Weights beyond the sheer clamp to the full-depth values.
+        """
+        sx, sy, sz = self._scales(length_in, beam_in, depth_in)
+        parent = np.asarray(weight_lbs, dtype=float) / (sx * sy * sz)
+        return self._lookup(self.displacement_lbs, parent, sx, sy, sz)
+
+
+def load_hydrostatic_table(
+    design: str = "A",
+    path=None,
+    dz_in: float = DEFAULT_DZ_IN,
+    cache_dir: Optional[Path] = CACHE_DIR,
+) -> HydrostaticTable:
+    """
+    Hydrostatic curves for a design letter (or an explicit offsets file).
+
+    Tables are cached as .npz under cache_dir, keyed by the geometry hash
+    of the parsed offsets, so edits to the offsets file (or a change of
+    TABLE_VERSION / dz_in) rebuild automatically. cache_dir=None disables
+    the disk cache.
+    """
+    if path is None:
+        path = DESIGN_DIR / f"dxf_coords_design_{design.upper()}.txt"
+    positions, sections = load_station_offsets(path)
+    key = geometry_hash(positions, sections, dz_in)
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = Path(cache_dir) / f"{key}.npz"
+        if cache_file.exists():
+            return HydrostaticTable.load(cache_file)
+
+    hull = StationHull.from_sections(positions, sections, Path(path).stem, dz_in)
+    table = HydrostaticTable.from_hull(hull)
+    if cache_file is not None:
+        # Write-then-rename so concurrent processes never read a partial file
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{key}.{os.getpid()}.tmp.npz")
+        table.save(tmp)
+        os.replace(tmp, cache_file)
+    return table
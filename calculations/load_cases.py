@@ -0,0 +1,345 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Multi-Load-Case Structural Checks
+
+One call evaluates every registered load case for one hull or a whole
+array of hulls:
+
+    lc = evaluate_load_cases(192, 32, 17, 0.5, 171)
+    lc.governing()          # the (case, check) row with the lowest SF
+    lc.table()              # all rows, ready for a report table
+
+Section properties (thin-shell U-section, as in the calculator) and ACI
+shear capacities are computed once per hull. Each girder case is a set of
+loads on the hull treated as a rigid free beam: a uniform net load plus
+point loads at fractions of L (paddlers, slings, stands). Shear and moment
+follow from statics on a grid of stations, vectorized over hulls:
+
+    V(x) = -u·x - Σ P_j·H(x - a_j)        (loads positive down)
+    M(x) = -u·x²/2 - Σ P_j·(x - a_j)⁺     (sagging positive)
+
+Racing cases float on uniform buoyancy, so the net uniform load is the
+hull weight minus the total displacement per foot. That is the stiff-hull
+limit of calculations.elastic_foundation, and an upper bound on it.
+Punching is ACI two-way shear around a kneeling paddler's pad.
+
+New cases are added with register_load_case(GirderCase(...)).
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    INCHES_PER_FOOT,
+    MIN_SAFETY_FACTOR,
+    section_modulus_thin_shell,
+    thin_shell_section_properties,
+)
+
+PHI_SHEAR = 0.75                 # ACI 318-19 §21.2.1
+DEFAULT_COMPRESSIVE_PSI = 2000.0  # f'c used in Appendix C
+DEFAULT_PAD_IN = 6.0             # kneeling pad, square side
+DEFAULT_STATIONS = 401           # statics grid points along L
+
+
+def aci_one_way_shear(
+    w_pcf: float,
+    fc_psi: float,
+    bw_in: float,
+    d_in: float,
+    Av_in2: float = 0.0,
+    fyt_psi: float = 0.0,
+    s_in: float = math.inf,
+) -> Tuple[float, float, float]:
+    """
+    ACI 318 one-way shear capacity (lbs); works on scalars or arrays.
+
+    Vc = 2 · (w/150) · √f'c · bw · d     [Eq. 22.5.5.1, λ = w/150 for LW]
+    Vs = Av · fyt · d / s                 [Eq. 22.5.10.5.3]
+    φVn = 0.75 · (Vc + Vs)                [§21.2.1]
+    """
+    lambda_lw = w_pcf / 150.0
+    Vc = 2.0 * lambda_lw * np.sqrt(fc_psi) * bw_in * d_in
+    Vs = Av_in2 * fyt_psi * d_in / s_in
+    return Vc, Vs, PHI_SHEAR * (Vc + Vs)
+
+
+def aci_punching_shear(
+    w_pcf: float, fc_psi: float, pad_in: float, d_in: float
+) -> Tuple[float, float]:
+    """
+    ACI 318 two-way shear around a square pad: (b_o, φVc) in (in, lbs).
+
+    Critical perimeter at d/2 from the pad: b_o = 4 · (c + d).
+    φVc = 0.75 · 4 · λ · √f'c · b_o · d
+    """
+    b_o = 4.0 * (pad_in + d_in)
+    lambda_lw = w_pcf / 150.0
+    return b_o, PHI_SHEAR * 4.0 * lambda_lw * np.sqrt(fc_psi) * b_o * d_in
+
+
+@dataclass(frozen=True)
+class LoadContext:
+    """Per-hull quantities the load definitions draw on (arrays of shape (n,))."""
+    length_ft: np.ndarray
+    hull_weight_lbs: np.ndarray
+    paddler_weight_lbs: np.ndarray
+
+
+PointLoads = Sequence[Tuple[float, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class GirderCase:
+    """
+    Hull-girder load case.
+
+    uniform(ctx) is the net uniform load (lb/ft, down positive);
+    point_loads(ctx) lists (fraction of L, load in lbs, down positive).
+    Supports are upward (negative) point loads; the set must balance.
+    """
+    name: str
+    description: str
+    uniform: Callable[[LoadContext], np.ndarray]
+    point_loads: Callable[[LoadContext], PointLoads]
+
+
+@dataclass(frozen=True)
+class PunchingCase:
+    """Concentrated load on a square pad through the shell."""
+    name: str
+    description: str
+    load: Callable[[LoadContext], np.ndarray]
+    pad_in: float = DEFAULT_PAD_IN
+
+
+LoadCase = Union[GirderCase, PunchingCase]
+
+
+def _racing(stations: Sequence[float]) -> GirderCase:
+    n = len(stations)
+    return GirderCase(
+        name=f"racing_{n}",
+        description=f"Racing, {n} paddlers at "
+                    + ", ".join(f"{s:.0%}" for s in stations)
+                    + " of L on uniform buoyancy",
+        uniform=lambda c: -n * c.paddler_weight_lbs / c.length_ft,
+        point_loads=lambda c: [(s, c.paddler_weight_lbs) for s in stations],
+    )
+
+
+def _two_supports(name: str, description: str, a: float, factor: float = 1.0) -> GirderCase:
+    return GirderCase(
+        name=name,
+        description=description,
+        uniform=lambda c: factor * c.hull_weight_lbs / c.length_ft,
+        point_loads=lambda c: [
+            (a, -0.5 * factor * c.hull_weight_lbs),
+            (1.0 - a, -0.5 * factor * c.hull_weight_lbs),
+        ],
+    )
+
+
+LOAD_CASES: Dict[str, LoadCase] = {}
+
+
+def register_load_case(case: LoadCase) -> LoadCase:
+    """Add (or replace) a load case evaluated by evaluate_load_cases()."""
+    LOAD_CASES[case.name] = case
+    return case
+
+
+register_load_case(_racing((0.25, 0.40, 0.60, 0.75)))
+register_load_case(_racing((0.25, 0.75)))
+register_load_case(_two_supports(
+    "sling_lift", "Lift on two slings at 25% / 75% of L (empty hull)", 0.25,
+))
+register_load_case(_two_supports(
+    "stands", "Transport on two stands at 15% / 85% of L (empty hull)", 0.15,
+))
+register_load_case(PunchingCase(
+    "punching", "Kneeling paddler on a 6\" × 6\" pad",
+    load=lambda c: c.paddler_weight_lbs,
+))
+
+
+@dataclass(frozen=True)
+class LoadCheck:
+    """One (case, check) row; array fields have shape (n_hulls,)."""
+    case: str
+    description: str
+    check: str            # "flexure", "shear" or "punching"
+    demand: np.ndarray    # M lb-ft (hogging < 0), |V| lbs or P lbs
+    demand_unit: str
+    location_ft: np.ndarray
+    capacity: np.ndarray  # in the same unit as demand
+    safety_factor: np.ndarray
+
+
+@dataclass
+class LoadCaseResults:
+    """All checks for n hulls plus the section properties they used."""
+    checks: List[LoadCheck]
+    section: Dict[str, np.ndarray]
+
+    @property
+    def min_safety_factor(self) -> np.ndarray:
+        return np.min([c.safety_factor for c in self.checks], axis=0)
+
+    @property
+    def governing_index(self) -> np.ndarray:
+        return np.argmin([c.safety_factor for c in self.checks], axis=0)
+
+    @property
+    def passes(self) -> np.ndarray:
+        return self.min_safety_factor >= MIN_SAFETY_FACTOR
+
+    def check(self, case: str, check: str) -> LoadCheck:
+        for c in self.checks:
+            if c.case == case and c.check == check:
+                return c
+        raise KeyError((case, check))
+
+    def table(self, hull: int = 0) -> List[Dict]:
+        """Rows for one hull, governing row flagged, in registration order."""
+        gov = int(self.governing_index.flat[hull])
+        rows = []
+        for k, c in enumerate(self.checks):
+            rows.append({
+                "case": c.case,
+                "description": c.description,
+                "check": c.check,
+                "demand": float(c.demand.flat[hull]),
+                "demand_unit": c.demand_unit,
+                "location_ft": float(c.location_ft.flat[hull]),
+                "capacity": float(c.capacity.flat[hull]),
+                "safety_factor": float(c.safety_factor.flat[hull]),
+                "pass": bool(c.safety_factor.flat[hull] >= MIN_SAFETY_FACTOR),
+                "governing": k == gov,
+            })
+        return rows
+
+    def governing(self, hull: int = 0) -> Dict:
+        return next(r for r in self.table(hull) if r["governing"])
+
+
+def section_properties(beam_in, depth_in, thickness_in) -> Dict[str, np.ndarray]:
+    """
+    thin_shell_section_properties() over arrays, plus s_in3 from
+    section_modulus_thin_shell() (with its 0.75 thin-shell factor).
+    """
+    b, d, t = np.broadcast_arrays(*(np.asarray(a, dtype=float)
+                                    for a in (beam_in, depth_in, thickness_in)))
+    props = thin_shell_section_properties(b, d, t)
+    props["s_in3"] = section_modulus_thin_shell(b, d, t)
+    return props
+
+
+def girder_statics(
+    length_ft: np.ndarray,
+    uniform: np.ndarray,
+    point_loads: PointLoads,
+    n_stations: int = DEFAULT_STATIONS,
+) -> Dict[str, np.ndarray]:
+    """
+    Shear and moment of a free beam on stations x = ξ·L.
+
+    Returns x_frac (n_stations,), shear_lb and moment_lb_ft (n, n_stations).
+    Point-load positions are added to the grid so peaks are sampled exactly;
+    shear is reported on both sides of each point load (max |V| is exact).
+    """
+    xi = np.union1d(np.linspace(0.0, 1.0, n_stations), [a for a, _ in point_loads])
+    L = np.asarray(length_ft, dtype=float)[..., None]
+    x = xi * L
+    u = np.asarray(uniform, dtype=float)[..., None]
+    shear = -u * x
+    moment = -0.5 * u * x**2
+    shear_left = shear.copy()
+    for a, P in point_loads:
+        P = np.asarray(P, dtype=float)[..., None]
+        shear = shear - P * (xi >= a)
+        shear_left = shear_left - P * (xi > a)
+        moment = moment - P * np.maximum(x - a * L, 0.0)
+    return {"x_frac": xi, "shear_lb": shear, "shear_left_lb": shear_left,
+            "moment_lb_ft": moment}
+
+
+def evaluate_load_cases(
+    length_in,
+    beam_in,
+    depth_in,
+    thickness_in,
+    hull_weight_lbs,
+    paddler_weight_lbs=175.0,
+    flexural_strength_psi=1500.0,
+    concrete_density_pcf=60.0,
+    compressive_strength_psi=DEFAULT_COMPRESSIVE_PSI,
+    shear_reinforcement: Tuple[float, float, float] = (0.0, 0.0, math.inf),
+    cases: Sequence[str] = None,
+    n_stations: int = DEFAULT_STATIONS,
+) -> LoadCaseResults:
+    """
+    Evaluate every registered load case (or the named subset) in one pass.
+
+    Inputs broadcast like run_complete_analysis_batch. Girder cases get a
+    flexure check (σ = M/S vs f'r) and a one-way shear check (both side
+    walls as the web, d = 0.8·D); punching cases get the ACI two-way check
+    with the shell thickness as d. SF = capacity / demand.
+
+    shear_reinforcement is (Av_in2, fyt_psi, s_in) for the two walls
+    together; the default is plain concrete (Vs = 0).
+    """
+    L_in, B, D, t, W, P, fr, w, fc = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            length_in, beam_in, depth_in, thickness_in, hull_weight_lbs,
+            paddler_weight_lbs, flexural_strength_psi, concrete_density_pcf,
+            compressive_strength_psi,
+        ))
+    )
+    ctx = LoadContext(length_ft=L_in / INCHES_PER_FOOT, hull_weight_lbs=W,
+                      paddler_weight_lbs=P)
+    section = section_properties(B, D, t)
+    # Flexural capacity as a moment, so demand and capacity share units
+    m_cap = fr * section["s_in3"] / INCHES_PER_FOOT
+    _, _, v_cap = aci_one_way_shear(w, fc, 2.0 * t, 0.8 * D, *shear_reinforcement)
+    section["moment_capacity_lb_ft"] = m_cap
+    section["shear_capacity_lbs"] = v_cap
+
+    names = list(LOAD_CASES) if cases is None else list(cases)
+    checks = []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for name in names:
+            case = LOAD_CASES[name]
+            if isinstance(case, PunchingCase):
+                load = np.broadcast_to(case.load(ctx), W.shape)
+                _, p_cap = aci_punching_shear(w, fc, case.pad_in, t)
+                checks.append(LoadCheck(
+                    case.name, case.description, "punching", load, "lbs",
+                    np.full(W.shape, np.nan), p_cap,
+                    np.where(load > 0, p_cap / load, np.inf),
+                ))
+                continue
+
+            st = girder_statics(ctx.length_ft, case.uniform(ctx),
+                                case.point_loads(ctx), n_stations)
+            m_abs = np.abs(st["moment_lb_ft"])
+            v_abs = np.maximum(np.abs(st["shear_lb"]), np.abs(st["shear_left_lb"]))
+            k_m = m_abs.argmax(axis=-1)
+            k_v = v_abs.argmax(axis=-1)
+            m = np.take_along_axis(m_abs, k_m[..., None], -1)[..., 0]
+            v = np.take_along_axis(v_abs, k_v[..., None], -1)[..., 0]
+            # Keep the sign of the governing moment (hogging negative)
+            m_signed = np.take_along_axis(st["moment_lb_ft"], k_m[..., None], -1)[..., 0]
+            checks.append(LoadCheck(
+                case.name, case.description, "flexure", m_signed, "lb-ft",
+                st["x_frac"][k_m] * ctx.length_ft, m_cap,
+                np.where(m > 0, m_cap / m, np.inf),
+            ))
+            checks.append(LoadCheck(
+                case.name, case.description, "shear", v, "lbs",
+                st["x_frac"][k_v] * ctx.length_ft, v_cap,
+                np.where(v > 0, v_cap / v, np.inf),
+            ))
+    return LoadCaseResults(checks=checks, section=section)
@@ -0,0 +1,589 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Vectorized Monte Carlo Engine
+
+Array-native counterpart of run_single() in scripts/uncertainty_analysis.py.
+evaluate() takes whole sample arrays and runs the same closed-form chain
+(shell weight -> draft -> freeboard -> GM -> crew bending -> SF) as one
+NumPy expression graph; run_monte_carlo() feeds it fixed-size chunks so
+peak temporary memory stays bounded regardless of the sample count.
+
+Each element of evaluate() matches run_single() to floating-point round-off
+(tested), so the scalar function remains the readable reference.
+
+run_parallel() splits a run into fixed-size shards, each drawing from its
+own SeedSequence child, and evaluates them on a ProcessPoolExecutor. Shard
+boundaries and seeds depend only on (seed, n, shard_size), each shard
+reduces to mergeable MonteCarloStats, and the partials are folded in shard
+order - so the merged result is bit-identical for any worker count.
+
+run_adaptive() instead evaluates one shard at a time until the failure
+probability and the reported percentiles reach target half-widths.
+
+Both accept checkpoint_dir: the folded statistics (and, with
+keep_samples, each shard's raw arrays) are saved as shards complete, and
+resume=True continues from the last checkpoint. Because shard seeds are
+fixed in advance and the fold order is unchanged, a resumed run gives
+exactly the result of an uninterrupted one.
+
+Per output, MonteCarloStats keeps constant-memory StreamingStats
+(calculations.streaming_stats): moments, a quantile sketch and a fixed-bin
+histogram over HISTOGRAM_RANGES. Raw samples are only kept on request.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    INCHES_PER_FOOT,
+    MIN_FREEBOARD_IN,
+    MIN_GM_IN,
+    MIN_SAFETY_FACTOR,
+    WATER_DENSITY_LB_PER_FT3,
+    section_modulus_thin_shell,
+)
+from calculations.checkpoint import (
+    Checkpoint,
+    seed_config,
+    streaming_from_arrays,
+    streaming_to_arrays,
+    table_config,
+)
+from calculations.streaming_stats import (
+    PROPORTION_INTERVALS,
+    StreamingStats,
+    quantile_interval,
+)
+
+# ── Baseline (Design A) ──
+BASE = {
+    "L": 192, "B": 32, "D": 17, "t": 0.5,
+    "density": 60.0,
+    "flexural": 1500.0,
+    "paddler_wt": 175.0,
+    "n_paddlers": 4,
+    "cwp": 0.70,
+    "crew_offset_ft": 0.0,  # crew centroid aft (+) of midship
+    "crew_cog_in": 10.0,    # crew centroid above keel (kneeling)
+}
+
+# BASE entries evaluate() also accepts as per-sample arrays
+VARIABLE_BASE = ("L", "B", "D", "cwp", "crew_offset_ft", "crew_cog_in")
+
+# ── Uncertain inputs: normal, limited to physical bounds [low, high] ──
+UNCERTAINTIES = {
+    "density":    {"mean": 60.0,  "std": 3.0,   "low": 45.0,  "high": 80.0,
+                   "label": "Concrete Density (PCF)", "pct": "±5%"},
+    "thickness":  {"mean": 0.5,   "std": 0.05,  "low": 0.25,  "high": 1.0,
+                   "label": "Wall Thickness (in)",    "pct": "±10%"},
+    "flexural":   {"mean": 1500,  "std": 150,   "low": 800.0, "high": 2500.0,
+                   "label": "Flexural Strength (psi)", "pct": "±10%"},
+    "paddler_wt": {"mean": 175,   "std": 15,    "low": 120.0, "high": 250.0,
+                   "label": "Paddler Weight (lbs)",   "pct": "±8.6%"},
+}
+
+OUTPUTS = ("canoe_wt", "loaded_wt", "fb_in", "gm_in", "sf")
+DEFAULT_SAMPLES = 1_000_000
+DEFAULT_CHUNK = 1 << 17  # 131,072 samples ≈ 20 MB of temporaries
+DEFAULT_SHARD = 1 << 20  # samples per SeedSequence child / task
+PASS_FLAGS = ("fb_pass", "gm_pass", "sf_pass", "all_pass")
+
+# Default adaptive targets: absolute half-width of the 5th/95th percentiles,
+# about half the last digit the uncertainty report prints
+PERCENTILE_TARGETS = {"canoe_wt": 1.0, "fb_in": 0.05, "gm_in": 0.05, "sf": 0.02}
+
+# Fixed histogram bins per output: (low, high, bins). Values outside land
+# in the under/overflow counts.
+HISTOGRAM_RANGES = {
+    "canoe_wt":  (0.0, 500.0, 1000),
+    "loaded_wt": (300.0, 1800.0, 1500),
+    "fb_in":     (0.0, 17.0, 680),
+    "gm_in":     (-10.0, 30.0, 800),
+    "sf":        (0.0, 8.0, 800),
+}
+
+HULL_COG_FRACTION = 0.38   # empty-hull KG as a fraction of depth
+REINFORCEMENT_FRACTION = 0.05
+FINISH_LBS = 3.0
+
+
+def evaluate(
+    density,
+    thickness,
+    flexural,
+    paddler_wt,
+    base: Dict = BASE,
+    hydro_table=None,
+    **varied,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized run_single(): inputs broadcast, outputs are arrays.
+
+    Any VARIABLE_BASE entry (hull dimensions, Cwp, crew position) may be
+    passed as a keyword array to vary per sample; otherwise it comes from
+    base. Returns canoe_wt, loaded_wt, fb_in, gm_in, sf and the pass flags
+    fb_pass, gm_pass, sf_pass, all_pass.
+    """
+    unknown = set(varied) - set(VARIABLE_BASE)
+    if unknown:
+        raise TypeError(f"evaluate() got unexpected per-sample inputs {sorted(unknown)}")
+    params = {k: varied.get(k, base.get(k, BASE[k])) for k in VARIABLE_BASE}
+    density, thickness, flexural, paddler_wt, *rest = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (density, thickness, flexural, paddler_wt)),
+        *(np.asarray(params[k], dtype=float) for k in varied),
+    )
+    params.update(zip(varied, rest))
+    L, B, D, cwp = params["L"], params["B"], params["D"], params["cwp"]
+    Lf, Bf, Df = L / INCHES_PER_FOOT, B / INCHES_PER_FOOT, D / INCHES_PER_FOOT
+    tf = thickness / INCHES_PER_FOOT
+
+    # shell_weight(): bottom + sides, times wall thickness and density
+    sw = ((math.pi / 4) * Lf * Bf + 2 * Lf * Df * 0.70) * tf * density
+    canoe_wt = sw + sw * REINFORCEMENT_FRACTION + FINISH_LBS
+    crew = paddler_wt * base["n_paddlers"]
+    loaded = canoe_wt + crew
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if hydro_table is not None:
+            curves = hydro_table.at_weight(loaded, L, B, D)
+            draft_ft = np.asarray(curves["draft_ft"], dtype=float)
+            KB = np.asarray(curves["kb_ft"], dtype=float)
+            BM = np.asarray(curves["bm_ft"], dtype=float)
+        else:
+            wp = Lf * Bf * cwp
+            draft_ft = np.where(wp > 0, loaded / WATER_DENSITY_LB_PER_FT3 / wp, 0.0)
+            KB = draft_ft / 2
+            I_wp = cwp * Lf * Bf**3 / 12
+            BM = np.where(draft_ft > 0, I_wp / (cwp * Lf * Bf * draft_ft), 0.0)
+        fb_in = np.maximum(0, (Df - draft_ft) * INCHES_PER_FOOT)
+
+        crew_cog_ft = params["crew_cog_in"] / INCHES_PER_FOOT
+        KG = (canoe_wt * Df * HULL_COG_FRACTION + crew * crew_cog_ft) / (canoe_wt + crew)
+        gm_in = (KB + BM - KG) * INCHES_PER_FOOT
+
+        # bending_moment_distributed_crew(): hull UDL + crew point load,
+        # taken at the load point x (midship when the crew offset is 0)
+        x = Lf / 2 + params["crew_offset_ft"]
+        M_max = canoe_wt / Lf * x * (Lf - x) / 2.0 + crew * x * (Lf - x) / Lf
+        S = section_modulus_thin_shell(B, D, thickness)
+        sigma = np.where(S > 0, (M_max * INCHES_PER_FOOT) / S, 0.0)
+        sf = np.where(sigma > 0, flexural / sigma, 0.0)
+
+    fb_pass = fb_in >= MIN_FREEBOARD_IN
+    gm_pass = gm_in >= MIN_GM_IN
+    sf_pass = sf >= MIN_SAFETY_FACTOR
+    return {
+        "canoe_wt": canoe_wt, "loaded_wt": loaded,
+        "fb_in": fb_in, "gm_in": gm_in, "sf": sf,
+        "fb_pass": fb_pass, "gm_pass": gm_pass, "sf_pass": sf_pass,
+        "all_pass": fb_pass & gm_pass & sf_pass,
+    }
+
+
+def sample_inputs(
+    rng: np.random.Generator,
+    n: int,
+    uncertainties: Dict = UNCERTAINTIES,
+) -> Dict[str, np.ndarray]:
+    """Normal draws for each uncertain input, clipped to [low, high]."""
+    return {
+        name: np.clip(rng.normal(u["mean"], u["std"], n), u["low"], u["high"])
+        for name, u in uncertainties.items()
+    }
+
+
+def run_monte_carlo(
+    n: int = DEFAULT_SAMPLES,
+    rng: Optional[np.random.Generator] = None,
+    chunk_size: int = DEFAULT_CHUNK,
+    base: Dict = BASE,
+    hydro_table=None,
+) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Sample and evaluate n designs in chunks of chunk_size.
+
+    Returns (outputs, samples): the OUTPUTS plus all_pass as length-n
+    arrays, and the input samples. Results are reproducible for a given
+    rng state and chunk_size (each chunk draws its inputs in turn).
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    samples = {name: np.empty(n) for name in UNCERTAINTIES}
+    outputs = {name: np.empty(n) for name in OUTPUTS}
+    outputs["all_pass"] = np.empty(n, dtype=bool)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        chunk = sample_inputs(rng, stop - start)
+        res = evaluate(**chunk, base=base, hydro_table=hydro_table)
+        for name, values in chunk.items():
+            samples[name][start:stop] = values
+        for name, values in outputs.items():
+            values[start:stop] = res[name]
+    return outputs, samples
+
+
+def summary_stats(values: np.ndarray) -> Dict[str, float]:
+    """Mean, std, 5th/95th percentiles, min and max of one output."""
+    p5, p95 = np.percentile(values, [5, 95])
+    return {
+        "mean": float(np.mean(values)), "std": float(np.std(values)),
+        "p5": float(p5), "p95": float(p95),
+        "min": float(np.min(values)), "max": float(np.max(values)),
+    }
+
+
+def _new_output_stats() -> Dict[str, StreamingStats]:
+    return {name: StreamingStats.with_range(*HISTOGRAM_RANGES[name]) for name in OUTPUTS}
+
+
+@dataclass
+class MonteCarloStats:
+    """
+    Mergeable partial result of one or more shards.
+
+    stats holds StreamingStats per output, passes the pass count per flag.
+    With keep_samples the raw outputs and inputs are carried too and
+    concatenated (in shard order) on merge.
+    """
+    count: int = 0
+    stats: Dict[str, StreamingStats] = field(default_factory=_new_output_stats)
+    passes: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(PASS_FLAGS, 0))
+    outputs: Optional[Dict[str, np.ndarray]] = None
+    samples: Optional[Dict[str, np.ndarray]] = None
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes["all_pass"] / self.count if self.count else math.nan
+
+    def update(self, results: Dict[str, np.ndarray]) -> None:
+        """Fold in one evaluated chunk."""
+        self.count += len(results["all_pass"])
+        for name in OUTPUTS:
+            self.stats[name].update(results[name])
+        for flag in PASS_FLAGS:
+            self.passes[flag] += int(np.count_nonzero(results[flag]))
+
+    def merge(self, other: "MonteCarloStats") -> "MonteCarloStats":
+        """Combine with the stats of the following shard."""
+        def cat(a, b):
+            if a is None or b is None:
+                return None
+            return {k: np.concatenate([a[k], b[k]]) for k in a}
+        return MonteCarloStats(
+            self.count + other.count,
+            {k: st.merge(other.stats[k]) for k, st in self.stats.items()},
+            {k: c + other.passes[k] for k, c in self.passes.items()},
+            cat(self.outputs, other.outputs),
+            cat(self.samples, other.samples),
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Counts and streaming stats as plain arrays (raw samples excluded)."""
+        out = {"count": np.array(self.count, dtype=np.int64),
+               "passes": np.array([self.passes[f] for f in PASS_FLAGS], dtype=np.int64)}
+        for name, st in self.stats.items():
+            out.update(streaming_to_arrays(st, name))
+        return out
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "MonteCarloStats":
+        return cls(
+            int(arrays["count"]),
+            {name: streaming_from_arrays(arrays, name) for name in OUTPUTS},
+            {f: int(c) for f, c in zip(PASS_FLAGS, arrays["passes"])},
+        )
+
+    def raw_arrays(self) -> Dict[str, np.ndarray]:
+        """Kept inputs and outputs, keyed in/<name> and out/<name>."""
+        return {**{f"in/{k}": v for k, v in self.samples.items()},
+                **{f"out/{k}": v for k, v in self.outputs.items()}}
+
+    def with_raw_arrays(self, parts) -> "MonteCarloStats":
+        """Copy carrying the concatenation of raw_arrays() dicts."""
+        def cat(prefix):
+            keys = [k for k in parts[0] if k.startswith(prefix)]
+            return {k[len(prefix):]: np.concatenate([p[k] for p in parts]) for k in keys}
+        return replace(self, samples=cat("in/"), outputs=cat("out/"))
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One unit of parallel work: a sample range and its seed."""
+    index: int
+    start: int
+    size: int
+    seed: np.random.SeedSequence
+
+
+def plan_shards(n: int, seed, shard_size: int = DEFAULT_SHARD) -> List[Shard]:
+    """Split n samples into fixed-size shards with spawned SeedSequence children."""
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    n_shards = max(1, -(-n // shard_size))
+    children = root.spawn(n_shards)
+    return [
+        Shard(i, i * shard_size, min(shard_size, n - i * shard_size), children[i])
+        for i in range(n_shards)
+    ]
+
+
+def run_shard(
+    shard: Shard,
+    chunk_size: int = DEFAULT_CHUNK,
+    base: Dict = BASE,
+    hydro_table=None,
+    keep_samples: bool = False,
+    sampler: Optional[str] = None,
+    copula=None,
+) -> MonteCarloStats:
+    """
+    Evaluate one shard in chunks and reduce it to MonteCarloStats.
+
+    sampler=None draws clipped normals (sample_inputs); a name from
+    calculations.sampling.SAMPLERS draws that point set per chunk, mapped
+    through the exact truncated normals. A copula.GaussianCopula draws
+    correlated inputs instead (through sampler's point set, if given).
+    """
+    rng = np.random.default_rng(shard.seed)
+    if copula is not None:
+        def draw(rng, n):
+            return copula.sample(rng, n, sampler)
+    elif sampler is None:
+        draw = sample_inputs
+    else:
+        from calculations.sampling import sample
+        def draw(rng, n):
+            return sample(sampler, n, rng)
+    stats = MonteCarloStats()
+    kept_in, kept_out = [], []
+    for start in range(0, shard.size, chunk_size):
+        chunk = draw(rng, min(chunk_size, shard.size - start))
+        res = evaluate(**chunk, base=base, hydro_table=hydro_table)
+        stats.update(res)
+        if keep_samples:
+            kept_in.append(chunk)
+            kept_out.append({k: res[k] for k in OUTPUTS + ("all_pass",)})
+    if keep_samples:
+        stats.samples = {k: np.concatenate([c[k] for c in kept_in]) for k in kept_in[0]}
+        stats.outputs = {k: np.concatenate([c[k] for c in kept_out]) for k in kept_out[0]}
+    return stats
+
+
+def _run_shard_task(args) -> MonteCarloStats:
+    return run_shard(*args)
+
+
+def run_parallel(
+    n: int = DEFAULT_SAMPLES,
+    seed=42,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD,
+    chunk_size: int = DEFAULT_CHUNK,
+    base: Dict = BASE,
+    hydro_table=None,
+    keep_samples: bool = False,
+    sampler: Optional[str] = None,
+    checkpoint_dir=None,
+    resume: bool = False,
+    checkpoint_every: int = 1,
+    copula=None,
+) -> MonteCarloStats:
+    """
+    Sharded Monte Carlo over a process pool.
+
+    workers defaults to os.cpu_count(); workers=1 runs in-process. The
+    result depends on (seed, n, shard_size, chunk_size) only. Keep
+    keep_samples off for very large n: memory is then constant in n and
+    only the streaming stats cross process boundaries. sampler is as in
+    run_shard(); with QMC samplers each chunk is an independently
+    randomized point set, so keep chunk_size a power of two for Sobol'.
+    copula (a copula.GaussianCopula) switches to correlated inputs.
+
+    With checkpoint_dir the folded stats are saved every checkpoint_every
+    shards (kept samples go to one compressed .npz per shard); resume=True
+    skips the shards already folded.
+    """
+    shards = plan_shards(n, seed, shard_size)
+    tasks = [(s, chunk_size, base, hydro_table, keep_samples, sampler, copula) for s in shards]
+    merged, done, on_part = None, 0, None
+    if checkpoint_dir is not None:
+        ck = Checkpoint(checkpoint_dir, {
+            "kind": "run_parallel", "n": n, "seed": seed_config(seed),
+            "shard_size": shard_size, "chunk_size": chunk_size, "base": base,
+            "hydro_table": table_config(hydro_table), "keep_samples": keep_samples,
+            "sampler": sampler, "copula": copula.config() if copula else None,
+        })
+        merged, done, _ = _resume(ck, resume, keep_samples)
+        on_part = _checkpointer(ck, done, len(shards), checkpoint_every, keep_samples)
+    tasks = tasks[done:]
+    if not tasks:
+        return merged
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        partials = map(_run_shard_task, tasks)
+        return _fold(partials, merged, on_part)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so the fold order is fixed
+        return _fold(pool.map(_run_shard_task, tasks), merged, on_part)
+
+
+def _fold(partials, merged=None, on_part=None) -> MonteCarloStats:
+    for part in partials:
+        merged = part if merged is None else merged.merge(part)
+        if on_part is not None:
+            on_part(merged, part)
+    return merged
+
+
+def _resume(ck: Checkpoint, resume: bool, keep_samples: bool):
+    """(merged stats, shards done, state) from a checkpoint, or (None, 0, None)."""
+    state = ck.start(resume)
+    if state is None:
+        return None, 0, None
+    done = int(state["shards_done"])
+    merged = MonteCarloStats.from_arrays(state)
+    if keep_samples:
+        merged = merged.with_raw_arrays([ck.load_part(i) for i in range(done)])
+    return merged, done, state
+
+
+def _checkpointer(ck: Checkpoint, done: int, total: int, every: int,
+                  keep_samples: bool, extra=None):
+    """on_part callback for _fold(): save parts and, every `every` shards, the state."""
+    counter = {"done": done}
+
+    def on_part(merged: MonteCarloStats, part: MonteCarloStats) -> None:
+        index = counter["done"]
+        counter["done"] += 1
+        if keep_samples:
+            ck.save_part(index, part.raw_arrays())
+        if counter["done"] % every == 0 or counter["done"] == total:
+            state = merged.to_arrays()
+            state["shards_done"] = np.array(counter["done"])
+            if extra is not None:
+                state.update(extra())
+            ck.save(state)
+    return on_part
+
+
+@dataclass
+class AdaptiveResult:
+    """Outcome of run_adaptive(): stats plus the precision achieved."""
+    stats: MonteCarloStats
+    converged: bool
+    batches: int
+    wall_time_s: float
+    intervals: Dict[str, Tuple[float, float]]
+    half_widths: Dict[str, float]
+
+    @property
+    def n_samples(self) -> int:
+        return self.stats.count
+
+
+def precision(
+    stats: MonteCarloStats,
+    quantiles=(0.05, 0.95),
+    outputs=tuple(PERCENTILE_TARGETS),
+    confidence: float = 0.95,
+    pf_method: str = "wilson",
+) -> Tuple[Dict[str, Tuple[float, float]], Dict[str, float]]:
+    """
+    Confidence intervals and half-widths of P(fail) and percentiles.
+
+    Keys are "p_fail" and "<output>@<q>" (e.g. "sf@0.05"). Percentile
+    half-widths are the larger side of the interval around the estimate.
+    """
+    interval = PROPORTION_INTERVALS[pf_method]
+    lo, hi = interval(stats.count - stats.passes["all_pass"], stats.count, confidence)
+    intervals = {"p_fail": (lo, hi)}
+    half = {"p_fail": (hi - lo) / 2}
+    for name in outputs:
+        sketch = stats.stats[name].sketch
+        for q in quantiles:
+            est = sketch.quantile(q)
+            lo, hi = quantile_interval(sketch, q, confidence)
+            intervals[f"{name}@{q:g}"] = (lo, hi)
+            half[f"{name}@{q:g}"] = max(est - lo, hi - est)
+    return intervals, half
+
+
+def run_adaptive(
+    pf_half_width: float = 0.005,
+    percentile_half_width: Optional[Dict[str, float]] = None,
+    quantiles=(0.05, 0.95),
+    confidence: float = 0.95,
+    pf_method: str = "wilson",
+    batch_size: int = 4096,
+    max_samples: int = 10_000_000,
+    seed=42,
+    chunk_size: int = DEFAULT_CHUNK,
+    base: Dict = BASE,
+    hydro_table=None,
+    sampler: Optional[str] = None,
+    keep_samples: bool = False,
+    checkpoint_dir=None,
+    resume: bool = False,
+    copula=None,
+) -> AdaptiveResult:
+    """
+    Monte Carlo that stops as soon as every precision target is met.
+
+    After each batch, the half-width of the P(fail) interval (pf_method:
+    "wilson" or "clopper-pearson") must be <= pf_half_width and each
+    percentile interval half-width <= percentile_half_width[output]
+    (defaults: PERCENTILE_TARGETS). Runs at most max_samples.
+
+    Batch i uses the i-th SeedSequence child of seed, so with batch_size
+    equal to run_parallel()'s shard_size the samples are the leading
+    shards of the equivalent fixed-size run.
+
+    checkpoint_dir / resume work as in run_parallel(); the checkpoint
+    stores the batch count, which is also the root SeedSequence's spawn
+    position, so the resumed batches draw the same streams. wall_time_s
+    includes the time spent before the interruption.
+    """
+    if max_samples <= 0 or batch_size <= 0:
+        raise ValueError(f"max_samples and batch_size must be positive, "
+                         f"got {max_samples} and {batch_size}")
+    targets = dict(PERCENTILE_TARGETS if percentile_half_width is None else percentile_half_width)
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    t0 = time.perf_counter()
+    merged, batches, converged, on_part, elapsed = None, 0, False, None, 0.0
+    if checkpoint_dir is not None:
+        ck = Checkpoint(checkpoint_dir, {
+            "kind": "run_adaptive", "seed": seed_config(root), "batch_size": batch_size,
+            "max_samples": max_samples, "chunk_size": chunk_size, "base": base,
+            "hydro_table": table_config(hydro_table), "keep_samples": keep_samples,
+            "sampler": sampler, "copula": copula.config() if copula else None,
+        })
+        merged, batches, state = _resume(ck, resume, keep_samples)
+        if state is not None:
+            elapsed = float(state["wall_time_s"])
+        root = np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key,
+                                      pool_size=root.pool_size, n_children_spawned=batches)
+        on_part = _checkpointer(ck, batches, -1, 1, keep_samples, lambda: {
+            "wall_time_s": np.array(elapsed + time.perf_counter() - t0)})
+    def check(stats):
+        intervals, half = precision(stats, quantiles, tuple(targets), confidence, pf_method)
+        met = half["p_fail"] <= pf_half_width and all(
+            half[f"{name}@{q:g}"] <= tol for name, tol in targets.items() for q in quantiles
+        )
+        return met, intervals, half
+
+    if merged is not None:
+        # Resumed: the checkpointed run may already have finished
+        converged, intervals, half = check(merged)
+    while not converged and (merged.count if merged else 0) < max_samples:
+        start = merged.count if merged else 0
+        shard = Shard(batches, start, min(batch_size, max_samples - start), root.spawn(1)[0])
+        part = run_shard(shard, chunk_size, base, hydro_table, keep_samples, sampler, copula)
+        merged = _fold([part], merged, on_part)
+        batches += 1
+        converged, intervals, half = check(merged)
+    return AdaptiveResult(merged, converged, batches, elapsed + time.perf_counter() - t0,
+                          intervals, half)
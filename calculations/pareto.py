@@ -0,0 +1,251 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Multi-Objective Search (NSGA-II)
+
+Population-based search for the trade-off between competing objectives
+(weight vs GM margin vs freeboard vs length) instead of one weighted
+minimum. Deb et al.'s NSGA-II:
+
+    1. rank parents + children into non-dominated fronts
+       (constrained domination: feasible beats infeasible, infeasible
+       designs are ordered by total violation)
+    2. within a front prefer designs with a large crowding distance
+    3. binary tournaments on (rank, crowding) pick parents; simulated
+       binary crossover (SBX) and polynomial mutation make children
+
+Every generation is evaluated by one call evaluate(X) on the whole
+(pop_size, n_vars) matrix, so a vectorized model (run_complete_analysis_
+batch) costs one NumPy pass per generation. Objectives are minimized;
+negate any that should be maximized.
+
+ParetoArchive keeps every feasible non-dominated design seen in any
+generation (bounded by crowding), so the exported front does not lose
+designs the population later drifted away from.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# evaluate(X) -> (objectives (n, m), violation (n,) >= 0, columns {name: (n,)})
+Evaluator = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]]
+
+DEFAULT_ARCHIVE_SIZE = 1000
+
+
+def dominance(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(len(a), len(b)) bool: a[i] Pareto-dominates b[j] (minimization)."""
+    # One 2-D comparison per objective; reducing a (na, nb, m) cube over
+    # its short last axis is several times slower.
+    no_worse = np.ones((len(a), len(b)), dtype=bool)
+    better = np.zeros((len(a), len(b)), dtype=bool)
+    for k in range(a.shape[1]):
+        ak, bk = a[:, k, None], b[None, :, k]
+        no_worse &= ak <= bk
+        better |= ak < bk
+    return no_worse & better
+
+
+def _equal_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(len(a), len(b)) bool: a[i] == b[j] in every column."""
+    same = np.ones((len(a), len(b)), dtype=bool)
+    for k in range(a.shape[1]):
+        same &= a[:, k, None] == b[None, :, k]
+    return same
+
+
+def non_dominated(F: np.ndarray) -> np.ndarray:
+    """Mask of the first (non-dominated) front of F."""
+    return ~dominance(F, F).any(axis=0)
+
+
+def non_dominated_sort(F: np.ndarray, violation: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Front index per row (0 = non-dominated). With violation, designs are
+    compared by constrained domination.
+    """
+    dom = dominance(F, F)
+    if violation is not None:
+        v = np.asarray(violation, dtype=float)
+        ok = v <= 0
+        both_ok = ok[:, None] & ok[None, :]
+        by_violation = (ok[:, None] & ~ok[None, :]) | (
+            ~ok[:, None] & ~ok[None, :] & (v[:, None] < v[None, :]))
+        dom = np.where(both_ok, dom, by_violation)
+    count = dom.sum(axis=0)
+    rank = np.full(len(F), -1)
+    remaining = np.ones(len(F), dtype=bool)
+    front = 0
+    while remaining.any():
+        current = remaining & (count == 0)
+        rank[current] = front
+        remaining &= ~current
+        count = count - dom[current].sum(axis=0)
+        front += 1
+    return rank
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance within one front; extremes are infinite."""
+    n, m = F.shape
+    if n <= 2:
+        return np.full(n, np.inf)
+    dist = np.zeros(n)
+    for k in range(m):
+        order = np.argsort(F[:, k], kind="stable")
+        f = F[order, k]
+        dist[order[[0, -1]]] = np.inf
+        span = f[-1] - f[0]
+        if span > 0:
+            dist[order[1:-1]] += (f[2:] - f[:-2]) / span
+    return dist
+
+
+def rank_and_crowding(F: np.ndarray, violation: Optional[np.ndarray] = None
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+    rank = non_dominated_sort(F, violation)
+    crowd = np.empty(len(F))
+    for r in np.unique(rank):
+        idx = np.flatnonzero(rank == r)
+        crowd[idx] = crowding_distance(F[idx])
+    return rank, crowd
+
+
+def sbx_crossover(rng: np.random.Generator, a: np.ndarray, b: np.ndarray,
+                  lo: np.ndarray, hi: np.ndarray, eta: float = 15.0,
+                  prob: float = 0.9) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulated binary crossover of parent rows a, b; children clipped to bounds."""
+    u = rng.random(a.shape)
+    beta = np.where(u <= 0.5, (2 * u) ** (1 / (eta + 1)),
+                    (1 / (2 * (1 - u))) ** (1 / (eta + 1)))
+    swap = (rng.random((len(a), 1)) < prob) & (rng.random(a.shape) < 0.5)
+    c1 = np.where(swap, 0.5 * ((1 + beta) * a + (1 - beta) * b), a)
+    c2 = np.where(swap, 0.5 * ((1 - beta) * a + (1 + beta) * b), b)
+    return np.clip(c1, lo, hi), np.clip(c2, lo, hi)
+
+
+def polynomial_mutation(rng: np.random.Generator, X: np.ndarray, lo: np.ndarray,
+                        hi: np.ndarray, eta: float = 20.0,
+                        prob: Optional[float] = None) -> np.ndarray:
+    """Polynomial mutation; each variable mutates with prob (default 1/n_vars)."""
+    prob = 1.0 / X.shape[1] if prob is None else prob
+    u = rng.random(X.shape)
+    delta = np.where(u < 0.5, (2 * u) ** (1 / (eta + 1)) - 1,
+                     1 - (2 * (1 - u)) ** (1 / (eta + 1)))
+    mutate = rng.random(X.shape) < prob
+    return np.clip(X + mutate * delta * (hi - lo), lo, hi)
+
+
+def tournament(rng: np.random.Generator, rank: np.ndarray, crowd: np.ndarray,
+               n: int) -> np.ndarray:
+    """n binary tournaments: lower rank wins, then larger crowding distance."""
+    i, j = rng.integers(len(rank), size=(2, n))
+    i_wins = (rank[i] < rank[j]) | ((rank[i] == rank[j]) & (crowd[i] >= crowd[j]))
+    return np.where(i_wins, i, j)
+
+
+def _take(columns: Dict[str, np.ndarray], idx) -> Dict[str, np.ndarray]:
+    return {k: v[idx] for k, v in columns.items()}
+
+
+def _concat(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {k: np.concatenate([a[k], b[k]]) for k in a}
+
+
+class ParetoArchive:
+    """
+    Feasible non-dominated designs over a whole run.
+
+    update() adds a generation: new designs dominated by the archive (or by
+    each other) are dropped, archived designs they dominate are evicted.
+    Past max_size the most crowded designs are dropped (extremes are kept).
+    """
+
+    def __init__(self, max_size: int = DEFAULT_ARCHIVE_SIZE):
+        self.max_size = max_size
+        self.X: Optional[np.ndarray] = None
+        self.F: Optional[np.ndarray] = None
+        self.columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return 0 if self.F is None else len(self.F)
+
+    def update(self, X: np.ndarray, F: np.ndarray, violation: np.ndarray,
+               columns: Optional[Dict[str, np.ndarray]] = None) -> int:
+        """Merge a generation; returns how many of its designs were archived."""
+        columns = columns or {}
+        keep = np.flatnonzero(np.asarray(violation) <= 0)
+        X, F, columns = X[keep], F[keep], _take(columns, keep)
+        keep = np.flatnonzero(non_dominated(F))
+        X, F, columns = X[keep], F[keep], _take(columns, keep)
+        if self.F is not None and len(F):
+            duplicate = _equal_rows(self.F, F).any(axis=0)
+            new = ~duplicate & ~dominance(self.F, F).any(axis=0)
+            old = ~dominance(F[new], self.F).any(axis=0)
+            X, F, columns = X[new], F[new], _take(columns, new)
+            self.X = np.concatenate([self.X[old], X])
+            self.F = np.concatenate([self.F[old], F])
+            self.columns = _concat(_take(self.columns, old), columns)
+        elif self.F is None:
+            self.X, self.F, self.columns = X, F, columns
+        if len(self) > self.max_size:
+            keep = np.sort(np.argsort(-crowding_distance(self.F), kind="stable")[:self.max_size])
+            self.X, self.F = self.X[keep], self.F[keep]
+            self.columns = _take(self.columns, keep)
+        return len(F)
+
+
+@dataclass
+class ParetoResult:
+    """Final population (X, F, violation, columns) and the run's archive."""
+    X: np.ndarray
+    F: np.ndarray
+    violation: np.ndarray
+    columns: Dict[str, np.ndarray]
+    archive: ParetoArchive
+    generations: int
+    evaluations: int
+
+
+def nsga2(
+    evaluate: Evaluator,
+    bounds: Sequence[Tuple[float, float]],
+    pop_size: int = 200,
+    generations: int = 200,
+    seed=None,
+    archive_size: int = DEFAULT_ARCHIVE_SIZE,
+    crossover_eta: float = 15.0,
+    mutation_eta: float = 20.0,
+) -> ParetoResult:
+    """
+    NSGA-II over a box. evaluate(X) gets the whole (n, n_vars) generation
+    and returns (objectives (n, m) to minimize, violation (n,) with 0 for a
+    feasible design, {column: (n,)} metrics to keep with archived designs).
+    The run is reproducible from seed.
+    """
+    rng = np.random.default_rng(seed)
+    lo, hi = np.array(bounds, dtype=float).T
+    archive = ParetoArchive(archive_size)
+
+    X = lo + rng.random((pop_size, len(lo))) * (hi - lo)
+    F, V, cols = evaluate(X)
+    archive.update(X, F, V, cols)
+    evaluations = pop_size
+    rank, crowd = rank_and_crowding(F, V)
+
+    for _ in range(generations):
+        parents = tournament(rng, rank, crowd, 2 * ((pop_size + 1) // 2))
+        c1, c2 = sbx_crossover(rng, X[parents[0::2]], X[parents[1::2]], lo, hi, crossover_eta)
+        children = polynomial_mutation(rng, np.concatenate([c1, c2])[:pop_size], lo, hi, mutation_eta)
+        Fc, Vc, cols_c = evaluate(children)
+        archive.update(children, Fc, Vc, cols_c)
+        evaluations += pop_size
+
+        X, F, V = np.concatenate([X, children]), np.concatenate([F, Fc]), np.concatenate([V, Vc])
+        cols = _concat(cols, cols_c)
+        rank, crowd = rank_and_crowding(F, V)
+        survivors = np.lexsort((-crowd, rank))[:pop_size]
+        X, F, V, cols = X[survivors], F[survivors], V[survivors], _take(cols, survivors)
+        rank, crowd = rank[survivors], crowd[survivors]
+
+    return ParetoResult(X, F, V, cols, archive, generations, evaluations)
@@ -0,0 +1,377 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Rare-Event Reliability
+
+Failure probabilities for the uncertainty model's limit states
+
+    freeboard   g = fb_in - MIN_FREEBOARD_IN
+    stability   g = gm_in - MIN_GM_IN
+    strength    g = sf    - MIN_SAFETY_FACTOR
+
+(g < 0 is failure; the system fails when any component does). A crude
+Monte Carlo pass rate of 100% over N samples only says P(fail) < ~3/N.
+The methods here work in independent standard-normal space u, mapped to
+the truncated-normal inputs by x = F⁻¹(Φ(u)), and resolve much smaller
+probabilities with far fewer model evaluations:
+
+    form()                 HL-RF design-point search, Pf ≈ Φ(-β)
+    sorm()                 Breitung curvature correction at the design point
+    importance_sampling()  normal mixture centred on design point(s)
+    subset_simulation()    Au & Beck, modified Metropolis, p0 = 0.1
+
+The sampling methods report a coefficient of variation, and every result
+records the number of limit-state evaluations spent. All limit-state
+calls go through evaluate(), a whole batch of u points per call.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy.special import ndtr
+
+from calculations.concrete_canoe_calculator import (
+    MIN_FREEBOARD_IN,
+    MIN_GM_IN,
+    MIN_SAFETY_FACTOR,
+)
+from calculations.monte_carlo import BASE, UNCERTAINTIES, evaluate
+from calculations.sampling import truncated_normal_ppf
+
+# component -> (output of evaluate(), minimum allowed value)
+COMPONENTS = {
+    "freeboard": ("fb_in", MIN_FREEBOARD_IN),
+    "stability": ("gm_in", MIN_GM_IN),
+    "strength": ("sf", MIN_SAFETY_FACTOR),
+}
+
+FD_STEP = 1e-4  # finite-difference step in u space
+
+
+class LimitState:
+    """
+    Vectorized limit-state function g(u) in standard-normal space.
+
+    components selects from COMPONENTS (minimum of their margins for a
+    series system); limits overrides the allowed minimum per component.
+    Calling with u of shape (n, d) returns g of shape (n,). evaluations
+    counts model evaluations (rows), calls the number of batches.
+    """
+
+    def __init__(
+        self,
+        components: Sequence[str] = tuple(COMPONENTS),
+        limits: Optional[Dict[str, float]] = None,
+        base: Dict = BASE,
+        hydro_table=None,
+        uncertainties: Dict = UNCERTAINTIES,
+    ):
+        self.components = tuple(components)
+        self.limits = {c: COMPONENTS[c][1] for c in self.components}
+        self.limits.update(limits or {})
+        self.base = base
+        self.hydro_table = hydro_table
+        self.uncertainties = uncertainties
+        self.evaluations = 0
+        self.calls = 0
+
+    @property
+    def dim(self) -> int:
+        return len(self.uncertainties)
+
+    def to_physical(self, u) -> Dict[str, np.ndarray]:
+        """Map standard-normal points (n, d) to the model inputs."""
+        u = np.atleast_2d(u)
+        return {
+            name: truncated_normal_ppf(ndtr(u[:, j]), p["mean"], p["std"], p["low"], p["high"])
+            for j, (name, p) in enumerate(self.uncertainties.items())
+        }
+
+    def margins(self, u) -> Dict[str, np.ndarray]:
+        """Per-component margins g_c(u)."""
+        u = np.atleast_2d(u)
+        self.evaluations += len(u)
+        self.calls += 1
+        out = evaluate(**self.to_physical(u), base=self.base, hydro_table=self.hydro_table)
+        return {c: out[COMPONENTS[c][0]] - self.limits[c] for c in self.components}
+
+    def __call__(self, u) -> np.ndarray:
+        m = self.margins(u)
+        return np.min(np.stack([m[c] for c in self.components]), axis=0)
+
+    def component(self, name: str) -> "LimitState":
+        """Single-component limit state sharing this one's settings."""
+        return LimitState((name,), {name: self.limits[name]}, self.base,
+                          self.hydro_table, self.uncertainties)
+
+
+@dataclass
+class ReliabilityResult:
+    """Failure probability estimate from one method."""
+    method: str
+    pf: float
+    cov: float
+    beta: float
+    evaluations: int
+    design_point_u: Optional[np.ndarray] = None
+    design_point: Optional[Dict[str, float]] = None
+    converged: bool = True
+    details: Dict = field(default_factory=dict)
+
+    def crude_mc_equivalent(self, cov: Optional[float] = None) -> float:
+        """Crude MC samples needed for the same CoV: (1 - p) / (p · CoV²)."""
+        cov = self.cov if cov is None else cov
+        if not self.pf or not cov or not math.isfinite(cov):
+            return math.nan
+        return (1.0 - self.pf) / (self.pf * cov * cov)
+
+
+def _beta_from_pf(pf: float) -> float:
+    from scipy.special import ndtri
+    return float(-ndtri(pf)) if 0 < pf < 1 else (math.inf if pf == 0 else -math.inf)
+
+
+def _gradient(g: LimitState, u: np.ndarray, step: float = FD_STEP):
+    """g(u) and its central-difference gradient, one batched call."""
+    d = len(u)
+    pts = np.vstack([u, u + step * np.eye(d), u - step * np.eye(d)])
+    vals = g(pts)
+    return vals[0], (vals[1:d + 1] - vals[d + 1:]) / (2 * step)
+
+
+def form(
+    g: LimitState,
+    u0: Optional[np.ndarray] = None,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> ReliabilityResult:
+    """
+    First-order reliability: HL-RF iteration for the design point u*
+    (the failure point closest to the origin), β = ±|u*|, Pf = Φ(-β).
+    """
+    start = g.evaluations
+    u = np.zeros(g.dim) if u0 is None else np.asarray(u0, dtype=float)
+    g0 = None
+    converged = False
+    for _ in range(max_iter):
+        val, grad = _gradient(g, u)
+        if g0 is None:
+            g0 = val
+        norm2 = float(grad @ grad)
+        if norm2 == 0.0:
+            break
+        u_new = (grad @ u - val) / norm2 * grad
+        step = np.linalg.norm(u_new - u)
+        u = u_new
+        if step < tol * max(1.0, np.linalg.norm(u)):
+            converged = True
+            break
+    beta = math.copysign(float(np.linalg.norm(u)), g0 if g0 is not None else 1.0)
+    phys = {k: float(v[0]) for k, v in g.to_physical(u).items()}
+    return ReliabilityResult(
+        "FORM", float(ndtr(-beta)), math.nan, beta, g.evaluations - start,
+        u, phys, converged, {"alpha": u / beta if beta else u},
+    )
+
+
+def sorm(g: LimitState, design: ReliabilityResult, step: float = 1e-3) -> ReliabilityResult:
+    """
+    Second-order (Breitung) correction of a FORM result:
+    Pf ≈ Φ(-β) · Π (1 + β κ_i)^-1/2 with κ_i the principal curvatures of
+    g = 0 at u* (positive when the surface bends away from the origin).
+    """
+    start = g.evaluations
+    u = design.design_point_u
+    d = len(u)
+    # Hessian by central differences, all points in one batch
+    e = np.eye(d) * step
+    pts = [u]
+    for i in range(d):
+        pts += [u + e[i], u - e[i]]
+        for j in range(i + 1, d):
+            pts += [u + e[i] + e[j], u + e[i] - e[j], u - e[i] + e[j], u - e[i] - e[j]]
+    vals = g(np.array(pts))
+    g0, k = vals[0], 1
+    grad = np.empty(d)
+    hess = np.empty((d, d))
+    for i in range(d):
+        gp, gm = vals[k], vals[k + 1]
+        k += 2
+        grad[i] = (gp - gm) / (2 * step)
+        hess[i, i] = (gp - 2 * g0 + gm) / step**2
+        for j in range(i + 1, d):
+            pp, pm, mp, mm = vals[k:k + 4]
+            k += 4
+            hess[i, j] = hess[j, i] = (pp - pm - mp + mm) / (4 * step**2)
+
+    # Tangent-plane basis orthogonal to the gradient
+    n_hat = grad / np.linalg.norm(grad)
+    q, _ = np.linalg.qr(np.column_stack([n_hat, np.eye(d)[:, :d - 1]]))
+    tangent = q[:, 1:]
+    kappa = np.linalg.eigvalsh(tangent.T @ hess @ tangent / np.linalg.norm(grad))
+    beta = design.beta
+    factor = np.prod(1.0 + beta * kappa)
+    pf = float(ndtr(-beta) / math.sqrt(factor)) if factor > 0 else math.nan
+    return ReliabilityResult(
+        "SORM", pf, math.nan, _beta_from_pf(pf), design.evaluations + g.evaluations - start,
+        u, design.design_point, design.converged, {"curvatures": kappa},
+    )
+
+
+def importance_sampling(
+    g: LimitState,
+    centers: Sequence[np.ndarray],
+    n: int = 10_000,
+    rng: Optional[np.random.Generator] = None,
+    batch: int = 1 << 16,
+) -> ReliabilityResult:
+    """
+    Importance sampling from an equal-weight mixture of unit normals at
+    the given centres (design points of the components):
+    Pf = E_h[ 1{g<0} φ(u) / h(u) ].
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    start = g.evaluations
+    centers = np.atleast_2d(np.asarray(centers, dtype=float))
+    m, d = centers.shape
+    total = total_sq = 0.0
+    for lo in range(0, n, batch):
+        size = min(batch, n - lo)
+        pick = rng.integers(m, size=size)
+        u = centers[pick] + rng.standard_normal((size, d))
+        # log φ(u)/h(u) with h the mixture density
+        log_h = -0.5 * ((u[:, None, :] - centers[None]) ** 2).sum(-1)
+        log_h = np.logaddexp.reduce(log_h, axis=1) - math.log(m)
+        w = np.exp(-0.5 * (u * u).sum(1) - log_h)
+        x = np.where(g(u) < 0, w, 0.0)
+        total += x.sum()
+        total_sq += (x * x).sum()
+    pf = total / n
+    var = max(total_sq / n - pf * pf, 0.0) / n
+    cov = math.sqrt(var) / pf if pf > 0 else math.inf
+    return ReliabilityResult("IS", pf, cov, _beta_from_pf(pf), g.evaluations - start,
+                             details={"centers": centers})
+
+
+def _chain_correlation(ind: np.ndarray, p: float) -> float:
+    """Au & Beck γ factor from indicator chains of shape (n_chains, length)."""
+    n_chains, length = ind.shape
+    n = n_chains * length
+    r0 = p * (1 - p)
+    if r0 <= 0:
+        return 0.0
+    gamma = 0.0
+    for k in range(1, length):
+        r = np.sum(ind[:, :-k] * ind[:, k:]) / (n - k * n_chains) - p * p
+        gamma += 2 * (1 - k * n_chains / n) * r / r0
+    return max(gamma, 0.0)
+
+
+def subset_simulation(
+    g: LimitState,
+    n_per_level: int = 2000,
+    p0: float = 0.1,
+    rng: Optional[np.random.Generator] = None,
+    proposal_std: float = 1.0,
+    max_levels: int = 12,
+) -> ReliabilityResult:
+    """
+    Subset simulation: Pf = p0^m · P(F | F_m) through nested intermediate
+    failure events g < b_1 > b_2 > ... > 0, each level seeded by the best
+    p0 fraction of the previous one and filled with component-wise
+    (modified) Metropolis chains. CoV combines the per-level
+    (1-p)/(pN)·(1+γ) terms, γ from the chain correlation.
+
+    If max_levels pass without reaching g < 0 the result is flagged not
+    converged and details["pf_upper"] (the product of the level
+    probabilities reached) bounds the failure probability from above.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    start = g.evaluations
+    n_seeds = int(round(n_per_level * p0))
+    steps = n_per_level // n_seeds
+    d = g.dim
+
+    u = rng.standard_normal((n_per_level, d))
+    gv = g(u)
+    thresholds: List[float] = []
+    cov2 = 0.0
+    pf = 1.0
+    converged = True
+    details: Dict = {}
+    ind_chains = None
+    for level in range(max_levels):
+        order = np.argsort(gv, kind="stable")
+        b = float(gv[order[n_seeds - 1]] + gv[order[n_seeds]]) / 2
+        if b <= 0 or level == max_levels - 1:
+            p_last = float(np.mean(gv < 0))
+            if b > 0:
+                converged = False
+                details["pf_upper"] = pf
+            gamma = _chain_correlation((ind_chains < 0), p_last) if ind_chains is not None else 0.0
+            if p_last > 0:
+                cov2 += (1 - p_last) / (p_last * n_per_level) * (1 + gamma)
+            pf *= p_last
+            break
+        thresholds.append(b)
+        gamma = _chain_correlation((ind_chains < b), p0) if ind_chains is not None else 0.0
+        cov2 += (1 - p0) / (p0 * n_per_level) * (1 + gamma)
+        pf *= p0
+
+        # Grow n_seeds chains of length `steps` inside {g < b}
+        cur_u = u[order[:n_seeds]]
+        cur_g = gv[order[:n_seeds]]
+        chain_u = np.empty((n_seeds, steps, d))
+        chain_g = np.empty((n_seeds, steps))
+        chain_u[:, 0], chain_g[:, 0] = cur_u, cur_g
+        for s in range(1, steps):
+            cand = cur_u + proposal_std * rng.standard_normal(cur_u.shape)
+            # Component-wise acceptance against the standard-normal density
+            ratio = np.exp(-0.5 * (cand**2 - cur_u**2))
+            cand = np.where(rng.random(cur_u.shape) < ratio, cand, cur_u)
+            cand_g = g(cand)
+            ok = cand_g < b
+            cur_u = np.where(ok[:, None], cand, cur_u)
+            cur_g = np.where(ok, cand_g, cur_g)
+            chain_u[:, s], chain_g[:, s] = cur_u, cur_g
+        u = chain_u.reshape(-1, d)
+        gv = chain_g.reshape(-1)
+        ind_chains = chain_g
+
+    details["thresholds"] = thresholds
+    return ReliabilityResult(
+        "Subset", pf, math.sqrt(cov2) if pf > 0 else math.inf, _beta_from_pf(pf),
+        g.evaluations - start, converged=converged, details=details,
+    )
+
+
+def analyze(
+    limit_state: Optional[LimitState] = None,
+    n_is: int = 10_000,
+    n_subset: int = 2000,
+    seed: int = 2026,
+) -> Dict[str, Dict[str, ReliabilityResult]]:
+    """
+    Run every method on each component of limit_state and on the series
+    system. FORM/SORM per component; IS uses the mixture of all finite
+    component design points for the system.
+    """
+    ls = LimitState() if limit_state is None else limit_state
+    rng = np.random.default_rng(seed)
+    results: Dict[str, Dict[str, ReliabilityResult]] = {}
+    centers = []
+    for name in ls.components:
+        comp = ls.component(name)
+        f = form(comp)
+        res = {"FORM": f}
+        if f.converged and math.isfinite(f.beta):
+            res["SORM"] = sorm(comp, f)
+            res["IS"] = importance_sampling(comp, [f.design_point_u], n_is, rng)
+            centers.append(f.design_point_u)
+        res["Subset"] = subset_simulation(comp, n_subset, rng=rng)
+        results[name] = res
+    system = {"Subset": subset_simulation(ls, n_subset, rng=rng)}
+    if centers:
+        system["IS"] = importance_sampling(ls, centers, n_is, rng)
+    results["system"] = system
+    return results
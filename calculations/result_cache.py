@@ -0,0 +1,256 @@
+"""
+Content-addressed memoization for run_complete_analysis().
+
+Report generators, the optimizer and the tests evaluate the same design
+tuples over and over. ResultCache keys each call on a SHA-256 of the
+normalized arguments plus MODEL_VERSION, so bumping the model version
+invalidates every stored result without touching the store.
+
+Two tiers:
+  - in-process LRU (OrderedDict, bounded by maxsize)
+  - optional SQLite file (WAL mode) shared by concurrent processes
+
+Caching is opt-in: nothing in the calculator consults it. Use
+
+    cache = ResultCache(path=".cache/results.sqlite")
+    r = cache.run_complete_analysis(192, 32, 17, 0.5, 171)
+
+A hit re-reports the result's "diagnostics" flags (weight mismatch,
+material sanity) under the active diagnostics() mode, so warn, collect
+and strict behave exactly as they do on a miss.
+"""
+
+import hashlib
+import inspect
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from calculations.concrete_canoe_calculator import (
+    MODEL_VERSION,
+    replay_diagnostics,
+    run_complete_analysis,
+)
+
+DEFAULT_MAXSIZE = 4096
+
+
+def _normalize(value: Any) -> Any:
+    """Map an argument onto a JSON-stable canonical form."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        v = float(value)
+        if math.isnan(v):
+            return "nan"
+        if v == 0.0:
+            return 0.0  # fold -0.0
+        return v
+    if hasattr(value, "geometry_hash"):  # HydrostaticTable, StationHull
+        return {"geometry_hash": value.geometry_hash}
+    if hasattr(value, "item") and getattr(value, "ndim", None) == 0:
+        return _normalize(value.item())  # numpy scalar
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    raise TypeError(f"cannot build a cache key from {type(value).__name__}")
+
+
+def canonical_key(func: Callable, args: tuple, kwargs: dict,
+                  model_version: str = MODEL_VERSION) -> str:
+    """SHA-256 of the bound, default-filled, normalized call arguments.
+
+    Positional and keyword spellings of the same call, and 192 vs 192.0,
+    map to the same key.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = {
+        "func": f"{func.__module__}.{func.__qualname__}",
+        "model_version": model_version,
+        "args": {k: _normalize(v) for k, v in bound.arguments.items()},
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Two-level copy so callers can mutate what they get back."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in result.items()}
+
+
+class ResultCache:
+    """Bounded LRU with an optional SQLite tier.
+
+    Attributes hits, disk_hits and misses count lookups; stats() returns
+    them together with the current sizes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        path: Optional[Path] = None,
+        model_version: str = MODEL_VERSION,
+    ):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.path = Path(path) if path is not None else None
+        self.model_version = model_version
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    # --- persistent tier ---
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        # A connection must not cross a fork; reopen in the child.
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " model_version TEXT NOT NULL,"
+                " result TEXT NOT NULL)"
+            )
+            conn.commit()
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        db = self._db()
+        if db is None:
+            return None
+        row = db.execute(
+            "SELECT result FROM results WHERE key = ? AND model_version = ?",
+            (key, self.model_version),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _disk_put(self, key: str, result: Dict[str, Any]) -> None:
+        db = self._db()
+        if db is None:
+            return
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, self.model_version, json.dumps(result)),
+            )
+
+    # --- LRU tier ---
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        if self.maxsize == 0:
+            return
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    # --- public API ---
+
+    def call(self, func: Callable, *args, **kwargs) -> Dict[str, Any]:
+        """Return func(*args, **kwargs), served from cache when possible."""
+        key = canonical_key(func, args, kwargs, self.model_version)
+        with self._lock:
+            result = self._lru.get(key)
+            if result is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+            else:
+                result = self._disk_get(key)
+                if result is not None:
+                    self.disk_hits += 1
+                    self._remember(key, result)
+                else:
+                    self.misses += 1
+        if result is not None:
+            result = _copy_result(result)
+            if "diagnostics" in result:
+                bound = inspect.signature(func).bind(*args, **kwargs)
+                bound.apply_defaults()
+                replay_diagnostics(result, bound.arguments, stacklevel=2)
+            return result
+
+        result = func(*args, **kwargs)
+        stored = _copy_result(result)
+        with self._lock:
+            self._remember(key, stored)
+            self._disk_put(key, stored)
+        return result
+
+    def run_complete_analysis(self, *args, **kwargs) -> Dict[str, Any]:
+        """Cached drop-in for calculations.run_complete_analysis."""
+        if kwargs.get("as_record"):
+            raise ValueError("ResultCache stores dict results; call "
+                             "without as_record=True")
+        return self.call(run_complete_analysis, *args, **kwargs)
+
+    def wrap(self, func: Callable) -> Callable:
+        """Decorator form: cache.wrap(run_complete_analysis)(...)."""
+        def cached(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        cached.__name__ = func.__name__
+        cached.__doc__ = func.__doc__
+        cached.__wrapped__ = func
+        cached.cache = self
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        disk_entries = 0
+        db = self._db()
+        if db is not None:
+            disk_entries = db.execute(
+                "SELECT COUNT(*) FROM results WHERE model_version = ?",
+                (self.model_version,),
+            ).fetchone()[0]
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._lru),
+            "disk_entries": disk_entries,
+            "model_version": self.model_version,
+        }
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the LRU (and with disk=True, every persisted row)."""
+        with self._lock:
+            self._lru.clear()
+            db = self._db()
+            if disk and db is not None:
+                with db:
+                    db.execute("DELETE FROM results")
+
+    def prune(self) -> int:
+        """Delete persisted rows stamped with another model version."""
+        db = self._db()
+        if db is None:
+            return 0
+        with db:
+            cur = db.execute(
+                "DELETE FROM results WHERE model_version != ?",
+                (self.model_version,),
+            )
+        return cur.rowcount
+
+    def close(self) -> None:
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
@@ -0,0 +1,231 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Columnar Export of Monte Carlo Results
+
+Writes sampled inputs and model outputs as whole arrays instead of row by
+row. Every export is a set of files sharing one stem:
+
+    <stem>.npz            all columns in one (optionally compressed) archive
+    <stem>/<column>.npy   one file per column; np.load(..., mmap_mode="r")
+    <stem>.parquet        Apache Parquet (needs pyarrow)
+    <stem>.arrow          Arrow IPC / Feather v2 (needs pyarrow)
+    <stem>.csv            opt-in text, streamed in chunks
+    <stem>.json           sidecar metadata: seed, sampler, model version,
+                          row count, column list and the files written
+
+Columns are named in/<input> and out/<output> in the binary formats (a
+prefix-free, readable header in CSV). load_results() reads any of the
+binary forms back into (inputs, outputs, metadata).
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import MODEL_VERSION
+
+FORMATS = ("npz", "npy", "parquet", "arrow", "csv")
+CSV_CHUNK = 1 << 16  # rows formatted per np.savetxt call
+CSV_FORMAT = "%.6g"
+
+# Legacy CSV layout (data/monte_carlo_results.csv): header -> output column
+LEGACY_CSV_COLUMNS = {
+    "weight_lbs": "canoe_wt",
+    "freeboard_in": "fb_in",
+    "gm_in": "gm_in",
+    "safety_factor": "sf",
+}
+
+
+def _columns(inputs: Dict[str, np.ndarray], outputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    cols = {f"in/{k}": np.asarray(v) for k, v in inputs.items()}
+    cols.update({f"out/{k}": np.asarray(v) for k, v in outputs.items()})
+    lengths = {len(v) for v in cols.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+    return cols
+
+
+def _require_pyarrow(fmt: str):
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError(f"{fmt} export needs pyarrow (pip install pyarrow); "
+                          f"npz/npy/csv work without it") from None
+
+
+def check_formats(formats: Iterable[str]) -> None:
+    """Raise before a long run if a format is unknown or its library is missing."""
+    formats = set(formats)
+    unknown = formats - set(FORMATS)
+    if unknown:
+        raise ValueError(f"unknown export format(s) {sorted(unknown)}; choose from {FORMATS}")
+    for fmt in sorted(formats & {"parquet", "arrow"}):
+        _require_pyarrow(fmt.capitalize())
+
+
+def _arrow_table(cols: Dict[str, np.ndarray]):
+    pa = _require_pyarrow("Arrow")
+    return pa.table({k: pa.array(v) for k, v in cols.items()})
+
+
+def write_npz(path: Path, cols: Dict[str, np.ndarray], compress: bool = False) -> Path:
+    path = path.with_suffix(".npz")
+    (np.savez_compressed if compress else np.savez)(path, **cols)
+    return path
+
+
+def write_npy(directory: Path, cols: Dict[str, np.ndarray]) -> Path:
+    """One .npy per column; '/' in column names becomes '__'."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, values in cols.items():
+        np.save(directory / f"{name.replace('/', '__')}.npy", values)
+    return directory
+
+
+def write_parquet(path: Path, cols: Dict[str, np.ndarray]) -> Path:
+    _require_pyarrow("Parquet")
+    import pyarrow.parquet as pq
+    path = path.with_suffix(".parquet")
+    pq.write_table(_arrow_table(cols), path)
+    return path
+
+
+def write_arrow(path: Path, cols: Dict[str, np.ndarray]) -> Path:
+    _require_pyarrow("Arrow")
+    import pyarrow.feather as feather
+    path = path.with_suffix(".arrow")
+    feather.write_feather(_arrow_table(cols), path)
+    return path
+
+
+def write_csv(
+    path: Path,
+    columns: Dict[str, np.ndarray],
+    fmt: str = CSV_FORMAT,
+    chunk_size: int = CSV_CHUNK,
+    index_name: Optional[str] = "iteration",
+) -> Path:
+    """
+    Stream columns to CSV chunk by chunk (np.savetxt on a 2-D block), so
+    memory stays at one chunk and no per-row Python formatting runs.
+    index_name adds a 1-based row counter as the first column.
+    """
+    path = path.with_suffix(".csv")
+    names = list(columns)
+    n = len(next(iter(columns.values()))) if columns else 0
+    header = ",".join(([index_name] if index_name else []) + names)
+    fmts = (["%d"] if index_name else []) + [fmt] * len(names)
+    with open(path, "w", newline="") as f:
+        f.write(header + "\n")
+        for lo in range(0, n, chunk_size):
+            hi = min(n, lo + chunk_size)
+            block = [np.asarray(columns[k][lo:hi], dtype=float) for k in names]
+            if index_name:
+                block.insert(0, np.arange(lo + 1, hi + 1, dtype=float))
+            np.savetxt(f, np.column_stack(block), fmt=fmts, delimiter=",")
+    return path
+
+
+def export_results(
+    stem,
+    inputs: Dict[str, np.ndarray],
+    outputs: Dict[str, np.ndarray],
+    metadata: Optional[Dict] = None,
+    formats: Iterable[str] = ("npz",),
+    compress: bool = False,
+    csv_columns: Optional[Dict[str, str]] = None,
+    csv_fmt: str = CSV_FORMAT,
+) -> Dict[str, Path]:
+    """
+    Write inputs and outputs in each requested format plus <stem>.json.
+
+    metadata (seed, sampler, ...) is merged into the sidecar together with
+    MODEL_VERSION, the row count, columns and written files. csv_columns
+    maps CSV header -> output name (default: every input and output).
+    Returns {format: path}.
+    """
+    formats = list(dict.fromkeys(formats))
+    check_formats(formats)
+    stem = Path(stem)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    cols = _columns(inputs, outputs)
+    n = len(next(iter(cols.values()))) if cols else 0
+
+    written = {}
+    for fmt in formats:
+        if fmt == "npz":
+            written[fmt] = write_npz(stem, cols, compress)
+        elif fmt == "npy":
+            written[fmt] = write_npy(stem, cols)
+        elif fmt == "parquet":
+            written[fmt] = write_parquet(stem, cols)
+        elif fmt == "arrow":
+            written[fmt] = write_arrow(stem, cols)
+        elif fmt == "csv":
+            if csv_columns is None:
+                csv_cols = {**inputs, **outputs}
+            else:
+                csv_cols = {header: outputs[key] for header, key in csv_columns.items()}
+            written[fmt] = write_csv(stem, csv_cols, csv_fmt)
+
+    sidecar = {
+        "model_version": MODEL_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rows": n,
+        "columns": {k: str(v.dtype) for k, v in cols.items()},
+        "files": {fmt: p.name for fmt, p in written.items()},
+        **(metadata or {}),
+    }
+    meta_path = stem.with_suffix(".json")
+    meta_path.write_text(json.dumps(sidecar, indent=2, default=_json_default) + "\n")
+    written["json"] = meta_path
+    return written
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def load_results(stem, fmt: Optional[str] = None, mmap: bool = False
+                 ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict]:
+    """
+    (inputs, outputs, metadata) from an export. fmt defaults to the first
+    binary format listed in the sidecar; mmap=True memory-maps .npy columns.
+    """
+    stem = Path(stem)
+    meta = json.loads(stem.with_suffix(".json").read_text())
+    if fmt is None:
+        fmt = next((f for f in ("npz", "npy", "parquet", "arrow") if f in meta["files"]), None)
+        if fmt is None:
+            raise ValueError(f"{stem}: no binary export to load (files: {meta['files']})")
+    if fmt == "npz":
+        with np.load(stem.with_suffix(".npz"), allow_pickle=False) as z:
+            cols = {k: z[k] for k in z.files}
+    elif fmt == "npy":
+        cols = {name: np.load(stem / f"{name.replace('/', '__')}.npy",
+                              mmap_mode="r" if mmap else None)
+                for name in meta["columns"]}
+    elif fmt in ("parquet", "arrow"):
+        _require_pyarrow(fmt)
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            table = pq.read_table(stem.with_suffix(".parquet"))
+        else:
+            import pyarrow.feather as feather
+            table = feather.read_table(stem.with_suffix(".arrow"))
+        cols = {k: table.column(k).to_numpy() for k in table.column_names}
+    else:
+        raise ValueError(f"cannot load format {fmt!r}")
+    inputs = {k[3:]: v for k, v in cols.items() if k.startswith("in/")}
+    outputs = {k[4:]: v for k, v in cols.items() if k.startswith("out/")}
+    return inputs, outputs, meta
@@ -0,0 +1,164 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Samplers for Uncertainty Analysis
+
+Pluggable point sets over the uncertain inputs in monte_carlo.UNCERTAINTIES.
+Every sampler produces points in the unit hypercube [0, 1)^d; map_to_inputs()
+turns them into physical values through the exact inverse CDF of each
+input's normal distribution truncated to [low, high]:
+
+    x = μ + σ · Φ⁻¹( Φ(a) + u · (Φ(b) - Φ(a)) ),   a, b = (low, high - μ)/σ
+
+so no probability mass piles up on the bounds as it does with clipping.
+
+Samplers (SAMPLERS registry, extend with register_sampler):
+    random  plain pseudo-random uniforms
+    lhs     Latin hypercube (one point per stratum in every dimension)
+    sobol   scrambled Sobol' (Owen scrambling); use powers of two
+    halton  scrambled Halton
+
+Each call draws a fresh randomization from rng, so repeated calls are
+independent replicates - which is what the error estimates in
+convergence_study() rely on.
+"""
+
+import math
+import warnings
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+from scipy.stats import qmc
+
+from calculations.monte_carlo import UNCERTAINTIES, evaluate
+
+Sampler = Callable[[np.random.Generator, int, int], np.ndarray]
+
+
+def truncated_normal_ppf(u, mean, std, low=-math.inf, high=math.inf):
+    """Inverse CDF of N(mean, std²) truncated to [low, high]."""
+    a = ndtr((low - mean) / std)
+    b = ndtr((high - mean) / std)
+    return np.clip(mean + std * ndtri(a + np.asarray(u) * (b - a)), low, high)
+
+
+def _random(rng, n, d):
+    return rng.random((n, d))
+
+
+def _lhs(rng, n, d):
+    return qmc.LatinHypercube(d, seed=rng).random(n)
+
+
+def _sobol(rng, n, d):
+    with warnings.catch_warnings():
+        # Non-power-of-two n only loses the balance guarantee
+        warnings.simplefilter("ignore", UserWarning)
+        return qmc.Sobol(d, scramble=True, seed=rng).random(n)
+
+
+def _halton(rng, n, d):
+    return qmc.Halton(d, scramble=True, seed=rng).random(n)
+
+
+SAMPLERS: Dict[str, Sampler] = {
+    "random": _random,
+    "lhs": _lhs,
+    "sobol": _sobol,
+    "halton": _halton,
+}
+
+
+def register_sampler(name: str, sampler: Sampler) -> None:
+    """Add a sampler: a callable (rng, n, d) -> (n, d) points in [0, 1)."""
+    SAMPLERS[name] = sampler
+
+
+def unit_points(sampler: str, rng: np.random.Generator, n: int, d: int) -> np.ndarray:
+    """(n, d) points from a registered sampler."""
+    try:
+        fn = SAMPLERS[sampler]
+    except KeyError:
+        raise ValueError(f"unknown sampler {sampler!r}; choose from {sorted(SAMPLERS)}") from None
+    return fn(rng, n, d)
+
+
+def map_to_inputs(u: np.ndarray, uncertainties: Dict = UNCERTAINTIES) -> Dict[str, np.ndarray]:
+    """Columns of u -> truncated-normal input arrays, in uncertainties order."""
+    return {
+        name: truncated_normal_ppf(u[:, j], p["mean"], p["std"], p["low"], p["high"])
+        for j, (name, p) in enumerate(uncertainties.items())
+    }
+
+
+def sample(
+    sampler: str,
+    n: int,
+    rng: np.random.Generator,
+    uncertainties: Dict = UNCERTAINTIES,
+) -> Dict[str, np.ndarray]:
+    """n input samples from a sampler, mapped through the truncated normals."""
+    return map_to_inputs(unit_points(sampler, rng, n, len(uncertainties)), uncertainties)
+
+
+# Estimators tracked by convergence_study(): name -> f(outputs)
+ESTIMATORS: Dict[str, Callable[[Dict[str, np.ndarray]], float]] = {
+    "mean_weight": lambda r: float(np.mean(r["canoe_wt"])),
+    "mean_sf": lambda r: float(np.mean(r["sf"])),
+    "std_sf": lambda r: float(np.std(r["sf"])),
+    "p_fail": lambda r: float(1.0 - np.mean(r["all_pass"])),
+}
+
+
+def convergence_study(
+    samplers: Sequence[str] = ("random", "lhs", "sobol", "halton"),
+    sizes: Sequence[int] = tuple(2 ** k for k in range(7, 15)),
+    replicates: int = 20,
+    seed: int = 2026,
+    reference_n: int = 1 << 22,
+    estimators: Dict = ESTIMATORS,
+    **evaluate_kwargs,
+) -> List[Dict]:
+    """
+    RMS error of each estimator versus N for each sampler.
+
+    The reference values come from one scrambled-Sobol run of reference_n
+    points. Each (sampler, N) pair is repeated with independent
+    randomizations; rows carry the RMSE and the mean of the replicate
+    estimates. The estimator functions see evaluate() output.
+    """
+    root = np.random.SeedSequence(seed)
+    ref_seq, *streams = root.spawn(1 + len(samplers))
+    ref_out = evaluate(**sample("sobol", reference_n, np.random.default_rng(ref_seq)),
+                       **evaluate_kwargs)
+    reference = {name: fn(ref_out) for name, fn in estimators.items()}
+
+    rows = []
+    for name, stream in zip(samplers, streams):
+        rng = np.random.default_rng(stream)
+        for n in sizes:
+            est = {k: np.empty(replicates) for k in estimators}
+            for r in range(replicates):
+                out = evaluate(**sample(name, n, rng), **evaluate_kwargs)
+                for k, fn in estimators.items():
+                    est[k][r] = fn(out)
+            for k, values in est.items():
+                rows.append({
+                    "sampler": name, "n": n, "estimator": k,
+                    "reference": reference[k],
+                    "rmse": float(np.sqrt(np.mean((values - reference[k]) ** 2))),
+                    "mean": float(values.mean()),
+                })
+    return rows
+
+
+def convergence_rates(rows: List[Dict]) -> Dict[tuple, float]:
+    """Log-log slope of RMSE vs N per (sampler, estimator); -0.5 is plain MC."""
+    rates = {}
+    keys = sorted({(r["sampler"], r["estimator"]) for r in rows})
+    for key in keys:
+        pts = [(r["n"], r["rmse"]) for r in rows
+               if (r["sampler"], r["estimator"]) == key and r["rmse"] > 0]
+        if len(pts) >= 2:
+            n, e = np.log(np.array(pts)).T
+            rates[key] = float(np.polyfit(n, e, 1)[0])
+    return rates
@@ -0,0 +1,231 @@
+"""
+NAU ASCE Concrete Canoe 2026 - Variance-Based Global Sensitivity
+
+First-order and total Sobol' indices of the uncertainty model outputs with
+respect to each uncertain input in monte_carlo.UNCERTAINTIES.
+
+Two independent N x d sample matrices A and B (one 2d-dimensional point
+set, truncated-normal marginals) plus the d matrices AB_i - A with column
+i taken from B - give N·(d+2) model evaluations, from which
+
+    S_i  = mean( f(B) · (f(AB_i) - f(A)) ) / V         (Saltelli 2010)
+    ST_i = mean( (f(A) - f(AB_i))² ) / (2V)            (Jansen 1999)
+
+with V the variance of f over A and B. S_i is the share of the output
+variance explained by input i alone; ST_i - S_i is what it contributes
+through interactions. Confidence intervals come from a percentile
+bootstrap over the N rows.
+
+The stacked matrix is evaluated in fixed-size blocks on a process pool
+(evaluate_matrix); blocks are concatenated in order, so the indices do not
+depend on the worker count. With a checkpoint directory each finished
+block's outputs are saved, and a resumed run evaluates only the missing
+blocks - the indices are identical to an uninterrupted run.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calculations.checkpoint import Checkpoint, seed_config, table_config
+from calculations.monte_carlo import BASE, DEFAULT_CHUNK, UNCERTAINTIES, evaluate
+from calculations.sampling import map_to_inputs, unit_points
+
+DEFAULT_N = 1 << 14  # base sample size; N·(d+2) = 98,304 evaluations for d = 4
+SOBOL_OUTPUTS = ("canoe_wt", "fb_in", "gm_in", "sf")
+BOOTSTRAP_BATCH = 64
+
+
+@dataclass
+class SobolIndices:
+    """First-order and total indices of one output, with bootstrap CIs."""
+    output: str
+    names: Tuple[str, ...]
+    first: np.ndarray
+    total: np.ndarray
+    first_ci: np.ndarray  # (d, 2)
+    total_ci: np.ndarray  # (d, 2)
+    variance: float
+    n: int
+
+    def ranking(self) -> List[str]:
+        """Input names by decreasing total index."""
+        return [self.names[i] for i in np.argsort(-self.total, kind="stable")]
+
+    @property
+    def interaction(self) -> np.ndarray:
+        """ST_i - S_i: variance share through interactions."""
+        return self.total - self.first
+
+
+def saltelli_inputs(
+    n: int,
+    rng: np.random.Generator,
+    sampler: str = "sobol",
+    uncertainties: Dict = UNCERTAINTIES,
+) -> Dict[str, np.ndarray]:
+    """Inputs for the stacked [A; B; AB_1; ...; AB_d] matrix, n·(d+2) rows."""
+    d = len(uncertainties)
+    u = unit_points(sampler, rng, n, 2 * d)
+    a, b = u[:, :d], u[:, d:]
+    blocks = [a, b]
+    for i in range(d):
+        ab = a.copy()
+        ab[:, i] = b[:, i]
+        blocks.append(ab)
+    return map_to_inputs(np.vstack(blocks), uncertainties)
+
+
+def _evaluate_block(args) -> Dict[str, np.ndarray]:
+    inputs, base, hydro_table, outputs = args
+    out = evaluate(**inputs, base=base, hydro_table=hydro_table)
+    return {k: out[k] for k in outputs}
+
+
+def evaluate_matrix(
+    inputs: Dict[str, np.ndarray],
+    outputs: Sequence[str] = SOBOL_OUTPUTS,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK,
+    base: Dict = BASE,
+    hydro_table=None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    evaluate() over the rows of inputs in blocks; workers=1 runs in-process.
+    Blocks already saved in checkpoint are loaded instead of evaluated.
+    """
+    n = len(next(iter(inputs.values())))
+    starts = range(0, n, chunk_size)
+    parts: List[Optional[Dict[str, np.ndarray]]] = [None] * len(starts)
+    if checkpoint is not None:
+        for i in range(len(starts)):
+            if checkpoint.has_part(i):
+                parts[i] = checkpoint.load_part(i)
+    todo = [i for i, p in enumerate(parts) if p is None]
+    tasks = [
+        ({k: v[starts[i]:starts[i] + chunk_size] for k, v in inputs.items()},
+         base, hydro_table, tuple(outputs))
+        for i in todo
+    ]
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        results = pool.map(_evaluate_block, tasks) if pool else map(_evaluate_block, tasks)
+        for i, part in zip(todo, results):
+            parts[i] = part
+            if checkpoint is not None:
+                checkpoint.save_part(i, part)
+                checkpoint.save({"blocks_done": np.array(sum(p is not None for p in parts))})
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return {k: np.concatenate([p[k] for p in parts]) for k in outputs}
+
+
+def _estimate(fa, fb, fab):
+    """
+    Saltelli first-order and Jansen total indices. fa, fb have shape
+    (..., n) and fab (..., d, n); leading axes are bootstrap replicates.
+    """
+    both = np.concatenate([fa, fb], axis=-1)
+    mean = both.mean(axis=-1, keepdims=True)
+    var = both.var(axis=-1)[..., None]
+    # Centring leaves both estimators unbiased and removes the mean·noise
+    # term that dominates S_i for outputs far from zero (e.g. weight)
+    fa, fb, fab = fa - mean, fb - mean, fab - mean[..., None, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        first = np.mean(fb[..., None, :] * (fab - fa[..., None, :]), axis=-1) / var
+        total = 0.5 * np.mean((fa[..., None, :] - fab) ** 2, axis=-1) / var
+    return first, total, var[..., 0]
+
+
+def sobol_indices(
+    n: int = DEFAULT_N,
+    seed=2026,
+    outputs: Sequence[str] = SOBOL_OUTPUTS,
+    sampler: str = "sobol",
+    workers: Optional[int] = None,
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    chunk_size: int = DEFAULT_CHUNK,
+    base: Dict = BASE,
+    hydro_table=None,
+    uncertainties: Dict = UNCERTAINTIES,
+    checkpoint_dir=None,
+    resume: bool = False,
+) -> Dict[str, SobolIndices]:
+    """
+    Sobol' indices of each output from n·(d+2) evaluations.
+
+    sampler is any registered sampling.SAMPLERS entry (keep n a power of
+    two for "sobol"). The bootstrap resamples rows of A, B and AB_i
+    together; n_bootstrap=0 skips it (CIs are then NaN). checkpoint_dir /
+    resume save and reuse evaluated blocks (the sample matrix itself is
+    regenerated from seed).
+    """
+    root = np.random.SeedSequence(seed)
+    sample_seq, boot_seq = root.spawn(2)
+    names = tuple(uncertainties)
+    d = len(names)
+    inputs = saltelli_inputs(n, np.random.default_rng(sample_seq), sampler, uncertainties)
+    ck = None
+    if checkpoint_dir is not None:
+        ck = Checkpoint(checkpoint_dir, {
+            "kind": "sobol_indices", "n": n, "seed": seed_config(seed),
+            "outputs": list(outputs), "sampler": sampler, "chunk_size": chunk_size,
+            "base": base, "hydro_table": table_config(hydro_table),
+            "uncertainties": uncertainties,
+        })
+        ck.start(resume)
+    values = evaluate_matrix(inputs, outputs, workers, chunk_size, base, hydro_table, ck)
+
+    alpha = (1.0 - confidence) / 2
+    results = {}
+    for key in outputs:
+        f = values[key].reshape(d + 2, n)
+        fa, fb, fab = f[0], f[1], f[2:]
+        first, total, var = _estimate(fa, fb, fab)
+
+        first_ci = np.full((d, 2), np.nan)
+        total_ci = np.full((d, 2), np.nan)
+        if n_bootstrap:
+            # Re-seeded per output, so every output resamples the same rows
+            rng = np.random.default_rng(boot_seq)
+            boot_first, boot_total = [], []
+            for lo in range(0, n_bootstrap, BOOTSTRAP_BATCH):
+                idx = rng.integers(n, size=(min(BOOTSTRAP_BATCH, n_bootstrap - lo), n))
+                s1, st, _ = _estimate(fa[idx], fb[idx], np.moveaxis(fab[:, idx], 0, 1))
+                boot_first.append(s1)
+                boot_total.append(st)
+            boot_first = np.concatenate(boot_first)
+            boot_total = np.concatenate(boot_total)
+            first_ci = np.nanquantile(boot_first, [alpha, 1 - alpha], axis=0).T
+            total_ci = np.nanquantile(boot_total, [alpha, 1 - alpha], axis=0).T
+
+        results[key] = SobolIndices(key, names, first, total, first_ci, total_ci, float(var), n)
+    return results
+
+
+def tornado_rows(
+    indices: Dict[str, SobolIndices],
+    output_labels: Optional[Dict[str, str]] = None,
+    uncertainties: Dict = UNCERTAINTIES,
+) -> Dict[str, List[Tuple[str, float, float, float]]]:
+    """
+    Sobol' indices in the one-at-a-time tornado format
+    {output label: [(parameter label, S_i, ST_i, 0.0)]}, i.e. low = first
+    order, high = total, baseline = 0.
+    """
+    output_labels = output_labels or {}
+    rows = {}
+    for key, idx in indices.items():
+        rows[output_labels.get(key, key)] = [
+            (f"{uncertainties[name]['label']} ({uncertainties[name]['pct']})",
+             float(idx.first[i]), float(idx.total[i]), 0.0)
+            for i, name in enumerate(idx.names)
+        ]
+    return rows
@@ -31,6 +31,7 @@ from calculations.concrete_canoe_calculator import (
     bending_stress_psi,
     safety_factor as calc_safety_factor,
 )
+from calculations.hydrostatics import load_hydrostatic_table
 
 # ── Page config ──
 st.set_page_config(
@@ -63,7 +64,13 @@ def shell_weight(L, B, D, t, density=CONCRETE_DENSITY):
     return (bottom + sides) * tf * density
 
 
-def full_calc(L, B, D, t, n_paddlers, paddler_wt, density):
+@st.cache_resource
+def station_table():
+    """Design A station-offset hydrostatic curves (cached on disk too)."""
+    return load_hydrostatic_table("A")
+
+
+def full_calc(L, B, D, t, n_paddlers, paddler_wt, density, hydro_table=None):
     sw = shell_weight(L, B, D, t, density)
     rw = sw * 0.05
     canoe_wt = sw + rw + 3.0
@@ -71,16 +78,23 @@ def full_calc(L, B, D, t, n_paddlers, paddler_wt, density):
     loaded = canoe_wt + crew
 
     Lf, Bf, Df = L/12, B/12, D/12
-    disp = loaded / WATER_DENSITY_LB_PER_FT3
-    wp = Lf * Bf * CWP
-    draft_ft = disp / wp if wp > 0 else 0
+    if hydro_table is not None:
+        # Station-offset curves scaled to L × B × D (table lookup)
+        curves = hydro_table.at_weight(loaded, L, B, D)
+        draft_ft = float(curves["draft_ft"])
+        KB = float(curves["kb_ft"])
+        BM = float(curves["bm_ft"])
+    else:
+        disp = loaded / WATER_DENSITY_LB_PER_FT3
+        wp = Lf * Bf * CWP
+        draft_ft = disp / wp if wp > 0 else 0
+
+        KB = draft_ft / 2
+        # 3D Bouguer's formula: BM = I_wp / V_disp
+        I_wp = CWP * Lf * Bf**3 / 12
+        V_disp = CWP * Lf * Bf * draft_ft if draft_ft > 0 else 1
+        BM = I_wp / V_disp if draft_ft > 0 else 0
     fb_in = max(0, (Df - draft_ft) * 12)
-
-    KB = draft_ft / 2
-    # 3D Bouguer's formula: BM = I_wp / V_disp
-    I_wp = CWP * Lf * Bf**3 / 12
-    V_disp = CWP * Lf * Bf * draft_ft if draft_ft > 0 else 1
-    BM = I_wp / V_disp if draft_ft > 0 else 0
     # Weighted COG from hull + crew components
     hull_cog = Df * 0.38
     crew_cog = 10.0 / 12.0  # kneeling paddler ~10"
@@ -114,8 +128,13 @@ thickness = st.sidebar.slider("Thickness (inches)", 0.30, 0.75, 0.50, 0.05)
 density = st.sidebar.slider("Concrete Density (PCF)", 50, 70, 60, 1)
 n_paddlers = st.sidebar.selectbox("Paddlers", [2, 3, 4], index=2)
 paddler_wt = st.sidebar.slider("Paddler Weight (lbs)", 130, 220, 175, 5)
+hull_model = st.sidebar.radio(
+    "Hydrostatics model",
+    ["Box (Cwp = 0.70)", "Station offsets (Design A form)"],
+)
+hydro = station_table() if hull_model.startswith("Station") else None
 
-r = full_calc(length, beam, depth, thickness, n_paddlers, paddler_wt, density)
+r = full_calc(length, beam, depth, thickness, n_paddlers, paddler_wt, density, hydro)
 
 # ════════════════════════════════════════════
 # MAIN PANEL
@@ -178,7 +197,7 @@ with left:
     colors = {"Design A (Optimal)": "#FF9800", "Design B (Conservative)": "#4CAF50",
               "Design C (Traditional)": "#9C27B0"}
     for bname, bd in BASELINES.items():
-        br = full_calc(bd["L"], bd["B"], bd["D"], bd["t"], n_paddlers, paddler_wt, density)
+        br = full_calc(bd["L"], bd["B"], bd["D"], bd["t"], n_paddlers, paddler_wt, density, hydro)
         bvals = [
             max(0, min(1, 1 - (br["canoe_wt"] - 150) / 100)),
             max(0, min(1, br["fb_in"] / 16)),
@@ -237,7 +256,7 @@ with right:
 st.subheader("Comparison with Baseline Designs")
 rows = []
 for bname, bd in BASELINES.items():
-    br = full_calc(bd["L"], bd["B"], bd["D"], bd["t"], n_paddlers, paddler_wt, density)
+    br = full_calc(bd["L"], bd["B"], bd["D"], bd["t"], n_paddlers, paddler_wt, density, hydro)
     rows.append({
         "Design": bname,
         "Dimensions": f'{bd["L"]}" × {bd["B"]}" × {bd["D"]}"',
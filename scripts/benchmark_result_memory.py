@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+NAU Concrete Canoe 2026 - Result Memory Benchmark
+Measures bytes per stored analysis result for the three representations:
+  1. nested dicts      (run_complete_analysis default)
+  2. slotted records   (run_complete_analysis(..., as_record=True))
+  3. ResultTable       (columnar NumPy arrays from run_complete_analysis_batch)
+
+Usage: python3 scripts/benchmark_result_memory.py [n_results]
+"""
+
+import sys
+import tracemalloc
+import warnings
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+
+from calculations.concrete_canoe_calculator import (
+    ResultTable,
+    run_complete_analysis,
+    run_complete_analysis_batch,
+)
+
+
+def design_sweep(n: int):
+    rng = np.random.default_rng(0)
+    return (
+        rng.uniform(192, 228, n),
+        rng.uniform(28, 36, n),
+        rng.uniform(14, 20, n),
+        np.full(n, 0.5),
+        rng.uniform(150, 250, n),
+    )
+
+
+def measure(build) -> tuple:
+    """Return (object, bytes retained) for build()."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    L, B, D, t, W = design_sweep(n)
+    # Python floats so both scalar paths allocate the same leaf objects
+    rows = list(zip(L.tolist(), B.tolist(), D.tolist(), t.tolist(), W.tolist()))
+
+    warnings.simplefilter("ignore")
+    dicts, dict_bytes = measure(lambda: [run_complete_analysis(*r) for r in rows])
+    del dicts
+    records, record_bytes = measure(
+        lambda: [run_complete_analysis(*r, as_record=True) for r in rows]
+    )
+    del records
+    table, table_bytes = measure(
+        lambda: ResultTable.from_batch(run_complete_analysis_batch(L, B, D, t, W))
+    )
+
+    print("=" * 60)
+    print(f"  RESULT MEMORY — {n:,} designs")
+    print("=" * 60)
+    print(f"  {'Representation':<22} {'Total MB':>10} {'Bytes/result':>14}")
+    for name, total in (
+        ("nested dicts", dict_bytes),
+        ("slotted records", record_bytes),
+        ("ResultTable (NumPy)", table_bytes),
+    ):
+        print(f"  {name:<22} {total / 1e6:>10.1f} {total / n:>14.0f}")
+    print("-" * 60)
+    print(f"  records vs dicts: {dict_bytes / record_bytes:.1f}× smaller")
+    print(f"  table vs dicts:   {dict_bytes / table_bytes:.1f}× smaller")
+    print(f"  (table holds {len(table)} rows, {table.nbytes / n:.0f} B/row of array data)")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from calculations.concrete_canoe_calculator import run_complete_analysis
+from calculations.cross_curves import SectionSet, gz_curve
+from calculations.load_cases import LOAD_CASES, evaluate_load_cases
 
 # ─── DESIGN PARAMETERS ───────────────────────────────────────────────
 LENGTH_IN = 192.0    # LOA
@@ -137,26 +139,11 @@ def compute_all():
     GM_ft = KB_ft + BM_ft - KG_ft
     GM_in = GM_ft * 12.0
 
-    # GZ curve (wall-sided formula with deck-edge correction)
+    # GZ curve — cross curves (KN) integrated on the Design A station
+    # sections, replacing the wall-sided formula with hand-tuned tapers
     heel_angles = list(range(0, 91, 5))
-    gz_values_ft = []
-    for phi_deg in heel_angles:
-        phi = math.radians(phi_deg)
-        if phi_deg == 0:
-            gz_values_ft.append(0.0)
-            continue
-        sin_p = math.sin(phi)
-        cos_p = math.cos(phi)
-        tan_p = math.tan(phi) if abs(cos_p) > 0.01 else 0
-        # Wall-sided: GZ = sin(φ)[GM + 0.5·BM·tan²(φ)]
-        gz = sin_p * (GM_ft + 0.5 * BM_ft * tan_p**2)
-        # Deck-edge immersion limit
-        deck_edge_gz = (B_FT / 2.0) * cos_p - fb_ft * sin_p
-        if phi_deg > 35:
-            gz = min(gz, max(deck_edge_gz, 0))
-        if phi_deg > 60:
-            gz = max(gz, 0) * (1 - (phi_deg - 60) / 60.0)  # taper to zero at 120°
-        gz_values_ft.append(gz)
+    curve = gz_curve(SectionSet.from_design("A"), total_loaded_wt, KG_ft, heel_angles)
+    gz_values_ft = [float(v) for v in curve["gz_ft"]]
 
     # Righting moments at key angles
     righting_moments = {}
@@ -175,76 +162,56 @@ def compute_all():
         "pass_gm": GM_in >= 6.0,
         "heel_angles": heel_angles,
         "gz_values_ft": gz_values_ft,
+        "deck_edge_angle": curve["deck_edge_angle_deg"],
+        "max_gz_ft": curve["max_gz_ft"],
+        "angle_max_gz": curve["angle_max_gz_deg"],
+        "area_0_30_ft_rad": curve["area_0_30_ft_rad"],
         "righting_moments": righting_moments,
     }
 
     # ── STRUCTURAL ANALYSIS ──
-    # Section properties: hollow rectangular thin-wall section at midship
-    b_o, h_o = BEAM_IN, DEPTH_IN
-    b_i, h_i = BEAM_IN - 2 * THICKNESS_IN, DEPTH_IN - 2 * THICKNESS_IN
-    Ix = (b_o * h_o**3 - b_i * h_i**3) / 12.0  # in⁴
-    c = h_o / 2.0  # in
-    Sx = Ix / c  # in³
-
-    # Load case 1: Racing — self-weight + 4 paddlers, buoyancy supports
-    w_self = total_hull_wt / L_FT  # lb/ft
-    buoy_per_ft = total_loaded_wt / L_FT
-
-    # Simply-supported beam max moment from self-weight
-    M_self = w_self * L_FT**2 / 8.0  # lb·ft
-
-    # Paddler point-load moments at midspan (P·a·b/L)
-    paddler_stations = [0.25, 0.40, 0.60, 0.75]
-    M_paddlers = 0
-    for s in paddler_stations:
-        a = s * L_FT
-        b = (1 - s) * L_FT
-        M_paddlers += PADDLER_WEIGHT_LBS * a * b / L_FT
-
-    # Buoyancy partially offsets; net moment ≈ 50% of sum (conservative)
-    M_max_lb_ft = M_self + M_paddlers * 0.50
-    M_max_lb_in = M_max_lb_ft * 12.0
-
-    # Flexural stress and safety factor
-    sigma_flex = M_max_lb_in / Sx if Sx > 0 else 0
-    SF = FLEXURAL_STRENGTH_PSI / sigma_flex if sigma_flex > 0 else 999
-
-    # Max shear
-    V_max = total_loaded_wt / 2.0
-
-    # Shear stress
-    Q = THICKNESS_IN * b_o * (h_o / 2 - THICKNESS_IN / 2) * 0.5
-    tau_shear = V_max * Q / (Ix * THICKNESS_IN) if Ix > 0 else 0
-
-    # Load case 2: Lifting (2 slings at 25% and 75%)
-    M_lift = total_hull_wt * L_FT / 8.0
-    sigma_lift = (M_lift * 12.0) / Sx if Sx > 0 else 0
-    SF_lift = FLEXURAL_STRENGTH_PSI / sigma_lift if sigma_lift > 0 else 999
-
-    # Load case 3: Punching shear
-    punch_perimeter = 4 * 6.0  # 6"×6" pad, perimeter = 24"
-    punch_area = punch_perimeter * THICKNESS_IN
-    tau_punch = PADDLER_WEIGHT_LBS / punch_area if punch_area > 0 else 0
+    # Every load case (racing 4/2 paddlers, sling lift, stands, punching)
+    # in one pass on the thin-shell U-section; see calculations/load_cases.py
+    lc = evaluate_load_cases(
+        LENGTH_IN, BEAM_IN, DEPTH_IN, THICKNESS_IN, total_hull_wt,
+        paddler_weight_lbs=PADDLER_WEIGHT_LBS,
+        flexural_strength_psi=FLEXURAL_STRENGTH_PSI,
+        concrete_density_pcf=CONCRETE_DENSITY_PCF,
+    )
+    sec = {k: float(v) for k, v in lc.section.items()}
+    Sx = sec["s_in3"]
+    racing = lc.check("racing_4", "flexure")
+    lift = lc.check("sling_lift", "flexure")
+    M_max_lb_ft = abs(float(racing.demand))
+    M_lift = abs(float(lift.demand))
+    sigma_flex = M_max_lb_ft * 12.0 / Sx if Sx > 0 else 0
+    sigma_lift = M_lift * 12.0 / Sx if Sx > 0 else 0
+    V_max = float(lc.check("racing_4", "shear").demand)
+    punch = lc.check("punching", "punching")
+    punch_bo = 4 * (LOAD_CASES["punching"].pad_in + THICKNESS_IN)
 
     R["structural"] = {
-        "Ix_in4": Ix, "Sx_in3": Sx, "c_in": c,
-        "w_self_lb_ft": w_self,
-        "buoy_per_ft": buoy_per_ft,
-        "paddler_stations": paddler_stations,
-        "M_self_lb_ft": M_self,
-        "M_paddlers_lb_ft": M_paddlers,
+        "Ix_in4": sec["i_in4"], "Sx_in3": Sx, "c_in": sec["c_max_in"],
+        "y_na_in": sec["y_na_in"], "area_in2": sec["area_in2"],
+        "w_self_lb_ft": total_hull_wt / L_FT,
+        "buoy_per_ft": total_loaded_wt / L_FT,
+        "paddler_stations": [0.25, 0.40, 0.60, 0.75],
         "M_max_lb_ft": M_max_lb_ft,
-        "M_max_lb_in": M_max_lb_in,
+        "M_max_lb_in": M_max_lb_ft * 12.0,
+        "M_max_x_ft": float(racing.location_ft),
         "sigma_flex_psi": sigma_flex,
-        "SF": SF,
+        "SF_racing": float(racing.safety_factor),
+        "SF": float(lc.min_safety_factor),
         "V_max_lbs": V_max,
-        "tau_shear_psi": tau_shear,
-        "Q_in3": Q,
+        "phi_Vc_lbs": sec["shear_capacity_lbs"],
         "M_lift_lb_ft": M_lift,
         "sigma_lift_psi": sigma_lift,
-        "SF_lift": SF_lift,
-        "tau_punch_psi": tau_punch,
-        "pass_sf": SF >= 2.0,
+        "SF_lift": float(lift.safety_factor),
+        "tau_punch_psi": PADDLER_WEIGHT_LBS / (punch_bo * THICKNESS_IN),
+        "phi_Vc_punch_lbs": float(punch.capacity),
+        "load_cases": lc.table(),
+        "governing": lc.governing(),
+        "pass_sf": bool(lc.passes),
     }
 
     # ── MATERIAL QUANTITIES ──
@@ -305,7 +272,7 @@ def compute_all():
         "opt": {
             "L": LENGTH_IN, "B": BEAM_IN, "D": DEPTH_IN,
             "wt": total_hull_wt,
-            "fb": fb_in, "gm": GM_in, "sf": SF,
+            "fb": fb_in, "gm": GM_in, "sf": R["structural"]["SF_racing"],
         },
         "wt_savings": ORIG_WEIGHT - total_hull_wt,
     }
@@ -324,6 +291,11 @@ def write_report(filename, content):
 
 def P(val): return "✓ PASS" if val else "✗ FAIL"
 
+
+def _fmt(x, spec, unit=""):
+    """format(x, spec) + unit, or "—" when x is missing or not finite."""
+    return "—" if x is None or not math.isfinite(x) else format(x, spec) + unit
+
 NOW = datetime.now().strftime('%Y-%m-%d %H:%M')
 
 
@@ -468,18 +440,44 @@ GM = KB + BM - KG
 
 ## GZ Curve Data (0°–90°)
 
+GZ = KN − KG·sin φ, with KN integrated directly on the Design A station
+sections at the heeled equilibrium waterline (cross curves, fixed trim).
+
 | Angle (°) | GZ (ft) | GZ (in) |
 |:----------:|--------:|--------:|
 {gz_table}
 *See: reports/figures/gz_curve.png*
 
+| Curve property | Value |
+|----------------|------:|
+| Maximum GZ | {s['max_gz_ft']*12:.2f} in @ {s['angle_max_gz']:.0f}° |
+| Area under GZ, 0°–30° | {s['area_0_30_ft_rad']:.4f} ft·rad |
+| Deck-edge immersion | {_fmt(s['deck_edge_angle'], '.0f', '°')} |
+
 ## Interpretation
 - Positive GM ({s['GM_in']:.2f} in) confirms initial transverse stability.
 - GZ remains positive well past 30°, providing strong capsize resistance.
+- Beyond deck-edge immersion ({_fmt(s['deck_edge_angle'], '.0f', '°')}) an open hull takes on water; GZ there assumes a watertight sheer.
 - Wider beam (32 in) compared to original (30 in) is the primary stability driver.
 """)
 
 
+def load_case_rows(rows):
+    """Markdown rows for the governing-case table (governing row in bold)."""
+    lines = []
+    for r in rows:
+        cells = [
+            r["case"], r["check"],
+            f"{r['demand']:.1f} {r['demand_unit']}",
+            f"{r['capacity']:.1f} {r['demand_unit']}",
+            f"{r['safety_factor']:.2f}", "≥ 2.0", P(r["pass"]),
+        ]
+        if r["governing"]:
+            cells = [f"**{c}**" for c in cells]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
 def report_structural(R):
     st = R["structural"]
     write_report("structural_analysis.md", f"""# Structural Analysis
@@ -490,30 +488,35 @@ def report_structural(R):
 
 ## Section Properties — Midship Cross-Section
 
-Thin-walled hollow rectangular section:
+Thin-shell U-section (bottom plate + two side walls, open top), the same
+model as `section_modulus_thin_shell()` in the calculator:
 
 | Property | Value | Unit |
 |----------|------:|------|
-| Outer width (b) | {BEAM_IN:.1f} | in |
-| Outer depth (h) | {DEPTH_IN:.1f} | in |
-| Inner width | {BEAM_IN - 2*THICKNESS_IN:.1f} | in |
-| Inner depth | {DEPTH_IN - 2*THICKNESS_IN:.1f} | in |
+| Beam (b) | {BEAM_IN:.1f} | in |
+| Depth (h) | {DEPTH_IN:.1f} | in |
 | Shell thickness (t) | {THICKNESS_IN} | in |
+| Section area | {st['area_in2']:.2f} | in² |
+| Neutral axis above keel | {st['y_na_in']:.2f} | in |
 | Moment of inertia (Ix) | {st['Ix_in4']:.1f} | in⁴ |
+| Extreme fiber distance (c) | {st['c_in']:.2f} | in |
 | Section modulus (Sx) | {st['Sx_in3']:.1f} | in³ |
-| Neutral axis depth (c) | {st['c_in']:.2f} | in |
 
 ### Calculation
 ```
-Ix = (b_o × h_o³ - b_i × h_i³) / 12
-   = ({BEAM_IN} × {DEPTH_IN}³ - {BEAM_IN-2*THICKNESS_IN} × {DEPTH_IN-2*THICKNESS_IN}³) / 12
+Ix = Σ (I_own + A·d²) over bottom plate and walls about the neutral axis
    = {st['Ix_in4']:.1f} in⁴
 
-Sx = Ix / c = {st['Ix_in4']:.1f} / {st['c_in']:.2f} = {st['Sx_in3']:.1f} in³
+Sx = 0.75 × Ix / c = 0.75 × {st['Ix_in4']:.1f} / {st['c_in']:.2f} = {st['Sx_in3']:.1f} in³
+     (0.75 = thin-shell reduction for curvature and microcracking)
 ```
 
 ## Load Cases
 
+Every case is evaluated in a single pass by `calculations/load_cases.py`
+(rigid hull, statics on 401 stations). Racing cases float on uniform
+buoyancy; lift and stand cases carry the empty hull on two supports.
+
 ### Load Case 1: Racing (4 Paddlers + Self-Weight) — CRITICAL
 
 | Parameter | Value | Unit |
@@ -523,17 +526,15 @@ Sx = Ix / c = {st['Ix_in4']:.1f} / {st['c_in']:.2f} = {st['Sx_in3']:.1f} in³
 | Crew (4 × {PADDLER_WEIGHT_LBS:.0f} lbs) | {R['hydro']['crew_wt']:.0f} | lbs |
 | Buoyancy load (uniform) | {st['buoy_per_ft']:.2f} | lb/ft (upward) |
 | Paddler stations | {', '.join(f'{s*100:.0f}%' for s in st['paddler_stations'])} | of LOA |
-| M from self-weight | {st['M_self_lb_ft']:.1f} | lb·ft |
-| M from paddler loads | {st['M_paddlers_lb_ft']:.1f} | lb·ft |
-| **Max bending moment** | **{st['M_max_lb_ft']:.1f}** | **lb·ft** |
+| **Max bending moment** | **{st['M_max_lb_ft']:.1f}** | **lb·ft** (at {st['M_max_x_ft']:.1f} ft) |
 | **Max bending moment** | **{st['M_max_lb_in']:.0f}** | **lb·in** |
 | **Flexural stress (σ)** | **{st['sigma_flex_psi']:.1f}** | **psi** |
 | Flexural strength (f'r) | {FLEXURAL_STRENGTH_PSI:.0f} | psi |
-| **Safety factor (SF)** | **{st['SF']:.2f}** | — |
+| **Safety factor (SF)** | **{st['SF_racing']:.2f}** | — |
 
 ```
 σ = M_max / Sx = {st['M_max_lb_in']:.0f} / {st['Sx_in3']:.1f} = {st['sigma_flex_psi']:.1f} psi
-SF = f'r / σ = {FLEXURAL_STRENGTH_PSI:.0f} / {st['sigma_flex_psi']:.1f} = {st['SF']:.2f}
+SF = f'r / σ = {FLEXURAL_STRENGTH_PSI:.0f} / {st['sigma_flex_psi']:.1f} = {st['SF_racing']:.2f}
 ```
 
 ### Load Case 2: Lifting (2-Point Sling at 25% & 75%)
@@ -550,22 +551,25 @@ SF = f'r / σ = {FLEXURAL_STRENGTH_PSI:.0f} / {st['sigma_flex_psi']:.1f} = {st['
 | Parameter | Value | Unit |
 |-----------|------:|------|
 | Paddler load | {PADDLER_WEIGHT_LBS:.0f} | lbs |
-| Contact area (6" × 6") | — | — |
+| Pad (6" × 6"), critical perimeter at d/2 | — | — |
 | Punching shear stress | {st['tau_punch_psi']:.1f} | psi |
+| φVc (ACI two-way, λ = w/150) | {st['phi_Vc_punch_lbs']:.0f} | lbs |
 
 ### Shear
 
 | Parameter | Value | Unit |
 |-----------|------:|------|
-| Max shear force | {st['V_max_lbs']:.1f} | lbs |
-| Shear stress (τ) | {st['tau_shear_psi']:.1f} | psi |
+| Max shear force (racing) | {st['V_max_lbs']:.1f} | lbs |
+| φVc (both walls, d = 0.8h, plain concrete) | {st['phi_Vc_lbs']:.1f} | lbs |
+
+## Governing Load Case
 
-## Safety Factor Summary
+| Load Case | Check | Demand | Capacity | SF | Min Required | Status |
+|-----------|-------|-------:|---------:|---:|-------------|--------|
+{load_case_rows(st['load_cases'])}
 
-| Load Case | Stress (psi) | SF | Min Required | Status |
-|-----------|------------:|----|-------------|--------|
-| Racing (LC1) | {st['sigma_flex_psi']:.1f} | {st['SF']:.2f} | ≥ 2.0 | {P(st['SF'] >= 2.0)} |
-| Lifting (LC2) | {st['sigma_lift_psi']:.1f} | {st['SF_lift']:.2f} | ≥ 2.0 | {P(st['SF_lift'] >= 2.0)} |
+**Governing:** {st['governing']['description']} — {st['governing']['check']},
+SF = {st['governing']['safety_factor']:.2f}
 
 *Bending moment diagram: reports/figures/bending_moment.png*
 """)
@@ -15,9 +15,9 @@ from datetime import date
 
 # Add project root to path so we can import the calculator
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "calculations"))
+sys.path.insert(0, str(PROJECT_ROOT))
 
-from concrete_canoe_calculator import (
+from calculations.concrete_canoe_calculator import (
     run_complete_analysis,
     displacement_volume,
     waterplane_approximation,
@@ -31,6 +31,7 @@ from concrete_canoe_calculator import (
     WATER_DENSITY_LB_PER_FT3,
     INCHES_PER_FOOT,
 )
+from calculations.load_cases import aci_one_way_shear
 
 from docx import Document
 from docx.shared import Inches, Pt, Cm, RGBColor, Emu
@@ -235,11 +236,7 @@ def compute_aci_shear(w_pcf, fc_psi, bw_in, d_in, Av_in2, fyt_psi, s_in):
     Vs = Av * fyt * d / s                     [ACI 318-19 Eq. 22.5.10.5.3]
     phi_Vn = 0.75 * (Vc + Vs)                [ACI 318-19 Sec. 21.2.1]
     """
-    lambda_lw = w_pcf / 150.0  # lightweight concrete factor
-    Vc = 2.0 * lambda_lw * math.sqrt(fc_psi) * bw_in * d_in
-    Vs = Av_in2 * fyt_psi * d_in / s_in
-    phi_Vn = 0.75 * (Vc + Vs)
-    return Vc, Vs, phi_Vn
+    return aci_one_way_shear(w_pcf, fc_psi, bw_in, d_in, Av_in2, fyt_psi, s_in)
 
 
 def compute_trevion_self_weight(cross_section_area_in2, density_pcf):
@@ -4,6 +4,7 @@ Generate Professional Structural Engineering Diagrams for NAU ASCE 2026 Concrete
 
 Figure 1: Free Body Diagram with Shear Force and Bending Moment Diagrams
 Figure 2: Moment of Inertia - Parallel Axis Theorem Cross-Section Analysis
+Figure 3: Moving-crew shear/moment envelopes (--envelope)
 
 Design A Parameters:
   Length = 192" (16 ft), Beam = 32", Depth = 17", Thickness = 0.5"
@@ -20,6 +21,14 @@ import matplotlib.patheffects as pe
 from matplotlib.patches import FancyArrowPatch, FancyBboxPatch, Polygon
 from matplotlib.lines import Line2D
 import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from calculations.crew_envelope import InfluenceLines, crew_layouts, envelope
 
 # ============================================================================
 # COLOR SCHEME
@@ -58,6 +67,14 @@ crew_fracs = [0.25, 0.40, 0.60, 0.75]
 crew_pos_ft = [f * L_ft for f in crew_fracs]
 crew_pos_in = [f * L_in for f in crew_fracs]
 
+# Envelope mode: each paddler may sit anywhere within +/- SEAT_TRAVEL_FRAC*L
+# of the nominal station, at least MIN_SPACING_FT from the next paddler,
+# and any paddler may be any of the crew weights (same 700 lb total).
+SEAT_TRAVEL_FRAC = 0.06
+SEAT_STEPS = 7
+MIN_SPACING_FT = 2.0
+PADDLER_WEIGHTS = [150.0, 165.0, 185.0, 200.0]
+
 
 def buoyancy_distribution(x_ft, L, W_total):
     """
@@ -753,6 +770,95 @@ def generate_figure2():
     return outpath
 
 
+# ============================================================================
+# FIGURE 3: MOVING-CREW SHEAR/MOMENT ENVELOPES
+# ============================================================================
+def compute_envelope():
+    """
+    Shear/moment envelopes over every admissible crew layout.
+
+    Uses the same sin^0.6 buoyancy shape as compute_shear_moment(), with
+    a trim term so off-centre layouts stay in equilibrium. Returns the
+    envelope dict plus the layout arrays and seat positions.
+    """
+    seat_options = [
+        np.linspace(f - SEAT_TRAVEL_FRAC, f + SEAT_TRAVEL_FRAC, SEAT_STEPS) * L_ft
+        for f in crew_fracs
+    ]
+    seats, seat_index, loads = crew_layouts(
+        seat_options, PADDLER_WEIGHTS, min_spacing_ft=MIN_SPACING_FT
+    )
+    lines = InfluenceLines.build(L_ft, seats, W_hull)
+    env = envelope(lines, seat_index, loads)
+    env.update(seats_ft=seats, seat_index=seat_index, loads=loads, lines=lines)
+    return env
+
+
+def generate_figure3():
+    """Moving-crew envelopes with the nominal layout and governing layouts."""
+    t0 = time.perf_counter()
+    env = compute_envelope()
+    elapsed = time.perf_counter() - t0
+    x = env["x_ft"]
+    lines = env["lines"]
+    seats, idx, loads = env["seats_ft"], env["seat_index"], env["loads"]
+
+    nominal = lines.evaluate(
+        np.searchsorted(seats, np.array(crew_pos_ft)), np.full(n_crew, W_crew_each)
+    )
+
+    fig, (ax_v, ax_m) = plt.subplots(2, 1, figsize=(11, 8), sharex=True)
+    fig.suptitle(
+        f"Moving-Crew Envelopes - {env['n_layouts']:,} Layouts "
+        f"(+/-{SEAT_TRAVEL_FRAC * L_ft:.1f} ft seat travel, weights "
+        f"{'/'.join(f'{w:.0f}' for w in PADDLER_WEIGHTS)} lb)",
+        fontsize=13, fontweight='bold', color=DARK_GRAY,
+    )
+
+    ax_v.fill_between(x, env["shear_min_lb"], env["shear_max_lb"],
+                      color=RED_LIGHT, alpha=0.5, label='Envelope')
+    ax_v.plot(x, env["shear_max_lb"], color=RED, lw=1.5)
+    ax_v.plot(x, env["shear_min_lb"], color=RED, lw=1.5)
+    ax_v.plot(x, nominal["shear_lb"][0], color=DARK_GRAY, lw=1.2, ls='--',
+              label=f'Nominal ({n_crew} x {W_crew_each:.0f} lb)')
+    ax_v.axhline(0, color=MEDIUM_GRAY, lw=0.8)
+    ax_v.set_ylabel('Shear V (lb)')
+    ax_v.legend(loc='upper right', fontsize=9)
+    ax_v.grid(alpha=0.3)
+
+    ax_m.fill_between(x, env["moment_min_lb_ft"], env["moment_max_lb_ft"],
+                      color=PURPLE_LIGHT, alpha=0.5, label='Envelope')
+    ax_m.plot(x, env["moment_max_lb_ft"], color=PURPLE, lw=1.5)
+    ax_m.plot(x, env["moment_min_lb_ft"], color=PURPLE, lw=1.5)
+    ax_m.plot(x, nominal["moment_lb_ft"][0], color=DARK_GRAY, lw=1.2, ls='--',
+              label='Nominal')
+    for key, color, label in (("max_sagging", BLUE, "sagging"),
+                              ("max_hogging", ORANGE, "hogging")):
+        k = env[f"{key}_layout"]
+        pos = ", ".join(f"{p:.1f}" for p in seats[idx[k]])
+        w = ", ".join(f"{v:.0f}" for v in loads[k])
+        ax_m.axvline(env[f"{key}_x_ft"], color=color, lw=1, ls=':')
+        ax_m.plot([], [], color=color, ls=':',
+                  label=f'Max {label} {env[f"{key}_lb_ft"]:.0f} lb-ft: '
+                        f'x = [{pos}] ft, W = [{w}] lb')
+    ax_m.axhline(0, color=MEDIUM_GRAY, lw=0.8)
+    ax_m.set_xlabel('Position from bow (ft)')
+    ax_m.set_ylabel('Moment M (lb-ft, sagging +)')
+    ax_m.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=2, fontsize=8)
+    ax_m.grid(alpha=0.3)
+    ax_m.set_xlim(0, L_ft)
+
+    outpath = '/root/concrete-canoe-project2026/reports/figures/report_fig3_crew_envelope.png'
+    fig.savefig(outpath, dpi=200, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    print(f"  Layouts: {env['n_layouts']:,} evaluated in {elapsed:.3f} s")
+    print(f"  Max sagging: {env['max_sagging_lb_ft']:.1f} lb-ft at x = {env['max_sagging_x_ft']:.2f} ft")
+    print(f"  Max hogging: {env['max_hogging_lb_ft']:.1f} lb-ft at x = {env['max_hogging_x_ft']:.2f} ft")
+    print(f"  Max |V|:     {env['max_shear_lb']:.1f} lb at x = {env['max_shear_x_ft']:.2f} ft")
+    print(f"  Saved: {outpath}")
+    return outpath
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -760,6 +866,11 @@ if __name__ == '__main__':
     # Ensure output directory exists
     os.makedirs('/root/concrete-canoe-project2026/reports/figures', exist_ok=True)
 
+    if "--envelope" in sys.argv:
+        print("Moving-crew shear/moment envelopes (Design A)")
+        generate_figure3()
+        sys.exit(0)
+
     print("=" * 65)
     print("NAU ASCE 2026 Concrete Canoe - Structural Engineering Diagrams")
     print("=" * 65)
@@ -3,19 +3,45 @@
 NAU Concrete Canoe 2026 - Hull Dimension Optimizer
 Finds optimal dimensions that minimize weight while meeting constraints.
 Uses scipy.optimize. Run: pip install scipy tqdm
+
+Multistart SLSQP; the starts run in parallel and merge deterministically.
+    --workers N    processes (default: all cores; 1 = in-process)
+    --seed S       master seed for the start points (default 42)
+    --starts N     number of starts (default 100)
+    --distinct K   stop once K distinct feasible optima are found
+
+--pareto runs an NSGA-II search of the weight / GM / freeboard / length
+trade-off instead and writes the non-dominated designs to
+data/pareto_front.csv (--pop N, --generations N, --seed S).
+
+--atlas evaluates a dense grid over BOUNDS (ATLAS_STEP_IN steps) ×
+thickness × density once into data/design_atlas/ and answers queries
+from it, e.g.  --atlas --query "B<=32, gm_in>=8"  for the lightest
+feasible design with B ≤ 32" and GM ≥ 8" (--rebuild forces a new grid).
 """
 
+import os
 import sys
 import csv
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 try:
-    from calculations.concrete_canoe_calculator import run_complete_analysis
+    from calculations.concrete_canoe_calculator import (
+        MODEL_VERSION, active_diagnostics, diagnostics, run_complete_analysis,
+        run_complete_analysis_batch,
+    )
 except ImportError:
-    from concrete_canoe_calculator import run_complete_analysis
+    from concrete_canoe_calculator import (
+        MODEL_VERSION, active_diagnostics, diagnostics, run_complete_analysis,
+        run_complete_analysis_batch,
+    )
 
 try:
     from scipy.optimize import minimize
@@ -24,6 +50,11 @@ except ImportError:
     print("Install: pip install scipy numpy")
     sys.exit(1)
 
+from calculations.gradients import analysis_gradients, jacobian
+from calculations.design_atlas import DesignAtlas, build_atlas, grid_axis, parse_conditions
+from calculations.pareto import nsga2
+from calculations.results_export import write_csv
+
 try:
     from tqdm import tqdm
 except ImportError:
@@ -38,6 +69,27 @@ MIN_FREEBOARD = 6.0
 MIN_GM = 6.0
 MIN_SF = 2.0
 
+SEED = 42
+N_STARTS = 100
+N_WORKERS = None        # None = all cores; results do not depend on it
+DISTINCT_OPTIMA = None  # stop early once this many distinct optima are found
+OPTIMUM_TOL_IN = 0.05   # optima closer than this in L, B and D are the same design
+EVAL_CACHE_SIZE = 8     # recent iterates kept by HullEvaluator
+
+# Pareto search: (metric, sense) pairs; -1 = maximize
+PARETO_OBJECTIVES = (("weight_lbs", 1), ("gm_in", -1), ("freeboard_in", -1), ("length_in", -1))
+PARETO_COLUMNS = ("length_in", "beam_in", "depth_in", "weight_lbs",
+                  "freeboard_in", "gm_in", "safety_factor")
+POP_SIZE = 200
+GENERATIONS = 200
+
+# Feasibility atlas grid: BOUNDS at ATLAS_STEP_IN plus thickness and density
+ATLAS_STEP_IN = 0.25
+ATLAS_THICKNESS_IN = (0.375, 0.5, 0.625, 0.75)
+ATLAS_DENSITY_PCF = (50.0, 60.0, 70.0, 80.0)
+ATLAS_METRICS = ("weight_lbs", "freeboard_in", "gm_in", "safety_factor")
+ATLAS_DIR = PROJECT_ROOT / "data" / "design_atlas"
+
 
 def weight_from_dimensions(L: float, B: float, D: float, t: float = 0.5) -> float:
     """Estimate concrete weight (lbs) from hull dimensions. Simplified surface area model."""
@@ -46,75 +98,422 @@ def weight_from_dimensions(L: float, B: float, D: float, t: float = 0.5) -> floa
     return vol_ft3 * 60  # 60 pcf lightweight concrete
 
 
+def weight_gradient(L: float, B: float, D: float, t: float = 0.5) -> np.ndarray:
+    """d(weight_from_dimensions)/d(L, B, D, t)."""
+    k = 60 / 1728
+    surf_in2 = 2 * (L * D + B * D) + L * B
+    return np.array([(2 * D + B) * t * k, (2 * D + L) * t * k,
+                     2 * (L + B) * t * k, surf_in2 * k])
+
+
 def objective(x: np.ndarray) -> float:
     """Minimize weight."""
     L, B, D = x
     return weight_from_dimensions(L, B, D, THICKNESS)
 
 
+def objective_grad(x: np.ndarray) -> np.ndarray:
+    """Exact gradient of objective() over (L, B, D)."""
+    L, B, D = x
+    return weight_gradient(L, B, D, THICKNESS)[:3]
+
+
+def analyze(x: np.ndarray) -> Tuple[float, Optional[dict], np.ndarray]:
+    """
+    Weight, run_complete_analysis() result (None if it raised) and the
+    SLSQP constraint vector g >= 0 at x: the margins over MIN_FREEBOARD,
+    MIN_GM and MIN_SF, or -1e6 each when the analysis failed.
+    """
+    L, B, D = x
+    w = weight_from_dimensions(L, B, D, THICKNESS)
+    try:
+        r = run_complete_analysis(L, B, D, THICKNESS, w, FLEXURAL_PSI)
+        g = np.array([r["freeboard"]["freeboard_in"] - MIN_FREEBOARD,
+                      r["stability"]["gm_in"] - MIN_GM,
+                      r["structural"]["safety_factor"] - MIN_SF])
+    except Exception:
+        r, g = None, np.array([-1e6, -1e6, -1e6])
+    return w, r, g
+
+
 def constraints_g(x: np.ndarray) -> np.ndarray:
     """g(x) >= 0 for SLSQP ineq. We need fb>=6 so return fb-6."""
+    return analyze(x)[2]
+
+
+def constraints_jac(x: np.ndarray) -> np.ndarray:
+    """Exact 3×3 Jacobian of constraints_g() over (L, B, D); weight follows
+    the dimensions through weight_from_dimensions()."""
     L, B, D = x
     w = weight_from_dimensions(L, B, D, THICKNESS)
+    _, grads = analysis_gradients(L, B, D, THICKNESS, w,
+                                  weight_gradient(L, B, D, THICKNESS), FLEXURAL_PSI)
+    return jacobian(grads, ("freeboard_in", "gm_in", "safety_factor"), ("L", "B", "D"))
+
+
+class HullEvaluator:
+    """
+    Per-run evaluation cache shared by the SLSQP callbacks.
+
+    SLSQP asks for the objective, the constraints and their Jacobians as
+    separate callbacks at the same iterate. The first callback at an x runs
+    the analysis once (analyze()); the others are
+    served from a small exact-match cache keyed on the bytes of x. The
+    Jacobians are computed on first request and cached with the values.
+
+    calls counts callback invocations by name; evaluations and jacobians
+    count the unique analyses actually run. merge() adds the counters of
+    another evaluator (e.g. one returned by a worker process).
+    """
+
+    CALLBACKS = ("objective", "constraints", "objective_grad", "constraints_jac")
+
+    def __init__(self, maxsize: int = EVAL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.calls: Counter = Counter()
+        self.evaluations = 0
+        self.jacobians = 0
+        self._cache: "OrderedDict[bytes, dict]" = OrderedDict()
+
+    def _entry(self, x) -> dict:
+        x = np.array(x, dtype=float)
+        key = x.tobytes()
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+        self.evaluations += 1
+        w, r, g = analyze(x)
+        entry = {"x": x, "weight": w, "analysis": r, "constraints": g}
+        self._cache[key] = entry
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return entry
+
+    def _jacobians(self, x) -> dict:
+        entry = self._entry(x)
+        if "constraints_jac" not in entry:
+            self.jacobians += 1
+            entry["objective_grad"] = objective_grad(entry["x"])
+            entry["constraints_jac"] = constraints_jac(entry["x"])
+        return entry
+
+    def objective(self, x) -> float:
+        self.calls["objective"] += 1
+        return self._entry(x)["weight"]
+
+    def constraints(self, x) -> np.ndarray:
+        self.calls["constraints"] += 1
+        return self._entry(x)["constraints"].copy()
+
+    def objective_grad(self, x) -> np.ndarray:
+        self.calls["objective_grad"] += 1
+        return self._jacobians(x)["objective_grad"].copy()
+
+    def constraints_jac(self, x) -> np.ndarray:
+        self.calls["constraints_jac"] += 1
+        return self._jacobians(x)["constraints_jac"].copy()
+
+    def analysis(self, x) -> Optional[dict]:
+        """run_complete_analysis() result at x (None if it raised)."""
+        return self._entry(x)["analysis"]
+
+    def clear(self) -> None:
+        """Drop cached iterates; counters are kept."""
+        self._cache.clear()
+
+    def merge(self, other: "HullEvaluator") -> "HullEvaluator":
+        self.calls.update(other.calls)
+        self.evaluations += other.evaluations
+        self.jacobians += other.jacobians
+        return self
+
+    def summary(self) -> str:
+        n = sum(self.calls.values())
+        parts = ", ".join(f"{name} ×{self.calls[name]}" for name in self.CALLBACKS)
+        return (f"{n} callback calls ({parts}) served by {self.evaluations} "
+                f"analyses and {self.jacobians} Jacobians")
+
+
+def start_point(seed) -> np.ndarray:
+    """Uniform random start inside BOUNDS from one start's seed."""
+    lo, hi = np.array(BOUNDS, dtype=float).T
+    return np.random.default_rng(seed).uniform(lo, hi)
+
+
+def solve_start(x0: np.ndarray, evaluator: Optional[HullEvaluator] = None) -> Optional[dict]:
+    """One SLSQP run from x0. The optimum as a results row if feasible, else None."""
+    ev = evaluator if evaluator is not None else HullEvaluator()
     try:
-        r = run_complete_analysis(L, B, D, THICKNESS, w, FLEXURAL_PSI)
+        res = minimize(
+            ev.objective,
+            x0,
+            method="SLSQP",
+            jac=ev.objective_grad,
+            bounds=BOUNDS,
+            constraints={"type": "ineq", "fun": ev.constraints, "jac": ev.constraints_jac},
+            options={"maxiter": 200},
+        )
+        if not res.success:
+            return None
+        L, B, D = res.x
+        w = weight_from_dimensions(L, B, D, THICKNESS)
+        r = ev.analysis(res.x)  # usually the last iterate: a cache hit
         fb = r["freeboard"]["freeboard_in"]
         gm = r["stability"]["gm_in"]
         sf = r["structural"]["safety_factor"]
-        return np.array([fb - 6.0, gm - 6.0, sf - 2.0])
     except Exception:
-        return np.array([-1e6, -1e6, -1e6])
-
-
-def run_optimization(n_starts: int = 100) -> list:
-    """Run optimization from multiple random starts. Returns top 10."""
-    results = []
-    np.random.seed(42)
-    L0, L1 = BOUNDS[0]
-    B0, B1 = BOUNDS[1]
-    D0, D1 = BOUNDS[2]
-
-    for _ in tqdm(range(n_starts), desc="Optimizing"):
-        x0 = np.array([
-            np.random.uniform(L0, L1),
-            np.random.uniform(B0, B1),
-            np.random.uniform(D0, D1),
-        ])
+        return None
+    if fb >= MIN_FREEBOARD and gm >= MIN_GM and sf >= MIN_SF:
+        return {
+            "length_in": L, "beam_in": B, "depth_in": D,
+            "weight_lbs": w, "freeboard_in": fb, "gm_in": gm,
+            "safety_factor": sf, "obj": res.fun,
+        }
+    return None
+
+
+def _solve_task(task):
+    """(index, seed, diagnostics mode) -> (index, row, DiagnosticsCollector, HullEvaluator)."""
+    index, seed, mode = task
+    evaluator = HullEvaluator()
+    with diagnostics(mode) as diag:
+        row = solve_start(start_point(seed), evaluator)
+    evaluator.clear()  # only the counters travel back
+    return index, row, diag, evaluator
+
+
+def _run_starts(tasks, workers: int):
+    """Yield _solve_task results as starts finish; closing the generator
+    cancels starts that have not begun."""
+    if workers == 1:
+        yield from map(_solve_task, tasks)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for future in as_completed([pool.submit(_solve_task, t) for t in tasks]):
+            yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _same_optimum(a: dict, b: dict) -> bool:
+    return all(abs(a[k] - b[k]) <= OPTIMUM_TOL_IN for k in ("length_in", "beam_in", "depth_in"))
+
+
+def run_optimization(
+    n_starts: int = N_STARTS,
+    seed: int = SEED,
+    workers: Optional[int] = None,
+    distinct: Optional[int] = None,
+    top: int = 10,
+    evaluator: Optional[HullEvaluator] = None,
+) -> list:
+    """
+    Run SLSQP from n_starts random starts. Returns the top lightest feasible.
+
+    Start i draws its point from SeedSequence(seed).spawn(n_starts)[i], so
+    each start is the same whichever process runs it. Starts run in a
+    process pool (workers defaults to os.cpu_count(); 1 runs in-process)
+    and finish in any order, but results are merged in start order: with
+    distinct=K the run stops at the first start by which K distinct
+    feasible optima (within OPTIMUM_TOL_IN) have been found, and later
+    starts are cancelled or discarded. The output therefore does not depend
+    on the number of workers. Diagnostics from the workers are merged into
+    the caller's diagnostics() collector, if any, and the per-start
+    evaluation counters into evaluator, if given.
+    """
+    active = active_diagnostics()
+    mode = active.mode if active is not None else "warn"
+    seeds = np.random.SeedSequence(seed).spawn(n_starts)
+    tasks = [(i, s, mode) for i, s in enumerate(seeds)]
+    workers = min(workers or os.cpu_count() or 1, n_starts)
+
+    finished = {}
+    results, optima = [], []
+    merged = 0  # starts [0, merged) are folded into results, in order
+    stopped = False
+    starts = _run_starts(tasks, workers)
+    try:
+        for index, row, diag, counts in tqdm(starts, total=n_starts, desc="Optimizing"):
+            finished[index] = (row, diag, counts)
+            while merged in finished and not stopped:
+                row, diag, counts = finished.pop(merged)
+                merged += 1
+                if active is not None:
+                    active.merge(diag)
+                if evaluator is not None:
+                    evaluator.merge(counts)
+                if row is None:
+                    continue
+                results.append(row)
+                if not any(_same_optimum(row, o) for o in optima):
+                    optima.append(row)
+                    stopped = distinct is not None and len(optima) >= distinct
+            if stopped:
+                break
+    finally:
+        starts.close()
+
+    if stopped:
+        print(f"Stopped after {merged} of {n_starts} starts: "
+              f"{len(optima)} distinct feasible optima found")
+    results.sort(key=lambda x: x["weight_lbs"])  # stable: ties keep start order
+    return results[:top]
+
+
+def evaluate_generation(X: np.ndarray):
+    """
+    Objectives, constraint violation and metrics for a whole generation of
+    (L, B, D) rows in one run_complete_analysis_batch call. The violation
+    sums the relative shortfalls below MIN_FREEBOARD, MIN_GM and MIN_SF.
+    """
+    L, B, D = X.T
+    batch = run_complete_analysis_batch(L, B, D, THICKNESS,
+                                        weight_from_dimensions(L, B, D, THICKNESS),
+                                        FLEXURAL_PSI)
+    F = np.column_stack([sense * batch[name] for name, sense in PARETO_OBJECTIVES])
+    violation = (
+        np.maximum(0.0, 1 - batch["freeboard_in"] / MIN_FREEBOARD)
+        + np.maximum(0.0, 1 - batch["gm_in"] / MIN_GM)
+        + np.maximum(0.0, 1 - batch["safety_factor"] / MIN_SF)
+    )
+    return F, violation, {k: batch[k] for k in PARETO_COLUMNS}
+
+
+def run_pareto(pop_size: int = POP_SIZE, generations: int = GENERATIONS, seed: int = SEED):
+    """NSGA-II over BOUNDS; returns the calculations.pareto.ParetoResult."""
+    return nsga2(evaluate_generation, BOUNDS, pop_size, generations, seed=seed)
+
+
+def pareto_main() -> int:
+    global POP_SIZE, GENERATIONS
+    if "--pop" in sys.argv:
+        POP_SIZE = int(sys.argv[sys.argv.index("--pop") + 1])
+    if "--generations" in sys.argv:
+        GENERATIONS = int(sys.argv[sys.argv.index("--generations") + 1])
+
+    print("NAU Canoe 2026 - Hull Pareto Search (NSGA-II)")
+    print("Objectives: min weight, max GM, max freeboard, max length")
+    print("Constraints: Freeboard≥6\", GM≥6\", SF≥2")
+    print("-" * 50)
+    t0 = time.perf_counter()
+    result = run_pareto(POP_SIZE, GENERATIONS, SEED)
+    archive = result.archive
+    print(f"{result.evaluations} designs in {time.perf_counter() - t0:.1f} s; "
+          f"{len(archive)} non-dominated feasible")
+    if not len(archive):
+        print("No feasible designs found. Try relaxing constraints.")
+        return 1
+
+    order = np.argsort(archive.columns["weight_lbs"], kind="stable")
+    front = {k: archive.columns[k][order] for k in PARETO_COLUMNS}
+    out_dir = PROJECT_ROOT / "data"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = write_csv(out_dir / "pareto_front", front, index_name=None)
+
+    print(f"\n{'':>10} {'W(lbs)':>8} {'GM':>6} {'FB':>6} {'L(in)':>6}")
+    for label, name, pick in (("lightest", "weight_lbs", np.argmin),
+                              ("stiffest", "gm_in", np.argmax),
+                              ("driest", "freeboard_in", np.argmax),
+                              ("longest", "length_in", np.argmax)):
+        i = pick(front[name])
+        print(f"{label:>10} {front['weight_lbs'][i]:>8.1f} {front['gm_in'][i]:>6.2f} "
+              f"{front['freeboard_in'][i]:>6.2f} {front['length_in'][i]:>6.1f}")
+    print(f"\nSaved: {out_path}")
+    return 0
+
+
+def evaluate_atlas(L, B, D, t, density):
+    """Atlas metrics for grid points; weight scales weight_from_dimensions' 60 pcf."""
+    w = weight_from_dimensions(L, B, D, t) * density / 60
+    batch = run_complete_analysis_batch(L, B, D, t, w, FLEXURAL_PSI,
+                                        concrete_density_pcf=density)
+    return {k: batch[k] for k in ATLAS_METRICS}
+
+
+def atlas_axes() -> dict:
+    (L0, L1), (B0, B1), (D0, D1) = BOUNDS
+    return {
+        "L": grid_axis(L0, L1, ATLAS_STEP_IN),
+        "B": grid_axis(B0, B1, ATLAS_STEP_IN),
+        "D": grid_axis(D0, D1, ATLAS_STEP_IN),
+        "t": np.array(ATLAS_THICKNESS_IN),
+        "density": np.array(ATLAS_DENSITY_PCF),
+    }
+
+
+def load_atlas(directory: Path = ATLAS_DIR, rebuild: bool = False) -> DesignAtlas:
+    """Open the atlas, building it first if missing, stale or rebuild=True."""
+    axes = atlas_axes()
+    if not rebuild and (directory / "atlas.json").exists():
         try:
-            res = minimize(
-                objective,
-                x0,
-                method="SLSQP",
-                bounds=BOUNDS,
-                constraints={"type": "ineq", "fun": constraints_g},
-                options={"maxiter": 200},
-            )
-            if res.success:
-                L, B, D = res.x
-                w = weight_from_dimensions(L, B, D, THICKNESS)
-                r = run_complete_analysis(L, B, D, THICKNESS, w, FLEXURAL_PSI)
-                fb = r["freeboard"]["freeboard_in"]
-                gm = r["stability"]["gm_in"]
-                sf = r["structural"]["safety_factor"]
-                if fb >= MIN_FREEBOARD and gm >= MIN_GM and sf >= MIN_SF:
-                    results.append({
-                        "length_in": L, "beam_in": B, "depth_in": D,
-                        "weight_lbs": w, "freeboard_in": fb, "gm_in": gm,
-                        "safety_factor": sf, "obj": res.fun,
-                    })
-        except Exception:
-            pass
-
-    results.sort(key=lambda x: x["weight_lbs"])
-    return results[:10]
+            atlas = DesignAtlas.open(directory)
+        except ValueError:
+            atlas = None
+        if (atlas is not None and atlas.meta.get("model_version") == MODEL_VERSION
+                and atlas.meta.get("flexural_psi") == FLEXURAL_PSI
+                and all(np.array_equal(atlas.axes[k], v) for k, v in axes.items())):
+            return atlas
+    n = int(np.prod([len(v) for v in axes.values()]))
+    print(f"Building design atlas: {n:,} grid points ...")
+    t0 = time.perf_counter()
+    atlas = build_atlas(directory, axes, evaluate_atlas, ATLAS_METRICS,
+                        metadata={"flexural_psi": FLEXURAL_PSI})
+    print(f"  done in {time.perf_counter() - t0:.1f} s -> {directory}")
+    return atlas
+
+
+def atlas_main() -> int:
+    atlas = load_atlas(rebuild="--rebuild" in sys.argv)
+    text = sys.argv[sys.argv.index("--query") + 1] if "--query" in sys.argv else ""
+    try:
+        ranges = parse_conditions(text)
+        t0 = time.perf_counter()
+        best = atlas.lightest(**ranges)
+        ms = (time.perf_counter() - t0) * 1000
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return 1
+    print(f"{len(atlas):,} designs; lightest feasible"
+          f"{' with ' + text if text else ''} ({ms:.1f} ms):")
+    if best is None:
+        print("  none")
+        return 1
+    print(f"  L={best['L']:.2f}\" B={best['B']:.2f}\" D={best['D']:.2f}\" "
+          f"t={best['t']:.3f}\" density={best['density']:.0f} pcf")
+    print(f"  W={best['weight_lbs']:.1f} lbs  FB={best['freeboard_in']:.2f}\"  "
+          f"GM={best['gm_in']:.2f}\"  SF={best['safety_factor']:.2f}")
+    return 0
 
 
 def main() -> int:
+    global SEED, N_STARTS, N_WORKERS, DISTINCT_OPTIMA
+    if "--workers" in sys.argv:
+        N_WORKERS = int(sys.argv[sys.argv.index("--workers") + 1])
+    if "--seed" in sys.argv:
+        SEED = int(sys.argv[sys.argv.index("--seed") + 1])
+    if "--starts" in sys.argv:
+        N_STARTS = int(sys.argv[sys.argv.index("--starts") + 1])
+    if "--distinct" in sys.argv:
+        DISTINCT_OPTIMA = int(sys.argv[sys.argv.index("--distinct") + 1])
+    if "--pareto" in sys.argv:
+        return pareto_main()
+    if "--atlas" in sys.argv:
+        return atlas_main()
+
     print("NAU Canoe 2026 - Hull Optimizer")
     print("Constraints: Freeboard≥6\", GM≥6\", SF≥2")
     print("-" * 50)
 
-    results = run_optimization(100)
+    # SLSQP line searches probe many odd designs; tally the sanity-check
+    # flags instead of warning on each evaluation.
+    evaluator = HullEvaluator()
+    with diagnostics("collect") as diag:
+        results = run_optimization(N_STARTS, seed=SEED, workers=N_WORKERS,
+                                   distinct=DISTINCT_OPTIMA, evaluator=evaluator)
+    print(f"Diagnostics: {diag.summary()}")
+    print(f"Evaluations: {evaluator.summary()}")
 
     if not results:
         print("No feasible designs found. Try relaxing constraints.")
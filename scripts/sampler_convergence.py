@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+NAU ASCE Concrete Canoe 2026 — Sampler Convergence Report
+RMS estimator error vs N for random, LHS, Sobol' and Halton sampling.
+
+Run: python scripts/sampler_convergence.py [--quick]
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from calculations.sampling import convergence_rates, convergence_study
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+FIG_DIR = PROJECT_ROOT / "reports" / "figures"
+REPORT_DIR = PROJECT_ROOT / "reports"
+for d in [FIG_DIR, REPORT_DIR]:
+    d.mkdir(parents=True, exist_ok=True)
+
+SAMPLERS = ("random", "lhs", "sobol", "halton")
+SIZES = tuple(2 ** k for k in range(7, 16))
+REPLICATES = 30
+LABELS = {
+    "mean_weight": "Mean canoe weight (lbs)",
+    "mean_sf": "Mean safety factor",
+    "std_sf": "Std dev of safety factor",
+    "p_fail": "P(fail)",
+}
+COLORS = {"random": "#F44336", "lhs": "#FF9800", "sobol": "#2196F3", "halton": "#4CAF50"}
+
+
+def plot_convergence(rows):
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle("Sampler Convergence — RMS Error vs Sample Count\n"
+                 "Design A, truncated-normal inputs",
+                 fontsize=15, fontweight="bold", y=1.02)
+    for ax, (est, label) in zip(axes.flat, LABELS.items()):
+        for name in SAMPLERS:
+            pts = [(r["n"], r["rmse"]) for r in rows
+                   if r["sampler"] == name and r["estimator"] == est]
+            n, e = np.array(pts).T
+            ax.loglog(n, e, "o-", color=COLORS[name], label=name, lw=1.5, ms=4)
+        n = np.array(SIZES, dtype=float)
+        ref = [r["rmse"] for r in rows
+               if r["sampler"] == "random" and r["estimator"] == est][0]
+        ax.loglog(n, ref * np.sqrt(n[0] / n), "k:", lw=1, label="N^-1/2")
+        ax.set_title(label, fontweight="bold")
+        ax.set_xlabel("Samples N")
+        ax.set_ylabel("RMS error")
+        ax.grid(True, which="both", alpha=0.2)
+        ax.legend(fontsize=8)
+    plt.tight_layout()
+    out = FIG_DIR / "sampler_convergence.png"
+    fig.savefig(out, dpi=200, bbox_inches="tight", facecolor="white")
+    plt.close(fig)
+    print(f"  [OK] {out.name}")
+
+
+def write_report(rows, rates):
+    n_max = max(SIZES)
+    md = f"""# Sampler Convergence Report
+## Design A: 192" × 32" × 17" — Uncertainty Sampling Efficiency
+
+Each sampler draws the four uncertain inputs through the exact inverse CDF
+of their truncated normal distributions. For each sample count N the
+estimate is repeated {REPLICATES} times with independent randomizations;
+the RMS error is measured against a 2²² point scrambled-Sobol' reference.
+
+## Convergence Rates (slope of log RMSE vs log N; plain MC ≈ −0.5)
+
+| Estimator | {" | ".join(SAMPLERS)} |
+|-----------|{"|".join("-" * (len(s) + 2) for s in SAMPLERS)}|
+"""
+    for est, label in LABELS.items():
+        md += f"| {label} | " + " | ".join(
+            f"{rates.get((s, est), float('nan')):.2f}" for s in SAMPLERS) + " |\n"
+
+    md += f"""
+## RMS Error at N = {n_max:,}
+
+| Estimator | Reference | {" | ".join(SAMPLERS)} | Random MC needs × more samples |
+|-----------|-----------|{"|".join("-" * (len(s) + 2) for s in SAMPLERS)}|--------------------------------|
+"""
+    for est, label in LABELS.items():
+        err = {r["sampler"]: r for r in rows if r["estimator"] == est and r["n"] == n_max}
+        best = min(SAMPLERS[1:], key=lambda s: err[s]["rmse"])
+        # Plain MC needs (e_random / e_best)² times more samples for equal error
+        ratio = (err["random"]["rmse"] / err[best]["rmse"]) ** 2
+        md += (f"| {label} | {err['random']['reference']:.4g} | "
+               + " | ".join(f"{err[s]['rmse']:.2e}" for s in SAMPLERS)
+               + f" | {ratio:,.0f}× ({best}) |\n")
+
+    md += """
+## Notes
+
+- Smooth means (weight, SF) gain the most: scrambled Sobol' and Halton
+  approach N⁻¹, so 10–100× fewer evaluations reach the same CI width.
+- P(fail) is the mean of a discontinuous indicator; QMC still helps but
+  the rate stays nearer N⁻¹ᐟ², so small failure probabilities need a
+  rare-event method rather than more QMC points.
+- Sobol' points are balanced for powers of two; keep N = 2ᵏ.
+
+## Figures
+
+- `figures/sampler_convergence.png` — RMS error vs N per sampler
+
+---
+*Generated by NAU ASCE Concrete Canoe Calculator — 2026*
+"""
+    out = REPORT_DIR / "sampler_convergence_report.md"
+    out.write_text(md)
+    print(f"  [OK] {out.name}")
+
+
+def main():
+    global SIZES, REPLICATES
+    if "--quick" in sys.argv:
+        SIZES, REPLICATES = SIZES[:5], 8
+
+    print("=" * 55)
+    print("  Sampler Convergence Study")
+    print("=" * 55)
+    rows = convergence_study(SAMPLERS, SIZES, REPLICATES)
+    rates = convergence_rates(rows)
+    for (name, est), rate in sorted(rates.items()):
+        print(f"  {name:7s} {est:12s} slope {rate:+.2f}")
+    plot_convergence(rows)
+    write_report(rows, rates)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """
 NAU ASCE Concrete Canoe 2026 — Uncertainty & Sensitivity Analysis
-Monte Carlo simulation (1000 iterations) + tornado sensitivity diagram.
+Monte Carlo simulation (10⁶ samples, vectorized) + tornado sensitivity diagram
+(one-at-a-time ±1σ, or Sobol' indices with --sobol).
 """
 
 import sys
-import csv
 import math
 from pathlib import Path
 from typing import Dict, List
@@ -26,6 +26,17 @@ from calculations.concrete_canoe_calculator import (
     bending_stress_psi,
     safety_factor as calc_safety_factor,
 )
+from calculations.monte_carlo import (
+    BASE,
+    DEFAULT_SHARD,
+    UNCERTAINTIES,
+    precision,
+    run_adaptive,
+    run_parallel,
+)
+from calculations.sensitivity import sobol_indices, tornado_rows
+from calculations.copula import GaussianCopula
+from calculations.results_export import LEGACY_CSV_COLUMNS, check_formats, export_results
 
 import matplotlib
 matplotlib.use("Agg")
@@ -37,27 +48,28 @@ DATA_DIR = PROJECT_ROOT / "data"
 for d in [FIG_DIR, REPORT_DIR, DATA_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
-# ── Baseline (Design A) ──
-BASE = {
-    "L": 192, "B": 32, "D": 17, "t": 0.5,
-    "density": 60.0,
-    "flexural": 1500.0,
-    "paddler_wt": 175.0,
-    "n_paddlers": 4,
-    "cwp": 0.70,
-}
-
-# ── Uncertainty ranges ──
-UNCERTAINTIES = {
-    "density":    {"mean": 60.0,  "std": 3.0,   "label": "Concrete Density (PCF)", "pct": "±5%"},
-    "thickness":  {"mean": 0.5,   "std": 0.05,  "label": "Wall Thickness (in)",    "pct": "±10%"},
-    "flexural":   {"mean": 1500,  "std": 150,   "label": "Flexural Strength (psi)","pct": "±10%"},
-    "paddler_wt": {"mean": 175,   "std": 15,    "label": "Paddler Weight (lbs)",   "pct": "±8.6%"},
+N_ITERATIONS = 1_000_000
+SEED = 42          # root of the per-shard SeedSequence streams
+N_WORKERS = None   # None = all cores; results do not depend on it
+KEEP_SAMPLES = True  # raw arrays for the export; stats/plots never need them
+EXPORT_FORMATS = ("npz",)  # any of npz, npy, parquet, arrow, csv (--export a,b / --csv)
+SAMPLER = None       # None = clipped normals; or "random", "lhs", "sobol", "halton"
+ADAPTIVE = False     # stop on precision instead of running N_ITERATIONS
+PF_HALF_WIDTH = 0.005
+SOBOL = False        # variance-based sensitivity instead of one-at-a-time
+SOBOL_N = 1 << 14    # base sample size; N·(d+2) model evaluations
+COPULA = None        # GaussianCopula for correlated inputs incl. geometry (--correlated)
+SHARD_SIZE = DEFAULT_SHARD  # also the checkpoint granularity
+CHECKPOINT_DIR = None  # e.g. data/checkpoints; None = no checkpointing
+RESUME = False         # continue from CHECKPOINT_DIR instead of starting over
+
+SENSITIVITY_OUTPUTS = {
+    "canoe_wt": "Canoe Weight (lbs)",
+    "fb_in": "Freeboard (in)",
+    "gm_in": "GM (in)",
+    "sf": "Safety Factor",
 }
 
-N_ITERATIONS = 1000
-np.random.seed(42)
-
 MIN_FB = 6.0
 MIN_GM = 6.0
 MIN_SF = 2.0
@@ -70,8 +82,16 @@ def shell_weight(L, B, D, t, density):
     return (bottom + sides) * tf * density
 
 
-def run_single(density, thickness, flexural, paddler_wt):
-    """Run one Monte Carlo iteration. Returns dict of metrics."""
+def run_single(density, thickness, flexural, paddler_wt, hydro_table=None):
+    """
+    Run one Monte Carlo iteration. Returns dict of metrics.
+
+    Scalar reference for calculations.monte_carlo.evaluate(), which runs
+    the same chain on whole sample arrays.
+
+    hydro_table: optional HydrostaticTable (calculations.hydrostatics) to take
+    draft, KB and BM from the station-offset curves instead of the Cwp box.
+    """
     L, B, D = BASE["L"], BASE["B"], BASE["D"]
     Lf, Bf, Df, tf = L/12, B/12, D/12, thickness/12
 
@@ -81,17 +101,24 @@ def run_single(density, thickness, flexural, paddler_wt):
     crew = paddler_wt * BASE["n_paddlers"]
     loaded = canoe_wt + crew
 
-    disp = loaded / WATER_DENSITY_LB_PER_FT3
-    wp = Lf * Bf * BASE["cwp"]
-    draft_ft = disp / wp if wp > 0 else 0
+    if hydro_table is not None:
+        curves = hydro_table.at_weight(loaded, L, B, D)
+        draft_ft = float(curves["draft_ft"])
+        KB = float(curves["kb_ft"])
+        BM = float(curves["bm_ft"])
+    else:
+        disp = loaded / WATER_DENSITY_LB_PER_FT3
+        wp = Lf * Bf * BASE["cwp"]
+        draft_ft = disp / wp if wp > 0 else 0
+
+        KB = draft_ft / 2
+        # 3D Bouguer's formula: BM = I_wp / V_disp
+        cwp = BASE["cwp"]
+        I_wp = cwp * Lf * Bf**3 / 12
+        V_disp = cwp * Lf * Bf * draft_ft if draft_ft > 0 else 1
+        BM = I_wp / V_disp if draft_ft > 0 else 0
     fb_in = max(0, (Df - draft_ft) * 12)
 
-    KB = draft_ft / 2
-    # 3D Bouguer's formula: BM = I_wp / V_disp
-    cwp = BASE["cwp"]
-    I_wp = cwp * Lf * Bf**3 / 12
-    V_disp = cwp * Lf * Bf * draft_ft if draft_ft > 0 else 1
-    BM = I_wp / V_disp if draft_ft > 0 else 0
     # Weighted COG from hull + crew components
     hull_cog = Df * 0.38
     crew_cog = 10.0 / 12.0  # kneeling paddler ~10"
@@ -118,55 +145,61 @@ def run_single(density, thickness, flexural, paddler_wt):
 # ═══════════════════════════════════════════════════════════════
 # Monte Carlo
 # ═══════════════════════════════════════════════════════════════
+def _checkpoint_dir(name):
+    return None if CHECKPOINT_DIR is None else Path(CHECKPOINT_DIR) / name
+
+
 def run_monte_carlo():
-    print("  Running Monte Carlo simulation (1000 iterations)...")
-    samples = {
-        "density": np.random.normal(60, 3, N_ITERATIONS),
-        "thickness": np.random.normal(0.5, 0.05, N_ITERATIONS),
-        "flexural": np.random.normal(1500, 150, N_ITERATIONS),
-        "paddler_wt": np.random.normal(175, 15, N_ITERATIONS),
-    }
-    # Clip to physical bounds
-    samples["density"] = np.clip(samples["density"], 45, 80)
-    samples["thickness"] = np.clip(samples["thickness"], 0.25, 1.0)
-    samples["flexural"] = np.clip(samples["flexural"], 800, 2500)
-    samples["paddler_wt"] = np.clip(samples["paddler_wt"], 120, 250)
-
-    results = []
-    for i in range(N_ITERATIONS):
-        r = run_single(
-            samples["density"][i],
-            samples["thickness"][i],
-            samples["flexural"][i],
-            samples["paddler_wt"][i],
-        )
-        results.append(r)
-
-    weights = np.array([r["canoe_wt"] for r in results])
-    freeboards = np.array([r["fb_in"] for r in results])
-    gms = np.array([r["gm_in"] for r in results])
-    sfs = np.array([r["sf"] for r in results])
-    all_pass = np.array([r["all_pass"] for r in results])
-
-    stats = {
-        "weight": {"mean": np.mean(weights), "std": np.std(weights),
-                    "p5": np.percentile(weights, 5), "p95": np.percentile(weights, 95),
-                    "min": np.min(weights), "max": np.max(weights), "data": weights},
-        "freeboard": {"mean": np.mean(freeboards), "std": np.std(freeboards),
-                       "p5": np.percentile(freeboards, 5), "p95": np.percentile(freeboards, 95),
-                       "min": np.min(freeboards), "max": np.max(freeboards), "data": freeboards},
-        "gm": {"mean": np.mean(gms), "std": np.std(gms),
-                "p5": np.percentile(gms, 5), "p95": np.percentile(gms, 95),
-                "min": np.min(gms), "max": np.max(gms), "data": gms},
-        "sf": {"mean": np.mean(sfs), "std": np.std(sfs),
-               "p5": np.percentile(sfs, 5), "p95": np.percentile(sfs, 95),
-               "min": np.min(sfs), "max": np.max(sfs), "data": sfs},
-        "pass_rate": np.mean(all_pass) * 100,
-        "fail_rate": (1 - np.mean(all_pass)) * 100,
-        "n_fail": int(np.sum(~all_pass)),
-    }
-    print(f"  Pass rate: {stats['pass_rate']:.1f}% ({stats['n_fail']} failures in {N_ITERATIONS})")
-    return stats, samples
+    global N_ITERATIONS
+    if ADAPTIVE:
+        print(f"  Running adaptive Monte Carlo (P(fail) ± {PF_HALF_WIDTH}, "
+              f"budget {N_ITERATIONS:,})...")
+        run = run_adaptive(PF_HALF_WIDTH, max_samples=N_ITERATIONS, seed=SEED,
+                           sampler=SAMPLER, keep_samples=KEEP_SAMPLES, copula=COPULA,
+                           checkpoint_dir=_checkpoint_dir("monte_carlo"), resume=RESUME)
+        mc = run.stats
+        N_ITERATIONS = mc.count
+        print(f"  {'Converged' if run.converged else 'Budget reached'} after "
+              f"{mc.count:,} samples ({run.batches} batches, {run.wall_time_s:.2f} s)")
+    else:
+        print(f"  Running Monte Carlo simulation ({N_ITERATIONS:,} samples, vectorized)...")
+        mc = run_parallel(N_ITERATIONS, seed=SEED, workers=N_WORKERS, shard_size=SHARD_SIZE,
+                          keep_samples=KEEP_SAMPLES, sampler=SAMPLER, copula=COPULA,
+                          checkpoint_dir=_checkpoint_dir("monte_carlo"), resume=RESUME)
+        run = None
+
+    # Statistics come from the streaming accumulators (constant memory);
+    # "data" is only present when raw samples were kept.
+    stats = {}
+    for key, col in (("weight", "canoe_wt"), ("freeboard", "fb_in"),
+                     ("gm", "gm_in"), ("sf", "sf")):
+        acc = mc.stats[col]
+        stats[key] = acc.summary()
+        stats[key]["hist"] = acc.histogram
+        stats[key]["range"] = tuple(acc.sketch.quantile([0.0005, 0.9995]))
+        if mc.outputs is not None:
+            stats[key]["data"] = mc.outputs[col]
+    stats["pass_rate"] = mc.pass_rate * 100
+    stats["fail_rate"] = (1 - mc.pass_rate) * 100
+    stats["n_fail"] = mc.count - mc.passes["all_pass"]
+    intervals, _ = precision(mc)
+    stats["pf_ci"] = tuple(100 * v for v in intervals["p_fail"])
+    stats["adaptive"] = run
+    print(f"  Pass rate: {stats['pass_rate']:.1f}% ({stats['n_fail']:,} failures in {N_ITERATIONS:,})")
+    return stats, mc
+
+
+def display_bins(hist, lo, hi, target=40):
+    """Merge fixed histogram bins inside [lo, hi] down to about target bars."""
+    i0 = max(0, int(np.searchsorted(hist.edges, lo, side="right")) - 1)
+    i1 = min(len(hist.counts), int(np.searchsorted(hist.edges, hi, side="left")))
+    step = max(1, -(-(i1 - i0) // target))
+    i1 = min(len(hist.counts), i0 + step * (-(-(i1 - i0) // step)))
+    counts = np.add.reduceat(hist.counts[i0:i1], np.arange(0, i1 - i0, step))
+    edges = hist.edges[i0:i1 + 1:step]
+    if len(edges) < len(counts) + 1:
+        edges = np.append(edges, hist.edges[i1])
+    return counts / (hist.total * np.diff(edges)), edges
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -174,7 +207,7 @@ def run_monte_carlo():
 # ═══════════════════════════════════════════════════════════════
 def plot_distributions(stats):
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle(f"Uncertainty Analysis — Monte Carlo ({N_ITERATIONS} iterations)\n"
+    fig.suptitle(f"Uncertainty Analysis — Monte Carlo ({N_ITERATIONS:,} samples)\n"
                  f"Design A: 192\" × 32\" × 17\"",
                  fontsize=15, fontweight="bold", y=1.02)
 
@@ -186,12 +219,12 @@ def plot_distributions(stats):
     ]
 
     for ax, (key, title, xlabel, threshold, thresh_label, invert) in zip(axes.flat, metrics):
-        data = stats[key]["data"]
         s = stats[key]
 
-        # Histogram
-        n, bins, patches = ax.hist(data, bins=40, alpha=0.7, color="#2196F3",
-                                    edgecolor="black", linewidth=0.5, density=True)
+        # Histogram (fixed streaming bins, merged for display)
+        heights, bins = display_bins(s["hist"], *s["range"])
+        patches = ax.bar(bins[:-1], heights, width=np.diff(bins), align="edge",
+                         alpha=0.7, color="#2196F3", edgecolor="black", linewidth=0.5)
 
         # Color fail zone
         for patch, left_edge in zip(patches, bins[:-1]):
@@ -242,11 +275,8 @@ def run_sensitivity():
         ("flexural", 1500, 150),
         ("paddler_wt", 175, 15),
     ]
-    outputs = ["canoe_wt", "fb_in", "gm_in", "sf"]
-    output_labels = ["Canoe Weight (lbs)", "Freeboard (in)", "GM (in)", "Safety Factor"]
-
     sensitivities = {}  # {output: [(param_label, low_val, high_val, baseline_val)]}
-    for okey, olabel in zip(outputs, output_labels):
+    for okey, olabel in SENSITIVITY_OUTPUTS.items():
         sens = []
         for pname, pmean, pstd in params:
             kwargs_low = {"density": 60, "thickness": 0.5, "flexural": 1500, "paddler_wt": 175}
@@ -262,7 +292,21 @@ def run_sensitivity():
     return sensitivities, baseline
 
 
-def plot_tornado(sensitivities, baseline):
+def run_sobol_sensitivity():
+    """Sobol' first-order/total indices, in the run_sensitivity() row format."""
+    n_eval = SOBOL_N * (len(UNCERTAINTIES) + 2)
+    print(f"  Running Sobol' sensitivity analysis ({n_eval:,} evaluations)...")
+    indices = sobol_indices(SOBOL_N, seed=SEED, outputs=tuple(SENSITIVITY_OUTPUTS),
+                            workers=N_WORKERS, checkpoint_dir=_checkpoint_dir("sobol"),
+                            resume=RESUME)
+    for key, idx in indices.items():
+        print(f"    {SENSITIVITY_OUTPUTS[key]:20s} ranking: {', '.join(idx.ranking())}")
+    return tornado_rows(indices, SENSITIVITY_OUTPUTS), indices
+
+
+def plot_tornado(sensitivities, baseline, sobol=None):
+    if sobol is not None:
+        return plot_sobol_tornado(sensitivities, sobol)
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle("Sensitivity Analysis — Tornado Diagrams\n"
                  "Impact of ±1σ Parameter Variation on Key Metrics",
@@ -303,25 +347,84 @@ def plot_tornado(sensitivities, baseline):
     print(f"  [OK] {out.name}")
 
 
+def plot_sobol_tornado(sensitivities, sobol):
+    """Tornado of Sobol' indices: total-order bar with the first-order share inside."""
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig.suptitle("Global Sensitivity — Sobol' Indices\n"
+                 "Share of Output Variance per Parameter (bars: total, inner: first-order)",
+                 fontsize=15, fontweight="bold", y=1.02)
+
+    for ax, (key, idx) in zip(axes.flat, sobol.items()):
+        olabel = SENSITIVITY_OUTPUTS[key]
+        order = np.argsort(-idx.total, kind="stable")
+        labels = [sensitivities[olabel][i][0] for i in order]
+        for row, i in enumerate(order):
+            ax.barh(row, idx.total[i], height=0.6, color="#90CAF9",
+                    edgecolor="black", linewidth=0.5)
+            ax.barh(row, idx.first[i], height=0.35, color="#1565C0")
+            ax.errorbar(idx.total[i], row, xerr=[[idx.total[i] - idx.total_ci[i, 0]],
+                                                 [idx.total_ci[i, 1] - idx.total[i]]],
+                        fmt="none", ecolor="black", capsize=3, lw=1)
+            ax.text(min(idx.total_ci[i, 1], 1.0) + 0.02, row,
+                    f"S={idx.first[i]:.2f}  ST={idx.total[i]:.2f}", va="center", fontsize=8)
+        ax.set_yticks(np.arange(len(labels)))
+        ax.set_yticklabels(labels, fontsize=9)
+        ax.set_xlim(0, 1.25)
+        ax.set_xlabel("Sobol' index")
+        ax.set_title(f"{olabel} (σ = {math.sqrt(idx.variance):.2f})",
+                     fontweight="bold", fontsize=11)
+        ax.grid(True, axis="x", alpha=0.2)
+        ax.invert_yaxis()
+
+    plt.tight_layout()
+    out = FIG_DIR / "sensitivity_tornado.png"
+    fig.savefig(out, dpi=300, bbox_inches="tight", facecolor="white")
+    plt.close(fig)
+    print(f"  [OK] {out.name}")
+
+
 # ═══════════════════════════════════════════════════════════════
 # Markdown report
 # ═══════════════════════════════════════════════════════════════
-def write_report(stats, sensitivities, baseline):
+def write_report(stats, sensitivities, baseline, sobol=None):
     pf = lambda v: "PASS ✓" if v else "FAIL ✗"
+    if COPULA:
+        sampler_note = f"Gaussian copula, {COPULA.dim} correlated inputs" + (
+            f", {SAMPLER} points" if SAMPLER else "")
+    else:
+        sampler_note = (SAMPLER + " (truncated normals)" if SAMPLER
+                        else "pseudo-random normals clipped to bounds")
+    run = stats.get("adaptive")
+    adaptive_note = "" if run is None else (
+        f"Adaptive stopping: {'targets met' if run.converged else 'budget reached'} after "
+        f"{run.n_samples:,} samples ({run.batches} batches, {run.wall_time_s:.2f} s); "
+        f"P(fail) half-width {run.half_widths['p_fail']:.4f}.\n"
+    )
     md = f"""# Uncertainty & Sensitivity Analysis Report
 ## Design A: 192" × 32" × 17" — Monte Carlo Simulation
 
 ## 1. Methodology
 
-**Monte Carlo Simulation** with {N_ITERATIONS} random iterations.
-
-### Parameter Distributions (Normal)
+**Monte Carlo Simulation** with {N_ITERATIONS:,} random samples (vectorized, chunked).
+Sampler: {sampler_note}.
+{adaptive_note}
+### Parameter Distributions ({"Gaussian copula marginals" if COPULA else "Normal"})
 
 | Parameter | Mean | Std Dev | Range (±1σ) | Uncertainty |
 |-----------|------|---------|-------------|-------------|
 """
-    for key, u in UNCERTAINTIES.items():
-        md += f"| {u['label']} | {u['mean']} | {u['std']} | {u['mean']-u['std']:.2f} – {u['mean']+u['std']:.2f} | {u['pct']} |\n"
+    for key, u in (COPULA.marginals if COPULA else UNCERTAINTIES).items():
+        if "std" in u:
+            md += f"| {u['label']} | {u['mean']} | {u['std']} | {u['mean']-u['std']:.2f} – {u['mean']+u['std']:.2f} | {u['pct']} |\n"
+        else:
+            md += f"| {u['label']} | {u['mean']} | {u.get('dist', 'normal')} | {u['low']} – {u['high']} | {u['pct']} |\n"
+    if COPULA:
+        pairs = [(COPULA.names[i], COPULA.names[j], COPULA.correlation[i, j])
+                 for i in range(COPULA.dim) for j in range(i + 1, COPULA.dim)
+                 if COPULA.correlation[i, j] != 0]
+        md += "\n**Input correlations (normal scores):** " + (", ".join(
+            f"{COPULA.marginals[a]['label']} – {COPULA.marginals[b]['label']} ρ = {r:+.2f}"
+            for a, b, r in pairs) or "none") + "\n"
 
     md += f"""
 ## 2. Monte Carlo Results
@@ -338,8 +441,8 @@ def write_report(stats, sensitivities, baseline):
 ### Pass/Fail Analysis
 
 - **Overall pass rate: {stats['pass_rate']:.1f}%**
-- Failures: {stats['n_fail']} / {N_ITERATIONS} iterations
-- Failure rate: {stats['fail_rate']:.1f}%
+- Failures: {stats['n_fail']:,} / {N_ITERATIONS:,} samples
+- Failure rate: {stats['fail_rate']:.1f}% (95% Wilson CI {stats['pf_ci'][0]:.2f}% – {stats['pf_ci'][1]:.2f}%)
 
 ### 95% Confidence Intervals
 
@@ -351,16 +454,39 @@ def write_report(stats, sensitivities, baseline):
 | Safety Factor | {stats['sf']['p5']:.1f} – {stats['sf']['p95']:.1f} | ≥ 2.0 | {stats['sf']['min']:.1f} | {pf(stats['sf']['min'] >= MIN_SF)} |
 
 ## 3. Sensitivity Analysis
-
+"""
+    if sobol is None:
+        md += """
 The tornado diagrams show the impact of varying each parameter by ±1 standard deviation
 on each output metric. Parameters are ranked by total impact (swing).
 
 ### Most Sensitive Parameters (by impact on weight)
 """
-    for olabel, sens in sensitivities.items():
-        md += f"\n**{olabel}:**\n"
-        for plabel, lo, hi, bv in sorted(sens, key=lambda s: abs(s[2]-s[1]), reverse=True):
-            md += f"- {plabel}: {lo:.1f} to {hi:.1f} (swing: {abs(hi-lo):.1f})\n"
+        for olabel, sens in sensitivities.items():
+            md += f"\n**{olabel}:**\n"
+            for plabel, lo, hi, bv in sorted(sens, key=lambda s: abs(s[2]-s[1]), reverse=True):
+                md += f"- {plabel}: {lo:.1f} to {hi:.1f} (swing: {abs(hi-lo):.1f})\n"
+    else:
+        n_eval = SOBOL_N * (len(UNCERTAINTIES) + 2)
+        md += f"""
+Variance-based (Sobol') indices from {n_eval:,} evaluations (Saltelli first-order,
+Jansen total, scrambled Sobol' points; 95% bootstrap intervals). S is the share of
+the output variance explained by a parameter alone, ST includes its interactions.
+Parameters are ranked by ST.
+"""
+        for olabel, sens in sensitivities.items():
+            key = next(k for k, v in SENSITIVITY_OUTPUTS.items() if v == olabel)
+            idx = sobol[key]
+            md += f"""
+**{olabel}** (σ = {math.sqrt(idx.variance):.2f}):
+
+| Parameter | S (first-order) | 95% CI | ST (total) | 95% CI |
+|-----------|-----------------|--------|------------|--------|
+"""
+            for i in np.argsort(-idx.total, kind="stable"):
+                md += (f"| {sens[i][0]} | {idx.first[i]:.3f} | "
+                       f"{idx.first_ci[i, 0]:.3f} – {idx.first_ci[i, 1]:.3f} | "
+                       f"{idx.total[i]:.3f} | {idx.total_ci[i, 0]:.3f} – {idx.total_ci[i, 1]:.3f} |\n")
 
     md += f"""
 ## 4. Risk Mitigation Strategies
@@ -396,30 +522,71 @@ on each output metric. Parameters are ranked by total impact (swing).
 
 
 def main():
+    global N_WORKERS, KEEP_SAMPLES, SAMPLER, ADAPTIVE, SOBOL, SOBOL_N
+    global SHARD_SIZE, CHECKPOINT_DIR, RESUME, COPULA, EXPORT_FORMATS
+    if "--workers" in sys.argv:
+        N_WORKERS = int(sys.argv[sys.argv.index("--workers") + 1])
+    if "--no-samples" in sys.argv:
+        KEEP_SAMPLES = False
+    if "--sampler" in sys.argv:
+        SAMPLER = sys.argv[sys.argv.index("--sampler") + 1]
+    if "--adaptive" in sys.argv:
+        ADAPTIVE = True
+    if "--sobol" in sys.argv:
+        SOBOL = True
+    if "--sobol-n" in sys.argv:
+        SOBOL, SOBOL_N = True, int(sys.argv[sys.argv.index("--sobol-n") + 1])
+    if "--export" in sys.argv:
+        EXPORT_FORMATS = tuple(sys.argv[sys.argv.index("--export") + 1].split(","))
+    if "--csv" in sys.argv:
+        EXPORT_FORMATS += ("csv",)
+    if KEEP_SAMPLES:
+        try:
+            check_formats(EXPORT_FORMATS)
+        except (ValueError, ImportError) as e:
+            sys.exit(f"ERROR: {e}")
+    if "--correlated" in sys.argv:
+        COPULA = GaussianCopula()
+    if "--shard-size" in sys.argv:
+        SHARD_SIZE = int(sys.argv[sys.argv.index("--shard-size") + 1])
+    if "--checkpoint" in sys.argv:
+        CHECKPOINT_DIR = sys.argv[sys.argv.index("--checkpoint") + 1]
+    if "--resume" in sys.argv:
+        RESUME = True
+        CHECKPOINT_DIR = CHECKPOINT_DIR or DATA_DIR / "checkpoints"
+
     print("=" * 55)
     print("  PHASE 3: Uncertainty & Sensitivity Analysis")
     print("=" * 55)
 
-    stats, samples = run_monte_carlo()
+    stats, mc = run_monte_carlo()
     plot_distributions(stats)
 
-    sensitivities, baseline = run_sensitivity()
-    plot_tornado(sensitivities, baseline)
-
-    write_report(stats, sensitivities, baseline)
-
-    # Export raw MC data
-    out = DATA_DIR / "monte_carlo_results.csv"
-    with open(out, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["iteration", "weight_lbs", "freeboard_in", "gm_in", "safety_factor"])
-        for i in range(N_ITERATIONS):
-            writer.writerow([i+1,
-                             f"{stats['weight']['data'][i]:.2f}",
-                             f"{stats['freeboard']['data'][i]:.2f}",
-                             f"{stats['gm']['data'][i]:.2f}",
-                             f"{stats['sf']['data'][i]:.2f}"])
-    print(f"  [OK] {out.name}")
+    if SOBOL:
+        sensitivities, sobol = run_sobol_sensitivity()
+        baseline = run_single(60, 0.5, 1500, 175)
+    else:
+        sensitivities, baseline = run_sensitivity()
+        sobol = None
+    plot_tornado(sensitivities, baseline, sobol)
+
+    write_report(stats, sensitivities, baseline, sobol)
+
+    # Export raw MC inputs and outputs as whole columns
+    if KEEP_SAMPLES:
+        metadata = {
+            "seed": SEED,
+            "sampler": SAMPLER or "clipped-normal",
+            "copula": COPULA.config() if COPULA else None,
+            "adaptive": ADAPTIVE,
+            "base": BASE,
+            "uncertainties": COPULA.marginals if COPULA else UNCERTAINTIES,
+        }
+        written = export_results(DATA_DIR / "monte_carlo_results", mc.samples, mc.outputs,
+                                 metadata, EXPORT_FORMATS, csv_columns=LEGACY_CSV_COLUMNS,
+                                 csv_fmt="%.2f")
+        for path in written.values():
+            print(f"  [OK] {path.name}")
 
     print("\n  Phase 3 complete.")
 
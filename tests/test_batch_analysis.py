@@ -0,0 +1,82 @@
+"""Tests for the vectorized run_complete_analysis_batch API."""
+import sys
+import warnings
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.concrete_canoe_calculator import (
+    run_complete_analysis,
+    run_complete_analysis_batch,
+)
+
+
+SCALAR_KEYS = {
+    "displacement_ft3": ("freeboard", "displacement_ft3"),
+    "draft_in": ("freeboard", "draft_in"),
+    "freeboard_in": ("freeboard", "freeboard_in"),
+    "gm_in": ("stability", "gm_in"),
+    "section_modulus_in3": ("structural", "section_modulus_in3"),
+    "max_bending_moment_lb_ft": ("structural", "max_bending_moment_lb_ft"),
+    "bending_stress_psi": ("structural", "bending_stress_psi"),
+    "safety_factor": ("structural", "safety_factor"),
+}
+
+
+@pytest.fixture
+def designs():
+    rng = np.random.default_rng(7)
+    n = 200
+    return {
+        "L": rng.uniform(168, 240, n),
+        "B": rng.uniform(26, 42, n),
+        "D": rng.uniform(12, 22, n),
+        "t": rng.uniform(0.3, 0.75, n),
+        "W": rng.uniform(100, 400, n),
+        "fr": rng.uniform(800, 2500, n),
+        "cwp": rng.uniform(0.6, 0.75, n),
+        "rho": rng.uniform(50, 80, n),
+        "crew": rng.uniform(0, 900, n),
+    }
+
+
+class TestBatchMatchesScalar:
+    def test_all_metrics_match(self, designs):
+        d = designs
+        batch = run_complete_analysis_batch(
+            d["L"], d["B"], d["D"], d["t"], d["W"], d["fr"],
+            d["cwp"], d["rho"], d["crew"],
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for i in range(len(d["L"])):
+                r = run_complete_analysis(
+                    d["L"][i], d["B"][i], d["D"][i], d["t"][i], d["W"][i],
+                    d["fr"][i], d["cwp"][i], d["rho"][i], d["crew"][i],
+                )
+                for key, (group, field) in SCALAR_KEYS.items():
+                    assert batch[key][i] == pytest.approx(
+                        r[group][field], rel=1e-12, abs=1e-12
+                    ), key
+                assert bool(batch["overall_pass"][i]) == r["overall_pass"]
+
+    def test_scalars_broadcast(self):
+        L = np.array([192.0, 196.0, 216.0])
+        batch = run_complete_analysis_batch(L, 32, 17, 0.5, 200, crew_weight_lbs=700)
+        assert batch["freeboard_in"].shape == (3,)
+        assert batch["beam_in"].tolist() == [32.0, 32.0, 32.0]
+
+    def test_zero_length_guards(self):
+        batch = run_complete_analysis_batch(0.0, 32, 17, 0.5, 200)
+        assert batch["draft_in"] == 0.0
+        assert batch["gm_in"] == 0.0
+        assert batch["max_bending_moment_lb_ft"] == 0.0
+        assert batch["safety_factor"] == 0.0
+
+    def test_weight_diff_reported_without_warning(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            batch = run_complete_analysis_batch(192, 32, 17, 0.5, 2000)
+        assert batch["weight_diff_pct"] > 20
@@ -0,0 +1,116 @@
+"""Tests for checkpoint / resume of long runs (calculations/checkpoint.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+import calculations.monte_carlo as monte_carlo
+from calculations.checkpoint import Checkpoint, streaming_from_arrays, streaming_to_arrays
+from calculations.monte_carlo import MonteCarloStats, run_adaptive, run_parallel
+from calculations.streaming_stats import StreamingStats
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(monkeypatch, module, name, calls):
+    """Make module.name raise after `calls` successful calls."""
+    original = getattr(module, name)
+    count = {"n": 0}
+
+    def wrapper(*args, **kwargs):
+        count["n"] += 1
+        if count["n"] > calls:
+            raise Interrupted
+        return original(*args, **kwargs)
+    monkeypatch.setattr(module, name, wrapper)
+
+
+def assert_same_stats(a: MonteCarloStats, b: MonteCarloStats):
+    assert a.count == b.count and a.passes == b.passes
+    for name, st in a.stats.items():
+        other = b.stats[name]
+        assert st.moments == other.moments
+        assert np.array_equal(st.histogram.counts, other.histogram.counts)
+        assert np.array_equal(st.sketch.quantile([0.01, 0.5, 0.99]),
+                              other.sketch.quantile([0.01, 0.5, 0.99]))
+
+
+class TestSerialization:
+    def test_streaming_stats_round_trip(self):
+        st = StreamingStats.with_range(0, 1, 50, k=64)
+        st.update(np.random.default_rng(0).random(5000))
+        back = streaming_from_arrays(streaming_to_arrays(st, "x"), "x")
+        assert back.moments == st.moments
+        assert back.sketch.levels and all(
+            np.array_equal(a, b) for a, b in zip(back.sketch.levels, st.sketch.levels))
+        assert back.sketch._offsets == st.sketch._offsets
+        assert np.array_equal(back.histogram.counts, st.histogram.counts)
+        # Further updates behave identically
+        more = np.random.default_rng(1).random(3000)
+        assert back.update(more).sketch.quantile(0.3) == st.update(more).sketch.quantile(0.3)
+
+    def test_config_mismatch_raises(self, tmp_path):
+        Checkpoint(tmp_path / "ck", {"n": 1}).save({"x": np.zeros(1)})
+        with pytest.raises(ValueError, match="differs in: n"):
+            Checkpoint(tmp_path / "ck", {"n": 2}).start(resume=True)
+
+    def test_fresh_start_clears(self, tmp_path):
+        ck = Checkpoint(tmp_path / "ck", {"n": 1})
+        ck.save_part(0, {"x": np.zeros(1)})
+        assert ck.start(resume=False) is None and not ck.has_part(0)
+
+
+class TestResume:
+    KW = dict(n=30_000, seed=2026, shard_size=6_000, chunk_size=2_500, workers=1)
+
+    def test_parallel_resume_identical(self, tmp_path, monkeypatch):
+        reference = run_parallel(keep_samples=True, **self.KW)
+        with monkeypatch.context() as m:
+            interrupt_after(m, monte_carlo, "_run_shard_task", 2)
+            with pytest.raises(Interrupted):
+                run_parallel(keep_samples=True, checkpoint_dir=tmp_path, **self.KW)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "part_00000.npz", "part_00001.npz", "state.npz"]
+
+        resumed = run_parallel(keep_samples=True, checkpoint_dir=tmp_path, resume=True, **self.KW)
+        assert_same_stats(resumed, reference)
+        assert np.array_equal(resumed.outputs["sf"], reference.outputs["sf"])
+        assert np.array_equal(resumed.samples["density"], reference.samples["density"])
+
+    def test_resume_of_finished_run(self, tmp_path):
+        first = run_parallel(checkpoint_dir=tmp_path, checkpoint_every=2, **self.KW)
+        again = run_parallel(checkpoint_dir=tmp_path, resume=True, **self.KW)
+        assert_same_stats(again, first)
+
+    def test_adaptive_resume_identical(self, tmp_path, monkeypatch):
+        kw = dict(pf_half_width=0.006, percentile_half_width={}, batch_size=2048, seed=4)
+        reference = run_adaptive(**kw)
+        assert reference.batches > 4
+        with monkeypatch.context() as m:
+            interrupt_after(m, monte_carlo, "run_shard", 3)
+            with pytest.raises(Interrupted):
+                run_adaptive(checkpoint_dir=tmp_path, **kw)
+        resumed = run_adaptive(checkpoint_dir=tmp_path, resume=True, **kw)
+        assert resumed.batches == reference.batches
+        assert_same_stats(resumed.stats, reference.stats)
+        # Resuming a finished run adds nothing
+        again = run_adaptive(checkpoint_dir=tmp_path, resume=True, **kw)
+        assert again.batches == reference.batches and again.converged
+
+    def test_sobol_resume_identical(self, tmp_path, monkeypatch):
+        pytest.importorskip("scipy")
+        import calculations.sensitivity as sensitivity
+        kw = dict(n=1 << 10, workers=1, n_bootstrap=20, chunk_size=1500)
+        reference = sensitivity.sobol_indices(**kw)
+        with monkeypatch.context() as m:
+            interrupt_after(m, sensitivity, "_evaluate_block", 2)
+            with pytest.raises(Interrupted):
+                sensitivity.sobol_indices(checkpoint_dir=tmp_path, **kw)
+        resumed = sensitivity.sobol_indices(checkpoint_dir=tmp_path, resume=True, **kw)
+        for key, idx in reference.items():
+            assert np.array_equal(resumed[key].first, idx.first)
+            assert np.array_equal(resumed[key].total_ci, idx.total_ci)
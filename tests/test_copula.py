@@ -0,0 +1,98 @@
+"""Tests for correlated input sampling (calculations/copula.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from calculations.copula import (
+    CORRELATED_UNCERTAINTIES,
+    GaussianCopula,
+    correlation_matrix,
+)
+from calculations.monte_carlo import BASE, UNCERTAINTIES, evaluate, run_parallel
+
+
+@pytest.fixture(scope="module")
+def draws():
+    return GaussianCopula().sample(np.random.default_rng(0), 200_000)
+
+
+class TestGaussianCopula:
+    def test_correlations_reproduced(self, draws):
+        r = np.corrcoef(draws["density"], draws["flexural"])[0, 1]
+        assert r == pytest.approx(0.6, abs=0.01)
+        assert np.corrcoef(draws["B"], draws["D"])[0, 1] == pytest.approx(0.3, abs=0.01)
+        assert abs(np.corrcoef(draws["paddler_wt"], draws["density"])[0, 1]) < 0.01
+
+    def test_marginals(self, draws):
+        for name, spec in CORRELATED_UNCERTAINTIES.items():
+            x = draws[name]
+            assert x.min() >= spec["low"] and x.max() <= spec["high"], name
+            assert x.mean() == pytest.approx(spec["mean"], abs=0.02 * (spec["high"] - spec["low"]))
+        # uniform crew offset, triangular crew COG with mode 10"
+        assert draws["crew_offset_ft"].std() == pytest.approx(2 / np.sqrt(12), rel=0.01)
+        hist, edges = np.histogram(draws["crew_cog_in"], bins=24, range=(8, 14))
+        assert edges[np.argmax(hist)] == pytest.approx(10.0, abs=0.5)
+
+    def test_lognormal_marginal(self):
+        c = GaussianCopula({"x": {"dist": "lognormal", "mean": 2.0, "std": 0.5}})
+        x = c.sample(np.random.default_rng(1), 400_000)["x"]
+        assert x.min() > 0
+        assert x.mean() == pytest.approx(2.0, rel=0.01) and x.std() == pytest.approx(0.5, rel=0.02)
+
+    def test_cholesky_computed_once(self):
+        c = GaussianCopula(UNCERTAINTIES, {("density", "flexural"): 0.5})
+        assert np.allclose(c.cholesky @ c.cholesky.T, c.correlation)
+        assert c.correlation[0, 2] == 0.5 and c.dim == 4
+
+    def test_invalid_correlation(self):
+        with pytest.raises(ValueError, match="positive definite"):
+            GaussianCopula(UNCERTAINTIES, {("density", "flexural"): 0.9,
+                                           ("density", "thickness"): 0.9,
+                                           ("thickness", "flexural"): -0.9})
+        with pytest.raises(ValueError, match="unknown input"):
+            correlation_matrix(["a", "b"], {("a", "c"): 0.1})
+        with pytest.raises(ValueError, match="unknown marginal"):
+            GaussianCopula({"x": {"dist": "weibull"}})
+
+    def test_qmc_points(self):
+        c = GaussianCopula()
+        x = c.sample(np.random.default_rng(2), 1024, sampler="sobol")
+        assert set(x) == set(CORRELATED_UNCERTAINTIES) and len(x["L"]) == 1024
+
+
+class TestEvaluateWithGeometry:
+    def test_per_sample_geometry_matches_scalar_base(self, draws):
+        sub = {k: v[:50] for k, v in draws.items()}
+        batch = evaluate(**sub)
+        for i in (0, 17, 49):
+            base = dict(BASE, **{k: float(sub[k][i]) for k in
+                                 ("L", "B", "D", "cwp", "crew_offset_ft", "crew_cog_in")})
+            ref = evaluate(*(sub[k][i] for k in UNCERTAINTIES), base=base)
+            for key in ("canoe_wt", "fb_in", "gm_in", "sf"):
+                assert batch[key][i] == pytest.approx(float(ref[key]), rel=1e-12)
+
+    def test_crew_placement(self):
+        mid = evaluate(60, 0.5, 1500, 175)
+        off = evaluate(60, 0.5, 1500, 175, crew_offset_ft=np.array([1.0, -1.0]))
+        high = evaluate(60, 0.5, 1500, 175, crew_cog_in=14.0)
+        assert np.all(off["sf"] > mid["sf"]) and off["sf"][0] == pytest.approx(off["sf"][1])
+        assert high["gm_in"] < mid["gm_in"]
+
+    def test_unknown_input_rejected(self):
+        with pytest.raises(TypeError, match="rocker"):
+            evaluate(60, 0.5, 1500, 175, rocker=2.0)
+
+    def test_run_parallel_with_copula(self):
+        c = GaussianCopula()
+        kw = dict(n=20_000, seed=3, shard_size=8_000, chunk_size=4_000,
+                  keep_samples=True, copula=c)
+        a = run_parallel(workers=1, **kw)
+        b = run_parallel(workers=2, **kw)
+        assert set(a.samples) == set(CORRELATED_UNCERTAINTIES)
+        assert a.stats["sf"].moments == b.stats["sf"].moments
+        direct = evaluate(**a.samples)
+        assert np.array_equal(direct["sf"], a.outputs["sf"])
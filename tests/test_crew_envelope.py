@@ -0,0 +1,90 @@
+"""Tests for moving-crew influence-line envelopes (calculations/crew_envelope.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.crew_envelope import InfluenceLines, crew_layouts, envelope
+from calculations.load_cases import girder_statics
+
+L = 16.0
+NOMINAL = np.array([0.25, 0.40, 0.60, 0.75]) * L
+
+
+@pytest.fixture(scope="module")
+def layouts():
+    opts = [np.linspace(p - 0.8, p + 0.8, 5) for p in NOMINAL]
+    return crew_layouts(opts, [150, 165, 185, 200], min_spacing_ft=2.0)
+
+
+@pytest.fixture(scope="module")
+def lines(layouts):
+    return InfluenceLines.build(L, layouts[0], 171.0)
+
+
+class TestInfluenceLines:
+    def test_uniform_buoyancy_matches_girder_statics(self):
+        il = InfluenceLines.build(L, NOMINAL, 171.0, buoyancy_shape=None)
+        r = il.evaluate(np.arange(4), np.full(4, 175.0))
+        st = girder_statics(L, 171.0 / L - 871.0 / L,
+                            [(p / L, 175.0) for p in NOMINAL])
+        m = np.interp(st["x_frac"] * L, il.x_ft, r["moment_lb_ft"][0])
+        assert m == pytest.approx(st["moment_lb_ft"], abs=1e-6)
+
+    def test_matches_fbd_script(self):
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+        pytest.importorskip("matplotlib")
+        import generate_structural_fbd as fbd
+        x = np.linspace(0, L, 20001)
+        _, M, _, _ = fbd.compute_shear_moment(x, L, 871.0, 171.0, NOMINAL, [175.0] * 4)
+        il = InfluenceLines.build(L, NOMINAL, 171.0, n_stations=2001)
+        r = il.evaluate(np.arange(4), np.full(4, 175.0))
+        assert r["moment_lb_ft"].max() == pytest.approx(M.max(), rel=1e-3)
+
+    def test_asymmetric_layout_stays_in_equilibrium(self, lines, layouts):
+        _, idx, loads = layouts
+        r = lines.evaluate(idx[::97], loads[::97])
+        assert np.abs(r["shear_lb"][:, -1]).max() < 1e-9
+        assert np.abs(r["moment_lb_ft"][:, -1]).max() < 1e-9
+
+
+class TestLayouts:
+    def test_spacing_and_weights(self, layouts):
+        seats, idx, loads = layouts
+        pos = np.sort(seats[idx], axis=1)
+        assert (np.diff(pos, axis=1) >= 2.0 - 1e-12).all()
+        assert np.allclose(loads.sum(axis=1), 700.0)
+        assert len({tuple(r) for r in loads}) == 24
+
+    def test_weight_count_mismatch(self):
+        with pytest.raises(ValueError):
+            crew_layouts([[4.0], [12.0]], [175.0])
+
+
+class TestEnvelope:
+    def test_matches_brute_force(self, lines, layouts):
+        _, idx, loads = layouts
+        env = envelope(lines, idx, loads, chunk_size=1000)
+        full = lines.evaluate(idx, loads)
+        assert env["moment_max_lb_ft"] == pytest.approx(full["moment_lb_ft"].max(axis=0))
+        assert env["shear_min_lb"] == pytest.approx(full["shear_lb"].min(axis=0))
+        k = env["max_sagging_layout"]
+        assert full["moment_lb_ft"][k].max() == pytest.approx(env["max_sagging_lb_ft"])
+        k = env["max_hogging_layout"]
+        assert -full["moment_lb_ft"][k].min() == pytest.approx(env["max_hogging_lb_ft"])
+
+    def test_bounds_nominal_layout(self, lines):
+        seat = np.searchsorted(lines.seats_ft, NOMINAL)
+        env = envelope(lines, seat, np.full(4, 175.0))
+        assert env["n_layouts"] == 1
+        nominal = lines.evaluate(seat, np.full(4, 175.0))["moment_lb_ft"][0]
+        assert env["moment_max_lb_ft"] == pytest.approx(nominal)
+
+    def test_chunking_is_invariant(self, lines, layouts):
+        _, idx, loads = layouts
+        a = envelope(lines, idx, loads, chunk_size=257)
+        b = envelope(lines, idx, loads)
+        for key in ("moment_min_lb_ft", "shear_max_lb", "max_shear_lb", "max_hogging_layout"):
+            assert np.array_equal(a[key], b[key])
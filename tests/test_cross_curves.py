@@ -0,0 +1,121 @@
+"""Tests for large-angle stability cross curves (calculations/cross_curves.py)."""
+import sys
+import math
+from dataclasses import replace
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.cross_curves import (
+    SectionSet,
+    area_under_gz,
+    gz_curve,
+    gz_curves_batch,
+)
+from calculations.hydrostatics import StationHull
+from calculations.concrete_canoe_calculator import WATER_DENSITY_LB_PER_FT3
+
+
+def box_sections(beam_in=30.0, depth_in=18.0, length_in=192.0, n=17):
+    """Prismatic rectangular hull (wall-sided everywhere)."""
+    b = beam_in / 2
+    rect = np.array([[-b, 0.0], [b, 0.0], [b, depth_in], [-b, depth_in]])
+    positions = np.linspace(0, length_in, n)
+    return SectionSet.from_sections(positions, [rect] * n, "box")
+
+
+@pytest.fixture(scope="module")
+def design_a():
+    return SectionSet.from_design("A")
+
+
+class TestBoxHull:
+    def test_wall_sided_formula(self):
+        """Until deck edge or chine crosses the waterline: GZ = sinφ(GM + ½BM tan²φ)."""
+        sections = box_sections()
+        L, B = 16.0, 2.5
+        weight = 1500.0  # T = 7.2": chine emerges at 25.6°, deck edge at 35.8°
+        T = weight / WATER_DENSITY_LB_PER_FT3 / (L * B)
+        kg = 0.6
+        bm = B**2 / (12 * T)
+        gm = T / 2 + bm - kg
+        curve = gz_curve(sections, weight, kg, [0, 5, 10, 15, 20, 25])
+        for phi, gz in zip(curve["angles_deg"], curve["gz_ft"]):
+            p = math.radians(phi)
+            expected = math.sin(p) * (gm + 0.5 * bm * math.tan(p) ** 2)
+            assert gz == pytest.approx(expected, abs=1e-9)
+
+    def test_upright_waterline_is_draft(self):
+        sections = box_sections()
+        curve = gz_curve(sections, 700.0, 0.6, [0.0])
+        assert curve["waterline_ft"][0] == pytest.approx(700 / 62.4 / (16 * 2.5))
+
+
+class TestDesignA:
+    def test_upright_matches_station_hydrostatics(self, design_a):
+        h = StationHull.from_design("A").hydrostatics_for_weight(871.0)
+        curve = gz_curve(design_a, 871.0, 0.65, [0.0])
+        assert curve["waterline_ft"][0] == pytest.approx(h["draft_ft"], rel=1e-4)
+        assert curve["gz_ft"][0] == pytest.approx(0.0, abs=1e-12)
+
+    def test_small_angle_slope_is_gm(self, design_a):
+        h = StationHull.from_design("A").hydrostatics_for_weight(871.0)
+        gm = h["kb_ft"] + h["bm_ft"] - 0.65
+        curve = gz_curve(design_a, 871.0, 0.65, [1.0])
+        assert curve["gz_ft"][0] == pytest.approx(gm * math.sin(math.radians(1)), rel=1e-3)
+
+    def test_full_curve_summary(self, design_a):
+        curve = gz_curve(design_a, 871.0, 0.65)
+        assert len(curve["gz_ft"]) == 91
+        assert 0 < curve["angle_max_gz_deg"] < 90
+        assert 0 < curve["deck_edge_angle_deg"] < 90
+        assert curve["area_0_40_ft_rad"] > curve["area_0_30_ft_rad"] > 0
+
+    def test_higher_kg_less_stable(self, design_a):
+        low = gz_curve(design_a, 871.0, 0.5)
+        high = gz_curve(design_a, 871.0, 0.9)
+        assert np.all(high["gz_ft"][1:] < low["gz_ft"][1:])
+
+
+class TestBatch:
+    def test_batch_matches_single(self, design_a):
+        angles = np.arange(0.0, 91.0, 10.0)
+        batch = gz_curves_batch(
+            design_a, [871.0, 900.0], [0.65, 0.7], angles_deg=angles,
+        )
+        for i, (w, kg) in enumerate([(871.0, 0.65), (900.0, 0.7)]):
+            single = gz_curve(design_a, w, kg, angles)
+            assert batch["gz_ft"][i] == pytest.approx(single["gz_ft"], abs=1e-10)
+
+    def test_scaled_beam_is_stiffer(self, design_a):
+        batch = gz_curves_batch(
+            design_a, 871.0, 0.65, beam_in=[30.0, 36.0],
+            angles_deg=np.arange(0.0, 41.0, 5.0), chunk_size=1,
+        )
+        assert batch["gz_ft"].shape == (2, 9)
+        assert batch["area_0_30_ft_rad"][1] > batch["area_0_30_ft_rad"][0]
+
+    def test_deck_edge_angle_matches_single(self, design_a):
+        angles = np.arange(0.0, 91.0, 2.0)
+        dims = [(192.0, 30.0, 12.0), (210.0, 34.0, 15.0), (228.0, 36.0, 20.0)]
+        L, B, D = np.array(dims).T
+        batch = gz_curves_batch(design_a, 871.0, 0.65, L, B, D, angles, chunk_size=2)
+        assert batch["deck_edge_angle_deg"].shape == (3,)
+        for i, (l, b, d) in enumerate(dims):
+            sx = l / (design_a.length_ft * 12)
+            sy, sz = b / (design_a.beam_ft * 12), d / (design_a.depth_ft * 12)
+            scaled = replace(design_a, vertices_ft=design_a.vertices_ft * [sy, sz],
+                             weights=design_a.weights * sx)
+            single = gz_curve(scaled, 871.0, 0.65, angles)
+            assert batch["deck_edge_angle_deg"][i] == single["deck_edge_angle_deg"]
+        assert np.isfinite(batch["deck_edge_angle_deg"]).all()
+
+
+class TestAreaUnderGZ:
+    def test_linear_curve(self):
+        angles = np.arange(0.0, 31.0, 1.0)
+        gz = np.deg2rad(angles)  # GZ = φ (rad)
+        expected = 0.5 * math.radians(30) ** 2
+        assert area_under_gz(angles, gz, 30.0) == pytest.approx(expected, rel=1e-6)
@@ -0,0 +1,108 @@
+"""Tests for the design-space feasibility atlas (calculations/design_atlas.py)."""
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.concrete_canoe_calculator import (
+    estimate_hull_weight,
+    run_complete_analysis_batch,
+)
+from calculations.design_atlas import DesignAtlas, build_atlas, grid_axis, parse_conditions
+
+METRICS = ("weight_lbs", "freeboard_in", "gm_in", "safety_factor")
+AXES = {
+    "L": grid_axis(192, 216, 2.0),
+    "B": grid_axis(28, 36, 1.0),
+    "D": grid_axis(14, 20, 1.0),
+    "t": np.array([0.5, 0.75]),
+}
+
+
+def evaluate(L, B, D, t):
+    w = estimate_hull_weight(L, B, D, t)
+    batch = run_complete_analysis_batch(L, B, D, t, w)
+    return {k: batch[k] for k in METRICS}
+
+
+@pytest.fixture(scope="module")
+def atlas(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("atlas")
+    return build_atlas(directory, AXES, evaluate, METRICS, chunk_rows=1000,
+                       block_rows=64, metadata={"note": "test"})
+
+
+@pytest.fixture(scope="module")
+def brute(atlas):
+    """Every grid point with its metrics, straight from the model."""
+    grids = np.meshgrid(*AXES.values(), indexing="ij")
+    cols = {k: g.ravel() for k, g in zip(AXES, grids)}
+    cols.update({k: v.astype(np.float32) for k, v in evaluate(**cols).items()})
+    return cols
+
+
+class TestBuild:
+    def test_layout(self, atlas):
+        n = 13 * 9 * 7 * 2
+        assert len(atlas) == n and atlas.shape == (13, 9, 7, 2)
+        assert isinstance(atlas._data["gm_in"], np.memmap)
+        w = np.asarray(atlas._data["weight_lbs"])
+        assert np.all(np.diff(w) >= 0)
+        assert np.array_equal(np.sort(atlas._data["cell"]), np.arange(n))
+        meta = json.loads((atlas.directory / "atlas.json").read_text())
+        assert meta["note"] == "test" and meta["rows"] == n
+        assert atlas.zone_min.shape == (-(-n // 64), len(atlas.columns))
+
+    def test_rows_match_model(self, atlas, brute):
+        rows = atlas._rows(0, len(atlas))
+        cell = np.asarray(atlas._data["cell"])
+        for k in atlas.columns:
+            assert np.array_equal(rows[k], brute[k][cell]), k
+
+
+class TestQuery:
+    def test_lightest_matches_brute_force(self, atlas, brute):
+        ok = ((brute["B"] <= 32) & (brute["gm_in"] >= 8) & (brute["freeboard_in"] >= 6)
+              & (brute["safety_factor"] >= 2))
+        i = np.flatnonzero(ok)[np.argmin(brute["weight_lbs"][ok])]
+        best = atlas.lightest(B=(None, 32), gm_in=(8, None))
+        assert best["weight_lbs"] == pytest.approx(float(brute["weight_lbs"][i]))
+        assert best["B"] <= 32 and best["gm_in"] >= 8 and best["safety_factor"] >= 2
+
+    def test_query_all_and_limit(self, atlas, brute):
+        ok = (brute["t"] == 0.5) & (brute["L"] >= 200) & (brute["gm_in"] >= 7)
+        rows = atlas.query(t=(0.5, 0.5), L=(200, None), gm_in=(7, None))
+        assert len(rows["L"]) == ok.sum()
+        assert np.all(np.diff(rows["weight_lbs"]) >= 0)
+        top = atlas.query(limit=5, t=(0.5, 0.5), L=(200, None), gm_in=(7, None))
+        assert np.array_equal(top["weight_lbs"], rows["weight_lbs"][:5])
+        assert atlas.count(feasible=True) == int(
+            ((brute["freeboard_in"] >= 6) & (brute["gm_in"] >= 6)
+             & (brute["safety_factor"] >= 2)).sum())
+
+    def test_zone_maps_skip_blocks(self, atlas):
+        heavy = float(np.asarray(atlas._data["weight_lbs"])[-64])
+        blocks = atlas.candidate_blocks({"weight_lbs": (heavy, None)})
+        assert len(blocks) <= 2 and blocks[-1] == len(atlas.zone_min) - 1
+
+    def test_no_match_and_bad_column(self, atlas):
+        assert atlas.lightest(gm_in=(1e6, None)) is None
+        assert len(atlas.query(B=(40, None))["B"]) == 0
+        with pytest.raises(ValueError, match="unknown atlas column"):
+            atlas.query(rocker=(0, 1))
+
+    def test_reopen(self, atlas):
+        again = DesignAtlas.open(atlas.directory)
+        assert again.lightest() == atlas.lightest()
+
+
+class TestParseConditions:
+    def test_parse(self):
+        assert parse_conditions("B<=32, gm_in>=8") == {"B": (None, 32.0), "gm_in": (8.0, None)}
+        assert parse_conditions("t==0.5, L>=200, L<=210") == {"t": (0.5, 0.5), "L": (200.0, 210.0)}
+        assert parse_conditions("") == {}
+        with pytest.raises(ValueError, match="cannot parse"):
+            parse_conditions("B<32")
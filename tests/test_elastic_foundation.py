@@ -0,0 +1,109 @@
+"""Tests for the beam-on-elastic-foundation hull girder (calculations/elastic_foundation.py)."""
+import sys
+import math
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from calculations.elastic_foundation import (
+    ElasticFoundationBeam,
+    bending_moment_elastic_foundation,
+    concrete_elastic_modulus_psi,
+)
+from calculations.hydrostatics import StationHull
+from calculations.concrete_canoe_calculator import (
+    WATER_DENSITY_LB_PER_FT3,
+    bending_moment_distributed_crew,
+    section_modulus_thin_shell,
+    thin_shell_section_properties,
+)
+
+
+def uniform_beam(ei, k, length_ft=16.0, n=2000, static_load=0.0):
+    x = np.linspace(0.0, length_ft, n + 1)
+    return ElasticFoundationBeam(
+        x_ft=x, ei_lb_ft2=ei, foundation_lb_ft2=np.full_like(x, k),
+        static_load_lb_per_ft=np.full_like(x, static_load),
+        section_modulus_in3=50.0, flexural_strength_psi=1500.0, draft_ft=0.5,
+    )
+
+
+class TestSectionProperties:
+    def test_section_modulus_unchanged(self):
+        props = thin_shell_section_properties(30, 18, 0.5)
+        s = section_modulus_thin_shell(30, 18, 0.5)
+        assert s == pytest.approx(props["i_in4"] / props["c_max_in"] * 0.75)
+        assert props["area_in2"] == pytest.approx(30 * 0.5 + 2 * 0.5 * 17.5)
+
+    def test_ec_aci(self):
+        assert concrete_elastic_modulus_psi(145, 4000) == pytest.approx(3.644e6, rel=1e-3)
+
+
+class TestClosedForm:
+    def test_rigid_limit_is_balanced_moment(self):
+        """Stiff hull, crew at midship on uniform buoyancy: M = P·L/8."""
+        beam = ElasticFoundationBeam.from_dimensions(
+            192, 32, 17, 0.5, 171, 700, compressive_strength_psi=2e15,
+        )
+        r = beam.solve([8.0], [700.0])
+        assert r["max_sagging_lb_ft"][0] == pytest.approx(700 * 16 / 8, rel=1e-6)
+
+    def test_long_flexible_beam_matches_hetenyi(self):
+        """Infinite beam, point load: M = P/(4β), v = Pβ/(2k)."""
+        k, ei, P = 100.0, 1.0e3, 50.0
+        beta = (k / (4 * ei)) ** 0.25
+        beam = uniform_beam(ei, k, length_ft=40.0, n=4000)
+        r = beam.solve([20.0], [P])
+        mid = 2000
+        assert r["moment_lb_ft"][0, mid] == pytest.approx(P / (4 * beta), rel=1e-4)
+        assert r["deflection_in"][0, mid] / 12 == pytest.approx(P * beta / (2 * k), rel=1e-4)
+
+    def test_free_ends_and_equilibrium(self):
+        beam = ElasticFoundationBeam.from_dimensions(192, 32, 17, 0.5, 171, 700)
+        r = beam.solve()
+        assert abs(r["shear_lb"][0, -1]) < 0.05
+        assert abs(r["moment_lb_ft"][0, -1]) < 0.5
+        assert r["moment_lb_ft"][0, 0] == 0.0
+
+
+class TestDesignA:
+    def test_less_than_simple_supports(self):
+        m_ss = bending_moment_distributed_crew(171, 700, 16.0)
+        m_ef = bending_moment_elastic_foundation(192, 32, 17, 0.5, 171, 700)
+        assert 0 < m_ef < m_ss
+
+    def test_station_hull_foundation(self):
+        hull = StationHull.from_design("A")
+        beam = ElasticFoundationBeam.from_dimensions(
+            192, hull.beam_ft * 12, 17, 0.5, 171, 700, station_hull=hull,
+        )
+        h = hull.hydrostatics_for_weight(871.0)
+        assert beam.draft_ft == pytest.approx(float(h["draft_ft"]), rel=1e-6)
+        # Static buoyancy carries exactly the total weight
+        q = beam.static_load_lb_per_ft
+        net = np.sum(0.5 * (q[1:] + q[:-1]) * np.diff(beam.x_ft))
+        assert -net == pytest.approx(700.0, rel=1e-9)
+        assert beam.foundation_lb_ft2.max() <= WATER_DENSITY_LB_PER_FT3 * hull.beam_ft
+        assert np.isfinite(beam.solve()["max_moment_lb_ft"][0])
+
+
+class TestBatch:
+    def test_batch_matches_single_layouts(self):
+        beam = ElasticFoundationBeam.from_dimensions(192, 32, 17, 0.5, 171, 700)
+        rng = np.random.default_rng(3)
+        pos = rng.uniform(2, 14, (25, 4))
+        batch = beam.solve(pos, 175.0)
+        assert batch["moment_lb_ft"].shape == (25, len(beam.x_ft))
+        for i in (0, 12, 24):
+            single = beam.solve(pos[i], 175.0)
+            assert batch["moment_lb_ft"][i] == pytest.approx(single["moment_lb_ft"][0])
+
+    def test_linearity(self):
+        beam = uniform_beam(5e3, 60.0)
+        a = beam.solve([[4.0]], [[100.0]])["deflection_in"]
+        b = beam.solve([[4.0]], [[200.0]])["deflection_in"]
+        assert b == pytest.approx(2 * a)
+        assert math.isfinite(float(a.max()))
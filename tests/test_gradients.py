@@ -0,0 +1,102 @@
+"""Tests for analytic design gradients (calculations/gradients.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.concrete_canoe_calculator import (
+    estimate_hull_weight,
+    run_complete_analysis,
+    section_modulus_thin_shell,
+)
+from calculations.gradients import (
+    OUTPUTS,
+    analysis_gradients,
+    jacobian,
+    section_modulus_gradient,
+)
+
+# (L, B, D, t): baseline, a deep thick hull, a wide shallow one where the
+# bottom fibre governs c_max, and one with freeboard clipped at zero
+DESIGNS = [
+    (192.0, 32.0, 17.0, 0.5),
+    (210.0, 30.0, 20.0, 0.75),
+    (200.0, 36.0, 6.0, 2.0),
+    (192.0, 28.0, 4.0, 0.5),
+]
+
+
+def model(x):
+    """Outputs of the calculator with the weight tied to the dimensions."""
+    L, B, D, t = x
+    w = estimate_hull_weight(L, B, D, t)
+    r = run_complete_analysis(L, B, D, t, w, 1500)
+    return np.array([w, r["freeboard"]["freeboard_in"], r["stability"]["gm_in"],
+                     r["structural"]["safety_factor"]])
+
+
+def model_fixed(x, w):
+    """Outputs of the calculator at a fixed hull weight."""
+    L, B, D, t = x
+    r = run_complete_analysis(L, B, D, t, w, 1500)
+    return np.array([r["freeboard"]["freeboard_in"], r["stability"]["gm_in"],
+                     r["structural"]["safety_factor"]])
+
+
+def central_difference(f, x, rel=1e-6):
+    x = np.asarray(x, dtype=float)
+    cols = []
+    for i in range(len(x)):
+        h = rel * max(1.0, abs(x[i]))
+        e = np.eye(len(x))[i] * h
+        cols.append((f(x + e) - f(x - e)) / (2 * h))
+    return np.array(cols).T
+
+
+def analytic(x):
+    """Gradients with the weight tied to the dimensions, as in model().
+
+    estimate_hull_weight() is proportional to L·(B + 2D)·t.
+    """
+    L, B, D, t = x
+    w = estimate_hull_weight(L, B, D, t)
+    girth = B + 2.0 * D
+    return analysis_gradients(*x, w, w * np.array([1 / L, 1 / girth, 2 / girth, 1 / t]))
+
+
+class TestGradients:
+    @pytest.mark.parametrize("x", DESIGNS)
+    def test_values_match_calculator(self, x):
+        values, _ = analytic(x)
+        ref = model(x)
+        for i, name in enumerate(OUTPUTS):
+            assert values[name] == pytest.approx(ref[i], rel=1e-12, abs=1e-12), name
+
+    @pytest.mark.parametrize("x", DESIGNS)
+    def test_jacobian_matches_finite_differences(self, x):
+        _, grads = analytic(x)
+        fd = central_difference(model, x)
+        assert np.allclose(jacobian(grads), fd, rtol=1e-6, atol=1e-7)
+
+    @pytest.mark.parametrize("x", DESIGNS)
+    def test_section_modulus(self, x):
+        s, ds = section_modulus_gradient(*x[1:])
+        assert s == pytest.approx(section_modulus_thin_shell(*x[1:]), rel=1e-12)
+        fd = central_difference(lambda y: np.array([section_modulus_thin_shell(*y[1:])]), x)
+        assert ds[0] == 0 and np.allclose(ds, fd[0], rtol=1e-6)
+
+    def test_fixed_weight(self):
+        x = DESIGNS[0]
+        w = 171.0
+        _, grads = analysis_gradients(*x, w)
+        fd = central_difference(lambda y: model_fixed(y, w), x)
+        assert np.allclose(jacobian(grads, OUTPUTS[1:]), fd, rtol=1e-6, atol=1e-7)
+        assert not grads["weight_lbs"].any()
+
+    def test_jacobian_subset(self):
+        _, grads = analytic(DESIGNS[0])
+        sub = jacobian(grads, ("gm_in", "safety_factor"), ("L", "B", "D"))
+        assert sub.shape == (2, 3)
+        assert np.array_equal(sub[1], grads["safety_factor"][:3])
@@ -0,0 +1,135 @@
+"""Tests for the multi-load-case structural engine (calculations/load_cases.py)."""
+import sys
+import math
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.load_cases import (
+    LOAD_CASES,
+    GirderCase,
+    aci_one_way_shear,
+    evaluate_load_cases,
+    girder_statics,
+    register_load_case,
+    section_properties,
+)
+from calculations.concrete_canoe_calculator import (
+    section_modulus_thin_shell,
+    thin_shell_section_properties,
+)
+
+
+class TestSectionProperties:
+    def test_matches_calculator(self):
+        B = np.array([30.0, 32.0, 36.0])
+        sec = section_properties(B, 17, 0.5)
+        for i, b in enumerate(B):
+            assert sec["s_in3"][i] == pytest.approx(section_modulus_thin_shell(b, 17, 0.5))
+
+    def test_arrays_match_scalar_elementwise(self):
+        B = np.array([30.0, 32.0, 0.0])
+        t = np.array([0.5, 0.75, 0.0])  # last section is degenerate
+        sec = section_properties(B, 17, t)
+        for i in range(3):
+            scalar = thin_shell_section_properties(B[i], 17.0, t[i])
+            assert {k: sec[k][i] for k in scalar} == scalar
+            assert sec["s_in3"][i] == section_modulus_thin_shell(B[i], 17.0, t[i])
+        assert sec["s_in3"][2] == 0.0
+
+
+class TestStatics:
+    def test_midship_point_on_uniform_buoyancy(self):
+        """Rigid hull, P at midship balanced by uniform buoyancy: M = PL/8."""
+        st = girder_statics(16.0, -700 / 16.0, [(0.5, 700.0)])
+        assert st["moment_lb_ft"].max() == pytest.approx(700 * 16 / 8)
+
+    def test_two_slings_uniform_hull(self):
+        """Supports at L/4 and 3L/4: hogging WL/32 over the slings, zero at midship."""
+        W, L = 200.0, 16.0
+        st = girder_statics(L, W / L, [(0.25, -W / 2), (0.75, -W / 2)])
+        m = st["moment_lb_ft"]
+        assert m.min() == pytest.approx(-W * L / 32)
+        mid = np.searchsorted(st["x_frac"], 0.5)
+        assert m[mid] == pytest.approx(0.0, abs=1e-9)
+
+    def test_free_ends(self):
+        st = girder_statics(16.0, -700 / 16.0, [(0.25, 175.0), (0.4, 175.0),
+                                               (0.6, 175.0), (0.75, 175.0)])
+        assert st["moment_lb_ft"][-1] == pytest.approx(0.0, abs=1e-9)
+        assert st["shear_lb"][-1] == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.fixture(scope="module")
+def design_a():
+    return evaluate_load_cases(192, 32, 17, 0.5, 171)
+
+
+class TestEngine:
+    def test_all_registered_cases(self, design_a):
+        cases = {c.case for c in design_a.checks}
+        assert {"racing_4", "racing_2", "sling_lift", "stands", "punching"} <= cases
+        assert len(design_a.table()) == len(design_a.checks)
+
+    def test_governing_is_minimum(self, design_a):
+        rows = design_a.table()
+        gov = design_a.governing()
+        assert gov["safety_factor"] == min(r["safety_factor"] for r in rows)
+        assert sum(r["governing"] for r in rows) == 1
+
+    def test_racing_flexure_matches_rigid_foundation(self, design_a):
+        pytest.importorskip("scipy")
+        from calculations.elastic_foundation import ElasticFoundationBeam
+        beam = ElasticFoundationBeam.from_dimensions(
+            192, 32, 17, 0.5, 171, 700, compressive_strength_psi=2e15,
+        )
+        m_rigid = beam.solve()["max_moment_lb_ft"][0]
+        m = abs(float(design_a.check("racing_4", "flexure").demand))
+        assert m == pytest.approx(m_rigid, rel=1e-4)
+
+    def test_punching_capacity(self, design_a):
+        chk = design_a.check("punching", "punching")
+        b_o = 4 * (6.0 + 0.5)
+        expected = 0.75 * 4 * (60 / 150) * math.sqrt(2000) * b_o * 0.5
+        assert float(chk.capacity) == pytest.approx(expected)
+        assert float(chk.safety_factor) == pytest.approx(expected / 175.0)
+
+    def test_vectorized_matches_single(self):
+        L = np.array([192.0, 210.0, 228.0])
+        batch = evaluate_load_cases(L, 32, 17, 0.5, 171)
+        for i, Li in enumerate(L):
+            single = evaluate_load_cases(Li, 32, 17, 0.5, 171)
+            assert batch.min_safety_factor[i] == pytest.approx(float(single.min_safety_factor))
+            for rb, rs in zip(batch.table(i), single.table()):
+                assert rb["demand"] == pytest.approx(rs["demand"])
+                assert rb["governing"] == rs["governing"]
+
+    def test_shear_reinforcement_raises_capacity(self):
+        plain = evaluate_load_cases(192, 32, 17, 0.5, 171)
+        meshed = evaluate_load_cases(192, 32, 17, 0.5, 171,
+                                     shear_reinforcement=(0.0017, 80000, 0.875))
+        assert meshed.section["shear_capacity_lbs"] > plain.section["shear_capacity_lbs"]
+
+    def test_register_custom_case(self):
+        case = GirderCase(
+            "heavy_bow", "One paddler at the bow",
+            uniform=lambda c: -c.paddler_weight_lbs / c.length_ft,
+            point_loads=lambda c: [(0.1, c.paddler_weight_lbs)],
+        )
+        register_load_case(case)
+        try:
+            r = evaluate_load_cases(192, 32, 17, 0.5, 171, cases=["heavy_bow"])
+            assert [c.check for c in r.checks] == ["flexure", "shear"]
+        finally:
+            del LOAD_CASES["heavy_bow"]
+
+
+class TestACIShear:
+    def test_crosscheck_values(self):
+        """Cross-check spreadsheet parameters (generate_crosscheck_report)."""
+        Vc, Vs, phi_Vn = aci_one_way_shear(70, 1500, 1.0, 13.1453, 0.0017, 80000, 0.875)
+        assert Vc == pytest.approx(2 * 70 / 150 * math.sqrt(1500) * 13.1453)
+        assert Vs == pytest.approx(0.0017 * 80000 * 13.1453 / 0.875)
+        assert phi_Vn == pytest.approx(0.75 * (Vc + Vs))
@@ -0,0 +1,145 @@
+"""Tests for the vectorized Monte Carlo engine (calculations/monte_carlo.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.monte_carlo import (
+    BASE,
+    OUTPUTS,
+    UNCERTAINTIES,
+    evaluate,
+    plan_shards,
+    precision,
+    run_adaptive,
+    run_monte_carlo,
+    run_parallel,
+    sample_inputs,
+    summary_stats,
+)
+
+
+@pytest.fixture(scope="module")
+def uncertainty_script():
+    pytest.importorskip("matplotlib")
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+    import uncertainty_analysis
+    return uncertainty_analysis
+
+
+@pytest.fixture(scope="module")
+def draws():
+    return sample_inputs(np.random.default_rng(7), 200)
+
+
+class TestEvaluate:
+    def test_matches_run_single(self, uncertainty_script, draws):
+        batch = evaluate(**draws)
+        for i in range(0, 200, 9):
+            ref = uncertainty_script.run_single(*(draws[k][i] for k in UNCERTAINTIES))
+            for key, value in ref.items():
+                assert batch[key][i] == pytest.approx(value, rel=1e-12), key
+
+    def test_matches_run_single_station_hull(self, uncertainty_script, draws):
+        from calculations.hydrostatics import load_hydrostatic_table
+        table = load_hydrostatic_table("A", cache_dir=None)
+        batch = evaluate(**draws, hydro_table=table)
+        for i in (0, 50, 199):
+            ref = uncertainty_script.run_single(*(draws[k][i] for k in UNCERTAINTIES),
+                                                hydro_table=table)
+            assert batch["gm_in"][i] == pytest.approx(ref["gm_in"], rel=1e-12)
+            assert batch["fb_in"][i] == pytest.approx(ref["fb_in"], rel=1e-12)
+
+    def test_broadcasts_scalars(self):
+        r = evaluate(60.0, np.array([0.4, 0.5, 0.6]), 1500.0, 175.0)
+        assert r["canoe_wt"].shape == (3,)
+        assert np.all(np.diff(r["canoe_wt"]) > 0)
+
+
+class TestRunMonteCarlo:
+    def test_samples_respect_bounds(self):
+        _, samples = run_monte_carlo(50_000, np.random.default_rng(1), chunk_size=8192)
+        for name, u in UNCERTAINTIES.items():
+            assert samples[name].min() >= u["low"] and samples[name].max() <= u["high"]
+
+    def test_outputs_match_evaluate(self):
+        outputs, samples = run_monte_carlo(10_000, np.random.default_rng(3), chunk_size=3000)
+        direct = evaluate(**samples)
+        for key in OUTPUTS + ("all_pass",):
+            assert np.array_equal(outputs[key], direct[key])
+
+    def test_reproducible(self):
+        a, _ = run_monte_carlo(5000, np.random.default_rng(11), chunk_size=1024)
+        b, _ = run_monte_carlo(5000, np.random.default_rng(11), chunk_size=1024)
+        assert np.array_equal(a["sf"], b["sf"])
+
+    def test_summary_stats(self):
+        s = summary_stats(np.arange(101.0))
+        assert s["p5"] == 5.0 and s["p95"] == 95.0 and s["mean"] == 50.0
+
+
+class TestParallel:
+    KW = dict(n=40_000, seed=2026, shard_size=9_000, chunk_size=4_000)
+
+    def test_bit_identical_across_worker_counts(self):
+        runs = [run_parallel(workers=w, keep_samples=True, **self.KW) for w in (1, 2, 3)]
+        for other in runs[1:]:
+            for name, st in runs[0].stats.items():
+                assert other.stats[name].moments == st.moments
+                assert np.array_equal(other.stats[name].histogram.counts, st.histogram.counts)
+                assert np.array_equal(other.stats[name].sketch.quantile([0.05, 0.95]),
+                                      st.sketch.quantile([0.05, 0.95]))
+            assert other.passes == runs[0].passes
+            assert np.array_equal(other.outputs["sf"], runs[0].outputs["sf"])
+
+    def test_merged_stats_match_samples(self):
+        mc = run_parallel(workers=1, keep_samples=True, **self.KW)
+        assert mc.count == 40_000 and len(mc.samples["density"]) == 40_000
+        sf = mc.outputs["sf"]
+        assert mc.stats["sf"].moments.mean == pytest.approx(sf.mean(), rel=1e-12)
+        assert mc.stats["sf"].moments.std == pytest.approx(sf.std(), rel=1e-10)
+        assert mc.stats["sf"].histogram.total == 40_000
+        assert mc.passes["all_pass"] == int(mc.outputs["all_pass"].sum())
+
+    def test_shards_are_independent_streams(self):
+        shards = plan_shards(25, 1, shard_size=10)
+        assert [(s.start, s.size) for s in shards] == [(0, 10), (10, 10), (20, 5)]
+        draws = [np.random.default_rng(s.seed).random() for s in shards]
+        assert len(set(draws)) == 3
+        assert plan_shards(25, 1, 10)[2].seed.spawn_key == shards[2].seed.spawn_key
+
+
+class TestAdaptive:
+    def test_stops_when_targets_met(self):
+        r = run_adaptive(pf_half_width=0.01, percentile_half_width={"sf": 0.02},
+                         batch_size=1024, seed=3)
+        assert r.converged and r.n_samples == 1024 * r.batches
+        assert r.half_widths["p_fail"] <= 0.01
+        assert r.half_widths["sf@0.05"] <= 0.02 and r.half_widths["sf@0.95"] <= 0.02
+        # One batch earlier the targets were not all met
+        prev = run_parallel(r.n_samples - 1024, seed=3, workers=1, shard_size=1024)
+        _, half = precision(prev, outputs=("sf",))
+        assert half["p_fail"] > 0.01 or max(half["sf@0.05"], half["sf@0.95"]) > 0.02
+
+    def test_matches_leading_shards_of_fixed_run(self):
+        r = run_adaptive(pf_half_width=0.02, percentile_half_width={}, batch_size=2048, seed=9)
+        fixed = run_parallel(r.n_samples, seed=9, workers=1, shard_size=2048)
+        assert r.stats.passes == fixed.passes
+        assert r.stats.stats["sf"].moments == fixed.stats["sf"].moments
+
+    def test_budget_cap(self):
+        r = run_adaptive(pf_half_width=1e-6, batch_size=1000, max_samples=2500, seed=1)
+        assert not r.converged and r.n_samples == 2500
+
+    @pytest.mark.parametrize("kw", [{"max_samples": 0}, {"batch_size": 0}])
+    def test_rejects_empty_budget(self, kw):
+        with pytest.raises(ValueError, match="must be positive"):
+            run_adaptive(**kw)
+
+    def test_passing_design_needs_few_samples(self):
+        base = dict(BASE, B=34, D=18, t=0.5)
+        r = run_adaptive(pf_half_width=0.01, percentile_half_width={}, batch_size=512,
+                         base=base, seed=5)
+        assert r.converged and r.n_samples <= 8192
@@ -0,0 +1,162 @@
+"""Tests for the multistart hull optimizer (scripts/optimize_hull.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from calculations.concrete_canoe_calculator import diagnostics
+
+
+@pytest.fixture(scope="module")
+def optimizer():
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+    import optimize_hull
+    return optimize_hull
+
+
+def run(optimizer, **kw):
+    with diagnostics("collect") as diag:
+        results = optimizer.run_optimization(**kw)
+    return results, diag
+
+
+class TestJacobians:
+    @pytest.mark.parametrize("x", [(192.0, 30.0, 16.0), (215.0, 34.0, 18.5)])
+    def test_match_finite_differences(self, optimizer, x):
+        x = np.array(x)
+        h = 1e-6 * x
+        eye = np.diag(h)
+        fd_obj = [(optimizer.objective(x + e) - optimizer.objective(x - e)) / (2 * hi)
+                  for e, hi in zip(eye, h)]
+        fd_con = np.array([(optimizer.constraints_g(x + e) - optimizer.constraints_g(x - e))
+                           / (2 * hi) for e, hi in zip(eye, h)]).T
+        assert np.allclose(optimizer.objective_grad(x), fd_obj, rtol=1e-7)
+        assert np.allclose(optimizer.constraints_jac(x), fd_con, rtol=1e-6, atol=1e-8)
+
+    def test_weight_gradient_thickness(self, optimizer):
+        g = optimizer.weight_gradient(192, 30, 16, 0.5)
+        w = optimizer.weight_from_dimensions
+        assert g[3] == pytest.approx((w(192, 30, 16, 0.5001) - w(192, 30, 16, 0.4999)) / 2e-4)
+
+
+class TestHullEvaluator:
+    X = np.array([200.0, 31.0, 16.5])
+
+    def test_callbacks_share_one_analysis(self, optimizer):
+        ev = optimizer.HullEvaluator()
+        x = self.X.copy()
+        assert ev.objective(x) == optimizer.objective(x)
+        assert np.array_equal(ev.constraints(x), optimizer.constraints_g(x))
+        assert np.array_equal(ev.constraints_jac(x), optimizer.constraints_jac(x))
+        assert np.array_equal(ev.objective_grad(x), optimizer.objective_grad(x))
+        assert ev.evaluations == 1 and ev.jacobians == 1
+        assert sum(ev.calls.values()) == 4
+        # Mutating the caller's array or a returned one does not touch the cache
+        g = ev.constraints(x)
+        g[:] = 0
+        x[0] = 210.0
+        assert np.array_equal(ev.constraints(self.X), optimizer.constraints_g(self.X))
+        assert ev.evaluations == 1
+
+    def test_constraints_use_thresholds(self, optimizer, monkeypatch):
+        base = optimizer.constraints_g(self.X)
+        monkeypatch.setattr(optimizer, "MIN_GM", 7.5)
+        assert optimizer.HullEvaluator().constraints(self.X)[1] == pytest.approx(base[1] - 1.5)
+        assert np.array_equal(optimizer.constraints_g(self.X)[[0, 2]], base[[0, 2]])
+
+    def test_exact_match_and_eviction(self, optimizer):
+        ev = optimizer.HullEvaluator(maxsize=2)
+        ev.objective(self.X)
+        ev.objective(self.X + [0, 0, 1e-12])
+        assert ev.evaluations == 2
+        ev.objective(self.X + [1, 0, 0])
+        ev.objective(self.X)  # evicted by the third point
+        assert ev.evaluations == 4
+
+    def test_counts_merged_across_workers(self, optimizer):
+        totals = [optimizer.HullEvaluator() for _ in range(2)]
+        for workers, ev in zip((1, 2), totals):
+            with diagnostics("collect") as diag:
+                optimizer.run_optimization(n_starts=12, workers=workers, evaluator=ev)
+        a, b = totals
+        assert a.calls == b.calls and a.evaluations == b.evaluations
+        assert a.evaluations == diag.evaluations
+        assert a.evaluations < a.calls["objective"] + a.calls["constraints"]
+        assert "callback calls" in a.summary()
+
+
+class TestMultistart:
+    def test_start_points_from_master_seed(self, optimizer):
+        seeds = np.random.SeedSequence(42).spawn(4)
+        again = np.random.SeedSequence(42).spawn(4)
+        points = [optimizer.start_point(s) for s in seeds]
+        assert all(np.array_equal(p, optimizer.start_point(s)) for p, s in zip(points, again))
+        lo, hi = np.array(optimizer.BOUNDS, dtype=float).T
+        assert all(np.all((p >= lo) & (p <= hi)) for p in points)
+        assert not np.array_equal(points[0], points[1])
+
+    def test_workers_do_not_change_results(self, optimizer):
+        serial, d1 = run(optimizer, n_starts=24, workers=1)
+        pooled, d2 = run(optimizer, n_starts=24, workers=2)
+        assert serial and serial == pooled
+        assert d1.evaluations == d2.evaluations > 0
+        weights = [r["weight_lbs"] for r in serial]
+        assert weights == sorted(weights) and len(serial) <= 10
+        r = serial[0]
+        assert r["freeboard_in"] >= optimizer.MIN_FREEBOARD and r["gm_in"] >= optimizer.MIN_GM - 1e-6
+
+    def test_early_stop_is_deterministic(self, optimizer, capsys):
+        full, _ = run(optimizer, n_starts=24, workers=1)
+        serial, d1 = run(optimizer, n_starts=24, workers=1, distinct=1)
+        pooled, d2 = run(optimizer, n_starts=24, workers=2, distinct=1)
+        assert "distinct feasible optima" in capsys.readouterr().out
+        # Stops at the first feasible start, whichever worker finishes first
+        assert serial == pooled and len(serial) == 1
+        assert d1.evaluations == d2.evaluations
+        assert serial[0]["weight_lbs"] == pytest.approx(full[0]["weight_lbs"], abs=0.1)
+
+
+class TestPareto:
+    def test_generation_matches_scalar_analysis(self, optimizer):
+        X = np.array([[192.0, 30.0, 16.0], [210.0, 34.0, 18.0], [200.0, 28.0, 14.0]])
+        F, violation, cols = optimizer.evaluate_generation(X)
+        for i, x in enumerate(X):
+            g = optimizer.constraints_g(x)
+            assert cols["weight_lbs"][i] == pytest.approx(optimizer.objective(x))
+            assert cols["gm_in"][i] == pytest.approx(g[1] + optimizer.MIN_GM)
+            assert (violation[i] == 0) == bool((g >= 0).all())
+        assert np.array_equal(F[:, 3], -X[:, 0])
+
+    def test_front_contains_slsqp_optimum(self, optimizer):
+        res = optimizer.run_pareto(pop_size=60, generations=60, seed=1)
+        cols = res.archive.columns
+        assert len(res.archive) > 20
+        assert (cols["freeboard_in"] >= 6).all() and (cols["safety_factor"] >= 2).all()
+        slsqp, _ = run(optimizer, n_starts=12, workers=1)
+        assert cols["weight_lbs"].min() == pytest.approx(slsqp[0]["weight_lbs"], rel=0.01)
+        assert cols["length_in"].max() == pytest.approx(optimizer.BOUNDS[0][1], abs=0.5)
+
+
+class TestAtlas:
+    def test_metrics_match_optimizer_model(self, optimizer):
+        x = np.array([200.0, 31.0, 16.5])
+        out = optimizer.evaluate_atlas(*(np.array([v]) for v in x), np.array([0.5]),
+                                       np.array([60.0]))
+        assert out["weight_lbs"][0] == pytest.approx(optimizer.objective(x))
+        g = optimizer.constraints_g(x)
+        assert out["gm_in"][0] == pytest.approx(g[1] + optimizer.MIN_GM)
+        assert out["safety_factor"][0] == pytest.approx(g[2] + optimizer.MIN_SF)
+
+    def test_built_once_then_reused(self, optimizer, monkeypatch, tmp_path, capsys):
+        monkeypatch.setattr(optimizer, "ATLAS_STEP_IN", 4.0)
+        first = optimizer.load_atlas(tmp_path)
+        assert "Building design atlas" in capsys.readouterr().out
+        again = optimizer.load_atlas(tmp_path)
+        assert "Building" not in capsys.readouterr().out
+        assert again.lightest() == first.lightest()
+        monkeypatch.setattr(optimizer, "ATLAS_STEP_IN", 2.0)  # new grid -> rebuilt
+        assert len(optimizer.load_atlas(tmp_path)) > len(first)
+        assert first.lightest() is not None  # old mapping still readable
@@ -0,0 +1,101 @@
+"""Tests for the NSGA-II multi-objective search (calculations/pareto.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.pareto import (
+    ParetoArchive,
+    crowding_distance,
+    dominance,
+    non_dominated,
+    non_dominated_sort,
+    nsga2,
+)
+
+
+def zdt1(X):
+    """ZDT1: convex front f2 = 1 - sqrt(f1) at x[1:] = 0."""
+    f1 = X[:, 0]
+    g = 1 + 9 * X[:, 1:].mean(axis=1)
+    F = np.column_stack([f1, g * (1 - np.sqrt(f1 / g))])
+    return F, np.zeros(len(X)), {"g": g}
+
+
+def constrained(X):
+    """Minimize (x, y) subject to x + y >= 1: the front is the line x + y = 1."""
+    F = X.copy()
+    return F, np.maximum(0.0, 1 - X.sum(axis=1)), {}
+
+
+@pytest.fixture(scope="module")
+def zdt1_result():
+    return nsga2(zdt1, [(0.0, 1.0)] * 5, pop_size=60, generations=120, seed=3)
+
+
+class TestSorting:
+    F = np.array([[1.0, 4.0], [2.0, 2.0], [4.0, 1.0], [3.0, 3.0], [4.0, 4.0], [2.0, 2.0]])
+
+    def test_dominance(self):
+        dom = dominance(self.F, self.F)
+        assert dom[1, 3] and dom[3, 4] and not dom[0, 1] and not dom[1, 5]
+        assert np.array_equal(non_dominated(self.F), [1, 1, 1, 0, 0, 1])
+
+    def test_fronts(self):
+        assert np.array_equal(non_dominated_sort(self.F), [0, 0, 0, 1, 2, 0])
+
+    def test_constrained_domination(self):
+        v = np.array([0.0, 0.5, 0.0, 0.0, 0.1, 0.0])
+        rank = non_dominated_sort(self.F, v)
+        # feasible designs first; infeasible ones ordered by violation
+        assert np.array_equal(rank, [0, 3, 0, 1, 2, 0])
+
+    def test_crowding(self):
+        F = np.array([[0.0, 1.0], [0.5, 0.5], [0.9, 0.1], [1.0, 0.0]])
+        d = crowding_distance(F)
+        assert np.isinf(d[[0, 3]]).all()
+        assert d[1] == pytest.approx(0.9 + 0.9) and d[2] == pytest.approx(0.5 + 0.5)
+
+
+class TestArchive:
+    def test_keeps_only_feasible_non_dominated(self):
+        arch = ParetoArchive()
+        F = np.array([[1.0, 3.0], [3.0, 1.0], [2.0, 2.5], [0.5, 0.5]])
+        X = F.copy()
+        added = arch.update(X, F, np.array([0, 0, 0, 1.0]), {"id": np.arange(4)})
+        assert added == 3 and sorted(arch.columns["id"]) == [0, 1, 2]
+        # one new design dominates two archived ones; a duplicate is ignored
+        added = arch.update(np.array([[1.0, 2.0], [3.0, 1.0]]), np.array([[1.0, 2.0], [3.0, 1.0]]),
+                            np.zeros(2), {"id": np.array([10, 11])})
+        assert added == 1 and sorted(arch.columns["id"]) == [1, 10]
+        assert non_dominated(arch.F).all()
+
+    def test_bounded_by_crowding(self):
+        arch = ParetoArchive(max_size=10)
+        f1 = np.linspace(0, 1, 50)
+        F = np.column_stack([f1, 1 - f1])
+        arch.update(F, F, np.zeros(50))
+        assert len(arch) == 10
+        assert arch.F[:, 0].min() == 0 and arch.F[:, 0].max() == 1
+
+
+class TestNSGA2:
+    def test_converges_to_zdt1_front(self, zdt1_result):
+        F = zdt1_result.archive.F
+        assert len(F) > 50
+        assert np.abs(F[:, 1] - (1 - np.sqrt(F[:, 0]))).max() < 0.05
+        assert F[:, 0].min() < 0.01 and F[:, 0].max() > 0.99
+        assert zdt1_result.evaluations == 60 * 121
+
+    def test_reproducible(self, zdt1_result):
+        again = nsga2(zdt1, [(0.0, 1.0)] * 5, pop_size=60, generations=120, seed=3)
+        assert np.array_equal(again.archive.X, zdt1_result.archive.X)
+        assert np.array_equal(again.archive.columns["g"], zdt1_result.archive.columns["g"])
+
+    def test_constraints(self):
+        res = nsga2(constrained, [(0.0, 2.0), (0.0, 2.0)], pop_size=40, generations=60, seed=1)
+        s = res.archive.X.sum(axis=1)
+        assert (s >= 1).all() and s.max() < 1.05 and np.median(s) < 1.01
+        assert (res.violation == 0).all()
@@ -0,0 +1,116 @@
+"""Tests for the rare-event reliability methods (calculations/reliability.py)."""
+import math
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from scipy.special import ndtr
+
+from calculations.reliability import (
+    LimitState,
+    form,
+    importance_sampling,
+    sorm,
+    subset_simulation,
+)
+
+
+class LinearLimit:
+    """g(u) = beta - a·u + curvature/2 · (t·u)², t ⟂ a; counts evaluations."""
+
+    def __init__(self, beta, dim=3, curvature=0.0):
+        self.beta, self.dim, self.curvature = beta, dim, curvature
+        self.a = np.ones(dim) / math.sqrt(dim)
+        self.evaluations = 0
+
+    def __call__(self, u):
+        u = np.atleast_2d(u)
+        self.evaluations += len(u)
+        tangent = u[:, 1] - u[:, 0]  # = sqrt(2)·(t·u)
+        return self.beta - u @ self.a + self.curvature / 4 * tangent**2
+
+    def to_physical(self, u):
+        return {"u": np.atleast_2d(u)[:, 0]}
+
+
+@pytest.fixture(scope="module")
+def stability():
+    return LimitState(("stability",))
+
+
+class TestForm:
+    def test_linear_limit_is_exact(self):
+        g = LinearLimit(3.5)
+        r = form(g)
+        assert r.converged
+        assert r.beta == pytest.approx(3.5, rel=1e-6)
+        assert r.pf == pytest.approx(ndtr(-3.5), rel=1e-5)
+        assert np.allclose(r.design_point_u, 3.5 * g.a, atol=1e-6)
+
+    def test_sorm_curvature(self):
+        beta, kappa = 3.0, 0.2
+        g = LinearLimit(beta, dim=2, curvature=kappa)
+        r = sorm(g, form(g))
+        assert max(r.details["curvatures"]) == pytest.approx(kappa, rel=1e-3)
+        assert r.pf == pytest.approx(ndtr(-beta) / math.sqrt(1 + beta * kappa), rel=1e-3)
+        assert r.pf < ndtr(-beta)
+
+    def test_model_design_point(self, stability):
+        r = form(stability)
+        assert r.converged and 3.5 < r.beta < 4.5
+        g = stability(r.design_point_u[None])
+        assert abs(g[0]) < 1e-3
+        # Heavy paddlers and a dense, thick hull drive GM down
+        assert r.design_point["paddler_wt"] > 200
+
+
+class TestSampling:
+    def test_importance_sampling_linear(self):
+        g = LinearLimit(4.0)
+        r = importance_sampling(g, [form(g).design_point_u], 20_000,
+                                np.random.default_rng(1))
+        assert r.pf == pytest.approx(ndtr(-4.0), rel=4 * r.cov)
+        assert r.cov < 0.03
+
+    def test_subset_linear(self):
+        g = LinearLimit(4.0)
+        r = subset_simulation(g, 2000, rng=np.random.default_rng(2))
+        assert r.converged
+        assert r.pf == pytest.approx(ndtr(-4.0), rel=3 * r.cov)
+        assert len(r.details["thresholds"]) == 4
+
+    def test_agree_with_crude_mc(self):
+        # Raise the GM limit so crude MC can resolve P(fail) ~ 3e-3
+        g = LimitState(("stability",), {"stability": 7.5})
+        u = np.random.default_rng(3).standard_normal((400_000, g.dim))
+        crude = float(np.mean(g(u) < 0))
+        ref_cov = math.sqrt((1 - crude) / (crude * len(u)))
+        r_form = form(g)
+        r_is = importance_sampling(g, [r_form.design_point_u], 5000, np.random.default_rng(4))
+        r_ss = subset_simulation(g, 2000, rng=np.random.default_rng(5))
+        for r in (r_is, r_ss):
+            tol = 3 * math.hypot(r.cov, ref_cov)
+            assert r.pf == pytest.approx(crude, rel=tol)
+        assert r_is.evaluations + r_form.evaluations < len(u) / 50
+
+    def test_rare_event_with_few_evaluations(self, stability):
+        r = importance_sampling(stability, [form(stability).design_point_u], 10_000,
+                                np.random.default_rng(6))
+        assert 1e-5 < r.pf < 1e-4 and r.cov < 0.05
+        # Crude MC would need millions of samples for the same CoV
+        assert r.crude_mc_equivalent() > 1e6
+
+    def test_unreachable_failure_is_bounded(self):
+        g = LimitState(("freeboard",))
+        r = subset_simulation(g, 500, rng=np.random.default_rng(7), max_levels=5)
+        assert not r.converged and r.pf == 0.0
+        assert r.details["pf_upper"] <= 1e-3
+
+    def test_counts_evaluations(self):
+        g = LimitState(("strength",))
+        r = subset_simulation(g, 1000, rng=np.random.default_rng(8))
+        assert r.evaluations == g.evaluations and g.calls >= 1
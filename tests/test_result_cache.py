@@ -0,0 +1,156 @@
+"""Tests for the opt-in result cache (calculations/result_cache.py)."""
+import sys
+import warnings
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from calculations.concrete_canoe_calculator import (
+    MODEL_VERSION,
+    Diagnostic,
+    DiagnosticError,
+    diagnostics,
+    run_complete_analysis,
+)
+from calculations.result_cache import ResultCache, canonical_key
+
+DESIGN_A = (192, 32, 17, 0.5, 171)
+
+
+@pytest.fixture(autouse=True)
+def _quiet():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+class TestCanonicalKey:
+    def test_positional_and_keyword_agree(self):
+        k1 = canonical_key(run_complete_analysis, DESIGN_A, {})
+        k2 = canonical_key(run_complete_analysis, (), dict(
+            hull_length_in=192.0, hull_beam_in=32, hull_depth_in=17,
+            hull_thickness_in=0.5, concrete_weight_lbs=171, flexural_strength_psi=1500,
+        ))
+        assert k1 == k2
+
+    def test_different_inputs_differ(self):
+        k1 = canonical_key(run_complete_analysis, DESIGN_A, {})
+        k2 = canonical_key(run_complete_analysis, (192, 32, 17, 0.5, 172), {})
+        assert k1 != k2
+
+    def test_model_version_in_key(self):
+        k1 = canonical_key(run_complete_analysis, DESIGN_A, {}, "2.1")
+        k2 = canonical_key(run_complete_analysis, DESIGN_A, {}, "2.2")
+        assert k1 != k2
+
+    def test_unhashable_argument_rejected(self):
+        with pytest.raises(TypeError):
+            canonical_key(run_complete_analysis, DESIGN_A, {"hydrostatic_table": object()})
+
+
+class TestMemoryTier:
+    def test_hit_returns_same_result(self):
+        cache = ResultCache()
+        first = cache.run_complete_analysis(*DESIGN_A)
+        second = cache.run_complete_analysis(*DESIGN_A)
+        assert second == first == run_complete_analysis(*DESIGN_A)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_caller_mutation_does_not_leak(self):
+        cache = ResultCache()
+        r = cache.run_complete_analysis(*DESIGN_A)
+        r["stability"]["gm_in"] = -1.0
+        assert cache.run_complete_analysis(*DESIGN_A)["stability"]["gm_in"] > 0
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        for w in (170, 171, 172):
+            cache.run_complete_analysis(192, 32, 17, 0.5, w)
+        assert cache.stats()["memory_entries"] == 2
+        cache.run_complete_analysis(192, 32, 17, 0.5, 170)  # evicted
+        assert cache.misses == 4
+
+    def test_wrap(self):
+        cache = ResultCache()
+        cached = cache.wrap(run_complete_analysis)
+        cached(*DESIGN_A)
+        cached(*DESIGN_A)
+        assert cached.cache.stats()["hit_rate"] == pytest.approx(0.5)
+
+
+class TestDiskTier:
+    def test_shared_between_instances(self, tmp_path):
+        db = tmp_path / "results.sqlite"
+        a = ResultCache(path=db)
+        expected = a.run_complete_analysis(*DESIGN_A)
+        a.close()
+        b = ResultCache(path=db)
+        assert b.run_complete_analysis(*DESIGN_A) == expected
+        assert (b.disk_hits, b.misses) == (1, 0)
+        b.run_complete_analysis(*DESIGN_A)
+        assert b.hits == 1  # promoted to LRU
+
+    def test_model_version_invalidates(self, tmp_path):
+        db = tmp_path / "results.sqlite"
+        ResultCache(path=db).run_complete_analysis(*DESIGN_A)
+        newer = ResultCache(path=db, model_version=MODEL_VERSION + "-next")
+        newer.run_complete_analysis(*DESIGN_A)
+        assert newer.misses == 1
+        assert newer.prune() == 1
+        assert newer.stats()["disk_entries"] == 1
+
+    def test_clear_disk(self, tmp_path):
+        cache = ResultCache(path=tmp_path / "results.sqlite")
+        cache.run_complete_analysis(*DESIGN_A)
+        cache.clear(disk=True)
+        assert cache.stats()["disk_entries"] == 0
+        assert cache.stats()["memory_entries"] == 0
+
+
+class TestDiagnosticsOnHit:
+    # 300 lbs is far more than 20% off the 133 lbs estimated for this shell
+    MISMATCH = (192, 32, 17, 0.5, 300)
+    CLEAN = (192, 32, 17, 0.5, 133)
+
+    @pytest.mark.parametrize("disk", [False, True])
+    def test_strict_raises_on_hit(self, tmp_path, disk):
+        cache = ResultCache(path=tmp_path / "results.sqlite" if disk else None)
+        first = cache.run_complete_analysis(*self.MISMATCH)
+        if disk:
+            cache = ResultCache(path=tmp_path / "results.sqlite")
+        with diagnostics("strict"), pytest.raises(DiagnosticError) as err:
+            cache.run_complete_analysis(*self.MISMATCH)
+        assert err.value.flags == first["diagnostics"] == Diagnostic.WEIGHT_MISMATCH
+        assert cache.hits + cache.disk_hits == 1
+
+    def test_collect_records_hits(self, tmp_path):
+        db = tmp_path / "results.sqlite"
+        ResultCache(path=db).run_complete_analysis(*self.MISMATCH)
+        cache = ResultCache(path=db)
+        with diagnostics("collect") as diag:
+            disk = cache.run_complete_analysis(*self.MISMATCH)
+            memory = cache.run_complete_analysis(*self.MISMATCH)
+            cache.run_complete_analysis(*self.CLEAN)
+        assert (cache.disk_hits, cache.hits, cache.misses) == (1, 1, 1)
+        assert diag.evaluations == 3 and diag.flagged == 2
+        for r in (disk, memory):
+            assert type(r["diagnostics"]) is Diagnostic
+            assert r["diagnostics"] == Diagnostic.WEIGHT_MISMATCH
+
+    def test_warns_on_hit(self):
+        cache = ResultCache()
+        cache.run_complete_analysis(*self.MISMATCH)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            cache.run_complete_analysis(*self.MISMATCH)
+        assert cache.hits == 1
+        assert [str(w.message) for w in caught] == [
+            str(w.message) for w in _warnings_of(*self.MISMATCH)]
+
+
+def _warnings_of(*args):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        run_complete_analysis(*args)
+    return caught
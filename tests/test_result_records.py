@@ -0,0 +1,182 @@
+"""Tests for result records, ResultTable and the diagnostics collector."""
+import sys
+import warnings
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from calculations.concrete_canoe_calculator import (
+    AnalysisResult,
+    Diagnostic,
+    DiagnosticError,
+    DiagnosticsCollector,
+    ResultTable,
+    StabilityResult,
+    active_diagnostics,
+    concrete_mix_flags,
+    diagnostics,
+    run_complete_analysis,
+    run_complete_analysis_batch,
+    validate_concrete_mix,
+)
+
+DESIGN_A = (192, 32, 17, 0.5, 171)
+
+
+@pytest.fixture(autouse=True)
+def _quiet():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+class TestRecords:
+    def test_default_return_is_still_dict(self):
+        r = run_complete_analysis(*DESIGN_A)
+        assert type(r) is dict and type(r["stability"]) is dict
+
+    def test_as_dict_view_matches_legacy(self):
+        rec = run_complete_analysis(*DESIGN_A, as_record=True)
+        legacy = run_complete_analysis(*DESIGN_A)
+        assert isinstance(rec, AnalysisResult)
+        assert rec.as_dict() == legacy
+        assert rec.to_dict() == legacy
+        assert list(rec.as_dict()["structural"]) == list(legacy["structural"])
+
+    def test_alias_keys(self):
+        view = run_complete_analysis(*DESIGN_A, as_record=True).as_dict()
+        assert view["stability"]["GM_in"] == view["stability"]["gm_in"]
+        assert view["structural"]["is_adequate"] == view["structural"]["pass"]
+
+    def test_view_is_zero_copy(self):
+        rec = run_complete_analysis(*DESIGN_A, as_record=True)
+        assert rec.stability.as_dict()["gm_in"] is rec.stability.gm_in
+
+    def test_frozen_and_slotted(self):
+        rec = StabilityResult(gm_in=8.0, passed=True)
+        with pytest.raises(FrozenInstanceError):
+            rec.gm_in = 1.0
+        assert not hasattr(rec, "__dict__")
+
+    def test_missing_key(self):
+        with pytest.raises(KeyError):
+            StabilityResult(8.0, True).as_dict()["nope"]
+
+
+class TestResultTable:
+    @pytest.fixture
+    def batch(self):
+        np = pytest.importorskip("numpy")
+        return run_complete_analysis_batch(
+            np.array([192.0, 204.0, 216.0]), 32, 17, 0.5, np.array([171.0, 180.0, 190.0]),
+        )
+
+    def test_wraps_without_copy(self, batch):
+        table = ResultTable.from_batch(batch)
+        assert len(table) == 3
+        assert table["gm_in"] is batch["gm_in"]
+
+    def test_row_matches_scalar(self, batch):
+        table = ResultTable.from_batch(batch)
+        scalar = run_complete_analysis(204.0, 32, 17, 0.5, 180.0)
+        row = table.row(1).to_dict()
+        for section in ("freeboard", "stability", "structural"):
+            for key, value in scalar[section].items():
+                assert row[section][key] == pytest.approx(value), (section, key)
+        assert row["overall_pass"] == scalar["overall_pass"]
+
+    def test_from_records_round_trip(self, batch):
+        records = [
+            run_complete_analysis(L, 32, 17, 0.5, W, as_record=True)
+            for L, W in ((192.0, 171.0), (204.0, 180.0), (216.0, 190.0))
+        ]
+        table = ResultTable.from_records(records)
+        assert table["safety_factor"] == pytest.approx(batch["safety_factor"])
+        assert table.row(2) == records[2]
+
+    def test_filter(self, batch):
+        table = ResultTable.from_batch(batch)
+        passing = table.filter(table["overall_pass"])
+        assert len(passing) == int(batch["overall_pass"].sum())
+
+    def test_ragged_columns_rejected(self):
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            ResultTable({"a": [1.0, 2.0], "b": [1.0]})
+
+
+class TestDiagnostics:
+    LIGHT = (192, 32, 17, 0.5, 100)  # > 20% below the estimated hull weight
+
+    def test_flags_on_result(self):
+        r = run_complete_analysis(*self.LIGHT, concrete_density_pcf=150)
+        assert r["diagnostics"] == Diagnostic.WEIGHT_MISMATCH | Diagnostic.DENSITY_UNUSUAL
+        assert run_complete_analysis(192, 32, 17, 0.5, 140)["diagnostics"] == Diagnostic.NONE
+
+    def test_default_mode_warns(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            run_complete_analysis(*self.LIGHT)
+        assert len(caught) == 1
+        assert "Check your weight input" in str(caught[0].message)
+        assert caught[0].filename == __file__
+
+    def test_collect_mode_is_silent(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with diagnostics("collect") as diag:
+                for _ in range(3):
+                    r = run_complete_analysis(*self.LIGHT)
+        assert r["diagnostics"] == Diagnostic.WEIGHT_MISMATCH
+        assert diag.evaluations == 3 and diag.flagged == 3
+        assert diag.counts[Diagnostic.WEIGHT_MISMATCH] == 3
+
+    def test_strict_mode_raises(self):
+        with diagnostics("strict"):
+            with pytest.raises(DiagnosticError) as exc:
+                run_complete_analysis(*self.LIGHT, flexural_strength_psi=5000)
+        assert exc.value.flags == Diagnostic.WEIGHT_MISMATCH | Diagnostic.FLEXURAL_UNUSUAL
+        assert "5000 psi" in str(exc.value)
+
+    def test_mode_is_restored(self):
+        with diagnostics("strict"):
+            pass
+        run_complete_analysis(*self.LIGHT)  # back to warn; no exception
+
+    def test_validate_concrete_mix(self):
+        assert concrete_mix_flags(60, 1500, 5000) == Diagnostic.FLEX_COMP_RATIO_HIGH
+        with diagnostics("collect") as diag:
+            assert validate_concrete_mix(60, 1500) is True
+            assert validate_concrete_mix(200, 1500) is False
+        assert diag.seen == Diagnostic.DENSITY_UNUSUAL
+
+    def test_batch_flags_match_scalar(self):
+        np = pytest.importorskip("numpy")
+        W = np.array([100.0, 171.0, 140.0])
+        rho = np.array([60.0, 60.0, 130.0])
+        batch = run_complete_analysis_batch(192, 32, 17, 0.5, W, concrete_density_pcf=rho)
+        for i in range(3):
+            r = run_complete_analysis(192, 32, 17, 0.5, W[i], concrete_density_pcf=rho[i])
+            assert batch["diagnostics"][i] == r["diagnostics"]
+            assert ResultTable.from_batch(batch).row(i).diagnostics == r["diagnostics"]
+
+    def test_merge_worker_tallies(self):
+        with diagnostics("collect") as worker:
+            run_complete_analysis(*self.LIGHT)
+            run_complete_analysis(*self.LIGHT, concrete_density_pcf=150)
+        assert active_diagnostics() is None
+        with diagnostics("collect") as diag:
+            assert active_diagnostics() is diag
+            run_complete_analysis(192, 32, 17, 0.5, 140)
+            diag.merge(worker)
+        assert diag.evaluations == 3 and diag.flagged == 2
+        assert diag.counts[Diagnostic.WEIGHT_MISMATCH] == 2
+        assert diag.seen == Diagnostic.WEIGHT_MISMATCH | Diagnostic.DENSITY_UNUSUAL
+        assert DiagnosticsCollector().merge(worker).summary() == worker.summary()
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            with diagnostics("loud"):
+                pass
@@ -0,0 +1,100 @@
+"""Tests for columnar export of Monte Carlo results (calculations/results_export.py)."""
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.concrete_canoe_calculator import MODEL_VERSION
+from calculations.results_export import (
+    LEGACY_CSV_COLUMNS,
+    check_formats,
+    export_results,
+    load_results,
+    write_csv,
+)
+
+
+@pytest.fixture(scope="module")
+def results():
+    rng = np.random.default_rng(0)
+    n = 1000
+    inputs = {"density": rng.normal(60, 3, n), "thickness": rng.normal(0.5, 0.03, n)}
+    outputs = {"canoe_wt": rng.normal(175, 8, n), "fb_in": rng.normal(10, 1, n),
+               "gm_in": rng.normal(8, 1, n), "sf": rng.normal(2.5, 0.3, n),
+               "passes": rng.random(n) < 0.8}
+    return inputs, outputs
+
+
+def assert_same(a, b):
+    assert set(a) == set(b)
+    for k in a:
+        assert np.array_equal(a[k], b[k]), k
+
+
+class TestExport:
+    def test_npz_round_trip_and_sidecar(self, results, tmp_path):
+        inputs, outputs = results
+        written = export_results(tmp_path / "mc", inputs, outputs,
+                                 metadata={"seed": np.int64(2026), "sampler": "sobol"})
+        assert set(written) == {"npz", "json"}
+        ins, outs, meta = load_results(tmp_path / "mc")
+        assert_same(ins, inputs)
+        assert_same(outs, outputs)
+        assert outs["passes"].dtype == bool
+        assert meta["model_version"] == MODEL_VERSION and meta["seed"] == 2026
+        assert meta["rows"] == 1000 and meta["files"] == {"npz": "mc.npz"}
+        assert meta["columns"]["in/density"] == "float64"
+
+    def test_npy_memory_mapped(self, results, tmp_path):
+        inputs, outputs = results
+        export_results(tmp_path / "mc", inputs, outputs, formats=("npy",))
+        ins, outs, _ = load_results(tmp_path / "mc", mmap=True)
+        assert isinstance(outs["sf"], np.memmap)
+        assert_same(ins, inputs)
+        assert_same(outs, outputs)
+
+    def test_csv_streamed_in_chunks(self, results, tmp_path):
+        _, outputs = results
+        cols = {h: outputs[k] for h, k in LEGACY_CSV_COLUMNS.items()}
+        path = write_csv(tmp_path / "mc", cols, fmt="%.2f", chunk_size=64)
+        lines = path.read_text().splitlines()
+        assert lines[0] == "iteration,weight_lbs,freeboard_in,gm_in,safety_factor"
+        data = np.loadtxt(path, delimiter=",", skiprows=1)
+        assert data.shape == (1000, 5)
+        assert np.array_equal(data[:, 0], np.arange(1, 1001))
+        assert np.allclose(data[:, 4], outputs["sf"], atol=0.005)
+
+    def test_csv_only_export_has_no_binary(self, results, tmp_path):
+        inputs, outputs = results
+        export_results(tmp_path / "mc", inputs, outputs, formats=("csv",))
+        header = (tmp_path / "mc.csv").read_text().splitlines()[0]
+        assert header.startswith("iteration,density,thickness,canoe_wt")
+        with pytest.raises(ValueError, match="no binary export"):
+            load_results(tmp_path / "mc")
+
+    def test_bad_inputs(self, results, tmp_path):
+        inputs, outputs = results
+        with pytest.raises(ValueError, match="unknown export format"):
+            export_results(tmp_path / "mc", inputs, outputs, formats=("xlsx",))
+        with pytest.raises(ValueError, match="different lengths"):
+            export_results(tmp_path / "mc", inputs, {"sf": outputs["sf"][:10]})
+        assert not (tmp_path / "mc.json").exists()
+
+    def test_pyarrow_formats(self, results, tmp_path):
+        inputs, outputs = results
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="pip install pyarrow"):
+                check_formats(("npz", "parquet"))
+            return
+        export_results(tmp_path / "mc", inputs, outputs, formats=("parquet", "arrow"))
+        for fmt in ("parquet", "arrow"):
+            ins, outs, _ = load_results(tmp_path / "mc", fmt=fmt)
+            assert_same(ins, inputs)
+            assert_same(outs, outputs)
+        meta = json.loads((tmp_path / "mc.json").read_text())
+        assert set(meta["files"]) == {"parquet", "arrow"}
@@ -0,0 +1,88 @@
+"""Tests for uncertainty samplers (calculations/sampling.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from scipy.stats import truncnorm
+
+from calculations.monte_carlo import UNCERTAINTIES, evaluate, run_parallel
+from calculations.sampling import (
+    SAMPLERS,
+    convergence_rates,
+    convergence_study,
+    map_to_inputs,
+    register_sampler,
+    sample,
+    truncated_normal_ppf,
+    unit_points,
+)
+
+
+class TestTruncatedNormal:
+    def test_matches_scipy(self):
+        u = np.linspace(0.001, 0.999, 51)
+        mean, std, low, high = 1500.0, 150.0, 800.0, 2500.0
+        ref = truncnorm.ppf(u, (low - mean) / std, (high - mean) / std, mean, std)
+        assert truncated_normal_ppf(u, mean, std, low, high) == pytest.approx(ref, rel=1e-12)
+
+    def test_tight_bounds_have_no_atoms(self):
+        """Clipping would put ~16% of the mass on the bound; the ppf puts none."""
+        x = truncated_normal_ppf(np.random.default_rng(0).random(10_000), 0.0, 1.0, -1.0, 1.0)
+        assert x.min() >= -1.0 and x.max() <= 1.0
+        assert np.count_nonzero(np.abs(x) == 1.0) == 0
+
+
+class TestSamplers:
+    @pytest.mark.parametrize("name", sorted(SAMPLERS))
+    def test_points_and_bounds(self, name):
+        d = sample(name, 256, np.random.default_rng(1))
+        assert list(d) == list(UNCERTAINTIES)
+        for key, u in UNCERTAINTIES.items():
+            assert d[key].shape == (256,)
+            assert u["low"] <= d[key].min() and d[key].max() <= u["high"]
+
+    def test_lhs_is_stratified(self):
+        u = unit_points("lhs", np.random.default_rng(2), 100, 4)
+        for j in range(4):
+            assert sorted(np.floor(u[:, j] * 100).astype(int)) == list(range(100))
+
+    def test_sobol_beats_random_on_mean(self):
+        rng = np.random.default_rng(3)
+        ref = evaluate(**sample("sobol", 1 << 18, rng))["sf"].mean()
+        err = {
+            name: np.sqrt(np.mean([
+                (evaluate(**sample(name, 1024, rng))["sf"].mean() - ref) ** 2
+                for _ in range(10)
+            ]))
+            for name in ("random", "sobol")
+        }
+        assert err["sobol"] < err["random"] / 5
+
+    def test_unknown_and_registered(self):
+        with pytest.raises(ValueError):
+            unit_points("nope", np.random.default_rng(0), 4, 2)
+        register_sampler("midpoint", lambda rng, n, d: np.full((n, d), 0.5))
+        try:
+            d = map_to_inputs(unit_points("midpoint", None, 3, 4))
+            assert d["density"] == pytest.approx([60.0] * 3, rel=1e-6)
+        finally:
+            del SAMPLERS["midpoint"]
+
+
+class TestIntegration:
+    def test_run_parallel_with_sampler(self):
+        mc = run_parallel(8192, seed=1, workers=1, shard_size=4096,
+                          chunk_size=1024, sampler="sobol")
+        assert mc.count == 8192
+        assert mc.stats["canoe_wt"].moments.mean == pytest.approx(174.3, abs=0.5)
+
+    def test_convergence_study(self):
+        rows = convergence_study(("random", "sobol"), sizes=(64, 256, 1024),
+                                 replicates=6, reference_n=1 << 16)
+        rates = convergence_rates(rows)
+        assert rates[("sobol", "mean_weight")] < rates[("random", "mean_weight")]
+        assert len(rows) == 2 * 3 * 4
@@ -0,0 +1,84 @@
+"""Tests for the Sobol' sensitivity indices (calculations/sensitivity.py)."""
+import math
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from calculations.monte_carlo import UNCERTAINTIES
+from calculations.sensitivity import (
+    _estimate,
+    saltelli_inputs,
+    sobol_indices,
+    tornado_rows,
+)
+
+
+@pytest.fixture(scope="module")
+def indices():
+    return sobol_indices(1 << 12, seed=11, workers=1, n_bootstrap=200)
+
+
+class TestEstimators:
+    def test_ishigami(self):
+        # Ishigami function, a = 7, b = 0.1: analytic S = (0.314, 0.442, 0),
+        # ST = (0.558, 0.442, 0.244)
+        rng = np.random.default_rng(0)
+        n = 200_000
+        a, b = rng.uniform(-np.pi, np.pi, (2, n, 3))
+        f = lambda x: np.sin(x[..., 0]) + 7 * np.sin(x[..., 1]) ** 2 \
+            + 0.1 * x[..., 2] ** 4 * np.sin(x[..., 0])
+        ab = np.repeat(a[None], 3, axis=0)
+        for i in range(3):
+            ab[i, :, i] = b[:, i]
+        first, total, _ = _estimate(f(a), f(b), f(ab))
+        assert first == pytest.approx([0.314, 0.442, 0.0], abs=0.02)
+        assert total == pytest.approx([0.558, 0.442, 0.244], abs=0.02)
+
+    def test_saltelli_matrix_layout(self):
+        n, d = 64, len(UNCERTAINTIES)
+        x = saltelli_inputs(n, np.random.default_rng(1))
+        cols = np.column_stack([x[k] for k in UNCERTAINTIES]).reshape(d + 2, n, d)
+        a, b = cols[0], cols[1]
+        for i in range(d):
+            ab = cols[2 + i]
+            assert np.array_equal(ab[:, i], b[:, i])
+            assert np.array_equal(np.delete(ab, i, 1), np.delete(a, i, 1))
+
+
+class TestModelIndices:
+    def test_weight_ignores_strength_and_crew(self, indices):
+        w = indices["canoe_wt"]
+        names = list(w.names)
+        for name in ("flexural", "paddler_wt"):
+            assert abs(w.total[names.index(name)]) < 1e-12
+        assert w.ranking()[:2] == ["thickness", "density"]
+        # Nearly additive model: first-order shares sum to ~1
+        assert w.first.sum() == pytest.approx(1.0, abs=0.03)
+
+    def test_first_order_below_total(self, indices):
+        for idx in indices.values():
+            assert np.all(idx.first <= idx.total + 0.02)
+            assert np.all(idx.total_ci[:, 0] <= idx.total + 1e-12)
+            assert np.all(idx.total <= idx.total_ci[:, 1] + 1e-12)
+
+    def test_safety_factor_ranking(self, indices):
+        assert indices["sf"].ranking()[0] == "flexural"
+        assert indices["gm_in"].ranking()[0] == "paddler_wt"
+
+    def test_independent_of_workers(self, indices):
+        par = sobol_indices(1 << 12, seed=11, workers=2, n_bootstrap=200, chunk_size=5000)
+        for key, idx in indices.items():
+            assert np.array_equal(par[key].first, idx.first)
+            assert np.array_equal(par[key].total_ci, idx.total_ci)
+
+    def test_tornado_rows(self, indices):
+        rows = tornado_rows(indices, {"sf": "Safety Factor"})
+        assert set(rows) == {"canoe_wt", "fb_in", "gm_in", "Safety Factor"}
+        label, low, high, base = rows["Safety Factor"][2]
+        assert label.startswith(UNCERTAINTIES["flexural"]["label"])
+        assert (low, high, base) == (indices["sf"].first[2], indices["sf"].total[2], 0.0)
+        assert not math.isnan(high)
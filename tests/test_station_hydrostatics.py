@@ -0,0 +1,194 @@
+"""Tests for station-offset hydrostatics (calculations/hydrostatics.py)."""
+import sys
+import math
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.hydrostatics import (
+    StationHull,
+    geometry_hash,
+    load_hydrostatic_table,
+    load_station_offsets,
+    section_breadth,
+    simpson_weights,
+)
+from calculations.concrete_canoe_calculator import (
+    WATER_DENSITY_LB_PER_FT3,
+    run_complete_analysis,
+    run_complete_analysis_batch,
+)
+
+OFFSETS_A = Path(__file__).resolve().parent.parent / "design" / "dxf_coords_design_A.txt"
+
+
+@pytest.fixture(scope="module")
+def hull_a():
+    return StationHull.from_design("A")
+
+
+class TestOffsetsParsing:
+    def test_design_a_station_count(self):
+        positions, sections = load_station_offsets(OFFSETS_A)
+        assert len(positions) == 33
+        assert positions[0] == 0.0 and positions[-1] == 192.0
+        assert sections[16].shape == (23, 2)
+
+    def test_principal_dimensions(self, hull_a):
+        assert hull_a.length_ft == pytest.approx(16.0)
+        assert hull_a.beam_ft == pytest.approx(32 / 12, rel=1e-3)
+        assert hull_a.depth_ft == pytest.approx(17 / 12)
+
+
+class TestSectionBreadth:
+    def test_v_bottom_matches_deadrise(self):
+        """Below the chine a 15° V-bottom has breadth 2z / tan(15°)."""
+        _, sections = load_station_offsets(OFFSETS_A)
+        z = np.array([1.0, 2.0, 3.0])
+        b = section_breadth(sections[16], z)
+        assert b == pytest.approx(2 * z / math.tan(math.radians(15)), rel=1e-3)
+
+    def test_vertical_wall_above_chine(self):
+        _, sections = load_station_offsets(OFFSETS_A)
+        assert section_breadth(sections[16], np.array([10.0]))[0] == pytest.approx(32.0)
+
+    def test_point_station_has_no_breadth(self):
+        b = section_breadth(np.array([[0.0, 0.0]]), np.array([0.0, 5.0]))
+        assert b.tolist() == [0.0, 0.0]
+
+
+class TestSimpson:
+    def test_exact_for_cubic_odd_points(self):
+        x = np.linspace(0, 2, 9)
+        assert simpson_weights(x) @ x**3 == pytest.approx(4.0, rel=1e-12)
+
+    def test_even_points_close(self):
+        x = np.linspace(0, 1, 10)
+        assert simpson_weights(x) @ x**2 == pytest.approx(1 / 3, rel=1e-3)
+
+
+class TestDraftSolve:
+    def test_round_trip_on_grid(self, hull_a):
+        for k in (20, 100, 250):
+            v = hull_a.volume_ft3[k]
+            assert hull_a.draft_from_displacement(v) == pytest.approx(hull_a.z_ft[k])
+
+    def test_round_trip_between_grid(self, hull_a):
+        drafts = np.linspace(0.05, 1.3, 50)
+        vols = hull_a.hydrostatics(drafts)["volume_ft3"]
+        assert hull_a.draft_from_displacement(vols) == pytest.approx(drafts, abs=1e-4)
+
+    def test_vectorized_matches_scalar(self, hull_a):
+        vols = np.array([5.0, 10.0, 15.0])
+        batch = hull_a.draft_from_displacement(vols)
+        for v, d in zip(vols, batch):
+            assert hull_a.draft_from_displacement(v) == pytest.approx(d)
+
+    def test_zero_and_overload(self, hull_a):
+        assert hull_a.draft_from_displacement(0.0) == 0.0
+        assert hull_a.draft_from_displacement(1e6) == pytest.approx(hull_a.depth_ft)
+
+    def test_weight_balance(self, hull_a):
+        h = hull_a.hydrostatics_for_weight(871.0)
+        assert h["displacement_lbs"] == pytest.approx(871.0, rel=1e-6)
+        assert 0 < h["draft_ft"] < hull_a.depth_ft
+
+
+class TestHydrostaticProperties:
+    def test_symmetric_hull_centroids_amidships(self, hull_a):
+        h = hull_a.hydrostatics(0.5)
+        assert h["lcb_ft"] == pytest.approx(8.0)
+        assert h["lcf_ft"] == pytest.approx(8.0)
+
+    def test_kb_below_draft(self, hull_a):
+        h = hull_a.hydrostatics(0.6)
+        assert 0.5 * 0.6 < h["kb_ft"] < 0.6  # V-bottom: KB above T/2
+
+    def test_volume_monotonic(self, hull_a):
+        assert np.all(np.diff(hull_a.volume_ft3) >= 0)
+
+    def test_displacement_units(self, hull_a):
+        h = hull_a.hydrostatics(0.5)
+        assert h["displacement_lbs"] == pytest.approx(
+            h["volume_ft3"] * WATER_DENSITY_LB_PER_FT3
+        )
+
+
+@pytest.fixture(scope="module")
+def table():
+    return load_hydrostatic_table("A", cache_dir=None)
+
+
+class TestHydrostaticTable:
+    def test_matches_station_hull(self, table, hull_a):
+        direct = hull_a.hydrostatics_for_weight(871.0)
+        curves = table.at_weight(871.0)
+        for key in ("draft_ft", "kb_ft", "bm_ft", "lcb_ft", "awp_ft2"):
+            assert curves[key] == pytest.approx(direct[key], rel=1e-4), key
+
+    def test_tpi_and_mct_positive(self, table):
+        curves = table.at_draft(0.6)
+        assert curves["tpi_lbs_per_in"] == pytest.approx(
+            curves["awp_ft2"] * WATER_DENSITY_LB_PER_FT3 / 12
+        )
+        assert curves["mct_lb_ft_per_in"] > 0
+
+    def test_scaling_to_parent_dims_is_identity(self, table):
+        a = table.at_weight(871.0)
+        b = table.at_weight(871.0, 192, table.beam_ft * 12, 17)
+        for key in a:
+            assert b[key] == pytest.approx(a[key], rel=1e-12), key
+
+    def test_scaled_hull_matches_scaled_offsets(self, table):
+        """Scaling the curves equals building the hull from scaled offsets."""
+        positions, sections = load_station_offsets(OFFSETS_A)
+        sx, sy, sz = 1.1, 0.9, 1.2
+        scaled = StationHull.from_sections(
+            positions * sx, [s * [sy, sz] for s in sections], dz_in=0.05 * sz
+        )
+        direct = scaled.hydrostatics_for_weight(900.0)
+        curves = table.at_weight(900.0, 192 * sx, table.beam_ft * 12 * sy, 17 * sz)
+        for key in ("draft_ft", "kb_ft", "bm_ft", "lcb_ft", "awp_ft2"):
+            assert curves[key] == pytest.approx(direct[key], rel=1e-4), key
+
+    def test_vectorized_queries(self, table):
+        w = np.linspace(300, 1200, 7)
+        curves = table.at_weight(w, np.full(7, 200.0), 32, 17)
+        assert curves["draft_ft"].shape == (7,)
+        assert np.all(np.diff(curves["draft_ft"]) > 0)
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        built = load_hydrostatic_table("A", cache_dir=tmp_path)
+        files = list(tmp_path.glob("*.npz"))
+        assert len(files) == 1 and files[0].stem == built.geometry_hash
+        cached = load_hydrostatic_table("A", cache_dir=tmp_path)
+        assert cached.geometry_hash == built.geometry_hash
+        assert np.array_equal(cached.bm_ft, built.bm_ft)
+
+    def test_hash_changes_with_geometry(self):
+        positions, sections = load_station_offsets(OFFSETS_A)
+        h1 = geometry_hash(positions, sections, 0.05)
+        h2 = geometry_hash(positions * 1.01, sections, 0.05)
+        assert h1 != h2
+
+    def test_run_complete_analysis_uses_table(self, table, hull_a):
+        r = run_complete_analysis(
+            192, table.beam_ft * 12, 17, 0.5, 171, crew_weight_lbs=700,
+            hydrostatic_table=table,
+        )
+        h = hull_a.hydrostatics_for_weight(871.0)
+        assert r["freeboard"]["draft_in"] == pytest.approx(h["draft_ft"] * 12, rel=1e-4)
+
+    def test_batch_matches_scalar_with_table(self, table):
+        L = np.array([192.0, 200.0, 216.0])
+        batch = run_complete_analysis_batch(
+            L, 32, 17, 0.5, 171, hydrostatic_table=table,
+        )
+        for i, Li in enumerate(L):
+            r = run_complete_analysis(
+                Li, 32, 17, 0.5, 171, hydrostatic_table=table,
+            )
+            assert batch["freeboard_in"][i] == pytest.approx(r["freeboard"]["freeboard_in"])
+            assert batch["gm_in"][i] == pytest.approx(r["stability"]["gm_in"])
@@ -0,0 +1,122 @@
+"""Tests for constant-memory streaming statistics (calculations/streaming_stats.py)."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from calculations.streaming_stats import (
+    Histogram,
+    Moments,
+    QuantileSketch,
+    StreamingStats,
+    clopper_pearson_interval,
+    quantile_interval,
+    wilson_interval,
+)
+
+
+@pytest.fixture(scope="module")
+def stream():
+    return np.random.default_rng(0).normal(2.3, 0.35, 2_000_000)
+
+
+class TestMoments:
+    def test_matches_numpy(self):
+        x = np.random.default_rng(0).normal(5.0, 2.0, 10_001)
+        m = Moments()
+        for part in np.array_split(x, 7):
+            m.update(part)
+        assert m.count == x.size
+        assert m.mean == pytest.approx(x.mean(), rel=1e-13)
+        assert m.variance == pytest.approx(x.var(), rel=1e-12)
+        assert (m.min, m.max) == (x.min(), x.max())
+
+    def test_merge_empty(self):
+        m = Moments().update([1.0, 2.0, 3.0])
+        assert Moments().merge(m) == m and m.merge(Moments()) == m
+
+    def test_mean_ci_covers(self, stream):
+        lo, hi = Moments().update(stream).mean_ci()
+        assert lo < 2.3 < hi
+
+
+class TestQuantileSketch:
+    Q = [0.01, 0.05, 0.5, 0.95, 0.99]
+
+    def test_rank_error(self, stream):
+        sk = QuantileSketch()
+        for part in np.array_split(stream, 20):
+            sk.update(part)
+        ranks = [(stream <= v).mean() for v in sk.quantile(self.Q)]
+        assert ranks == pytest.approx(self.Q, abs=2e-3)
+        assert sk.size < 2 * sk.k
+
+    def test_merge_matches_single_stream(self, stream):
+        halves = [QuantileSketch().update(h) for h in np.array_split(stream, 2)]
+        merged = halves[0].merge(halves[1])
+        assert merged.count == stream.size
+        ranks = [(stream <= v).mean() for v in merged.quantile(self.Q)]
+        assert ranks == pytest.approx(self.Q, abs=2e-3)
+
+    def test_small_stream_is_exact(self):
+        x = np.arange(100.0)
+        sk = QuantileSketch().update(x)
+        assert sk.quantile(0.5) == 49.0 and sk.rank(49.0) == pytest.approx(0.5)
+
+    def test_deterministic(self, stream):
+        a = QuantileSketch().update(stream[:300_000]).merge(QuantileSketch().update(stream[300_000:600_000]))
+        b = QuantileSketch().update(stream[:300_000]).merge(QuantileSketch().update(stream[300_000:600_000]))
+        assert np.array_equal(a.quantile(self.Q), b.quantile(self.Q))
+
+
+class TestHistogram:
+    def test_counts_and_overflow(self):
+        h = Histogram.uniform(0.0, 1.0, 10).update([-1.0, 0.05, 0.55, 0.55, 2.0])
+        assert h.underflow == 1 and h.overflow == 1 and h.total == 5
+        assert h.counts[5] == 2
+
+    def test_merge_and_density(self, stream):
+        a = Histogram.uniform(0, 5, 100).update(stream[:1000])
+        b = Histogram.uniform(0, 5, 100).update(stream[1000:2000])
+        m = a.merge(b)
+        assert np.array_equal(m.counts, np.histogram(stream[:2000], m.edges)[0])
+        assert (m.density() * np.diff(m.edges)).sum() == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            a.merge(Histogram.uniform(0, 1, 100))
+
+
+class TestStreamingStats:
+    def test_summary(self, stream):
+        st = StreamingStats.with_range(0, 5).update(stream)
+        s = st.summary()
+        assert s["mean"] == pytest.approx(stream.mean())
+        assert s["p5"] == pytest.approx(np.percentile(stream, 5), abs=5e-3)
+        assert st.histogram.total == stream.size
+
+
+class TestIntervals:
+    def test_wilson_known_value(self):
+        lo, hi = wilson_interval(10, 100)
+        assert (lo, hi) == pytest.approx((0.0552, 0.1744), abs=1e-4)
+
+    def test_clopper_pearson_matches_beta(self):
+        pytest.importorskip("scipy")
+        from scipy.stats import beta
+        lo, hi = clopper_pearson_interval(10, 100)
+        assert lo == pytest.approx(beta.ppf(0.025, 10, 91))
+        assert hi == pytest.approx(beta.ppf(0.975, 11, 90))
+        assert clopper_pearson_interval(0, 1000)[0] == 0.0
+
+    def test_zero_failures_upper_bound(self):
+        """k = 0: Wilson upper ≈ z²/(n+z²); Clopper-Pearson ≈ 3.7/n (rule of three at 97.5%)."""
+        assert wilson_interval(0, 1000)[1] == pytest.approx(1.96**2 / (1000 + 1.96**2), rel=1e-3)
+        pytest.importorskip("scipy")
+        assert clopper_pearson_interval(0, 1000)[1] == pytest.approx(3.69 / 1000, rel=0.01)
+
+    def test_quantile_interval_covers(self, stream):
+        sk = QuantileSketch().update(stream[:100_000])
+        lo, hi = quantile_interval(sk, 0.95)
+        assert lo < np.percentile(stream, 95) < hi
+        assert hi - lo < 0.02